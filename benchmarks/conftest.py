@@ -0,0 +1,234 @@
+"""
+Pytest configuration and shared fixtures for Tea benchmarks.
+
+Benchmarks use pytest-benchmark and are kept out of the default test run.
+They never touch the network: yt-dlp is replaced by an offline stand-in
+that fetches synthetic media from a local HTTP server, and media for the
+FFmpeg benchmarks is generated with FFmpeg itself. Run them with:
+
+    python -m pytest benchmarks --benchmark-only --no-cov
+
+Save results as JSON (under .benchmarks/) and compare a later run against
+them to catch regressions across commits:
+
+    python -m pytest benchmarks --benchmark-only --no-cov --benchmark-autosave
+    python -m pytest benchmarks --benchmark-only --no-cov --benchmark-compare \\
+        --benchmark-compare-fail=mean:10%
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+import threading
+import urllib.request
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tea.info import extract_video_id  # noqa: E402
+
+DATA_DIR = Path(__file__).parent / "data"
+
+# Size of each synthetic media file served by the local server
+MEDIA_SIZE = 512 * 1024
+
+# Bytes read per progress hook call, like yt-dlp's HTTP downloader
+CHUNK_SIZE = 64 * 1024
+
+# Length of the media generated for the FFmpeg benchmarks
+GENERATED_MEDIA_SECONDS = 60
+
+
+@pytest.fixture(scope="session")
+def title_corpus() -> List[str]:
+    """Load the corpus of real video titles.
+
+    Returns:
+        List of video titles
+    """
+    with open(DATA_DIR / "titles.txt", "r", encoding="utf-8") as f:
+        return [
+            line.rstrip("\n")
+            for line in f
+            if line.strip() and not line.startswith("#")
+        ]
+
+
+class _MediaHandler(BaseHTTPRequestHandler):
+    """Serve MEDIA_SIZE bytes of synthetic media for any path."""
+
+    payload = bytes(range(256)) * (MEDIA_SIZE // 256)
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(self.payload)))
+        self.end_headers()
+        self.wfile.write(self.payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the benchmark output clean."""
+
+
+@pytest.fixture(scope="session")
+def media_server() -> Iterator[str]:
+    """Run a local HTTP server with synthetic media.
+
+    Yields:
+        Base URL of the server
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MediaHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class FakeYoutubeDL:
+    """Offline yt-dlp stand-in.
+
+    Metadata requests answer immediately; downloads stream the media from
+    the local server into the file named by the output template, calling
+    the progress hooks per chunk as yt-dlp does. Post-processing leaves the
+    file as it is.
+    """
+
+    base_url = ""
+
+    def __init__(self, options: Optional[Dict] = None):
+        self.options = options or {}
+
+    def __enter__(self) -> "FakeYoutubeDL":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def _info(self, url: str) -> Dict[str, Any]:
+        video_id = extract_video_id(url) or url.rsplit("/", 1)[-1]
+        return {"id": video_id, "title": f"Benchmark {video_id}", "ext": "mp4",
+                "extractor_key": "Youtube", "webpage_url": url}
+
+    def prepare_filename(self, info: Dict[str, Any]) -> str:
+        template = self.options.get("outtmpl", "%(title)s.{ext}")
+        return template.replace("%(title)s", info["title"]).replace("{ext}", info.get("ext", "mp4"))
+
+    def extract_info(self, url: str, download: bool = True, **kwargs) -> Dict[str, Any]:
+        info = self._info(url)
+        if not download:
+            return info
+
+        filepath = self.prepare_filename(info)
+        hooks = self.options.get("progress_hooks", [])
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        downloaded = 0
+        with urllib.request.urlopen(f"{self.base_url}/media/{info['id']}") as response, \
+                open(filepath, "wb") as f:
+            total = int(response.headers["Content-Length"])
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                downloaded += len(chunk)
+                for hook in hooks:
+                    hook({"status": "downloading", "downloaded_bytes": downloaded,
+                          "total_bytes": total, "filename": filepath,
+                          "_percent_str": f"{100 * downloaded / total:.1f}%"})
+        for hook in hooks:
+            hook({"status": "finished", "filename": filepath, "total_bytes": total})
+
+        info["requested_downloads"] = [{"filepath": filepath}]
+        return info
+
+    def post_process(self, filename: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the postprocessors, which only call the postprocessor hooks here."""
+        hooks = self.options.get("postprocessor_hooks", [])
+        for postprocessor in self.options.get("postprocessors", []):
+            for status in ("started", "finished"):
+                for hook in hooks:
+                    hook({"status": status, "postprocessor": postprocessor["key"], "info_dict": info})
+        return {**info, "filepath": filename}
+
+
+@pytest.fixture
+def offline_ytdlp(media_server: str) -> Iterator[type]:
+    """Replace yt-dlp with FakeYoutubeDL for the download and info modules.
+
+    Yields:
+        The FakeYoutubeDL class, bound to the local media server
+    """
+    fake = type("BoundFakeYoutubeDL", (FakeYoutubeDL,), {"base_url": media_server})
+    with patch("tea.downloader.YoutubeDL", fake), patch("tea.info.YoutubeDL", fake):
+        yield fake
+
+
+def _ffmpeg(*args: str) -> None:
+    """Run FFmpeg quietly, failing the fixture on errors."""
+    subprocess.run(["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", *args], check=True)
+
+
+@pytest.fixture(scope="session")
+def generated_media_seconds() -> int:
+    """Length in seconds of the media made by the generated_media fixture."""
+    return GENERATED_MEDIA_SECONDS
+
+
+@pytest.fixture(scope="session")
+def generated_media(tmp_path_factory: pytest.TempPathFactory) -> Dict[str, Path]:
+    """Generate an MP3 and an MP4 with FFmpeg's test sources.
+
+    Returns:
+        Dictionary with 'mp3' and 'mp4' paths
+    """
+    if shutil.which("ffmpeg") is None:
+        pytest.skip("FFmpeg is not installed")
+
+    media_dir = tmp_path_factory.mktemp("media")
+    duration = str(GENERATED_MEDIA_SECONDS)
+    mp3 = media_dir / "tone.mp3"
+    mp4 = media_dir / "testsrc.mp4"
+    _ffmpeg("-f", "lavfi", "-i", f"sine=frequency=440:duration={duration}",
+            "-b:a", "192k", str(mp3))
+    _ffmpeg("-f", "lavfi", "-i", f"testsrc=duration={duration}:size=640x360:rate=30",
+            "-f", "lavfi", "-i", f"sine=frequency=440:duration={duration}",
+            "-c:v", "libx264", "-preset", "ultrafast", "-c:a", "aac", "-shortest", str(mp4))
+    return {"mp3": mp3, "mp4": mp4}
+
+
+@pytest.fixture
+def make_history_file(tmp_path: Path) -> Callable[[int], Path]:
+    """Build history files with a given number of entries.
+
+    Returns:
+        Function taking an entry count and returning the history file path
+    """
+    def make(entries: int) -> Path:
+        history: Dict[str, List[Dict[str, str]]] = {}
+        start = datetime(2024, 1, 1)
+        for i in range(entries):
+            day = (start + timedelta(days=i // 100)).strftime("%Y-%m-%d")
+            history.setdefault(day, []).append({
+                "url": f"https://www.youtube.com/watch?v=h{i:010d}",
+                "title": f"History entry {i}",
+                "output_path": "downloads",
+                "timestamp": start.isoformat(),
+                "video_id": f"h{i:010d}",
+            })
+        path = tmp_path / f"history-{entries}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(history, f)
+        return path
+
+    return make
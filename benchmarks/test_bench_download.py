@@ -0,0 +1,56 @@
+"""
+Benchmarks for batch downloads through DownloadService.download.
+
+The whole pipeline runs (content type detection, scheduling, retries,
+progress hooks, history and archive writes); only yt-dlp is replaced by
+the offline stand-in from conftest.py.
+"""
+
+import shutil
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+from tea.config import ConfigManager
+from tea.downloader import DownloadService
+from tea.history import HistoryManager
+from tea.info import InfoExtractor
+from tea.progress import ProgressReporter
+
+# URLs per batch
+BATCH_SIZE = 24
+
+
+def _batch_urls() -> List[str]:
+    """Build a batch of distinct video URLs."""
+    return [f"https://www.youtube.com/watch?v=bench{i:06d}" for i in range(BATCH_SIZE)]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_batch_download_throughput(benchmark, offline_ytdlp, tmp_path: Path, workers: int):
+    """Benchmark downloading a batch of videos end to end."""
+    urls = _batch_urls()
+    run_dirs: List[Path] = []
+
+    def setup() -> Tuple[Tuple, Dict]:
+        run_dir = tmp_path / f"run-{len(run_dirs)}"
+        run_dirs.append(run_dir)
+        service = DownloadService(
+            config_manager=ConfigManager(config_path=str(run_dir / "config.json")),
+            history_manager=HistoryManager(history_path=str(run_dir / "history.json")),
+            info_extractor=InfoExtractor(),
+            progress_reporter=ProgressReporter(),
+        )
+        return (service,), {}
+
+    def run(service: DownloadService) -> List[Dict]:
+        results = service.download(urls, output_path=str(run_dirs[-1] / "out"), max_workers=workers)
+        # Keep disk usage flat across rounds
+        shutil.rmtree(run_dirs[-1] / "out")
+        return results
+
+    results = benchmark.pedantic(run, setup=setup, rounds=5)
+    benchmark.extra_info["videos"] = BATCH_SIZE
+    assert len(results) == BATCH_SIZE
+    assert all(result["success"] for result in results)
@@ -0,0 +1,46 @@
+"""
+Benchmarks for splitting media with FFmpegService.
+
+Media is generated by FFmpeg (see the generated_media fixture), so these
+benchmarks are skipped when FFmpeg is not installed.
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from tea.ffmpeg import FFmpegService
+
+# Clips cut from the generated media in each round
+CLIP_COUNT = 6
+
+
+def _timestamps(seconds: int, clips: int) -> List[Dict[str, str]]:
+    """Split a duration into equal clips."""
+    length = seconds // clips
+    return [
+        {
+            'start': f"{(i * length) // 60}:{(i * length) % 60:02d}",
+            'end': f"{((i + 1) * length) // 60}:{((i + 1) * length) % 60:02d}",
+            'title': f"Clip {i + 1}",
+        }
+        for i in range(clips)
+    ]
+
+
+@pytest.mark.parametrize("kind,audio_only", [("mp3", True), ("mp4", False)])
+def test_split_throughput(benchmark, generated_media: Dict[str, Path], generated_media_seconds: int,
+                          tmp_path: Path, kind: str, audio_only: bool):
+    """Benchmark splitting generated media into clips."""
+    service = FFmpegService()
+    timestamps = _timestamps(generated_media_seconds, CLIP_COUNT)
+
+    results = benchmark.pedantic(
+        service.split_video_by_timestamps,
+        args=(str(generated_media[kind]), timestamps, str(tmp_path / kind)),
+        kwargs={'audio_only': audio_only, 'video_title': 'Benchmark'},
+        rounds=3,
+    )
+    benchmark.extra_info["clips"] = CLIP_COUNT
+    assert [result['success'] for result in results] == [True] * CLIP_COUNT
@@ -0,0 +1,33 @@
+"""
+Benchmarks for the regex fallback of FilenameCleaner.
+
+The fallback is the whole cost of cleaning titles offline, so it is
+measured over a corpus of real playlist titles.
+"""
+
+from typing import List
+
+import pytest
+
+from tea.ai.filename_cleaner import FilenameCleaner
+
+# Each round cleans the corpus this many times to smooth out timer noise
+CORPUS_REPEAT = 20
+
+
+@pytest.fixture
+def cleaner() -> FilenameCleaner:
+    """Create a FilenameCleaner that never reaches the API."""
+    return FilenameCleaner(api_key="benchmark-key")
+
+
+def test_regex_clean_corpus(benchmark, cleaner: FilenameCleaner, title_corpus: List[str]):
+    """Benchmark regex cleaning of every title in the corpus."""
+    titles = title_corpus * CORPUS_REPEAT
+
+    def clean_all() -> List[str]:
+        return [cleaner._regex_clean(title) for title in titles]
+
+    cleaned = benchmark(clean_all)
+    assert len(cleaned) == len(titles)
+    assert all(cleaned)
@@ -0,0 +1,55 @@
+"""
+Benchmarks for download history lookups.
+
+Duplicate detection checks every URL of a batch against the history, so
+lookups are measured at history sizes heavy users actually reach.
+"""
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from tea.history import HistoryManager
+
+
+@pytest.mark.parametrize("entries", [10_000, 100_000])
+def test_history_load(benchmark, make_history_file: Callable[[int], Path], entries: int):
+    """Benchmark reading a history file from disk."""
+    path = make_history_file(entries)
+
+    def load() -> int:
+        history = HistoryManager(history_path=str(path))
+        return sum(len(downloads) for downloads in history.load().values())
+
+    assert benchmark(load) == entries
+
+
+@pytest.mark.parametrize("entries", [10_000, 100_000])
+def test_is_downloaded_miss(benchmark, make_history_file: Callable[[int], Path], entries: int):
+    """Benchmark the worst case: a URL that is not in the history."""
+    history = HistoryManager(history_path=str(make_history_file(entries)))
+    history.load()
+
+    downloaded, _ = benchmark(history.is_downloaded, "https://youtu.be/notInThere")
+    assert downloaded is False
+
+
+@pytest.mark.parametrize("entries", [10_000, 100_000])
+def test_is_downloaded_hit(benchmark, make_history_file: Callable[[int], Path], entries: int):
+    """Benchmark finding a URL in the middle of the history."""
+    history = HistoryManager(history_path=str(make_history_file(entries)))
+    history.load()
+    url = f"https://youtu.be/h{entries // 2:010d}"
+
+    downloaded, _ = benchmark(history.is_downloaded, url)
+    assert downloaded is True
+
+
+@pytest.mark.parametrize("entries", [10_000, 100_000])
+def test_find_file_miss(benchmark, make_history_file: Callable[[int], Path], entries: int):
+    """Benchmark the local-copy lookup made for every video of a sync."""
+    history = HistoryManager(history_path=str(make_history_file(entries)))
+    history.load()
+
+    assert benchmark(history.find_file, "notInThere0") is None
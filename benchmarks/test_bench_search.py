@@ -0,0 +1,44 @@
+"""
+Benchmarks for ranking search results.
+
+Results are built from the title corpus, so fuzzy matching sees realistic
+titles, and ranked offline.
+"""
+
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from tea.search import YouTubeSearchService, score_results
+
+QUERY = "rick astley never gonna give you up official"
+
+
+@pytest.fixture
+def search_results(title_corpus: List[str]) -> List[Dict]:
+    """Build search results from the title corpus."""
+    return [
+        {
+            'title': title,
+            'uploader': f"Channel {i % 7}",
+            'view_count': 10 ** (i % 9),
+            'duration': 180 + i,
+            'id': f"id{i:09d}",
+        }
+        for i, title in enumerate(title_corpus)
+    ]
+
+
+def test_score_results(benchmark, search_results: List[Dict]):
+    """Benchmark scoring one page of results."""
+    scores = benchmark(score_results, QUERY, search_results)
+    assert len(scores) == len(search_results)
+
+
+def test_rank_results(benchmark, search_results: List[Dict]):
+    """Benchmark ranking through the search service."""
+    service = YouTubeSearchService(config_manager=MagicMock(**{'get.return_value': 70}))
+
+    ranked = benchmark(service._rank_results, QUERY, search_results)
+    assert ranked[0]['title'].startswith("Rick Astley")
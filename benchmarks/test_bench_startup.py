@@ -0,0 +1,28 @@
+"""
+Benchmarks for CLI startup.
+
+Each round starts a fresh interpreter, the way every ``tea`` command does.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.mark.parametrize("command", [
+    ["-c", "import tea.cli"],
+    ["tea.py", "--help"],
+    ["tea.py", "download", "--help"],
+], ids=["import", "help", "download-help"])
+def test_cli_startup(benchmark, command):
+    """Benchmark starting Tea in a new process."""
+    def start() -> int:
+        return subprocess.run(
+            [sys.executable, *command], cwd=PROJECT_ROOT, capture_output=True, timeout=60
+        ).returncode
+
+    assert benchmark.pedantic(start, rounds=5, warmup_rounds=1) == 0
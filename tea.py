@@ -13,28 +13,17 @@ import sys
 
 # Import tea CLI module
 try:
-    from tea.cli import CLI
-    from tea.logger import setup_logger
+    from tea.cli import main as cli_main
 except ImportError as e:
     print(f"[ERROR] Failed to import Tea modules: {e}")
     print("[ERROR] Make sure you're running from the correct directory")
     sys.exit(1)
 
 
-def main():
+def main() -> int:
     """Main entry point for Tea application."""
-    logger = setup_logger('tea')
-    cli = CLI(logger=logger)
-
-    try:
-        cli.run()
-    except KeyboardInterrupt:
-        logger.info("\nDownload cancelled by user")
-        sys.exit(0)
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        raise
+    return cli_main()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -6,6 +6,7 @@ Provides AI-powered features for the Tea YouTube downloader.
 
 __version__ = '1.0.0'
 
+from .client import AIClientError, OpenRouterClient, TokenBucket, get_client
 from .filename_cleaner import FilenameCleaner
 
-__all__ = ['FilenameCleaner']
+__all__ = ['AIClientError', 'FilenameCleaner', 'OpenRouterClient', 'TokenBucket', 'get_client']
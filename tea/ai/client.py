@@ -0,0 +1,390 @@
+"""
+Shared OpenRouter client for Tea YouTube Downloader.
+
+Both AI features (filename cleaning and search query enhancement) talk to
+the same OpenRouter endpoint with the same API key. This module gives them
+one client per key with keep-alive connection pooling, a single token-bucket
+rate limiter and response-time metrics.
+"""
+
+import http.client
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+from urllib.parse import urlparse
+
+from tea.constants import (
+    OPENROUTER_API_URL as API_URL,
+    OPENROUTER_MODEL as MODEL,
+    AI_MAX_DAILY_REQUESTS as MAX_DAILY_REQUESTS,
+    AI_MIN_REQUEST_INTERVAL as MIN_REQUEST_INTERVAL,
+)
+
+BURST_REQUESTS = 1  # requests allowed back-to-back before pacing kicks in
+
+# Connection pooling
+MAX_POOL_CONNECTIONS = 4
+DEFAULT_TIMEOUT = 10
+
+REQUEST_HEADERS = {
+    'Content-Type': 'application/json',
+    'HTTP-Referer': 'https://github.com/yourusername/tea',
+    'X-Title': 'Tea YouTube Downloader',
+    'Connection': 'keep-alive',
+}
+
+
+class AIClientError(Exception):
+    """Raised when an OpenRouter request fails or returns an unusable response."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter with a daily request cap.
+
+    Tokens refill continuously at one per ``interval`` seconds up to
+    ``capacity``. Each request consumes one token and counts toward the
+    daily cap.
+    """
+
+    def __init__(
+        self,
+        interval: float = MIN_REQUEST_INTERVAL,
+        capacity: int = BURST_REQUESTS,
+        daily_limit: int = MAX_DAILY_REQUESTS
+    ):
+        """
+        Initialize TokenBucket.
+
+        Args:
+            interval: Seconds needed to refill one token
+            capacity: Maximum number of stored tokens
+            daily_limit: Maximum number of requests per calendar day
+        """
+        self.interval = interval
+        self.capacity = capacity
+        self.daily_limit = daily_limit
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._daily_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last update."""
+        if self.interval > 0:
+            self._tokens = min(
+                float(self.capacity),
+                self._tokens + (now - self._updated) / self.interval
+            )
+        else:
+            self._tokens = float(self.capacity)
+        self._updated = now
+
+    def remaining_today(self) -> int:
+        """
+        Get the number of requests left under the daily cap.
+
+        Returns:
+            Number of remaining requests for today
+        """
+        today = datetime.now().strftime('%Y-%m-%d')
+        with self._lock:
+            return max(0, self.daily_limit - self._daily_counts.get(today, 0))
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Take a token, optionally waiting for one to become available.
+
+        Args:
+            blocking: Wait for a token instead of failing immediately
+            timeout: Maximum seconds to wait when blocking (None waits as needed)
+
+        Returns:
+            True if a token was taken, False if rate or daily limits prevent it
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                today = datetime.now().strftime('%Y-%m-%d')
+                if self._daily_counts.get(today, 0) >= self.daily_limit:
+                    return False
+
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._daily_counts = {today: self._daily_counts.get(today, 0) + 1}
+                    return True
+
+                wait = (1 - self._tokens) * self.interval
+
+            if not blocking:
+                return False
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class OpenRouterClient:
+    """
+    Pooled HTTP/1.1 client for the OpenRouter chat completions API.
+
+    Connections are kept alive and reused across requests and threads, all
+    requests made with the same API key share one ``TokenBucket``, and
+    response times are recorded for ``get_metrics``.
+
+    Use ``get_client`` to obtain the shared instance for an API key.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = API_URL,
+        model: str = MODEL,
+        limiter: Optional[TokenBucket] = None,
+        max_connections: int = MAX_POOL_CONNECTIONS
+    ):
+        """
+        Initialize OpenRouterClient.
+
+        Args:
+            api_key: OpenRouter API key
+            api_url: Chat completions endpoint URL
+            model: Model identifier used for completions
+            limiter: Rate limiter shared by all users of this key
+            max_connections: Maximum number of idle connections kept open
+        """
+        if not api_key or not isinstance(api_key, str):
+            raise ValueError("API key must be a non-empty string")
+
+        self.api_key = api_key.strip()
+        self.model = model
+        self.limiter = limiter or TokenBucket()
+
+        parsed = urlparse(api_url)
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname or ''
+        self._port = parsed.port
+        self._path = parsed.path or '/'
+        self._max_connections = max_connections
+        self._idle: Deque[http.client.HTTPConnection] = deque()
+        self._pool_lock = threading.Lock()
+
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[str, float] = {
+            'requests': 0,
+            'errors': 0,
+            'rate_limited': 0,
+            'connections_opened': 0,
+            'connections_reused': 0,
+            'total_response_time': 0.0,
+            'max_response_time': 0.0,
+            'last_response_time': 0.0,
+        }
+
+    # Connection pool
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        """Open a new connection to the API host."""
+        self._record('connections_opened')
+        if self._scheme == 'http':
+            return http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+        return http.client.HTTPSConnection(self._host, self._port, timeout=timeout)
+
+    def _checkout(self, timeout: float) -> http.client.HTTPConnection:
+        """Take an idle connection from the pool or open a new one."""
+        with self._pool_lock:
+            connection = self._idle.pop() if self._idle else None
+
+        if connection is None:
+            return self._new_connection(timeout)
+
+        self._record('connections_reused')
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection
+
+    def _checkin(self, connection: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._pool_lock:
+            if len(self._idle) < self._max_connections:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._pool_lock:
+            while self._idle:
+                self._idle.pop().close()
+
+    # Requests
+
+    def _post(self, body: bytes, timeout: float) -> Dict[str, Any]:
+        """
+        POST a JSON body over a pooled connection.
+
+        A reused connection that the server has already closed is retried
+        once on a fresh connection.
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            AIClientError: On network errors, HTTP errors or invalid JSON
+        """
+        headers = dict(REQUEST_HEADERS)
+        headers['Authorization'] = f'Bearer {self.api_key}'
+
+        for attempt in range(2):
+            connection = self._checkout(timeout)
+            reused = connection.sock is not None
+            try:
+                connection.request('POST', self._path, body=body, headers=headers)
+                response = connection.getresponse()
+                payload = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                raise AIClientError(f"Connection error: {e}") from e
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                raise AIClientError(f"Request failed: {e}") from e
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._checkin(connection)
+
+            if response.status >= 400:
+                raise AIClientError(f"HTTP {response.status}: {response.reason}")
+
+            try:
+                return json.loads(payload.decode('utf-8'))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise AIClientError(f"Malformed response: {e}") from e
+
+        raise AIClientError("Connection closed by server")
+
+    def complete(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 100,
+        temperature: float = 0.3,
+        timeout: float = DEFAULT_TIMEOUT,
+        wait: bool = True
+    ) -> Optional[str]:
+        """
+        Request a chat completion and return the stripped message content.
+
+        Args:
+            messages: Chat messages in OpenAI format
+            max_tokens: Maximum tokens in the completion
+            temperature: Sampling temperature
+            timeout: Socket timeout in seconds
+            wait: Wait for the rate limiter instead of giving up immediately
+
+        Returns:
+            Completion text, or None if the rate limiter refused the request
+
+        Raises:
+            AIClientError: If the request fails or the response is malformed
+        """
+        if not self.limiter.acquire(blocking=wait):
+            self._record('rate_limited')
+            return None
+
+        data = {
+            'model': self.model,
+            'messages': messages,
+            'max_tokens': max_tokens,
+            'temperature': temperature,
+        }
+        body = json.dumps(data).encode('utf-8')
+
+        start = time.perf_counter()
+        try:
+            response_data = self._post(body, timeout)
+            content = response_data['choices'][0]['message']['content']
+        except AIClientError:
+            self._record('errors')
+            raise
+        except (KeyError, IndexError, TypeError) as e:
+            self._record('errors')
+            raise AIClientError(f"Unexpected response format: {e}") from e
+        finally:
+            self._record_response_time(time.perf_counter() - start)
+
+        return str(content).strip()
+
+    def remaining_requests(self) -> int:
+        """
+        Get the number of requests left today for this API key.
+
+        Returns:
+            Number of remaining requests
+        """
+        return self.limiter.remaining_today()
+
+    # Metrics
+
+    def _record(self, key: str) -> None:
+        """Increment a counter metric."""
+        with self._metrics_lock:
+            self._metrics[key] += 1
+
+    def _record_response_time(self, elapsed: float) -> None:
+        """Record the duration of a completed or failed request."""
+        with self._metrics_lock:
+            self._metrics['requests'] += 1
+            self._metrics['total_response_time'] += elapsed
+            self._metrics['last_response_time'] = elapsed
+            self._metrics['max_response_time'] = max(self._metrics['max_response_time'], elapsed)
+
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Get request counters and response-time statistics.
+
+        Returns:
+            Dictionary of metrics including 'avg_response_time'
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        requests = metrics['requests']
+        metrics['avg_response_time'] = metrics['total_response_time'] / requests if requests else 0.0
+        return metrics
+
+
+_clients: Dict[str, OpenRouterClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(api_key: str) -> OpenRouterClient:
+    """
+    Get the shared OpenRouterClient for an API key.
+
+    Args:
+        api_key: OpenRouter API key
+
+    Returns:
+        Client shared by every caller using the same key
+    """
+    if not api_key or not isinstance(api_key, str):
+        raise ValueError("API key must be a non-empty string")
+
+    key = api_key.strip()
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = OpenRouterClient(key)
+            _clients[key] = client
+        return client
@@ -6,13 +6,89 @@ with regex-based fallback for when AI is unavailable.
 """
 
 import re
-import json
-import time
-from typing import Optional, Dict
-from datetime import datetime
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from typing import Optional
+
+from .client import AIClientError, get_client
+from tea.constants import (
+    OPENROUTER_API_URL,
+    OPENROUTER_MODEL,
+    AI_MAX_DAILY_REQUESTS,
+    AI_MIN_REQUEST_INTERVAL,
+)
+
+
+# Bracketed junk tags removed wherever they appear in a title
+_BRACKETED_OFFICIAL_VIDEO_RE = re.compile(
+    r'\s+(?:\(Official Video\)|\[Official Video\])', re.IGNORECASE)
+_BRACKETED_OFFICIAL_MUSIC_VIDEO_RE = re.compile(
+    r'\s+(?:\(Official Music Video\)|\[Official Music Video\])', re.IGNORECASE)
+
+# Junk tags only removed from the end of a title, in the order they are tried
+_TRAILING_JUNK = [
+    r'Official Video',
+    r'Official Music Video',
+    r'\(MV\)', r'\[MV\]', r'MV',
+    r'\(HD\)', r'\[HD\]', r'HD',
+    r'\(4K\)', r'\[4K\]', r'4K',
+    r'\(Remastered\)', r'\[Remastered\]', r'Remastered',
+    r'\(Lyrics\)', r'\[Lyrics\]', r'Lyrics',
+    r'\(Audio\)', r'\[Audio\]', r'Audio',
+    r'\(Official\)', r'\[Official\]', r'Official',
+]
+_TRAILING_JUNK_RE = re.compile(
+    r'\s+(?:' + '|'.join(f'(?P<j{i}>{phrase})' for i, phrase in enumerate(_TRAILING_JUNK)) + r')\s*$',
+    re.IGNORECASE,
+)
+# Lowercase spellings of the trailing tags, for a cheap pre-check on ASCII titles
+_TRAILING_JUNK_SUFFIXES = tuple(phrase.replace('\\', '').lower() for phrase in _TRAILING_JUNK)
+_TRAILING_JUNK_MAX_LENGTH = max(len(suffix) for suffix in _TRAILING_JUNK_SUFFIXES)
+
+_FEAT_RE = re.compile(r'\s+[\[\(]?feat\.?\s.*?[\]\)]?$', re.IGNORECASE)
+_FT_RE = re.compile(r'\s+[\[\(]?ft\.?\s.*?[\]\)]?$', re.IGNORECASE)
+
+_EMOJI_RE = re.compile(
+    '['
+    '\U0001F600-\U0001F64F'  # Emoticons
+    '\U0001F300-\U0001F5FF'  # Symbols & pictographs
+    '\U0001F680-\U0001F6FF'  # Transport & map
+    '\U0001F1E0-\U0001F1FF'  # Flags
+    '\U00002702-\U000027B0'  # Dingbats
+    '\U000024C2-\U0001F251'  # Enclosed characters
+    ']'
+)
+
+_SEPARATOR_RUN_RE = re.compile(r'(?:[^\w\s\-]|\s)+')
+
+
+def _strip_trailing_junk(title: str, first: int, stop: int) -> str:
+    """
+    Strip trailing junk tags ``_TRAILING_JUNK[first:stop]`` from a title.
+
+    Each tag is tried once, in order, so a tag uncovered by stripping a
+    later one is kept.
+
+    Args:
+        title: The title to clean
+        first: Index of the first tag to try
+        stop: Index one past the last tag to try
+
+    Returns:
+        Title with trailing junk tags removed
+    """
+    position = first
+    while position < stop:
+        tail = title.rstrip()[-_TRAILING_JUNK_MAX_LENGTH:]
+        if tail.isascii() and not tail.lower().endswith(_TRAILING_JUNK_SUFFIXES):
+            break
+        match = _TRAILING_JUNK_RE.search(title)
+        if not match:
+            break
+        index = int(match.lastgroup[1:])
+        if index < position or index >= stop:
+            break
+        title = title[:match.start()]
+        position = index + 1
+    return title
 
 
 class FilenameCleaner:
@@ -24,12 +100,12 @@ class FilenameCleaner:
     """
 
     # OpenRouter API configuration
-    API_URL = "https://openrouter.ai/api/v1/chat/completions"
-    MODEL = "qwen/qwen-2.5-coder-32b-instruct:free"
+    API_URL = OPENROUTER_API_URL
+    MODEL = OPENROUTER_MODEL
 
-    # Rate limiting (free tier limits)
-    MAX_DAILY_REQUESTS = 50
-    MIN_REQUEST_INTERVAL = 3.0  # seconds between requests (20 req/min limit)
+    # Rate limiting (free tier limits, enforced by the shared client)
+    MAX_DAILY_REQUESTS = AI_MAX_DAILY_REQUESTS
+    MIN_REQUEST_INTERVAL = AI_MIN_REQUEST_INTERVAL
 
     # Dangerous patterns to validate against
     DANGEROUS_PATTERNS = [
@@ -53,73 +129,32 @@ class FilenameCleaner:
             raise ValueError("API key must be a non-empty string")
 
         self.api_key = api_key.strip()
-        self.request_history: Dict[str, int] = {}
-        self.last_request_time: float = 0
-
-    def _can_make_request(self) -> bool:
-        """
-        Check if we can make an API request based on rate limits.
-
-        Returns:
-            True if request can be made, False otherwise
-        """
-        today = datetime.now().strftime('%Y-%m-%d')
-
-        # Check daily limit
-        daily_count = self.request_history.get(today, 0)
-        if daily_count >= self.MAX_DAILY_REQUESTS:
-            return False
-
-        # Check minimum interval between requests
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.MIN_REQUEST_INTERVAL:
-            return False
-
-        return True
-
-    def _record_request(self) -> None:
-        """Record that a request was made."""
-        today = datetime.now().strftime('%Y-%m-%d')
-        self.request_history[today] = self.request_history.get(today, 0) + 1
-        self.last_request_time = time.time()
+        self._client = get_client(self.api_key)
 
     def get_remaining_requests(self) -> int:
         """
         Get the number of remaining API requests for today.
 
+        The quota is shared with every other user of the same API key.
+
         Returns:
             Number of remaining requests (0-50)
         """
-        today = datetime.now().strftime('%Y-%m-%d')
-        return max(0, self.MAX_DAILY_REQUESTS - self.request_history.get(today, 0))
+        return self._client.remaining_requests()
 
     def _ai_clean(self, title: str) -> Optional[str]:
         """
         Clean a title using the OpenRouter API.
 
+        Does not wait for the rate limiter; when no request slot is free the
+        caller falls back to regex cleaning.
+
         Args:
             title: The title to clean
 
         Returns:
             Cleaned title, or None if API call failed
         """
-        # Check rate limits
-        if not self._can_make_request():
-            return None
-
-        # Wait for minimum interval
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.MIN_REQUEST_INTERVAL:
-            time.sleep(self.MIN_REQUEST_INTERVAL - time_since_last)
-
-        # Prepare request
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json',
-            'HTTP-Referer': 'https://github.com/yourusername/tea',
-            'X-Title': 'Tea YouTube Downloader',
-        }
-
         prompt = f"""Clean this YouTube video title for use as a filename.
 
 Rules:
@@ -134,54 +169,28 @@ Original title: {title}
 
 Cleaned title:"""
 
-        data = {
-            'model': self.MODEL,
-            'messages': [
-                {
-                    'role': 'system',
-                    'content': 'You are a helpful assistant that cleans video titles for filenames. Output only the cleaned title, no explanations.'
-                },
-                {
-                    'role': 'user',
-                    'content': prompt
-                }
-            ],
-            'max_tokens': 100,
-            'temperature': 0.3,
-        }
+        messages = [
+            {
+                'role': 'system',
+                'content': 'You are a helpful assistant that cleans video titles for filenames. Output only the cleaned title, no explanations.'
+            },
+            {
+                'role': 'user',
+                'content': prompt
+            }
+        ]
 
         try:
-            # Make request with timeout
-            req = Request(
-                self.API_URL,
-                data=json.dumps(data).encode('utf-8'),
-                headers=headers,
-                method='POST'
-            )
-
-            with urlopen(req, timeout=10) as response:
-                response_data = json.loads(response.read().decode('utf-8'))
-
-                # Extract the cleaned title
-                if 'choices' in response_data and len(response_data['choices']) > 0:
-                    cleaned = response_data['choices'][0]['message']['content'].strip()
-
-                    # Validate the response
-                    if self._validate_ai_output(cleaned):
-                        self._record_request()
-                        return cleaned
-
+            cleaned = self._client.complete(messages, max_tokens=100, temperature=0.3, wait=False)
+        except AIClientError:
+            # Network, API or malformed response error
             return None
 
-        except (URLError, HTTPError) as e:
-            # Network or API error
-            return None
-        except (json.JSONDecodeError, KeyError, IndexError):
-            # Malformed response
-            return None
-        except Exception:
-            # Any other error
-            return None
+        # Validate the response
+        if cleaned and self._validate_ai_output(cleaned):
+            return cleaned
+
+        return None
 
     def _validate_ai_output(self, output: str) -> bool:
         """
@@ -224,58 +233,23 @@ Cleaned title:"""
         if not title or not isinstance(title, str):
             return 'Untitled'
 
-        # Remove common junk phrases (more specific patterns to avoid over-matching)
-        junk_phrases = [
-            r'\s+\(Official Video\)',
-            r'\s+\[Official Video\]',
-            r'\s+Official Video\s*$',
-            r'\s+\(Official Music Video\)',
-            r'\s+\[Official Music Video\]',
-            r'\s+Official Music Video\s*$',
-            r'\s+\(MV\)\s*$',
-            r'\s+\[MV\]\s*$',
-            r'\s+MV\s*$',
-            r'\s+\(HD\)\s*$',
-            r'\s+\[HD\]\s*$',
-            r'\s+HD\s*$',
-            r'\s+\(4K\)\s*$',
-            r'\s+\[4K\]\s*$',
-            r'\s+4K\s*$',
-            r'\s+\(Remastered\)\s*$',
-            r'\s+\[Remastered\]\s*$',
-            r'\s+Remastered\s*$',
-            r'\s+\(Lyrics\)\s*$',
-            r'\s+\[Lyrics\]\s*$',
-            r'\s+Lyrics\s*$',
-            r'\s+\(Audio\)\s*$',
-            r'\s+\[Audio\]\s*$',
-            r'\s+Audio\s*$',
-            r'\s+\(Official\)\s*$',
-            r'\s+\[Official\]\s*$',
-            r'\s+Official\s*$',
-        ]
-
-        for phrase in junk_phrases:
-            title = re.sub(phrase, '', title, flags=re.IGNORECASE)
+        # Remove common junk phrases. Bracketed video tags go wherever they
+        # appear; trailing tags are each stripped at most once, in order.
+        title = _BRACKETED_OFFICIAL_VIDEO_RE.sub('', title)
+        title = _strip_trailing_junk(title, 0, 1)
+        title = _BRACKETED_OFFICIAL_MUSIC_VIDEO_RE.sub('', title)
+        title = _strip_trailing_junk(title, 1, len(_TRAILING_JUNK))
 
         # Remove "feat." or "ft." from end
-        title = re.sub(r'\s+[\[\(]?feat\.?\s.*?[\]\)]?$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s+[\[\(]?ft\.?\s.*?[\]\)]?$', '', title, flags=re.IGNORECASE)
+        title = _FEAT_RE.sub('', title)
+        title = _FT_RE.sub('', title)
 
         # Remove emojis and special characters (keep basic punctuation)
-        # Replace common unicode ranges with space
-        title = re.sub(r'[\U0001F600-\U0001F64F]', '', title)  # Emoticons
-        title = re.sub(r'[\U0001F300-\U0001F5FF]', '', title)  # Symbols & pictographs
-        title = re.sub(r'[\U0001F680-\U0001F6FF]', '', title)  # Transport & map
-        title = re.sub(r'[\U0001F1E0-\U0001F1FF]', '', title)  # Flags
-        title = re.sub(r'[\U00002702-\U000027B0]', '', title)  # Dingbats
-        title = re.sub(r'[\U000024C2-\U0001F251]', '', title)  # Enclosed characters
-
-        # Remove special characters but keep letters, numbers, hyphens, and basic punctuation
-        title = re.sub(r'[^\w\s\-]', ' ', title)
-
-        # Replace multiple spaces with single space
-        title = re.sub(r'\s+', ' ', title)
+        title = _EMOJI_RE.sub('', title)
+
+        # Replace special characters and whitespace runs with a single space,
+        # keeping letters, numbers and hyphens
+        title = _SEPARATOR_RUN_RE.sub(' ', title)
 
         # Remove leading/trailing whitespace and limit length
         title = title.strip()[:100]
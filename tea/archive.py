@@ -0,0 +1,200 @@
+"""
+Download archive for Tea YouTube Downloader.
+
+The archive records the ID of every video Tea has downloaded, one
+``<extractor> <id>`` line per video (the same format as yt-dlp's
+``--download-archive``, so the file can be shared with it). Lines are only
+ever appended, and the IDs are kept in a set once loaded, so lookups stay
+cheap for archives with hundreds of thousands of entries.
+
+Next to the archive, a small JSON file keeps a high-water mark per channel
+or playlist (the newest video downloaded by the last sync). Stopping early
+is decided by the archive itself: ``tea download --sync`` stops as soon as
+it reaches videos it already has.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+# Import from tea modules
+try:
+    from tea.constants import ARCHIVE_DEFAULT_EXTRACTOR
+except ImportError:
+    # Fallback for development
+    from tea.constants import ARCHIVE_DEFAULT_EXTRACTOR
+
+
+class DownloadArchive:
+    """Append-only index of downloaded video IDs plus per-channel sync marks.
+
+    Attributes:
+        _archive_path: Path to the archive text file
+        _state_path: Path to the JSON file with per-channel high-water marks
+        _ids: Loaded ``<extractor> <id>`` keys (None until first use)
+        _logger: Logger instance for logging
+    """
+
+    def __init__(self, archive_path: str, state_path: str, logger=None):
+        """Initialize DownloadArchive.
+
+        Args:
+            archive_path: Path to the archive text file
+            state_path: Path to the JSON file with per-channel high-water marks
+            logger: Optional logger instance for logging operations.
+        """
+        self._archive_path = archive_path
+        self._state_path = state_path
+        self._logger = logger
+        self._ids: Optional[Set[str]] = None
+        self._state: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def archive_path(self) -> str:
+        """Get path to the archive file."""
+        return self._archive_path
+
+    @staticmethod
+    def _key(video_id: str, extractor: Optional[str]) -> str:
+        """Build the archive key for a video."""
+        return f"{(extractor or ARCHIVE_DEFAULT_EXTRACTOR).lower()} {video_id}"
+
+    def _load_ids(self) -> Set[str]:
+        """Read the archive file once (lock held)."""
+        if self._ids is None:
+            self._ids = set()
+            try:
+                with open(self._archive_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            self._ids.add(line)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                if self._logger:
+                    self._logger.warning(f"Error loading download archive: {e}")
+        return self._ids
+
+    def __len__(self) -> int:
+        """Number of archived videos."""
+        with self._lock:
+            return len(self._load_ids())
+
+    def contains(self, video_id: str, extractor: Optional[str] = None) -> bool:
+        """
+        Check if a video is archived.
+
+        Args:
+            video_id: Video ID as reported by yt-dlp
+            extractor: Extractor key (default: youtube)
+
+        Returns:
+            True if the video was downloaded before
+        """
+        with self._lock:
+            return self._key(video_id, extractor) in self._load_ids()
+
+    def add(self, video_id: str, extractor: Optional[str] = None) -> bool:
+        """
+        Record a downloaded video.
+
+        Args:
+            video_id: Video ID as reported by yt-dlp
+            extractor: Extractor key (default: youtube)
+
+        Returns:
+            True if the video was new to the archive
+        """
+        key = self._key(video_id, extractor)
+        with self._lock:
+            ids = self._load_ids()
+            if key in ids:
+                return False
+            try:
+                with open(self._archive_path, 'a', encoding='utf-8') as f:
+                    f.write(key + '\n')
+            except OSError as e:
+                if self._logger:
+                    self._logger.warning(f"Could not write to download archive: {e}")
+                return False
+            ids.add(key)
+            return True
+
+    # Sync state
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """Read the sync state file once (lock held)."""
+        if self._state is None:
+            try:
+                with open(self._state_path, 'r', encoding='utf-8') as f:
+                    self._state = json.load(f)
+                if not isinstance(self._state, dict):
+                    self._state = {}
+            except FileNotFoundError:
+                self._state = {}
+            except (OSError, json.JSONDecodeError) as e:
+                if self._logger:
+                    self._logger.warning(f"Error loading sync state: {e}")
+                self._state = {}
+        return self._state
+
+    def get_mark(self, source: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the high-water mark of a channel or playlist.
+
+        Args:
+            source: Channel/playlist ID or URL
+
+        Returns:
+            Dictionary with 'latest_id', 'latest_upload_date', 'synced_at'
+            and 'count', or None if never synced
+        """
+        with self._lock:
+            mark = self._load_state().get(source)
+            return dict(mark) if mark else None
+
+    def set_mark(
+        self,
+        source: str,
+        latest_id: Optional[str],
+        latest_upload_date: Optional[str] = None,
+        count: int = 0
+    ) -> bool:
+        """
+        Store the high-water mark of a channel or playlist after a sync.
+
+        Args:
+            source: Channel/playlist ID or URL
+            latest_id: ID of the newest video downloaded
+            latest_upload_date: Upload date (YYYYMMDD) of the newest video downloaded
+            count: Videos downloaded by this sync
+
+        Returns:
+            True if saved successfully
+        """
+        with self._lock:
+            state = self._load_state()
+            previous = state.get(source, {})
+            state[source] = {
+                'latest_id': latest_id or previous.get('latest_id'),
+                'latest_upload_date': max(
+                    filter(None, (latest_upload_date, previous.get('latest_upload_date'))),
+                    default=None,
+                ),
+                'synced_at': datetime.now().isoformat(),
+                'count': count,
+            }
+            try:
+                tmp_path = self._state_path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self._state_path)
+                return True
+            except OSError as e:
+                if self._logger:
+                    self._logger.warning(f"Could not save sync state: {e}")
+                return False
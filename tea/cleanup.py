@@ -0,0 +1,284 @@
+"""
+Cleanup of interrupted downloads for Tea YouTube Downloader.
+
+``tea cleanup`` removes the leftovers of interrupted downloads (``.part``
+files, fragments, ``.ytdl`` state) from a download directory in a single
+``os.scandir`` pass, matching every CLEANUP_PATTERNS entry at once.
+
+Files that may still be written are left alone:
+
+- A running download keeps a lock file (``.tea-download-<pid>.lock``) in
+  its output directory; nothing below a directory with the lock file of a
+  live process is removed.
+- Files modified within the last ``min_age`` seconds are skipped, which
+  also covers downloads by other tools or on other machines.
+"""
+
+import fnmatch
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Import from tea modules
+try:
+    from tea.constants import (
+        CLEANUP_PATTERNS,
+        CLEANUP_MIN_AGE,
+        CLEANUP_COMPLETE_EXTENSIONS,
+        DOWNLOAD_LOCK_PREFIX,
+        DOWNLOAD_LOCK_SUFFIX,
+    )
+except ImportError:
+    # Fallback for development
+    from tea.constants import (
+        CLEANUP_PATTERNS,
+        CLEANUP_MIN_AGE,
+        CLEANUP_COMPLETE_EXTENSIONS,
+        DOWNLOAD_LOCK_PREFIX,
+        DOWNLOAD_LOCK_SUFFIX,
+    )
+
+
+def _compile_patterns(patterns: Tuple[str, ...]) -> 're.Pattern[str]':
+    """Combine shell patterns into one regex, matched against normcased names."""
+    return re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
+_LOCK_PATTERN = re.compile(
+    re.escape(DOWNLOAD_LOCK_PREFIX) + r'(\d+)' + re.escape(DOWNLOAD_LOCK_SUFFIX) + r'\Z'
+)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process is running."""
+    if pid <= 0:
+        return False
+    if os.name == 'nt':
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        # PROCESS_QUERY_LIMITED_INFORMATION
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            # Access denied means the process exists
+            return ctypes.GetLastError() == 5
+        try:
+            code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+            # STILL_ACTIVE
+            return code.value == 259
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def lock_path(directory: str, pid: Optional[int] = None) -> str:
+    """
+    Get the lock file a process keeps in a directory it downloads into.
+
+    Args:
+        directory: Output directory
+        pid: Process ID. If None, uses the current process.
+
+    Returns:
+        Path of the lock file
+    """
+    pid = os.getpid() if pid is None else pid
+    return os.path.join(directory, f'{DOWNLOAD_LOCK_PREFIX}{pid}{DOWNLOAD_LOCK_SUFFIX}')
+
+
+# Downloads of this process running per lock file
+_held: Dict[str, int] = {}
+_held_lock = threading.Lock()
+
+
+@contextmanager
+def download_lock(directory: str) -> Iterator[str]:
+    """
+    Mark a directory as being downloaded into while the block runs.
+
+    Concurrent downloads of one process into the same directory share its
+    lock file, which is removed when the last of them finishes.
+
+    Args:
+        directory: Output directory; must exist
+
+    Yields:
+        Path of the lock file
+    """
+    path = os.path.abspath(lock_path(directory))
+    with _held_lock:
+        if not _held.get(path):
+            try:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(f'{os.getpid()}\n')
+            except OSError:
+                # A read-only directory will not get leftovers to protect
+                pass
+        _held[path] = _held.get(path, 0) + 1
+    try:
+        yield path
+    finally:
+        with _held_lock:
+            _held[path] -= 1
+            if not _held[path]:
+                del _held[path]
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+def _live_lock(names: List[str]) -> bool:
+    """Check whether a directory listing holds the lock file of a running process."""
+    for name in names:
+        match = _LOCK_PATTERN.match(name)
+        if match and _pid_alive(int(match.group(1))):
+            return True
+    return False
+
+
+def _ancestor_locked(directory: str) -> bool:
+    """Check the parents of a directory for the lock file of a running download."""
+    current = os.path.abspath(directory)
+    while True:
+        parent = os.path.dirname(current)
+        if parent == current:
+            return False
+        current = parent
+        try:
+            with os.scandir(current) as entries:
+                names = [entry.name for entry in entries if entry.name.startswith(DOWNLOAD_LOCK_PREFIX)]
+        except OSError:
+            continue
+        if _live_lock(names):
+            return True
+
+
+class CleanupReport:
+    """Outcome of a cleanup run.
+
+    Attributes:
+        removed: Leftover files removed (or that would be, in a dry run)
+        reclaimed_bytes: Total size of the removed files
+        locked: Leftovers skipped because a running download holds their directory
+        recent: Leftovers skipped because they are younger than min_age
+        failed: (path, error) of leftovers that could not be removed
+        complete_files: Finished downloads found during the scan
+        dry_run: Whether files were only listed
+    """
+
+    def __init__(self, dry_run: bool = False):
+        """
+        Initialize an empty CleanupReport.
+
+        Args:
+            dry_run: Whether files are only listed
+        """
+        self.removed: List[str] = []
+        self.reclaimed_bytes = 0
+        self.locked: List[str] = []
+        self.recent: List[str] = []
+        self.failed: List[Tuple[str, str]] = []
+        self.complete_files = 0
+        self.dry_run = dry_run
+
+
+def cleanup_downloads(
+    directory: str,
+    min_age: float = CLEANUP_MIN_AGE,
+    dry_run: bool = False,
+    patterns: Tuple[str, ...] = CLEANUP_PATTERNS,
+    now: Optional[float] = None,
+    logger=None
+) -> CleanupReport:
+    """
+    Remove the leftovers of interrupted downloads below a directory.
+
+    The tree is walked once with ``os.scandir``; symlinked directories are
+    not followed. Stale lock files of processes that are gone are removed
+    like any other leftover.
+
+    Args:
+        directory: Download directory to clean up
+        min_age: Seconds since a leftover was last modified before it is removed
+        dry_run: Only report what would be removed
+        patterns: Shell patterns of leftover file names
+        now: Current time for the age check. If None, uses ``time.time()``.
+        logger: Logger instance for logging
+
+    Returns:
+        CleanupReport of the run
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"Directory not found: {directory}")
+
+    now = time.time() if now is None else now
+    leftover = _compile_patterns(tuple(patterns) + (f'{DOWNLOAD_LOCK_PREFIX}*{DOWNLOAD_LOCK_SUFFIX}',))
+    report = CleanupReport(dry_run=dry_run)
+
+    stack = [(directory, _ancestor_locked(directory))]
+    while stack:
+        path, locked = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            if logger:
+                logger.warning(f"Could not scan {path}: {e}")
+            continue
+
+        locked = locked or _live_lock([entry.name for entry in entries])
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, locked))
+                    continue
+                name = os.path.normcase(entry.name)
+                if not leftover.match(name):
+                    if name.endswith(CLEANUP_COMPLETE_EXTENSIONS):
+                        report.complete_files += 1
+                    continue
+                if _LOCK_PATTERN.match(entry.name) and locked:
+                    # The live lock itself, or a sibling lock under it
+                    continue
+                if locked:
+                    report.locked.append(entry.path)
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+            except OSError as e:
+                report.failed.append((entry.path, str(e)))
+                continue
+
+            if now - stat.st_mtime < min_age:
+                report.recent.append(entry.path)
+                continue
+            if not dry_run:
+                try:
+                    os.remove(entry.path)
+                except OSError as e:
+                    report.failed.append((entry.path, str(e)))
+                    continue
+            report.removed.append(entry.path)
+            report.reclaimed_bytes += stat.st_size
+
+    if logger:
+        logger.info(
+            f"Cleanup of {directory}: {len(report.removed)} files, {report.reclaimed_bytes} bytes"
+            f"{' (dry run)' if dry_run else ''}"
+        )
+    return report
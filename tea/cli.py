@@ -4,9 +4,11 @@ CLI interaction and menus for Tea YouTube Downloader.
 This module handles all user interface interactions, menus, and input handling.
 """
 
+import argparse
 import sys
 import os
 import re
+from contextlib import ExitStack
 from typing import List, Optional, Dict, Any
 
 # Import from tea modules
@@ -14,23 +16,73 @@ try:
     from tea.logger import setup_logger
     from tea.config import ConfigManager
     from tea.history import HistoryManager
-    from tea.info import InfoExtractor
+    from tea.info import InfoExtractor, dedupe_urls, extract_video_id, guess_content_type
     from tea.downloader import DownloadService, DEFAULT_CONCURRENT_WORKERS
     from tea.timestamps import TimestampProcessor, time_to_seconds
     from tea.ffmpeg import FFmpegService
     from tea.search import YouTubeSearchService
+    from tea.metrics import get_metrics
+    from tea.profiling import Profiler, extract_profile_option
+    from tea.events import get_events, jsonl_events, extract_events_option
+    from tea.formats import is_audio_quality
     from tea.exceptions import TeaError, ValidationError, DownloadError, ConfigurationError
+    from tea.constants import (
+        __version__,
+        EXIT_OK,
+        EXIT_FAILURE,
+        EXIT_USAGE,
+        EXIT_PARTIAL,
+        EXIT_INTERRUPTED,
+        HEADLESS_DUPLICATE_ACTIONS,
+        PRIORITY_NAMES,
+        MAX_CONCURRENT_WORKERS,
+        SPLIT_FROM_CHAPTERS,
+        VALID_AUDIO_FORMATS,
+        VALID_MP3_QUALITIES,
+        QUALITY_PRESETS,
+        AUDIO_QUALITY_PRESETS,
+        DAEMON_HOST,
+        DAEMON_PORT,
+        JOB_DONE,
+        WATCH_POLL_INTERVAL,
+        CLEANUP_MIN_AGE,
+    )
 except ImportError:
     # Fallback for development
     from tea.logger import setup_logger
     from tea.config import ConfigManager
     from tea.history import HistoryManager
-    from tea.info import InfoExtractor
+    from tea.info import InfoExtractor, dedupe_urls, extract_video_id, guess_content_type
     from tea.downloader import DownloadService, DEFAULT_CONCURRENT_WORKERS
     from tea.timestamps import TimestampProcessor, time_to_seconds
     from tea.ffmpeg import FFmpegService
     from tea.search import YouTubeSearchService
+    from tea.metrics import get_metrics
+    from tea.profiling import Profiler, extract_profile_option
+    from tea.events import get_events, jsonl_events, extract_events_option
+    from tea.formats import is_audio_quality
     from tea.exceptions import TeaError, ValidationError, DownloadError, ConfigurationError
+    from tea.constants import (
+        __version__,
+        EXIT_OK,
+        EXIT_FAILURE,
+        EXIT_USAGE,
+        EXIT_PARTIAL,
+        EXIT_INTERRUPTED,
+        HEADLESS_DUPLICATE_ACTIONS,
+        PRIORITY_NAMES,
+        MAX_CONCURRENT_WORKERS,
+        SPLIT_FROM_CHAPTERS,
+        VALID_AUDIO_FORMATS,
+        VALID_MP3_QUALITIES,
+        QUALITY_PRESETS,
+        AUDIO_QUALITY_PRESETS,
+        DAEMON_HOST,
+        DAEMON_PORT,
+        JOB_DONE,
+        WATCH_POLL_INTERVAL,
+        CLEANUP_MIN_AGE,
+    )
 
 # Import security utilities
 try:
@@ -66,13 +118,6 @@ except ImportError:
         except (ValueError, TypeError):
             return False
 
-# Try to import AI filename cleaner
-FilenameCleaner = None
-try:
-    from tea.ai.filename_cleaner import FilenameCleaner
-except (ImportError, ValueError):
-    FilenameCleaner = None
-
 # Try to import UX components
 try:
     from tea.ux import ConfigEditor, QualitySelector
@@ -81,6 +126,228 @@ except ImportError:
     QualitySelector = None
 
 
+# Subcommands handled by the argparse parser; anything else goes to the
+# legacy flag handling (--batch, --search, ...)
+COMMANDS = ('download', 'serve', 'submit', 'jobs', 'watch', 'cleanup')
+
+
+def _worker_count(value: str) -> int:
+    """Parse --workers, rejecting values outside 1..MAX_CONCURRENT_WORKERS."""
+    if not validate_concurrent_workers(value):
+        raise argparse.ArgumentTypeError(
+            f"must be a number between 1 and {MAX_CONCURRENT_WORKERS}"
+        )
+    return int(value)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for non-interactive commands.
+
+    Returns:
+        ArgumentParser with one subparser per command
+    """
+    parser = argparse.ArgumentParser(
+        prog='tea',
+        description='Tea - YouTube Downloader. Run without arguments for interactive mode.'
+    )
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    download = subparsers.add_parser(
+        'download',
+        help='Download URLs without any prompts',
+        description='Download videos, playlists or channels without any prompts.'
+    )
+    download.add_argument('urls', nargs='*', metavar='URL', help='YouTube URL(s) to download')
+    download.add_argument(
+        '-f', '--file', dest='url_files', action='append', default=[], metavar='FILE',
+        help="Read URLs from a text file, one per line ('-' reads stdin)"
+    )
+    download.add_argument(
+        '--audio', action='store_true',
+        help='Download audio only (MP3)'
+    )
+    _add_format_arguments(download)
+    download.add_argument(
+        '-o', '--out', dest='output', metavar='DIR',
+        help='Output directory (default: default_output from config)'
+    )
+    download.add_argument(
+        '-w', '--workers', type=_worker_count, metavar='N',
+        help=f'Concurrent downloads, 1-{MAX_CONCURRENT_WORKERS} (default: concurrent_downloads from config)'
+    )
+    download.add_argument(
+        '--on-duplicate', choices=HEADLESS_DUPLICATE_ACTIONS,
+        help="What to do with URLs already in history; 'replace' removes the old entry "
+             "(default: duplicate_action from config, or skip if it is 'ask')"
+    )
+    download.add_argument(
+        '--sync', action='store_true',
+        help='Only fetch videos of playlists/channels that are not in the download archive; '
+             'channels stop at the first already-downloaded uploads'
+    )
+    download.add_argument(
+        '--metrics-report', metavar='FILE',
+        help='Write per-stage timings and counters of this run to a JSON file'
+    )
+    download.add_argument(
+        '--split-from', metavar='SOURCE',
+        help=f"Split a single video after download using '{SPLIT_FROM_CHAPTERS}' "
+             "or a JSON timestamps file"
+    )
+
+    serve = subparsers.add_parser(
+        'serve',
+        help='Run the download daemon',
+        description='Keep Tea loaded and accept download jobs on a local HTTP API.'
+    )
+    _add_daemon_address_arguments(serve)
+    serve.add_argument(
+        '-w', '--workers', type=_worker_count, metavar='N',
+        help=f'Concurrent downloads, 1-{MAX_CONCURRENT_WORKERS} (default: concurrent_downloads from config)'
+    )
+
+    submit = subparsers.add_parser(
+        'submit',
+        help='Send URLs to a running daemon',
+        description='Queue downloads on a running daemon (see tea serve).'
+    )
+    submit.add_argument('urls', nargs='*', metavar='URL', help='YouTube URL(s) to download')
+    submit.add_argument(
+        '-f', '--file', dest='url_files', action='append', default=[], metavar='FILE',
+        help="Read URLs from a text file, one per line ('-' reads stdin)"
+    )
+    submit.add_argument('--audio', action='store_true', help='Download audio only (MP3)')
+    _add_format_arguments(submit)
+    submit.add_argument(
+        '-o', '--out', dest='output', metavar='DIR',
+        help="Output directory inside the daemon's default_output or daemon_output_dirs "
+             "(default: default_output)"
+    )
+    submit.add_argument(
+        '--on-duplicate', choices=HEADLESS_DUPLICATE_ACTIONS,
+        help="What to do with URLs already in history (default: the daemon's config)"
+    )
+    _add_priority_argument(submit)
+    submit.add_argument(
+        '--wait', action='store_true',
+        help='Wait for the jobs to finish and exit with their combined status'
+    )
+    _add_daemon_address_arguments(submit)
+
+    jobs = subparsers.add_parser(
+        'jobs',
+        help='Show jobs of a running daemon',
+        description='Show jobs of a running daemon.'
+    )
+    jobs.add_argument('job_id', nargs='?', metavar='JOB', help='Show a single job')
+    jobs.add_argument('--status', help='Only show jobs in this state')
+    jobs.add_argument('--cancel', action='store_true', help='Cancel JOB if it has not started')
+    _add_daemon_address_arguments(jobs)
+
+    watch = subparsers.add_parser(
+        'watch',
+        help='Download URLs from list files dropped into a folder',
+        description='Follow a folder of URL list files (.txt/.list) and download new URLs as they appear.'
+    )
+    watch.add_argument('directory', metavar='DIR', help='Folder to watch')
+    watch.add_argument('--audio', action='store_true', help='Download audio only (MP3)')
+    watch.add_argument(
+        '-o', '--out', dest='output', metavar='DIR',
+        help='Output directory (default: default_output from config)'
+    )
+    watch.add_argument(
+        '-w', '--workers', type=_worker_count, metavar='N',
+        help=f'Concurrent downloads, 1-{MAX_CONCURRENT_WORKERS} (default: concurrent_downloads from config)'
+    )
+    _add_priority_argument(watch)
+    watch.add_argument(
+        '--poll', type=float, default=WATCH_POLL_INTERVAL, metavar='SECONDS',
+        help=f'Seconds between scans when polling (default: {WATCH_POLL_INTERVAL:g})'
+    )
+    watch.add_argument(
+        '--no-inotify', dest='use_inotify', action='store_false',
+        help='Always poll instead of using inotify'
+    )
+
+    cleanup = subparsers.add_parser(
+        'cleanup',
+        help='Remove leftovers of interrupted downloads',
+        description='Remove .part, .ytdl and fragment files of interrupted downloads, '
+                    'skipping files a running download may still write.'
+    )
+    cleanup.add_argument(
+        'directory', nargs='?', metavar='DIR',
+        help='Download directory (default: default_output from config)'
+    )
+    cleanup.add_argument(
+        '--min-age', type=float, default=CLEANUP_MIN_AGE, metavar='SECONDS',
+        help=f'Only remove files unchanged for this long (default: {CLEANUP_MIN_AGE})'
+    )
+    cleanup.add_argument(
+        '-n', '--dry-run', action='store_true',
+        help='Only list the files that would be removed'
+    )
+
+    return parser
+
+
+def _add_daemon_address_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --host and --port options for commands that talk to the daemon."""
+    parser.add_argument('--host', default=DAEMON_HOST, help=f'Daemon host (default: {DAEMON_HOST})')
+    parser.add_argument(
+        '--port', type=int, default=DAEMON_PORT, help=f'Daemon port (default: {DAEMON_PORT})'
+    )
+
+
+def _add_priority_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the --priority option for commands that queue jobs."""
+    parser.add_argument(
+        '--priority', choices=list(PRIORITY_NAMES),
+        help='Scheduling priority (default: normal for videos, low for playlists and channels)'
+    )
+
+
+def _add_format_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that override the configured download format."""
+    parser.add_argument(
+        '--audio-format', choices=VALID_AUDIO_FORMATS,
+        help="With --audio: 'mp3' converts, 'native' keeps YouTube's M4A/Opus audio without "
+             "transcoding (default: audio_format from config)"
+    )
+    parser.add_argument(
+        '--quality', choices=list(QUALITY_PRESETS), metavar='PRESET',
+        help=f"Video quality preset: {', '.join(QUALITY_PRESETS)} "
+             "(default: default_quality from config)"
+    )
+    parser.add_argument(
+        '--audio-quality', metavar='KBPS',
+        choices=sorted(VALID_MP3_QUALITIES, key=int) + list(AUDIO_QUALITY_PRESETS),
+        help=f"MP3 bitrate: {', '.join(sorted(VALID_MP3_QUALITIES, key=int))} or "
+             f"{', '.join(AUDIO_QUALITY_PRESETS)} (default: mp3_quality from config)"
+    )
+
+
+def exit_code_for(results: List[Dict]) -> int:
+    """
+    Map download results to a process exit code.
+
+    Args:
+        results: Result dicts returned by DownloadService.download
+
+    Returns:
+        EXIT_OK if nothing failed, EXIT_FAILURE if nothing succeeded,
+        otherwise EXIT_PARTIAL
+    """
+    failed = sum(1 for r in results if not r.get('success'))
+    if not failed:
+        return EXIT_OK
+    if failed == len(results):
+        return EXIT_FAILURE
+    return EXIT_PARTIAL
+
+
 class CLI:
     """Command-line interface for Tea YouTube Downloader.
 
@@ -103,6 +370,7 @@ class CLI:
         _ffmpeg: FFmpegService instance for media processing
         _search: YouTubeSearchService instance for search functionality
         _downloader: DownloadService instance for download operations
+        _events: Event bus for split and search progress
         _logger: Logger instance for logging
     """
 
@@ -131,24 +399,92 @@ class CLI:
             info_extractor=self._info,
             logger=self._logger
         )
+        self._events = get_events()
 
-    def run(self) -> None:
-        """Run the CLI application."""
-        if len(sys.argv) > 1:
-            self._handle_args()
-        else:
+    def run(self, argv: Optional[List[str]] = None) -> int:
+        """
+        Run the CLI application.
+
+        Args:
+            argv: Command-line arguments without the program name.
+                Defaults to ``sys.argv[1:]``.
+
+        Returns:
+            Process exit code
+        """
+        args = sys.argv[1:] if argv is None else list(argv)
+
+        if not args:
             self._interactive_mode()
+            return EXIT_OK
+
+        if args[0] in COMMANDS or args[0] in ('-h', '--version'):
+            return self._run_command(args)
 
-    def _handle_args(self) -> None:
-        """Handle command-line arguments."""
-        arg = sys.argv[1]
+        return self._handle_args(args)
+
+    def _run_command(self, args: List[str]) -> int:
+        """
+        Parse and run a non-interactive command.
+
+        Args:
+            args: Command-line arguments without the program name
+
+        Returns:
+            Process exit code
+        """
+        parser = build_parser()
+        try:
+            options = parser.parse_args(args)
+        except SystemExit as e:
+            # argparse exits after --help/--version (0) or a usage error (2)
+            return e.code if isinstance(e.code, int) else EXIT_USAGE
+
+        if options.command is None:
+            parser.print_help()
+            return EXIT_USAGE
+
+        try:
+            if options.command == 'download':
+                try:
+                    return self._download_command(options)
+                finally:
+                    if options.metrics_report:
+                        self._write_metrics_report(options.metrics_report)
+            if options.command == 'serve':
+                return self._serve_command(options)
+            if options.command == 'submit':
+                return self._submit_command(options)
+            if options.command == 'jobs':
+                return self._jobs_command(options)
+            if options.command == 'watch':
+                return self._watch_command(options)
+            if options.command == 'cleanup':
+                return self._cleanup_command(options)
+        except TeaError as e:
+            print(f"[ERROR] {e}")
+            return EXIT_FAILURE
+
+        return EXIT_USAGE
+
+    def _handle_args(self, args: List[str]) -> int:
+        """
+        Handle legacy command-line flags.
+
+        Args:
+            args: Command-line arguments without the program name
+
+        Returns:
+            Process exit code
+        """
+        arg = args[0]
 
         if arg == '--help':
             self.show_help()
         elif arg == '--list-formats':
             self._list_formats()
         elif arg == '--batch':
-            self._batch_mode()
+            self._batch_mode(args)
         elif arg == '--config':
             self._config_mode()
         elif arg == '--history':
@@ -156,10 +492,103 @@ class CLI:
         elif arg == '--search':
             self._search_and_download_mode()
         elif arg == '--search-file':
-            self._search_file_mode()
+            self._search_file_mode(args)
         else:
             print(f"[ERROR] Unknown argument: {arg}")
             print("Use 'tea --help' for usage information")
+            return EXIT_USAGE
+
+        return EXIT_OK
+
+    def _write_metrics_report(self, path: str) -> None:
+        """
+        Write the metrics of this run to a JSON file.
+
+        Args:
+            path: Report file
+        """
+        try:
+            get_metrics().write_report(path)
+            print(f"[OK] Metrics report written to {path}")
+        except OSError as e:
+            print(f"[WARNING] Could not write metrics report: {e}")
+
+    def _download_command(self, options: argparse.Namespace) -> int:
+        """
+        Run ``tea download`` without prompting.
+
+        Args:
+            options: Parsed arguments from the 'download' subparser
+
+        Returns:
+            Process exit code
+        """
+        urls = self._collect_urls(options)
+        if not urls:
+            print("[ERROR] No valid YouTube URLs given")
+            return EXIT_USAGE
+
+        timestamps: List[Dict] = []
+        if options.split_from:
+            if len(urls) != 1:
+                print("[ERROR] --split-from needs exactly one video URL")
+                return EXIT_USAGE
+            if options.split_from != SPLIT_FROM_CHAPTERS and not os.path.isfile(options.split_from):
+                print(f"[ERROR] Timestamps file not found: {options.split_from}")
+                return EXIT_USAGE
+
+        duplicate_action = options.on_duplicate or self._config.duplicate_action
+        if duplicate_action not in HEADLESS_DUPLICATE_ACTIONS:
+            duplicate_action = 'skip'
+
+        if options.sync:
+            # Playlists and channels are checked video by video against the archive
+            lists = [url for url in urls if guess_content_type(url) != 'video']
+            kept = set(self._handle_duplicates(
+                [url for url in urls if url not in lists], action=duplicate_action
+            ))
+            urls = [url for url in urls if url in lists or url in kept]
+        else:
+            urls = self._handle_duplicates(urls, action=duplicate_action)
+        if not urls:
+            print("[INFO] Nothing to download (all URLs already downloaded)")
+            return EXIT_OK
+
+        if options.split_from:
+            if options.split_from == SPLIT_FROM_CHAPTERS:
+                timestamps = self._timestamps.extract_youtube_chapters(urls[0])
+            else:
+                timestamps = self._timestamps.load_from_json(options.split_from)
+
+        output_dir = sanitize_path(options.output or '') or self._config.default_output or 'downloads'
+        max_workers = min(options.workers or self._config.concurrent_downloads, len(urls))
+        audio_only = options.audio or is_audio_quality(options.quality)
+
+        cleaner = self._init_ai_cleaner()
+        results = self._downloader.download(
+            urls=urls,
+            output_path=output_dir,
+            max_workers=max(1, max_workers),
+            audio_only=audio_only,
+            cleaner=cleaner,
+            sync=options.sync,
+            audio_format=options.audio_format,
+            quality=options.quality,
+            audio_quality=options.audio_quality,
+            source=options.url_files[0] if len(options.url_files) == 1 else None
+        )
+
+        exit_code = exit_code_for(results)
+
+        if options.split_from and exit_code == EXIT_OK:
+            if not timestamps:
+                print("[ERROR] No timestamps found to split on")
+                return EXIT_PARTIAL
+            title = results[0].get('title', '') if results else ''
+            if not self._handle_splitting(output_dir, timestamps, audio_only, title=title):
+                return EXIT_PARTIAL
+
+        return exit_code
 
     def _interactive_mode(self) -> None:
         """Run interactive mode."""
@@ -204,7 +633,8 @@ class CLI:
             return
 
         # Get quality
-        audio_only = self._select_quality_audio_only()
+        quality = self._select_quality_preset()
+        audio_only = is_audio_quality(quality)
 
         # Get output directory
         output_dir = self._select_output_directory()
@@ -250,16 +680,273 @@ class CLI:
             output_path=final_output_dir,
             max_workers=max_workers,
             audio_only=audio_only,
-            cleaner=cleaner
+            cleaner=cleaner,
+            quality=quality
         )
 
         # Handle splitting
         if split_enabled and timestamps:
             self._handle_splitting(final_output_dir, timestamps, audio_only)
 
-    def _handle_duplicates(self, urls: List[str]) -> List[str]:
-        """Handle duplicate URL detection."""
-        duplicate_action = self._config.duplicate_action
+    def _collect_urls(self, options: argparse.Namespace) -> List[str]:
+        """
+        Gather URLs from positional arguments and --file options.
+
+        Args:
+            options: Parsed arguments with 'urls' and 'url_files'
+
+        Returns:
+            Valid URLs in order, without repeats (in any URL form)
+        """
+        urls = self.parse_multiple_urls(' '.join(options.urls))
+        for url_file in options.url_files:
+            if url_file == '-':
+                urls.extend(self.parse_multiple_urls(sys.stdin.read()))
+            else:
+                urls.extend(self.load_urls_from_file(url_file))
+
+        # Keep the first form of each video/playlist
+        return dedupe_urls(urls)
+
+    def _serve_command(self, options: argparse.Namespace) -> int:
+        """
+        Run ``tea serve`` until interrupted.
+
+        Args:
+            options: Parsed arguments from the 'serve' subparser
+
+        Returns:
+            Process exit code
+        """
+        # The daemon modules are only needed by this command
+        from tea.daemon import TeaDaemon
+        from tea.jobs import JobQueue
+        from tea.downloader import YoutubeDL
+
+        workers = options.workers or self._config.concurrent_downloads
+        job_queue = JobQueue(
+            download_service=self._downloader,
+            history_manager=self._history,
+            workers=workers,
+            cleaner=self._init_ai_cleaner(),
+            logger=self._logger
+        )
+        daemon = TeaDaemon(
+            job_queue,
+            config_manager=self._config,
+            host=options.host,
+            port=options.port,
+            logger=self._logger
+        )
+
+        # Load yt-dlp now so the first job does not pay for it
+        YoutubeDL.resolve()
+
+        host, port = daemon.address
+        print(f"[OK] Tea daemon listening on http://{host}:{port} ({workers} workers)")
+        print("[INFO] Press Ctrl+C to stop")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            print("\n[INFO] Stopping daemon...")
+        finally:
+            job_queue.stop()
+        return EXIT_OK
+
+    def _submit_command(self, options: argparse.Namespace) -> int:
+        """
+        Run ``tea submit``.
+
+        Args:
+            options: Parsed arguments from the 'submit' subparser
+
+        Returns:
+            Process exit code
+        """
+        from tea.daemon import DaemonClient
+
+        urls = self._collect_urls(options)
+        if not urls:
+            print("[ERROR] No valid YouTube URLs given")
+            return EXIT_USAGE
+
+        # Resolve relative to this shell, not the daemon's working directory
+        output = os.path.abspath(sanitize_path(options.output)) if options.output else None
+
+        client = DaemonClient(options.host, options.port, config_path=self._config.config_path)
+        response = client.submit(
+            urls,
+            output=output,
+            audio=options.audio or is_audio_quality(options.quality),
+            on_duplicate=options.on_duplicate,
+            priority=options.priority,
+            audio_format=options.audio_format,
+            quality=options.quality,
+            audio_quality=options.audio_quality,
+        )
+
+        jobs = response.get('jobs', [])
+        for job in jobs:
+            print(f"[OK] Queued {job['id']}: {job['url']}")
+        for url in response.get('skipped', []):
+            print(f"[INFO] Skipped (already downloaded): {url}")
+        for url in response.get('invalid', []):
+            print(f"[WARNING] Rejected by daemon: {url}")
+
+        if not options.wait or not jobs:
+            return EXIT_OK
+
+        finished = client.wait([job['id'] for job in jobs])
+        for job in finished:
+            label = job.get('title') or job['url']
+            if job['status'] == JOB_DONE:
+                print(f"[OK] {job['id']}: {label}")
+            else:
+                print(f"[ERROR] {job['id']} {job['status']}: {job.get('error') or label}")
+        return exit_code_for([{'success': job['status'] == JOB_DONE} for job in finished])
+
+    def _jobs_command(self, options: argparse.Namespace) -> int:
+        """
+        Run ``tea jobs``.
+
+        Args:
+            options: Parsed arguments from the 'jobs' subparser
+
+        Returns:
+            Process exit code
+        """
+        from tea.daemon import DaemonClient
+
+        client = DaemonClient(options.host, options.port, config_path=self._config.config_path)
+
+        if options.cancel:
+            if not options.job_id:
+                print("[ERROR] --cancel needs a JOB id")
+                return EXIT_USAGE
+            job = client.cancel(options.job_id)
+            print(f"[OK] Cancelled {job['id']}: {job['url']}")
+            return EXIT_OK
+
+        jobs = [client.get_job(options.job_id)] if options.job_id else client.list_jobs(options.status)
+        if not jobs:
+            print("[INFO] No jobs")
+        for job in jobs:
+            label = job.get('title') or job['url']
+            print(f"  {job['id']}  {job['status']:<9}  {label[:60]}")
+            if job.get('error'):
+                print(f"      {job['error'][:100]}")
+        return EXIT_OK
+
+    def _watch_command(self, options: argparse.Namespace) -> int:
+        """
+        Run ``tea watch`` until interrupted.
+
+        Args:
+            options: Parsed arguments from the 'watch' subparser
+
+        Returns:
+            Process exit code
+        """
+        from tea.jobs import JobQueue
+        from tea.watch import FolderWatcher, queue_urls
+
+        if not os.path.isdir(options.directory):
+            print(f"[ERROR] Not a directory: {options.directory}")
+            return EXIT_USAGE
+
+        output_dir = sanitize_path(options.output or '') or self._config.default_output or 'downloads'
+        workers = options.workers or self._config.concurrent_downloads
+        job_queue = JobQueue(
+            download_service=self._downloader,
+            history_manager=self._history,
+            workers=workers,
+            cleaner=self._init_ai_cleaner(),
+            logger=self._logger
+        )
+
+        def on_urls(name: str, urls: List[str]) -> None:
+            queued = queue_urls(
+                job_queue, urls, output_dir, options.audio, priority=options.priority, source=name
+            )
+            print(f"[OK] {name}: {len(urls)} new URL(s), {queued} queued")
+
+        watcher = FolderWatcher(
+            options.directory,
+            on_urls,
+            poll_interval=options.poll,
+            use_inotify=options.use_inotify,
+            pending=job_queue.pending_by_source,
+            logger=self._logger
+        )
+
+        print(f"[OK] Watching {watcher.directory} ({watcher.backend_name}), saving to {output_dir}")
+        print("[INFO] Press Ctrl+C to stop")
+        job_queue.start()
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            print("\n[INFO] Stopping watch...")
+        finally:
+            # Stop the queue first so the watcher saves what is still queued
+            job_queue.stop()
+            watcher.close()
+        return EXIT_OK
+
+    def _cleanup_command(self, options: argparse.Namespace) -> int:
+        """
+        Run ``tea cleanup``.
+
+        Args:
+            options: Parsed arguments from the 'cleanup' subparser
+
+        Returns:
+            Process exit code
+        """
+        from tea.cleanup import cleanup_downloads
+        from tea.events import format_bytes
+
+        directory = sanitize_path(options.directory or '') or self._config.default_output or 'downloads'
+        if not os.path.isdir(directory):
+            print(f"[ERROR] Not a directory: {directory}")
+            return EXIT_USAGE
+
+        report = cleanup_downloads(
+            directory, min_age=options.min_age, dry_run=options.dry_run, logger=self._logger
+        )
+
+        action = 'Would remove' if report.dry_run else 'Removed'
+        for path in report.removed:
+            print(f"  {action}: {os.path.relpath(path, directory)}")
+        for path, error in report.failed:
+            print(f"[WARNING] Could not remove {os.path.relpath(path, directory)}: {error}")
+
+        if report.removed:
+            reclaimed = 'reclaiming' if report.dry_run else 'reclaimed'
+            print(f"[OK] {action} {len(report.removed)} file(s), "
+                  f"{reclaimed} {format_bytes(report.reclaimed_bytes)}")
+        else:
+            print("[OK] No leftovers of interrupted downloads found")
+        if report.locked:
+            print(f"[INFO] Skipped {len(report.locked)} file(s) of running downloads")
+        if report.recent:
+            print(f"[INFO] Skipped {len(report.recent)} file(s) changed in the last "
+                  f"{options.min_age:g}s (see --min-age)")
+        print(f"[INFO] Complete downloads: {report.complete_files}")
+        return EXIT_FAILURE if report.failed else EXIT_OK
+
+    def _handle_duplicates(self, urls: List[str], action: Optional[str] = None) -> List[str]:
+        """
+        Handle duplicate URL detection.
+
+        Args:
+            urls: URLs to check against download history
+            action: Override for the configured duplicate_action. 'replace'
+                removes the history entry and downloads again.
+
+        Returns:
+            URLs that should be downloaded
+        """
+        duplicate_action = action or self._config.duplicate_action
         urls_to_download = []
         skipped_urls = []
 
@@ -267,17 +954,25 @@ class CLI:
             already_downloaded, download_info = self._history.is_downloaded(url)
 
             if already_downloaded and download_info:
+                stored = self._is_stored(url, download_info)
                 if duplicate_action == 'download':
-                    print(f"[INFO] Duplicate: {download_info['title'][:60]} (downloading again)")
+                    note = "linking stored copy" if stored else "downloading again"
+                    print(f"[INFO] Duplicate: {download_info['title'][:60]} ({note})")
                     urls_to_download.append(url)
                 elif duplicate_action == 'skip':
                     print(f"[INFO] Duplicate: {download_info['title'][:60]} (skipped)")
                     skipped_urls.append(url)
+                elif duplicate_action == 'replace':
+                    print(f"[INFO] Duplicate: {download_info['title'][:60]} (replacing)")
+                    self._history.remove(url)
+                    urls_to_download.append(url)
                 else:
                     print(f"\n[WARNING] Duplicate detected!")
                     print(f"   Title: {download_info['title'][:60]}")
                     print(f"   Downloaded: {download_info['timestamp'][:10]}")
                     print(f"   Location: {download_info['output_path']}")
+                    if stored:
+                        print("   Stored: yes (a new copy is linked, not downloaded)")
                     print()
                     print("   Choose action:")
                     print("     1. Download again (create new copy)")
@@ -314,15 +1009,36 @@ class CLI:
 
         return urls_to_download
 
+    def _is_stored(self, url: str, download_info: Dict) -> bool:
+        """
+        Check if a downloaded URL has a copy in the media store.
+
+        Args:
+            url: Video URL
+            download_info: History entry of the earlier download
+
+        Returns:
+            True if downloading it again only links the stored copy
+        """
+        store = self._downloader.media_store
+        video_id = download_info.get('video_id') or extract_video_id(url)
+        return store is not None and bool(video_id) and store.contains(video_id)
+
     def _init_ai_cleaner(self):
         """Initialize AI filename cleaner if enabled."""
-        if not self._config.use_ai_filename_cleaning or not FilenameCleaner:
+        if not self._config.use_ai_filename_cleaning:
             return None
 
         api_key = self._config.openrouter_api_key
         if not api_key:
             return None
 
+        # The AI module is only imported when filename cleaning is enabled
+        try:
+            from tea.ai.filename_cleaner import FilenameCleaner
+        except ImportError:
+            return None
+
         try:
             cleaner = FilenameCleaner(api_key=api_key)
             remaining = cleaner.get_remaining_requests()
@@ -332,14 +1048,31 @@ class CLI:
             print(f"[WARNING] Failed to initialize AI cleaner: {e}")
             return None
 
-    def _handle_splitting(self, output_dir: str, timestamps: List[Dict], audio_only: bool) -> None:
-        """Handle video/audio splitting after download."""
+    def _handle_splitting(
+        self,
+        output_dir: str,
+        timestamps: List[Dict],
+        audio_only: bool,
+        title: str = ""
+    ) -> bool:
+        """
+        Handle video/audio splitting after download.
+
+        Args:
+            output_dir: Directory the media was downloaded to
+            timestamps: Clips to cut
+            audio_only: Whether the download is audio
+            title: Optional title used to find the downloaded file
+
+        Returns:
+            True if the file was found and every clip was created
+        """
         content_type = "audio" if audio_only else "video"
         print(f"\n{'=' * 60}")
         print(f"[OK] Starting {content_type} splitting...")
         print("-" * 60)
 
-        media_file = self._ffmpeg.find_downloaded_video(output_dir, "")
+        media_file = self._ffmpeg.find_downloaded_video(output_dir, title)
 
         if media_file:
             print(f"[OK] Found {content_type}: {os.path.basename(media_file)}")
@@ -353,21 +1086,16 @@ class CLI:
             successful_clips = [r for r in split_results if r['success']]
             failed_clips = [r for r in split_results if not r['success']]
 
-            print("\n" + "-" * 60)
-            print("SPLIT SUMMARY")
-            print("-" * 60)
-            print(f"[OK] Successful clips: {len(successful_clips)}")
-            print(f"[ERROR] Failed clips: {len(failed_clips)}")
+            self._events.emit(
+                'summary', kind='split', output_dir=clips_dir,
+                successful=len(successful_clips), failed=len(failed_clips),
+                failures=[{'clip': clip['clip'], 'title': clip['title']} for clip in failed_clips],
+            )
 
-            if successful_clips:
-                print(f"\n[OK] Clips saved to: {clips_dir}")
+            return bool(split_results) and not failed_clips
 
-            if failed_clips:
-                print("\n[ERROR] Failed clips:")
-                for clip in failed_clips:
-                    print(f"  {clip['clip']}. {clip['title']}")
-        else:
-            print(f"[ERROR] Could not find downloaded {content_type} for splitting")
+        print(f"[ERROR] Could not find downloaded {content_type} for splitting")
+        return False
 
     # Banner and help methods
 
@@ -399,12 +1127,22 @@ class CLI:
         print("  tea --search           # Search and download songs")
         print("  tea --search-file <f>  # Search from song list file")
         print("  tea --help             # Show this help")
+        print("  tea download URL...    # Download without prompts (see tea download -h)")
+        print("  tea serve              # Run the download daemon")
+        print("  tea submit URL...      # Queue URLs on a running daemon")
+        print("  tea jobs               # Show daemon jobs")
+        print("  tea watch DIR          # Download URLs from list files dropped into DIR")
+        print("  tea cleanup [DIR]      # Remove leftovers of interrupted downloads")
+        print("  tea --profile[=MODE] ... # Profile any command (cpu, wall or alloc)")
+        print("  tea --events jsonl ...   # Emit JSON Lines events (add --events-file F to keep console output)")
         print("\nExamples:")
         print("  tea")
         print("  tea --batch urls.txt")
         print("  tea --config")
         print("  tea --search")
         print("  tea --search-file songs.txt")
+        print("  tea download URL --audio --out music --on-duplicate skip")
+        print("  tea --profile=wall download URL")
         print()
 
     def show_supported_formats(self) -> None:
@@ -462,8 +1200,8 @@ class CLI:
 
     # Selection methods
 
-    def _select_quality_audio_only(self) -> bool:
-        """Select quality with enhanced UX, return whether audio-only."""
+    def _select_quality_preset(self) -> str:
+        """Select quality with enhanced UX, return the QUALITY_PRESETS key ('1'-'5')."""
         if QualitySelector is None:
             # Fallback to basic selection
             print("Select video quality:")
@@ -477,12 +1215,12 @@ class CLI:
                 choice = input("Enter choice (1-5, default=1): ").strip()
 
                 if not choice:
-                    return False
+                    return '1'
 
                 if validate_choice(choice, ['1', '2', '3', '4', '5']):
                     if choice == '5':
                         print("Selected: Audio only (MP3)")
-                        return True
+                        return choice
                     else:
                         quality_labels = {
                             '1': 'Best available (1080p)',
@@ -491,15 +1229,12 @@ class CLI:
                             '4': 'Low (360p)'
                         }
                         print(f"Selected: {quality_labels.get(choice, 'Best')}")
-                        return False
+                        return choice
                 else:
                     print("[WARNING] Invalid choice. Please enter 1-5")
 
-            return False
-
         selector = QualitySelector(default_quality=self._config.default_quality)
-        choice = selector.display(show_current=self._config.default_quality)
-        return selector.is_audio_only(choice)
+        return selector.display(show_current=self._config.default_quality)
 
     def select_quality(self) -> str:
         """Interactive quality selection with enhanced UX."""
@@ -603,13 +1338,13 @@ class CLI:
 
     # Command handlers
 
-    def _batch_mode(self) -> None:
+    def _batch_mode(self, args: List[str]) -> None:
         """Handle batch download mode."""
-        if len(sys.argv) < 3:
+        if len(args) < 2:
             print("[ERROR] Usage: tea --batch <file.txt>")
             return
 
-        batch_file = sys.argv[2]
+        batch_file = args[1]
         self.show_banner()
 
         urls = self.load_urls_from_file(batch_file)
@@ -622,7 +1357,8 @@ class CLI:
         for i, url in enumerate(urls, 1):
             print(f"  {i}. {url}")
 
-        audio_only = self._select_quality_audio_only()
+        quality = self._select_quality_preset()
+        audio_only = is_audio_quality(quality)
         output_dir = self._select_output_directory()
 
         max_workers = 1
@@ -634,9 +1370,15 @@ class CLI:
         cleaner = self._init_ai_cleaner()
 
         if output_dir:
-            self._downloader.download(urls, output_dir, max_workers=max_workers, audio_only=audio_only, cleaner=cleaner)
+            self._downloader.download(
+                urls, output_dir, max_workers=max_workers, audio_only=audio_only, cleaner=cleaner,
+                quality=quality, source=batch_file
+            )
         else:
-            self._downloader.download(urls, max_workers=max_workers, audio_only=audio_only, cleaner=cleaner)
+            self._downloader.download(
+                urls, max_workers=max_workers, audio_only=audio_only, cleaner=cleaner, quality=quality,
+                source=batch_file
+            )
 
     def _config_mode(self) -> None:
         """Handle configuration mode with enhanced UX."""
@@ -683,13 +1425,13 @@ class CLI:
 
         self._process_search_results(songs)
 
-    def _search_file_mode(self) -> None:
+    def _search_file_mode(self, args: List[str]) -> None:
         """Handle search from file mode."""
-        if len(sys.argv) < 3:
+        if len(args) < 2:
             print("[ERROR] Usage: tea --search-file <file.txt>")
             return
 
-        song_file = sys.argv[2]
+        song_file = args[1]
         self.show_banner()
 
         songs = self._search.load_songs_from_file(song_file)
@@ -724,16 +1466,15 @@ class CLI:
         print(f"{'=' * 60}\n")
 
         for i, song in enumerate(songs, 1):
-            print(f"\n[{i}/{len(songs)}] Searching for: {song}")
+            self._events.emit('search_started', index=i, total=len(songs), query=song)
 
             selected_url = self._search.search_and_select(song)
 
             if selected_url:
                 urls_to_download.append(selected_url)
-                print(f"[OK] Added to download queue")
             else:
-                print(f"[INFO] Skipped: {song}")
                 skipped_songs.append(song)
+            self._events.emit('search_done', index=i, total=len(songs), query=song, url=selected_url)
 
         # Download selected URLs
         if urls_to_download:
@@ -746,7 +1487,8 @@ class CLI:
 
             if urls_to_download:
                 # Get quality
-                audio_only = self._select_quality_audio_only()
+                quality = self._select_quality_preset()
+                audio_only = is_audio_quality(quality)
 
                 # Get output directory
                 output_dir = self._select_output_directory()
@@ -770,16 +1512,57 @@ class CLI:
                     output_path=final_output_dir,
                     max_workers=max_workers,
                     audio_only=audio_only,
-                    cleaner=cleaner
+                    cleaner=cleaner,
+                    quality=quality
                 )
             else:
                 print("\n[INFO] No videos to download (all were duplicates)")
         else:
             print("\n[INFO] No videos selected for download")
 
-        # Show summary
-        print(f"\n{'=' * 60}")
-        print("SEARCH SUMMARY")
-        print(f"{'=' * 60}")
-        print(f"[OK] Downloads queued: {len(urls_to_download)}")
-        print(f"[INFO] Skipped: {len(skipped_songs)}")
+        self._events.emit('summary', kind='search', queued=len(urls_to_download), skipped=len(skipped_songs))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point for the ``tea`` command.
+
+    Args:
+        argv: Command-line arguments without the program name.
+            Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        Process exit code
+    """
+    logger = setup_logger('tea')
+
+    try:
+        profile_mode, argv = extract_profile_option(sys.argv[1:] if argv is None else argv)
+        event_format, events_file, argv = extract_events_option(argv)
+    except ValidationError as e:
+        print(f"[ERROR] {e}")
+        return EXIT_USAGE
+
+    profiler = Profiler(profile_mode, logger=logger) if profile_mode else None
+    if profiler:
+        profiler.start()
+
+    cli = CLI(logger=logger)
+    try:
+        with ExitStack() as stack:
+            if event_format == 'jsonl':
+                stack.enter_context(jsonl_events(events_file))
+            return cli.run(argv)
+    except KeyboardInterrupt:
+        logger.info("\nDownload cancelled by user")
+        return EXIT_INTERRUPTED
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        raise
+    finally:
+        if profiler:
+            profiler.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,7 @@ This module handles loading, saving, and validating configuration.
 
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from tea.exceptions import ValidationError, ConfigurationError
@@ -14,6 +14,12 @@ from tea.constants import (
     VALID_QUALITIES,
     VALID_DUPLICATE_ACTIONS,
     VALID_MP3_QUALITIES,
+    VALID_EXTERNAL_DOWNLOADERS,
+    VALID_AUDIO_FORMATS,
+    AUDIO_FORMAT_MP3,
+    DEFAULT_CONCURRENT_FRAGMENTS,
+    MAX_FRAGMENT_THREADS,
+    MIN_HTTP_CHUNK_SIZE,
     DEFAULT_CONFIG as CONSTANTS_DEFAULT_CONFIG,
 )
 
@@ -82,6 +88,70 @@ def validate_config(config: Dict[str, Any]) -> bool:
                 value=config['mp3_quality'],
             )
 
+    # Validate audio_format
+    if 'audio_format' in config:
+        if config['audio_format'] not in VALID_AUDIO_FORMATS:
+            raise ValidationError(
+                message=f"Invalid audio_format '{config['audio_format']}'. "
+                f"Valid values: {', '.join(VALID_AUDIO_FORMATS)}",
+                field="audio_format",
+                value=config['audio_format'],
+            )
+
+    # Validate concurrent_fragments
+    if 'concurrent_fragments' in config:
+        fragments = config['concurrent_fragments']
+        if not isinstance(fragments, int) or not (1 <= fragments <= MAX_FRAGMENT_THREADS):
+            raise ValidationError(
+                message=f"Invalid concurrent_fragments '{fragments}'. "
+                f"Must be an integer between 1 and {MAX_FRAGMENT_THREADS}",
+                field="concurrent_fragments",
+                value=fragments,
+            )
+
+    # Validate http_chunk_size
+    if config.get('http_chunk_size') is not None:
+        chunk_size = config['http_chunk_size']
+        if not isinstance(chunk_size, int) or chunk_size < MIN_HTTP_CHUNK_SIZE:
+            raise ValidationError(
+                message=f"Invalid http_chunk_size '{chunk_size}'. "
+                f"Must be null or a number of bytes of at least {MIN_HTTP_CHUNK_SIZE}",
+                field="http_chunk_size",
+                value=chunk_size,
+            )
+
+    # Validate thumbnail_cache
+    if config.get('thumbnail_cache') is not None:
+        cache_dir = config['thumbnail_cache']
+        if not isinstance(cache_dir, str) or not cache_dir.strip():
+            raise ValidationError(
+                message=f"Invalid thumbnail_cache '{cache_dir}'. Must be null or a directory path",
+                field="thumbnail_cache",
+                value=cache_dir,
+            )
+
+    # Validate daemon_output_dirs
+    if 'daemon_output_dirs' in config:
+        output_dirs = config['daemon_output_dirs']
+        if not isinstance(output_dirs, list) or not all(
+            isinstance(d, str) and d.strip() for d in output_dirs
+        ):
+            raise ValidationError(
+                message=f"Invalid daemon_output_dirs '{output_dirs}'. Must be a list of directory paths",
+                field="daemon_output_dirs",
+                value=output_dirs,
+            )
+
+    # Validate external_downloader
+    if config.get('external_downloader') is not None:
+        if config['external_downloader'] not in VALID_EXTERNAL_DOWNLOADERS:
+            raise ValidationError(
+                message=f"Invalid external_downloader '{config['external_downloader']}'. "
+                f"Valid values: null, {', '.join(VALID_EXTERNAL_DOWNLOADERS)}",
+                field="external_downloader",
+                value=config['external_downloader'],
+            )
+
     return True
 
 
@@ -250,11 +320,31 @@ class ConfigManager:
         """Get concurrent downloads setting."""
         return self.get('concurrent_downloads', 3)
 
+    @property
+    def concurrent_fragments(self) -> int:
+        """Get number of fragments one download fetches in parallel."""
+        return self.get('concurrent_fragments', DEFAULT_CONCURRENT_FRAGMENTS)
+
+    @property
+    def http_chunk_size(self) -> Optional[int]:
+        """Get HTTP range request size in bytes (None to fetch in one request)."""
+        return self.get('http_chunk_size')
+
+    @property
+    def external_downloader(self) -> Optional[str]:
+        """Get external downloader name (None for yt-dlp's native downloader)."""
+        return self.get('external_downloader')
+
     @property
     def mp3_quality(self) -> str:
         """Get MP3 quality setting."""
         return self.get('mp3_quality', '320')
 
+    @property
+    def audio_format(self) -> str:
+        """Get audio format ('mp3' to convert, 'native' to keep M4A/Opus)."""
+        return self.get('audio_format', AUDIO_FORMAT_MP3)
+
     @property
     def duplicate_action(self) -> str:
         """Get duplicate action setting."""
@@ -295,6 +385,32 @@ class ConfigManager:
         """Get search fuzzy threshold setting."""
         return self.get('search_fuzzy_threshold', 70)
 
+    @property
+    def search_auto_pick(self) -> bool:
+        """Get search auto-pick setting."""
+        return self.get('search_auto_pick', False)
+
+    @property
+    def media_store(self) -> Optional[str]:
+        """Get media store directory (None when disabled)."""
+        return self.get('media_store')
+
+    @property
+    def thumbnail_cache(self) -> Optional[str]:
+        """Get thumbnail cache directory (None when disabled).
+
+        Relative paths are resolved against the config file's directory.
+        """
+        cache_dir = self.get('thumbnail_cache')
+        if not cache_dir:
+            return None
+        return os.path.join(os.path.dirname(os.path.abspath(self._config_path)), cache_dir)
+
+    @property
+    def daemon_output_dirs(self) -> List[str]:
+        """Get the directories besides default_output that daemon jobs may write to."""
+        return list(self.get('daemon_output_dirs') or [])
+
     @property
     def thumbnail_embed(self) -> bool:
         """Get thumbnail embedding setting."""
@@ -31,6 +31,42 @@ MAX_CONCURRENT_WORKERS = 5
 DEFAULT_CONCURRENT_WORKERS = 3
 """Default number of concurrent download workers."""
 
+# =============================================================================
+# Fragment Download Constants
+# =============================================================================
+
+DEFAULT_CONCURRENT_FRAGMENTS = 4
+"""Default number of DASH/HLS fragments one download fetches in parallel."""
+
+MAX_FRAGMENT_THREADS = 16
+"""Cap on fragment threads across all concurrent downloads (fragments x workers)."""
+
+MIN_HTTP_CHUNK_SIZE = 1024 * 1024
+"""Smallest allowed http_chunk_size in bytes."""
+
+VALID_EXTERNAL_DOWNLOADERS = ("aria2c",)
+"""External downloaders yt-dlp can hand transfers to."""
+
+# =============================================================================
+# Post-processing Constants
+# =============================================================================
+
+POSTPROCESS_QUEUE_SIZE = 8
+"""Downloaded files that may wait for a post-processing worker before downloads pause."""
+
+# =============================================================================
+# Thumbnail Cache Constants
+# =============================================================================
+
+THUMBNAIL_CACHE_DIRNAME = "tea-thumbnails"
+"""Default thumbnail cache directory, relative to the config file's directory."""
+
+THUMBNAIL_EMBED_EXTENSIONS = ("jpg", "png")
+"""Image formats every thumbnail embedder accepts as they are."""
+
+THUMBNAIL_CONVERT_EXTENSION = "png"
+"""Format other thumbnails (WebP, ...) are converted to, as yt-dlp does before embedding."""
+
 # =============================================================================
 # File Extensions
 # =============================================================================
@@ -50,10 +86,11 @@ VALID_FORMAT_EXTENSIONS: Set[str] = VALID_VIDEO_EXTENSIONS | VALID_AUDIO_EXTENSI
 
 QUALITY_PRESETS: Dict[str, str] = {
     "best": "bestvideo+bestaudio/best",
-    "1": "bestvideo+bestaudio/best",
-    "2": "bestvideo[height<=1080]+bestaudio/best",
-    "3": "bestvideo[height<=720]+bestaudio/best",
-    "4": "bestvideo[height<=480]+bestaudio/best",
+    # Numbered presets match the quality menu (1 = best up to 1080p)
+    "1": "bestvideo[height<=1080]+bestaudio/best[height<=1080]/best",
+    "2": "bestvideo[height<=720]+bestaudio/best[height<=720]/best",
+    "3": "bestvideo[height<=480]+bestaudio/best[height<=480]/best",
+    "4": "bestvideo[height<=360]+bestaudio/best[height<=360]/best",
     "5": "bestaudio/best",  # Audio only
     "audio": "bestaudio/best",
     "1080p": "bestvideo[height<=1080]+bestaudio/best",
@@ -81,6 +118,37 @@ VALID_QUALITIES: Set[str] = {
 VALID_MP3_QUALITIES: Set[str] = {"128", "192", "256", "320"}
 """Valid MP3 quality settings in kbps."""
 
+AUDIO_ONLY_QUALITIES: Set[str] = {"5", "audio"}
+"""Quality presets that download audio only."""
+
+DEFAULT_VIDEO_QUALITY = "1"
+"""Video quality preset used when the configured default_quality is audio only."""
+
+DEFAULT_MP3_QUALITY = "320"
+"""Default MP3 bitrate in kbps."""
+
+# =============================================================================
+# Format Planning Constants
+# =============================================================================
+
+AUDIO_FORMAT_MP3 = "mp3"
+"""Audio format that converts downloads to MP3."""
+
+AUDIO_FORMAT_NATIVE = "native"
+"""Audio format that keeps the source's own M4A/Opus audio without transcoding."""
+
+VALID_AUDIO_FORMATS = (AUDIO_FORMAT_MP3, AUDIO_FORMAT_NATIVE)
+"""Valid audio_format settings."""
+
+MP4_VIDEO_CODEC_FILTER = "[vcodec^=avc1]"
+"""Format filter for H.264 video, which fits MP4 without conversion."""
+
+MP4_AUDIO_CODEC_FILTER = "[ext=m4a]"
+"""Format filter for AAC audio, which fits MP4 without conversion."""
+
+NATIVE_AUDIO_FORMAT = "bestaudio[ext=m4a]/bestaudio[acodec=opus]/bestaudio/best"
+"""Format selector for audio kept in its own container, preferring M4A then Opus."""
+
 # =============================================================================
 # Configuration Validation
 # =============================================================================
@@ -88,13 +156,20 @@ VALID_MP3_QUALITIES: Set[str] = {"128", "192", "256", "320"}
 VALID_DUPLICATE_ACTIONS: Set[str] = {"ask", "download", "skip"}
 """Valid actions for handling duplicate downloads."""
 
+HEADLESS_DUPLICATE_ACTIONS: List[str] = ["skip", "download", "replace"]
+"""Duplicate actions accepted on the command line (no interactive prompt)."""
+
 DEFAULT_CONFIG: Dict[str, object] = {
     "default_quality": "5",
     "default_output": "downloads",
     "concurrent_downloads": DEFAULT_CONCURRENT_WORKERS,
+    "concurrent_fragments": DEFAULT_CONCURRENT_FRAGMENTS,
+    "http_chunk_size": None,
+    "external_downloader": None,
     "thumbnail_embed": True,
     "split_enabled": False,
-    "mp3_quality": "320",
+    "mp3_quality": DEFAULT_MP3_QUALITY,
+    "audio_format": AUDIO_FORMAT_MP3,
     "duplicate_action": "ask",
     "use_ai_filename_cleaning": False,
     "openrouter_api_key": None,
@@ -103,6 +178,10 @@ DEFAULT_CONFIG: Dict[str, object] = {
     "search_max_duration": 600,
     "search_use_ai": True,
     "search_fuzzy_threshold": 70,
+    "search_auto_pick": False,
+    "media_store": None,
+    "thumbnail_cache": THUMBNAIL_CACHE_DIRNAME,
+    "daemon_output_dirs": [],
     "_version": __version__,
 }
 """Default configuration values."""
@@ -237,6 +316,28 @@ DEFAULT_SEARCH_MAX_DURATION = 600
 DEFAULT_FUZZY_THRESHOLD = 70
 """Default threshold for fuzzy string matching (0-100)."""
 
+SEARCH_PREVIEW_RESULTS = 3
+"""Number of streamed search results shown before the first selection prompt."""
+
+SEARCH_AUTO_PICK_RATIO = 90
+"""Minimum fuzzy title match (0-100) for a streamed result to be auto-picked."""
+
+# =============================================================================
+# AI (OpenRouter) Constants
+# =============================================================================
+
+OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+"""OpenRouter chat completions endpoint."""
+
+OPENROUTER_MODEL = "qwen/qwen-2.5-coder-32b-instruct:free"
+"""Model used for filename cleaning and search query enhancement."""
+
+AI_MAX_DAILY_REQUESTS = 50
+"""Maximum AI requests per day per API key (free tier limit)."""
+
+AI_MIN_REQUEST_INTERVAL = 3.0
+"""Minimum seconds between AI requests (20 requests/minute free tier limit)."""
+
 # =============================================================================
 # Timestamp/FFmpeg Constants
 # =============================================================================
@@ -270,6 +371,245 @@ HISTORY_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
 MAX_HISTORY_DISPLAY_ENTRIES = 50
 """Maximum number of history entries to display."""
 
+# =============================================================================
+# Command-Line Constants
+# =============================================================================
+
+EXIT_OK = 0
+"""Exit code when every requested item succeeded (or nothing needed doing)."""
+
+EXIT_FAILURE = 1
+"""Exit code when nothing succeeded or an unrecoverable error occurred."""
+
+EXIT_USAGE = 2
+"""Exit code for invalid command-line usage (same as argparse)."""
+
+EXIT_PARTIAL = 3
+"""Exit code when some, but not all, requested items failed."""
+
+EXIT_INTERRUPTED = 130
+"""Exit code when cancelled with Ctrl+C (128 + SIGINT)."""
+
+SPLIT_FROM_CHAPTERS = "chapters"
+"""``--split-from`` value that splits on YouTube chapters or description timestamps."""
+
+# =============================================================================
+# Playlist Streaming Constants
+# =============================================================================
+
+MAX_NESTED_PLAYLIST_DEPTH = 2
+"""How deep nested playlists (e.g. channel tabs) are expanded when streaming entries."""
+
+# =============================================================================
+# YoutubeDL Pool Constants
+# =============================================================================
+
+YTDLP_POOL_MAX_IDLE = 8
+"""Idle YoutubeDL instances kept open for reuse; the least recently used is closed first."""
+
+# =============================================================================
+# Download Archive Constants
+# =============================================================================
+
+ARCHIVE_FILENAME = "tea-archive.txt"
+"""Archive of downloaded video IDs, stored next to the history file."""
+
+SYNC_STATE_FILENAME = "tea-sync.json"
+"""Per-channel high-water marks for incremental sync, stored next to the history file."""
+
+ARCHIVE_DEFAULT_EXTRACTOR = "youtube"
+"""Extractor key used for archive entries when yt-dlp does not report one."""
+
+SYNC_KNOWN_STREAK = 3
+"""Consecutive archived videos after which a newest-first sync stops enumerating."""
+
+# =============================================================================
+# Media Store Constants
+# =============================================================================
+
+STORE_INFO_FILENAME = "info.json"
+"""Metadata file kept next to each item in the media store."""
+
+STORE_INFO_FIELDS = (
+    "id",
+    "title",
+    "uploader",
+    "uploader_id",
+    "channel",
+    "channel_id",
+    "upload_date",
+    "duration",
+    "extractor_key",
+    "ext",
+)
+"""Info fields kept in the media store, enough to rebuild output file names."""
+
+LOCAL_AUDIO_SOURCE_EXTENSIONS = ("mp4", "mkv", "webm", "m4a", "opus")
+"""Local files an MP3 can be transcoded from instead of downloading the audio again."""
+
+LOCAL_REMUX_SOURCE_EXTENSIONS = ("mkv", "webm", "mov")
+"""Local video files that can be remuxed to MP4 instead of downloaded again."""
+
+# =============================================================================
+# Scheduling Constants
+# =============================================================================
+
+PRIORITY_HIGH = 0
+"""Priority class for interactive requests that should start first."""
+
+PRIORITY_NORMAL = 1
+"""Priority class for ordinary downloads."""
+
+PRIORITY_LOW = 2
+"""Priority class for large background jobs (channels, playlists, archives)."""
+
+PRIORITY_NAMES: Dict[str, int] = {
+    "high": PRIORITY_HIGH,
+    "normal": PRIORITY_NORMAL,
+    "low": PRIORITY_LOW,
+}
+"""Priority class names accepted on the command line and by the daemon API."""
+
+MAX_IN_FLIGHT_PER_CHANNEL = 2
+"""Maximum concurrent downloads from the same channel or playlist."""
+
+# =============================================================================
+# Daemon Constants
+# =============================================================================
+
+DAEMON_HOST = "127.0.0.1"
+"""Interface the daemon listens on (localhost only by default)."""
+
+DAEMON_PORT = 8765
+"""Default TCP port of the daemon job API."""
+
+DAEMON_MAX_REQUEST_BYTES = 1024 * 1024
+"""Largest request body the daemon accepts."""
+
+DAEMON_MAX_FINISHED_JOBS = 1000
+"""Finished jobs kept in memory for status queries before the oldest are dropped."""
+
+DAEMON_CLIENT_TIMEOUT = 10
+"""Socket timeout in seconds for daemon client requests."""
+
+DAEMON_POLL_INTERVAL = 1.0
+"""Seconds between job status polls when waiting for submitted jobs."""
+
+DAEMON_TOKEN_FILENAME = "tea-daemon-{port}.token"
+"""Per-daemon API token file, written next to the config file when the daemon starts."""
+
+DAEMON_LOOPBACK_HOSTS = ("localhost", "127.0.0.1", "::1")
+"""Host header names the daemon accepts besides the address it is bound to."""
+
+JOB_QUEUED = "queued"
+"""Job is waiting for a worker."""
+
+JOB_RUNNING = "running"
+"""Job is being downloaded."""
+
+JOB_DONE = "done"
+"""Job finished successfully."""
+
+JOB_FAILED = "failed"
+"""Job finished with an error."""
+
+JOB_CANCELLED = "cancelled"
+"""Job was cancelled before it started."""
+
+JOB_FINISHED_STATES: Set[str] = {JOB_DONE, JOB_FAILED, JOB_CANCELLED}
+"""Job states that will not change any more."""
+
+# =============================================================================
+# Watch Folder Constants
+# =============================================================================
+
+WATCH_FILE_EXTENSIONS: Set[str] = {".txt", ".list"}
+"""URL list file extensions picked up by tea watch."""
+
+WATCH_POLL_INTERVAL = 2.0
+"""Seconds between directory scans when inotify is unavailable."""
+
+WATCH_SETTLE_SECONDS = 2.0
+"""Seconds a file must be unchanged before a last line without newline is read."""
+
+WATCH_STATE_FILENAME = ".tea-watch.json"
+"""File in the watched directory that stores how far each list has been read."""
+
+# =============================================================================
+# Cleanup Constants
+# =============================================================================
+
+CLEANUP_PATTERNS = (
+    "*.part",
+    "*.ytdl",
+    "*.temp",
+    "*.part-Frag*",
+    "*.f*.mp4.part*",
+    "*.f*.mp4.ytdl",
+)
+"""Leftovers of interrupted downloads removed by tea cleanup."""
+
+CLEANUP_MIN_AGE = 3600
+"""Seconds since a leftover was last modified before tea cleanup removes it."""
+
+CLEANUP_COMPLETE_EXTENSIONS = (".mp4", ".mp3", ".mkv", ".webm")
+"""Extensions of finished downloads counted by tea cleanup."""
+
+DOWNLOAD_LOCK_PREFIX = ".tea-download-"
+"""Start of the lock file a running download keeps in its output directory."""
+
+DOWNLOAD_LOCK_SUFFIX = ".lock"
+"""End of the lock file name; the process ID goes in between."""
+
+# =============================================================================
+# Metrics Constants
+# =============================================================================
+
+METRICS_NAMESPACE = "tea"
+"""Prefix of every exported metric name."""
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the Prometheus text exposition format."""
+
+THROTTLE_ERROR_MARKERS = ("HTTP Error 429", "Too Many Requests")
+"""Error text that marks a failed attempt as throttled by YouTube."""
+
+# =============================================================================
+# Event Stream Constants
+# =============================================================================
+
+EVENT_FORMATS = ("human", "jsonl")
+"""Output formats accepted by tea --events FORMAT."""
+
+EVENT_PROGRESS_INTERVAL = 0.2
+"""Minimum seconds between progress events for the same file."""
+
+# =============================================================================
+# Profiling Constants
+# =============================================================================
+
+PROFILE_MODES = ("cpu", "wall", "alloc")
+"""Modes accepted by tea --profile=MODE."""
+
+PROFILE_DEFAULT_MODE = "cpu"
+"""Mode used by a bare tea --profile."""
+
+PROFILE_FILE_EXTENSIONS: Dict[str, str] = {
+    "cpu": ".pstats",
+    "wall": ".speedscope.json",
+    "alloc": ".tracemalloc",
+}
+"""Report file extension per profiling mode."""
+
+PROFILE_TOP_N = 20
+"""Functions or allocation sites listed in the summary printed at exit."""
+
+PROFILE_SAMPLE_INTERVAL = 0.005
+"""Seconds between stack samples in wall mode."""
+
+PROFILE_TRACEMALLOC_FRAMES = 16
+"""Stack frames stored per allocation in alloc mode."""
+
 # =============================================================================
 # Error Messages
 # =============================================================================
@@ -0,0 +1,777 @@
+"""
+Daemon mode for Tea YouTube Downloader.
+
+``tea serve`` keeps one set of services (download service, info cache,
+history, yt-dlp) loaded and accepts download jobs over a small JSON API on
+localhost. ``tea submit`` uses DaemonClient to hand jobs to it, so each
+submission costs one HTTP request rather than a new interpreter.
+
+Endpoints:
+    GET    /health      Liveness check with uptime and job counts
+    GET    /metrics     Stage timers, counters and job counts (Prometheus text format)
+    GET    /jobs        List jobs (optional ?status=queued|running|done|failed|cancelled)
+    POST   /jobs        Submit {"urls": [...], "output": dir, "audio": bool, "on_duplicate": str,
+                        "audio_format": str, "quality": str, "audio_quality": str}
+    GET    /jobs/<id>   Job details
+    DELETE /jobs/<id>   Cancel a job that has not started
+
+Requests must carry a Host header naming the bound address or localhost,
+which keeps DNS-rebinding pages out. POST and DELETE also need the daemon's
+token (``Authorization: Bearer <token>``); the daemon writes it to
+DAEMON_TOKEN_FILENAME next to the config file, readable only by the user,
+and DaemonClient reads it from there. A web page cannot read that file, and
+its cross-origin "simple" requests are refused because job submissions
+must be ``application/json``. Jobs write only into default_output or one of
+the ``daemon_output_dirs`` from the config.
+"""
+
+import hmac
+import http.client
+import ipaddress
+import json
+import os
+import secrets
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# Import from tea modules
+try:
+    from tea.jobs import JobQueue
+    from tea.info import channel_key, dedupe_urls
+    from tea.scheduler import parse_priority
+    from tea.metrics import Metrics, get_metrics
+    from tea.config import ConfigManager, get_config_path
+    from tea.formats import normalize_audio_quality, plan_format
+    from tea.exceptions import DaemonError, ValidationError
+    from tea.constants import (
+        __version__,
+        DAEMON_HOST,
+        DAEMON_PORT,
+        DAEMON_MAX_REQUEST_BYTES,
+        DAEMON_CLIENT_TIMEOUT,
+        DAEMON_POLL_INTERVAL,
+        DAEMON_TOKEN_FILENAME,
+        DAEMON_LOOPBACK_HOSTS,
+        HEADLESS_DUPLICATE_ACTIONS,
+        AUDIO_FORMAT_MP3,
+        JOB_FINISHED_STATES,
+        METRICS_CONTENT_TYPE,
+    )
+except ImportError:
+    # Fallback for development
+    from tea.jobs import JobQueue
+    from tea.info import channel_key, dedupe_urls
+    from tea.scheduler import parse_priority
+    from tea.metrics import Metrics, get_metrics
+    from tea.config import ConfigManager, get_config_path
+    from tea.formats import normalize_audio_quality, plan_format
+    from tea.exceptions import DaemonError, ValidationError
+    from tea.constants import (
+        __version__,
+        DAEMON_HOST,
+        DAEMON_PORT,
+        DAEMON_MAX_REQUEST_BYTES,
+        DAEMON_CLIENT_TIMEOUT,
+        DAEMON_POLL_INTERVAL,
+        DAEMON_TOKEN_FILENAME,
+        DAEMON_LOOPBACK_HOSTS,
+        HEADLESS_DUPLICATE_ACTIONS,
+        AUDIO_FORMAT_MP3,
+        JOB_FINISHED_STATES,
+        METRICS_CONTENT_TYPE,
+    )
+
+# Import security utilities
+try:
+    from tea.utils.security import sanitize_path, validate_url
+except ImportError:
+    # Fallback definitions
+    def sanitize_path(path):
+        if not path or not isinstance(path, str):
+            return ''
+        return path.strip().strip('"').strip("'")
+
+    def validate_url(url):
+        if not url or not isinstance(url, str):
+            return False
+        return 'youtube.com' in url or 'youtu.be' in url
+
+
+def daemon_token_path(port: int, config_path: Optional[str] = None) -> str:
+    """
+    Get the token file of the daemon listening on a port.
+
+    Args:
+        port: Daemon port
+        config_path: Config file the token lives next to. If None, uses the
+            default config location.
+
+    Returns:
+        Path of the token file
+    """
+    config_dir = os.path.dirname(os.path.abspath(config_path or get_config_path()))
+    return os.path.join(config_dir, DAEMON_TOKEN_FILENAME.format(port=port))
+
+
+def _write_token(path: str, token: str) -> None:
+    """Write a token file readable only by the current user."""
+    if os.path.exists(path):
+        os.remove(path)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(token)
+
+
+class TeaDaemon:
+    """Localhost HTTP server that accepts download jobs.
+
+    Attributes:
+        _jobs: JobQueue that runs submitted downloads
+        _config: ConfigManager used for default output and duplicate handling
+        _server: Underlying ThreadingHTTPServer
+        _metrics: Metrics registry exported on /metrics
+        _token: Token required by POST and DELETE requests
+        _token_path: File the token is written to
+        _logger: Logger instance for logging
+    """
+
+    def __init__(
+        self,
+        job_queue: JobQueue,
+        config_manager: Optional[ConfigManager] = None,
+        host: str = DAEMON_HOST,
+        port: int = DAEMON_PORT,
+        metrics: Optional[Metrics] = None,
+        logger=None
+    ):
+        """Initialize TeaDaemon and bind its socket.
+
+        Args:
+            job_queue: JobQueue that runs submitted downloads
+            config_manager: Configuration manager instance. If None, creates default.
+            host: Interface to listen on
+            port: TCP port to listen on (0 picks a free port)
+            metrics: Metrics registry to export. If None, uses the process-wide one.
+            logger: Logger instance for logging
+
+        Raises:
+            DaemonError: If the address cannot be bound
+        """
+        self._jobs = job_queue
+        self._config = config_manager or ConfigManager(logger=logger)
+        self._metrics = metrics or get_metrics()
+        self._logger = logger
+        self._started_at = time.time()
+        self._thread: Optional[threading.Thread] = None
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), _DaemonRequestHandler)
+        except OSError as e:
+            raise DaemonError(f"Cannot listen on {host}:{port}: {e}", address=f"{host}:{port}") from e
+        self._server.daemon_threads = True
+        self._server.tea_daemon = self
+
+        self._token = secrets.token_urlsafe(32)
+        self._token_path = daemon_token_path(self.address[1], self._config.config_path)
+        try:
+            _write_token(self._token_path, self._token)
+        except OSError as e:
+            self._server.server_close()
+            raise DaemonError(
+                f"Cannot write daemon token {self._token_path}: {e}", address=f"{host}:{port}"
+            ) from e
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """(host, port) the daemon is listening on."""
+        host, port = self._server.server_address[:2]
+        return host, port
+
+    @property
+    def jobs(self) -> JobQueue:
+        """JobQueue that runs submitted downloads."""
+        return self._jobs
+
+    @property
+    def token(self) -> str:
+        """Token required by POST and DELETE requests."""
+        return self._token
+
+    def check_host(self, host_header: Optional[str]) -> bool:
+        """
+        Check the Host header of a request.
+
+        Only the bound address and loopback names are accepted, so a page
+        that rebinds its own domain to 127.0.0.1 cannot talk to the daemon.
+        IP literals are accepted for wildcard binds (0.0.0.0, ::), as DNS
+        rebinding needs a domain name.
+
+        Args:
+            host_header: Value of the Host header
+
+        Returns:
+            True if the request may be served
+        """
+        if not host_header:
+            return False
+        if host_header.startswith('['):
+            # [IPv6]:port
+            name, _, rest = host_header[1:].partition(']')
+            port = rest[1:]
+        elif host_header.count(':') == 1:
+            name, _, port = host_header.partition(':')
+        else:
+            name, port = host_header, ''
+        name = name.lower()
+        bound_host, bound_port = self.address
+        # Clients leave out the default port
+        if (port or '80') != str(bound_port):
+            return False
+        if name in DAEMON_LOOPBACK_HOSTS or name == bound_host.lower():
+            return True
+        try:
+            ipaddress.ip_address(name)
+        except ValueError:
+            return False
+        return ipaddress.ip_address(bound_host).is_unspecified
+
+    def check_token(self, authorization: Optional[str]) -> bool:
+        """
+        Check the Authorization header of a request.
+
+        Args:
+            authorization: Value of the Authorization header
+
+        Returns:
+            True if it carries the daemon's token
+        """
+        scheme, _, token = (authorization or '').partition(' ')
+        return scheme.lower() == 'bearer' and hmac.compare_digest(token.strip(), self._token)
+
+    # Lifecycle
+
+    def serve_forever(self) -> None:
+        """Start the job workers and serve requests until shutdown() is called."""
+        self._jobs.start()
+        try:
+            self._server.serve_forever(poll_interval=0.2)
+        finally:
+            self._server.server_close()
+
+    def start(self) -> None:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="tea-daemon", daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stop serving requests and stop the job workers."""
+        self._server.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._jobs.stop()
+        try:
+            os.remove(self._token_path)
+        except OSError:
+            pass
+
+    # API operations
+
+    def health(self) -> Dict[str, Any]:
+        """
+        Get daemon status.
+
+        Returns:
+            Dictionary with status, version, uptime and job counts
+        """
+        return {
+            'status': 'ok',
+            'version': __version__,
+            'pid': os.getpid(),
+            'uptime': round(time.time() - self._started_at, 3),
+            'jobs': self._jobs.counts(),
+        }
+
+    def metrics(self) -> str:
+        """
+        Export pipeline metrics, job counts and uptime.
+
+        Returns:
+            Prometheus text exposition
+        """
+        return self._metrics.to_prometheus(extra={
+            'jobs': {(('status', status),): count for status, count in self._jobs.counts().items()},
+            'uptime_seconds': {(): round(time.time() - self._started_at, 3)},
+        })
+
+    def submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue the URLs of a submission.
+
+        Args:
+            payload: Submission with 'urls' (or 'url'), and optional 'output',
+                'audio', 'on_duplicate', 'priority' and the format overrides
+                'audio_format', 'quality' and 'audio_quality'
+
+        Returns:
+            Dictionary with the queued 'jobs', and 'skipped' and 'invalid' URLs
+
+        Raises:
+            ValueError: If the payload is malformed or 'output' is outside the
+                allowed directories
+        """
+        urls = payload.get('urls')
+        if urls is None and 'url' in payload:
+            urls = [payload['url']]
+        if not isinstance(urls, list) or not urls or not all(isinstance(u, str) for u in urls):
+            raise ValueError("'urls' must be a non-empty list of strings")
+
+        output = payload.get('output')
+        if output is not None and not isinstance(output, str):
+            raise ValueError("'output' must be a string")
+        output_path = sanitize_path(output or '') or self._config.default_output or 'downloads'
+        if output is not None and not self._output_allowed(output_path):
+            raise ValueError("'output' must be inside default_output or one of daemon_output_dirs")
+
+        audio_only = payload.get('audio', False)
+        if not isinstance(audio_only, bool):
+            raise ValueError("'audio' must be true or false")
+
+        formats = {}
+        for key in ('audio_format', 'quality', 'audio_quality'):
+            value = payload.get(key)
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"'{key}' must be a string")
+            formats[key] = value
+        try:
+            plan_format(audio_format=formats['audio_format'] or AUDIO_FORMAT_MP3, quality=formats['quality'])
+            if formats['audio_quality'] is not None:
+                normalize_audio_quality(formats['audio_quality'])
+        except ValidationError as e:
+            raise ValueError(e.message)
+
+        on_duplicate = payload.get('on_duplicate')
+        if on_duplicate is None:
+            on_duplicate = self._config.duplicate_action
+            if on_duplicate not in HEADLESS_DUPLICATE_ACTIONS:
+                # 'ask' cannot prompt in the daemon
+                on_duplicate = 'skip'
+        elif on_duplicate not in HEADLESS_DUPLICATE_ACTIONS:
+            raise ValueError(
+                f"'on_duplicate' must be one of: {', '.join(HEADLESS_DUPLICATE_ACTIONS)}"
+            )
+
+        priority = payload.get('priority')
+        if priority is not None:
+            priority = parse_priority(priority)
+
+        # The URLs of one submission take turns with other submissions
+        source = f"submission-{uuid.uuid4().hex[:8]}"
+
+        queued, skipped, invalid = [], [], []
+        for url in dedupe_urls(u.strip() for u in urls):
+            if not validate_url(url):
+                invalid.append(url)
+                continue
+
+            job = self._jobs.submit(
+                url, output_path, audio_only, on_duplicate, priority=priority, source=source,
+                channel=channel_key(url), **formats
+            )
+            if job is None:
+                skipped.append(url)
+            else:
+                queued.append(job.to_dict())
+
+        return {'jobs': queued, 'skipped': skipped, 'invalid': invalid}
+
+    def _output_allowed(self, path: str) -> bool:
+        """Check that an output directory is inside default_output or daemon_output_dirs."""
+        target = os.path.realpath(path)
+        for root in [self._config.default_output or 'downloads', *self._config.daemon_output_dirs]:
+            root = os.path.realpath(root)
+            try:
+                if os.path.commonpath([target, root]) == root:
+                    return True
+            except ValueError:
+                # Different drives on Windows
+                continue
+        return False
+
+    def log(self, message: str) -> None:
+        """Log a request line at debug level."""
+        if self._logger:
+            self._logger.debug(message)
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    """Routes HTTP requests to the owning TeaDaemon."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = f'Tea/{__version__}'
+
+    @property
+    def tea_daemon(self) -> TeaDaemon:
+        """TeaDaemon that owns the server."""
+        return self.server.tea_daemon
+
+    def _refuse(self, token: bool = False) -> bool:
+        """
+        Answer requests from unexpected hosts or without the token.
+
+        Args:
+            token: Whether the request needs the daemon token
+
+        Returns:
+            True if an error response was sent
+        """
+        if not self.tea_daemon.check_host(self.headers.get('Host')):
+            self._discard_body()
+            self._send_error(403, "Host not allowed")
+            return True
+        if token and not self.tea_daemon.check_token(self.headers.get('Authorization')):
+            self._discard_body()
+            self._send_error(401, "Missing or invalid daemon token")
+            return True
+        return False
+
+    def do_GET(self) -> None:
+        """Handle GET /health, /metrics, /jobs and /jobs/<id>."""
+        if self._refuse():
+            return
+        parsed = urlparse(self.path)
+        parts = [p for p in parsed.path.split('/') if p]
+
+        if parts == ['health']:
+            self._send_json(200, self.tea_daemon.health())
+        elif parts == ['metrics']:
+            self._send_text(200, self.tea_daemon.metrics(), METRICS_CONTENT_TYPE)
+        elif parts == ['jobs']:
+            status = parse_qs(parsed.query).get('status', [None])[0]
+            jobs = self.tea_daemon.jobs.list_jobs(status)
+            self._send_json(200, {'jobs': [job.to_dict() for job in jobs]})
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            job = self.tea_daemon.jobs.get(parts[1])
+            if job is None:
+                self._send_error(404, f"Unknown job: {parts[1]}")
+            else:
+                self._send_json(200, job.to_dict())
+        else:
+            self._send_error(404, f"Not found: {parsed.path}")
+
+    def do_POST(self) -> None:
+        """Handle POST /jobs."""
+        if self._refuse(token=True):
+            return
+        if urlparse(self.path).path.rstrip('/') != '/jobs':
+            self._discard_body()
+            self._send_error(404, f"Not found: {self.path}")
+            return
+        content_type = self.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if content_type != 'application/json':
+            self._discard_body()
+            self._send_error(415, "Content-Type must be application/json")
+            return
+
+        try:
+            payload = self._read_json()
+            response = self.tea_daemon.submit(payload)
+        except ValueError as e:
+            self._send_error(400, str(e))
+            return
+
+        self._send_json(201 if response['jobs'] else 200, response)
+
+    def do_DELETE(self) -> None:
+        """Handle DELETE /jobs/<id>."""
+        if self._refuse(token=True):
+            return
+        parts = [p for p in urlparse(self.path).path.split('/') if p]
+        if len(parts) != 2 or parts[0] != 'jobs':
+            self._send_error(404, f"Not found: {self.path}")
+            return
+
+        job = self.tea_daemon.jobs.get(parts[1])
+        if job is None:
+            self._send_error(404, f"Unknown job: {parts[1]}")
+        elif self.tea_daemon.jobs.cancel(job.id):
+            self._send_json(200, job.to_dict())
+        else:
+            self._send_error(409, f"Job {job.id} is already {job.status}")
+
+    def _read_json(self) -> Dict[str, Any]:
+        """Read and decode a JSON object request body."""
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            raise ValueError("Invalid Content-Length")
+        if length <= 0:
+            raise ValueError("Request body is empty")
+        if length > DAEMON_MAX_REQUEST_BYTES:
+            self.close_connection = True
+            raise ValueError(f"Request body exceeds {DAEMON_MAX_REQUEST_BYTES} bytes")
+
+        try:
+            payload = json.loads(self.rfile.read(length).decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        if not isinstance(payload, dict):
+            raise ValueError("Request body must be a JSON object")
+        return payload
+
+    def _discard_body(self) -> None:
+        """Read and drop a request body so the connection can be reused."""
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = 0
+        if 0 < length <= DAEMON_MAX_REQUEST_BYTES:
+            self.rfile.read(length)
+        elif length:
+            self.close_connection = True
+
+    def _send_json(self, status: int, data: Dict[str, Any]) -> None:
+        """Send a JSON response."""
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(self, status: int, text: str, content_type: str) -> None:
+        """Send a plain text response."""
+        body = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str) -> None:
+        """Send a JSON error response."""
+        self._send_json(status, {'error': message})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Send request logs to the daemon logger instead of stderr."""
+        self.tea_daemon.log(f"{self.address_string()} {format % args}")
+
+
+class DaemonClient:
+    """Client for the daemon job API, used by ``tea submit``.
+
+    Attributes:
+        host: Daemon host
+        port: Daemon port
+        timeout: Socket timeout in seconds
+        token: Daemon token sent with POST and DELETE requests
+    """
+
+    def __init__(
+        self,
+        host: str = DAEMON_HOST,
+        port: int = DAEMON_PORT,
+        timeout: float = DAEMON_CLIENT_TIMEOUT,
+        token: Optional[str] = None,
+        config_path: Optional[str] = None
+    ):
+        """Initialize DaemonClient.
+
+        Args:
+            host: Daemon host
+            port: Daemon port
+            timeout: Socket timeout in seconds
+            token: Daemon token. If None, it is read from the daemon's token
+                file when a request needs it.
+            config_path: Config file of the daemon, next to which its token
+                file lives. If None, uses the default config location.
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.token = token
+        self._config_path = config_path
+
+    def _read_token(self) -> Optional[str]:
+        """Read the daemon's token file, if there is one."""
+        try:
+            with open(daemon_token_path(self.port, self._config_path), encoding='utf-8') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    @property
+    def address(self) -> str:
+        """host:port of the daemon."""
+        return f"{self.host}:{self.port}"
+
+    def _request(self, method: str, path: str, payload: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Send a request and decode the JSON response.
+
+        Raises:
+            DaemonError: If the daemon is unreachable or returns an error
+        """
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        if method != 'GET':
+            token = self.token or self._read_token()
+            if token:
+                headers['Authorization'] = f'Bearer {token}'
+
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            raw = response.read()
+        except ConnectionRefusedError as e:
+            raise DaemonError(
+                "Tea daemon is not running (start it with 'tea serve')", address=self.address
+            ) from e
+        except (OSError, http.client.HTTPException) as e:
+            raise DaemonError(f"Request to daemon failed: {e}", address=self.address) from e
+        finally:
+            connection.close()
+
+        try:
+            data = json.loads(raw.decode('utf-8')) if raw else {}
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise DaemonError(
+                f"Malformed response from daemon: {e}", address=self.address, status=response.status
+            ) from e
+
+        if response.status >= 400:
+            raise DaemonError(
+                data.get('error', response.reason), address=self.address, status=response.status
+            )
+        return data
+
+    def health(self) -> Dict[str, Any]:
+        """
+        Check that the daemon is running.
+
+        Returns:
+            Health dictionary from the daemon
+        """
+        return self._request('GET', '/health')
+
+    def submit(
+        self,
+        urls: List[str],
+        output: Optional[str] = None,
+        audio: bool = False,
+        on_duplicate: Optional[str] = None,
+        priority: Optional[str] = None,
+        audio_format: Optional[str] = None,
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Submit URLs for download.
+
+        Args:
+            urls: YouTube URLs to download
+            output: Output directory (absolute, as seen by the daemon)
+            audio: Download audio only (MP3)
+            on_duplicate: 'skip', 'download' or 'replace' (default: daemon config)
+            priority: 'high', 'normal' or 'low' (default: by content type)
+            audio_format: 'mp3' or 'native' (default: daemon config)
+            quality: Video quality preset (default: daemon config)
+            audio_quality: MP3 bitrate or preset name (default: daemon config)
+
+        Returns:
+            Dictionary with the queued 'jobs', and 'skipped' and 'invalid' URLs
+        """
+        payload: Dict[str, Any] = {'urls': list(urls), 'audio': audio}
+        if output:
+            payload['output'] = output
+        if on_duplicate:
+            payload['on_duplicate'] = on_duplicate
+        if priority:
+            payload['priority'] = priority
+        for key, value in (('audio_format', audio_format), ('quality', quality),
+                           ('audio_quality', audio_quality)):
+            if value:
+                payload[key] = value
+        return self._request('POST', '/jobs', payload)
+
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get the current state of a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job dictionary
+        """
+        return self._request('GET', f'/jobs/{job_id}')
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List jobs known to the daemon.
+
+        Args:
+            status: Only return jobs in this state
+
+        Returns:
+            List of job dictionaries
+        """
+        path = f'/jobs?status={status}' if status else '/jobs'
+        return self._request('GET', path)['jobs']
+
+    def cancel(self, job_id: str) -> Dict[str, Any]:
+        """
+        Cancel a job that has not started.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job dictionary
+        """
+        return self._request('DELETE', f'/jobs/{job_id}')
+
+    def wait(
+        self,
+        job_ids: List[str],
+        poll_interval: float = DAEMON_POLL_INTERVAL,
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Poll until every job has finished.
+
+        Args:
+            job_ids: Jobs to wait for
+            poll_interval: Seconds between polls
+            timeout: Maximum seconds to wait (None waits as needed)
+
+        Returns:
+            Final job dictionaries, in the order of job_ids
+
+        Raises:
+            DaemonError: If the timeout expires
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        finished: Dict[str, Dict[str, Any]] = {}
+
+        while True:
+            for job_id in job_ids:
+                if job_id not in finished:
+                    job = self.get_job(job_id)
+                    if job['status'] in JOB_FINISHED_STATES:
+                        finished[job_id] = job
+
+            if len(finished) == len(job_ids):
+                return [finished[job_id] for job_id in job_ids]
+
+            if deadline is not None and time.monotonic() >= deadline:
+                raise DaemonError(
+                    f"Timed out waiting for {len(job_ids) - len(finished)} job(s)",
+                    address=self.address
+                )
+            time.sleep(poll_interval)
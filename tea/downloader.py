@@ -5,20 +5,35 @@ This module handles the core download functionality for videos, playlists, and c
 """
 
 import os
+import shutil
 import time
-from typing import List, Dict, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import uuid
+from contextlib import ExitStack
+from typing import Any, Dict, Iterator, List, Optional, Callable, Set, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-from yt_dlp import YoutubeDL
+from tea.utils.lazy import LazyImport
+
+# yt-dlp is slow to import and only needed once a URL is processed
+YoutubeDL = LazyImport('yt_dlp', 'YoutubeDL')
 
 # Import from tea modules
 try:
     from tea.config import ConfigManager
     from tea.history import HistoryManager
-    from tea.info import InfoExtractor
+    from tea.info import InfoExtractor, dedupe_urls, extract_video_id, guess_content_type
     from tea.progress import ProgressReporter
     from tea.ffmpeg import FFmpegService
     from tea.timestamps import TimestampProcessor
+    from tea.scheduler import DownloadScheduler, default_priority
+    from tea.store import MediaStore
+    from tea.formats import FormatPlan, plan_format
+    from tea.metrics import Metrics, get_metrics
+    from tea.events import EventBus, get_events
+    from tea.pool import YoutubeDLPool, get_ydl_pool
+    from tea.postprocess import PostProcessPool, get_postprocess_pool
+    from tea.thumbnails import ThumbnailCache
+    from tea.cleanup import download_lock
     from tea.logger import setup_logger
     from tea.exceptions import DownloadError, ValidationError, FFmpegError, ConfigurationError
     from tea.constants import (
@@ -26,16 +41,31 @@ try:
         RETRY_DELAY,
         MAX_CONCURRENT_WORKERS,
         DEFAULT_CONCURRENT_WORKERS,
+        MAX_FRAGMENT_THREADS,
+        MAX_NESTED_PLAYLIST_DEPTH,
+        SYNC_KNOWN_STREAK,
+        LOCAL_AUDIO_SOURCE_EXTENSIONS,
+        LOCAL_REMUX_SOURCE_EXTENSIONS,
+        THROTTLE_ERROR_MARKERS,
         YTDLP_OPTIONS,
     )
 except ImportError:
     # Fallback for development
     from tea.config import ConfigManager
     from tea.history import HistoryManager
-    from tea.info import InfoExtractor
+    from tea.info import InfoExtractor, dedupe_urls, extract_video_id, guess_content_type
     from tea.progress import ProgressReporter
     from tea.ffmpeg import FFmpegService
     from tea.timestamps import TimestampProcessor
+    from tea.scheduler import DownloadScheduler, default_priority
+    from tea.store import MediaStore
+    from tea.formats import FormatPlan, plan_format
+    from tea.metrics import Metrics, get_metrics
+    from tea.events import EventBus, get_events
+    from tea.pool import YoutubeDLPool, get_ydl_pool
+    from tea.postprocess import PostProcessPool, get_postprocess_pool
+    from tea.thumbnails import ThumbnailCache
+    from tea.cleanup import download_lock
     from tea.logger import setup_logger
     from tea.exceptions import DownloadError, ValidationError, FFmpegError, ConfigurationError
     from tea.constants import (
@@ -43,6 +73,12 @@ except ImportError:
         RETRY_DELAY,
         MAX_CONCURRENT_WORKERS,
         DEFAULT_CONCURRENT_WORKERS,
+        MAX_FRAGMENT_THREADS,
+        MAX_NESTED_PLAYLIST_DEPTH,
+        SYNC_KNOWN_STREAK,
+        LOCAL_AUDIO_SOURCE_EXTENSIONS,
+        LOCAL_REMUX_SOURCE_EXTENSIONS,
+        THROTTLE_ERROR_MARKERS,
         YTDLP_OPTIONS,
     )
 
@@ -57,6 +93,9 @@ class DownloadService:
     - Progress reporting and logging
     - History tracking integration
     - Audio-only (MP3) and video downloads
+    - A two-stage pipeline: network workers fetch streams and hand them to
+      a CPU-sized pool that runs the FFmpeg postprocessors
+    - Cached, pre-converted thumbnails for embedding
     - AI-powered filename cleaning
 
     The service uses dependency injection for all components, making it
@@ -69,6 +108,12 @@ class DownloadService:
         _progress: ProgressReporter instance for progress updates
         _ffmpeg: FFmpegService instance for media processing
         _timestamps: TimestampProcessor instance for timestamp handling
+        _store: MediaStore instance, or None when the media store is disabled
+        _thumbnails: ThumbnailCache instance, or None when the cache is disabled
+        _metrics: Metrics registry for stage timers and counters
+        _events: Event bus the service reports progress and results on
+        _ydl_pool: Pool of YoutubeDL instances reused across jobs
+        _postprocess_pool: Worker pool for the post-processing stage
         _logger: Logger instance for logging
     """
 
@@ -80,6 +125,12 @@ class DownloadService:
         progress_reporter: Optional[ProgressReporter] = None,
         ffmpeg_service: Optional[FFmpegService] = None,
         timestamp_processor: Optional[TimestampProcessor] = None,
+        media_store: Optional[MediaStore] = None,
+        thumbnail_cache: Optional[ThumbnailCache] = None,
+        metrics: Optional[Metrics] = None,
+        events: Optional[EventBus] = None,
+        ydl_pool: Optional[YoutubeDLPool] = None,
+        postprocess_pool: Optional[PostProcessPool] = None,
         logger=None
     ):
         """Initialize DownloadService with dependency injection.
@@ -91,6 +142,15 @@ class DownloadService:
             progress_reporter: Progress reporter instance. If None, creates default.
             ffmpeg_service: FFmpeg service instance. If None, creates default.
             timestamp_processor: Timestamp processor instance. If None, creates default.
+            media_store: Media store instance. If None, one is created when
+                ``media_store`` is set in the config.
+            thumbnail_cache: Thumbnail cache. If None, one is created when
+                ``thumbnail_cache`` is set in the config.
+            metrics: Metrics registry. If None, uses the process-wide one.
+            events: Event bus. If None, uses the process-wide one.
+            ydl_pool: YoutubeDL pool. If None, uses the process-wide one.
+            postprocess_pool: Post-processing pool. If None, uses the
+                process-wide one.
             logger: Logger instance for logging. If None, creates default.
         """
         self._config = config_manager or ConfigManager(logger=logger)
@@ -99,15 +159,37 @@ class DownloadService:
         self._progress = progress_reporter or ProgressReporter(logger=logger)
         self._ffmpeg = ffmpeg_service or FFmpegService(logger=logger)
         self._timestamps = timestamp_processor or TimestampProcessor(logger=logger)
+        if media_store is None and self._config.media_store:
+            media_store = MediaStore(self._config.media_store, logger=logger)
+        self._store = media_store
+        if thumbnail_cache is None and self._config.thumbnail_cache:
+            thumbnail_cache = ThumbnailCache(
+                self._config.thumbnail_cache, ffmpeg_service=self._ffmpeg, metrics=metrics, logger=logger
+            )
+        self._thumbnails = thumbnail_cache
+        self._metrics = metrics or get_metrics()
+        self._events = events or get_events()
+        self._ydl_pool = ydl_pool or get_ydl_pool()
+        self._postprocess_pool = postprocess_pool or get_postprocess_pool()
         self._logger = logger
 
+    @property
+    def media_store(self) -> Optional[MediaStore]:
+        """Get the media store (None when disabled)."""
+        return self._store
+
     def download_single_video(
         self,
         url: str,
         output_path: str,
         thread_id: int = 0,
         audio_only: bool = False,
-        cleaner: Optional['FilenameCleaner'] = None
+        cleaner: Optional['FilenameCleaner'] = None,
+        sync: bool = False,
+        workers: int = 1,
+        audio_format: Optional[str] = None,
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None
     ) -> dict:
         """
         Download a single YouTube video, playlist, or channel with retry mechanism.
@@ -116,61 +198,124 @@ class DownloadService:
             url: YouTube URL to download
             output_path: Directory to save the download
             thread_id: Thread identifier for logging
-            audio_only: If True, download audio only in MP3 format
+            audio_only: If True, download audio only (see ``audio_format``)
             cleaner: Optional AI filename cleaner instance
+            sync: For playlists and channels, skip videos already in the
+                download archive; channels stop enumerating once they reach
+                archived videos (see ``_download_entries``)
+            workers: Downloads running at the same time, which share the
+                MAX_FRAGMENT_THREADS fragment threads
+            audio_format: 'mp3' or 'native' for audio downloads. If None,
+                uses the configured audio format.
+            quality: Video quality preset (see ``tea.formats.plan_format``).
+                If None, uses the configured default_quality.
+            audio_quality: MP3 bitrate or preset name. If None, uses the
+                configured mp3_quality.
 
         Returns:
             Result dict with success/failure info
         """
-        # Get quality format selector
-        if audio_only:
-            format_selector = 'bestaudio/best'
-            file_extension = 'mp3'
-            postprocessors = [
-                {
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '320',
-                },
-                {
-                    'key': 'EmbedThumbnail',
-                    'already_have_thumbnail': False
-                },
-                {
-                    'key': 'FFmpegMetadata',
-                    'add_metadata': True
-                }
-            ]
-            print(f"[Thread {thread_id}] Audio-only mode: Downloading highest quality MP3 (320kbps) with album art...")
-        else:
-            format_selector = (
-                'bestvideo[height<=1080]+bestaudio/best[height<=1080]/'
-                'best'
+        result = self.fetch(
+            url, output_path, thread_id, audio_only, cleaner, sync, workers,
+            audio_format, quality, audio_quality
+        )
+        if isinstance(result, Future):
+            return result.result()
+        return result
+
+    def fetch(
+        self,
+        url: str,
+        output_path: str,
+        thread_id: int = 0,
+        audio_only: bool = False,
+        cleaner: Optional['FilenameCleaner'] = None,
+        sync: bool = False,
+        workers: int = 1,
+        audio_format: Optional[str] = None,
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None
+    ) -> Union[dict, Future]:
+        """
+        Start a download without waiting for its post-processing.
+
+        Long-running callers (the job queue) use this to free their network
+        slot as soon as the streams are fetched. The output directory stays
+        locked against ``tea cleanup`` until post-processing has finished.
+
+        Args:
+            See ``download_single_video``
+
+        Returns:
+            Result dict, or a Future of it while the download is post-processed
+
+        Raises:
+            DownloadError: If the download failed after all retries
+        """
+        os.makedirs(output_path, exist_ok=True)
+        lock = ExitStack()
+        lock.enter_context(download_lock(output_path))
+        try:
+            result = self._fetch(
+                url, output_path, thread_id, audio_only, cleaner, sync, workers,
+                audio_format, quality, audio_quality
             )
-            file_extension = 'mp4'
-            postprocessors = [
-                {
-                    'key': 'FFmpegVideoConvertor',
-                    'preferedformat': 'mp4',
-                },
-                {
-                    'key': 'FFmpegMetadata',
-                    'add_metadata': True
-                }
-            ]
+        except BaseException:
+            lock.close()
+            raise
+        if isinstance(result, Future):
+            result.add_done_callback(lambda _: lock.close())
+        else:
+            lock.close()
+        return result
+
+    def _fetch(
+        self,
+        url: str,
+        output_path: str,
+        thread_id: int = 0,
+        audio_only: bool = False,
+        cleaner: Optional['FilenameCleaner'] = None,
+        sync: bool = False,
+        workers: int = 1,
+        audio_format: Optional[str] = None,
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None
+    ) -> Union[dict, Future]:
+        """
+        Run the network stage of a download, with retries.
+
+        Streams are fetched without postprocessors. A downloaded video is
+        handed to the post-processing pool, which runs them, and a Future of
+        its result is returned right away, so the caller's network slot is
+        free for the next download. Playlists and channels pipeline their
+        entries the same way and return once all of them are done.
+
+        Args:
+            See ``download_single_video``
+
+        Returns:
+            Result dict, or a Future of it while the download is post-processed
+
+        Raises:
+            DownloadError: If the download failed after all retries
+        """
+        # Plan the stream selection and postprocessing
+        plan = self.plan_format(audio_only, audio_format, quality, audio_quality)
+        file_extension = plan.output_extension
 
         # Build downloader options
         downloader_options = {
-            'format': format_selector,
             'ignoreerrors': True,
             'no_warnings': False,
             'noplaylist': False,
             'extract_flat': False,
             'progress_hooks': [self._progress.progress_hook],
-            'writethumbnail': True,
+            'postprocessor_hooks': [self._progress.postprocessor_hook],
+            # With the thumbnail cache, thumbnails are added in post-processing
+            'writethumbnail': self._thumbnails is None,
             'embedthumbnail': True,
             'addmetadata': True,
-            'postprocessors': postprocessors,
             'keepvideo': False,
             'clean_infojson': True,
             'retries': MAX_RETRIES,
@@ -178,16 +323,19 @@ class DownloadService:
             'compat_opts': ['no-youtube-unavailable-videos'],
             'youtube_include_dash_manifest': False,
             'nocheckcertificate': True,
+            # The postprocessors run in the post-processing stage
+            **plan.downloader_options(postprocess=False),
+            **self._transfer_options(workers),
         }
 
-        if not audio_only:
-            downloader_options['merge_output_format'] = 'mp4'
+        profile = plan.profile
 
         # Detect content type
-        content_type, _ = self._info.get_info(url)
+        with self._metrics.time('probe'):
+            content_type, _ = self._info.get_info(url)
 
         # Handle AI filename cleaning for single videos
-        ai_template_set = False
+        cleaned_title = None
         use_ai = self._config.use_ai_filename_cleaning and cleaner is not None
 
         if use_ai and content_type == 'video':
@@ -197,40 +345,76 @@ class DownloadService:
                     'skip_download': True,
                     'no_warnings': True,
                 }
-                with YoutubeDL(metadata_opts) as ydl:
-                    metadata = ydl.extract_info(url, download=False)
+                with self._ydl_pool.acquire('probe', metadata_opts, YoutubeDL) as ydl:
+                    with self._metrics.time('probe'):
+                        metadata = ydl.extract_info(url, download=False)
                     if metadata and metadata.get('title'):
                         raw_title = metadata.get('title', 'Unknown')
-                        cleaned_title = cleaner.clean_title(raw_title)
-                        print(f"[Thread {thread_id}] AI cleaned: '{cleaned_title}'")
+                        with self._metrics.time('ai_clean'):
+                            cleaned_title = cleaner.clean_title(raw_title)
+                        self._events.emit('title_cleaned', job=thread_id, title=cleaned_title)
                         downloader_options['outtmpl'] = os.path.join(output_path, f'{cleaned_title}.{{ext}}')
-                        ai_template_set = True
             except Exception as e:
-                print(f"[Thread {thread_id}] [WARNING] AI cleaning failed: {e}")
+                cleaned_title = None
+                self._events.emit('message', level='warning', text=f"AI cleaning failed: {e}", job=thread_id)
 
         # Set output template based on content type
         if content_type == 'playlist':
             downloader_options['outtmpl'] = os.path.join(
                 output_path, '%(playlist_title)s', f'%(playlist_index)s-%(title)s.{file_extension}')
-            print(f"[Thread {thread_id}] Detected playlist URL. Downloading entire playlist...")
-            print(f"[Thread {thread_id}] Files will be saved to: {output_path}/[playlist_name]/")
         elif content_type == 'channel':
             downloader_options['outtmpl'] = os.path.join(
                 output_path, '%(uploader)s', f'%(upload_date)s-%(title)s.{file_extension}')
-            print(f"[Thread {thread_id}] Detected channel URL. Downloading entire channel...")
-            print(f"[Thread {thread_id}] Files will be saved to: {output_path}/[channel_name]/")
-        elif not ai_template_set:
+        elif cleaned_title is None:
             downloader_options['outtmpl'] = os.path.join(
                 output_path, '%(title)s.{ext}')
-            print(f"[Thread {thread_id}] Detected single video URL. Downloading {'audio' if audio_only else 'video'}...")
-            print(f"[Thread {thread_id}] File will be saved to: {output_path}/")
+        self._events.emit(
+            'job_started', job=thread_id, url=url, content_type=content_type,
+            audio_only=audio_only, output_path=output_path, title=cleaned_title,
+            quality=plan.quality, audio_quality=plan.audio_quality
+        )
+
+        # Entries of a playlist/channel finished in an earlier attempt
+        completed: Set[str] = set()
 
         # Download with retry logic
         last_exception = None
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                with YoutubeDL(downloader_options) as ydl:
-                    download_result = ydl.extract_info(url, download=True)
+                ydl_profile = 'download-audio' if audio_only else 'download-video'
+                with self._ydl_pool.acquire(ydl_profile, downloader_options, YoutubeDL) as ydl:
+                    if content_type in ('playlist', 'channel'):
+                        return self._download_entries(
+                            ydl, url, content_type, thread_id, plan, output_path,
+                            completed, sync
+                        )
+
+                    video_id = extract_video_id(url)
+                    reused = self._link_stored(ydl, video_id, profile)
+                    how = 'linked from media store'
+                    if reused is None:
+                        reused = self._reuse_local(ydl, video_id, plan)
+                        how = 'converted from local copy'
+                    if reused is not None:
+                        title = reused.get('title') or 'Unknown'
+                        self._events.emit(
+                            'file_written', job=thread_id, url=url, video_id=video_id,
+                            path=reused.get('filepath'),
+                            source='media_store' if how.startswith('linked') else 'local_copy'
+                        )
+                        return {
+                            'url': url,
+                            'success': True,
+                            'count': 1,
+                            'title': title,
+                            'id': video_id,
+                            'filepath': reused.get('filepath'),
+                            'type': 'video',
+                            'message': f"[OK] [Thread {thread_id}] {'Audio' if audio_only else 'Video'} '{title}' {how}! Location: {output_path}"
+                        }
+
+                    with self._metrics.time('download'):
+                        download_result = ydl.extract_info(url, download=True)
 
                     if download_result is None:
                         return {
@@ -242,10 +426,13 @@ class DownloadService:
 
                     if download_result.get('_type') == 'playlist':
                         title = download_result.get('title', 'Unknown Playlist')
-                        video_count = len(download_result.get('entries', []))
-                        print(f"[Thread {thread_id}] {content_type.title()}: '{title}' ({video_count} videos)")
+                        entries = [entry for entry in download_result.get('entries') or [] if entry]
+                        self._events.emit(
+                            'playlist_started', job=thread_id, url=url, content_type=content_type,
+                            title=title, count=len(entries)
+                        )
 
-                        if video_count == 0:
+                        if not entries:
                             return {
                                 'url': url,
                                 'success': False,
@@ -253,31 +440,43 @@ class DownloadService:
                                 'message': f"[ERROR] [Thread {thread_id}] {content_type.title()} appears to be empty or private"
                             }
 
+                        failed = self._postprocess_all(plan, entries)
+                        video_count = len(entries) - failed
+                        if video_count == 0:
+                            return {
+                                'url': url,
+                                'success': False,
+                                'count': 0,
+                                'failed': failed,
+                                'message': f"[ERROR] [Thread {thread_id}] Post-processing failed for all {failed} entries of {content_type} '{title}'"
+                            }
+
+                        failed_note = f", {failed} failed" if failed else ""
                         return {
                             'url': url,
                             'success': True,
                             'count': video_count,
+                            'failed': failed,
                             'title': title,
                             'type': content_type,
-                            'message': f"[OK] [Thread {thread_id}] {content_type.title()} '{title}' download completed! ({video_count} {'MP3s' if audio_only else 'videos'}) Location: {output_path}"
+                            'message': f"[OK] [Thread {thread_id}] {content_type.title()} '{title}' download completed! ({video_count} {'MP3s' if audio_only else 'videos'}{failed_note}) Location: {output_path}"
                         }
                     else:
-                        title = download_result.get('title', 'Unknown')
-                        return {
-                            'url': url,
-                            'success': True,
-                            'count': 1,
-                            'title': title,
-                            'type': 'video',
-                            'message': f"[OK] [Thread {thread_id}] {'Audio' if audio_only else 'Video'} '{title}' download completed! Location: {output_path}"
-                        }
+                        return self._postprocess_pool.submit(
+                            self._finish_video, url, thread_id, plan, output_path, download_result
+                        )
 
             except Exception as error:
                 last_exception = error
+                if any(marker in str(error) for marker in THROTTLE_ERROR_MARKERS):
+                    self._metrics.inc('throttles')
                 if attempt < MAX_RETRIES:
+                    self._metrics.inc('retries')
                     retry_delay = RETRY_DELAY * (2 ** (attempt - 1))
-                    error_msg = f"[WARNING] [Thread {thread_id}] Attempt {attempt}/{MAX_RETRIES} failed: {str(error)[:100]}. Retrying in {retry_delay}s..."
-                    print(error_msg)
+                    self._events.emit(
+                        'retry', job=thread_id, url=url, attempt=attempt, max_attempts=MAX_RETRIES,
+                        delay=retry_delay, error=str(error)
+                    )
                     time.sleep(retry_delay)
                 else:
                     # All retries exhausted - raise DownloadError
@@ -295,6 +494,601 @@ class DownloadService:
             details={"error": str(last_exception)},
         )
 
+    def plan_format(
+        self,
+        audio_only: bool = False,
+        audio_format: Optional[str] = None,
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None
+    ) -> FormatPlan:
+        """
+        Plan a download's format, filling in unset options from the config.
+
+        Args:
+            audio_only: Whether only audio is downloaded
+            audio_format: 'mp3' or 'native'. If None, uses audio_format.
+            quality: Video quality preset. If None, uses default_quality.
+            audio_quality: MP3 bitrate or preset name. If None, uses mp3_quality.
+
+        Returns:
+            FormatPlan for the download
+
+        Raises:
+            ValidationError: If an option is invalid
+        """
+        return plan_format(
+            audio_only,
+            audio_format or self._config.audio_format,
+            quality or self._config.default_quality,
+            audio_quality or self._config.mp3_quality,
+        )
+
+    def _transfer_options(self, workers: int) -> Dict[str, Any]:
+        """
+        Build the yt-dlp options for parallel and chunked transfers.
+
+        DASH/HLS fragments are fetched ``concurrent_fragments`` at a time,
+        reduced so that fragments times workers stays within
+        MAX_FRAGMENT_THREADS. With ``http_chunk_size`` set, progressive
+        formats are fetched in HTTP range requests of that size. With
+        ``external_downloader`` set and installed, yt-dlp hands transfers to
+        it with the same number of connections.
+
+        Args:
+            workers: Downloads running at the same time
+
+        Returns:
+            Options to merge into the downloader options
+        """
+        fragments = max(1, min(self._config.concurrent_fragments, MAX_FRAGMENT_THREADS // max(workers, 1)))
+        options: Dict[str, Any] = {'concurrent_fragment_downloads': fragments}
+
+        if self._config.http_chunk_size:
+            options['http_chunk_size'] = self._config.http_chunk_size
+
+        downloader = self._config.external_downloader
+        if downloader:
+            if shutil.which(downloader):
+                options['external_downloader'] = {'default': downloader}
+                options['external_downloader_args'] = {
+                    downloader: ['-x', str(fragments), '-s', str(fragments), '-k', '1M'],
+                }
+            elif self._logger:
+                self._logger.warning(f"External downloader '{downloader}' not found, using the built-in one")
+        return options
+
+    def _postprocess(self, plan: FormatPlan, info: Dict) -> Dict:
+        """
+        Run a plan's postprocessors on a downloaded file.
+
+        This is the CPU-bound second stage of a download, run on the
+        post-processing pool: audio extraction, remuxing and embedding the
+        thumbnail and metadata. With the thumbnail cache enabled, the
+        thumbnail to embed is taken from the cache first.
+
+        Args:
+            plan: Format of the download
+            info: Info dict returned by yt-dlp after fetching the streams
+
+        Returns:
+            The info dict, describing the final file
+
+        Raises:
+            PostProcessingError: If a postprocessor fails
+        """
+        requested = info.get('requested_downloads') or [info]
+        downloaded = requested[-1]
+        filepath = downloaded.get('filepath')
+        if not filepath or not plan.postprocessors:
+            return info
+
+        postprocess_options = {
+            'keepvideo': False,
+            'postprocessors': [dict(postprocessor) for postprocessor in plan.postprocessors],
+            'postprocessor_hooks': [self._progress.postprocessor_hook],
+        }
+        ydl_profile = 'postprocess-audio' if plan.audio_only else 'postprocess-video'
+        with self._ydl_pool.acquire(ydl_profile, postprocess_options, YoutubeDL) as ydl:
+            if self._thumbnails is not None and plan.embeds_thumbnail:
+                try:
+                    self._thumbnails.prepare(ydl, downloaded, filepath)
+                except OSError as error:
+                    if self._logger:
+                        self._logger.warning(f"Thumbnail cache failed, not embedding a thumbnail: {error}")
+            processed = ydl.post_process(filepath, downloaded)
+
+        if downloaded is info:
+            return processed
+        info['requested_downloads'] = [*requested[:-1], processed]
+        return info
+
+    def _postprocess_all(self, plan: FormatPlan, infos: List[Dict]) -> int:
+        """
+        Post-process several downloaded files and wait for all of them.
+
+        A file whose postprocessors fail is left as downloaded and counted
+        as failed.
+
+        Args:
+            plan: Format of the downloads
+            infos: Info dicts returned by yt-dlp after fetching the streams
+
+        Returns:
+            Number of files whose post-processing failed
+        """
+        futures = [self._postprocess_pool.submit(self._postprocess, plan, info) for info in infos if info]
+        failed = 0
+        for future in wait(futures).done:
+            if future.exception() is not None:
+                failed += 1
+                if self._logger:
+                    self._logger.warning(f"Post-processing failed: {future.exception()}")
+        return failed
+
+    def _finish_video(
+        self,
+        url: str,
+        thread_id: int,
+        plan: FormatPlan,
+        output_path: str,
+        info: Dict
+    ) -> dict:
+        """
+        Post-process a downloaded video and build its result.
+
+        Runs on the post-processing pool (see ``_postprocess``).
+
+        Args:
+            url: URL the video was downloaded from
+            thread_id: Thread identifier for logging
+            plan: Format of the download
+            output_path: Directory the video was saved to
+            info: Info dict returned by yt-dlp after fetching the streams
+
+        Returns:
+            Result dict (see ``download_single_video``)
+
+        Raises:
+            DownloadError: If post-processing failed
+        """
+        try:
+            info = self._postprocess(plan, info)
+        except Exception as error:
+            raise DownloadError(
+                message="Post-processing failed",
+                url=url,
+                details={"error": str(error)},
+            ) from error
+
+        title = info.get('title', 'Unknown')
+        self._store_download(info, plan.profile)
+        filepath = self._downloaded_path(info)
+        self._events.emit(
+            'file_written', job=thread_id, url=url, video_id=info.get('id'),
+            path=filepath, source='download'
+        )
+        return {
+            'url': url,
+            'success': True,
+            'count': 1,
+            'title': title,
+            'id': info.get('id'),
+            'filepath': filepath,
+            'type': 'video',
+            'message': f"[OK] [Thread {thread_id}] {'Audio' if plan.audio_only else 'Video'} '{title}' download completed! Location: {output_path}"
+        }
+
+    def _download_entries(
+        self,
+        ydl: Any,
+        url: str,
+        content_type: str,
+        thread_id: int,
+        plan: FormatPlan,
+        output_path: str,
+        completed: Set[str],
+        sync: bool = False
+    ) -> dict:
+        """
+        Download a playlist or channel one entry at a time.
+
+        Entries are enumerated lazily (``process=False``), so yt-dlp never
+        builds the full list of info dicts; each entry's info dict is dropped
+        once it has been downloaded and counted. Downloaded IDs are recorded
+        in the download archive.
+
+        In sync mode, archived videos are skipped without extracting them.
+        Channel tabs list the newest uploads first, so after
+        SYNC_KNOWN_STREAK archived videos in a row the rest of the tab is not
+        enumerated at all. The newest video downloaded by each sync is kept
+        as the channel's high-water mark; a failed video is not archived, so
+        the next sync tries it again.
+
+        With the media store enabled, entries already stored in this format
+        are linked instead of downloaded, and new downloads are stored.
+
+        Each downloaded entry is handed to the post-processing pool, and the
+        next entry is fetched while its postprocessors run. Entries are
+        counted as they finish; all of them have finished when this returns.
+
+        Args:
+            ydl: Open YoutubeDL instance
+            url: Playlist or channel URL
+            content_type: 'playlist' or 'channel'
+            thread_id: Thread identifier for logging
+            plan: Format of the download
+            output_path: Directory to save the download
+            completed: IDs of entries already downloaded; updated in place so a
+                retry resumes where the failed attempt stopped
+            sync: Skip archived videos and stop early on channels
+
+        Returns:
+            Result dict with success/failure info, or a Future of it when
+            the URL turned out to be a single video
+        """
+        label = content_type.title()
+        audio_only = plan.audio_only
+        profile = plan.profile
+        playlist = ydl.extract_info(url, download=False, process=False)
+        if playlist is None:
+            return {
+                'url': url,
+                'success': False,
+                'count': 0,
+                'message': f"[ERROR] [Thread {thread_id}] Failed to extract {content_type} information. It may be private or unavailable."
+            }
+
+        if playlist.get('_type') not in ('playlist', 'multi_video'):
+            # The URL resolved to a single video after all
+            info = ydl.process_ie_result(playlist, download=True)
+            if info is None:
+                return {
+                    'url': url,
+                    'success': False,
+                    'count': 0,
+                    'message': f"[ERROR] [Thread {thread_id}] Failed to download video. It may be private or unavailable."
+                }
+            return self._postprocess_pool.submit(
+                self._finish_video, url, thread_id, plan, output_path, info
+            )
+
+        title = playlist.get('title', f'Unknown {label}')
+        self._events.emit(
+            'playlist_started', job=thread_id, url=url, content_type=content_type, title=title, count=None
+        )
+        playlist_fields = {
+            'playlist': title,
+            'playlist_title': title,
+            'playlist_id': playlist.get('id'),
+        }
+
+        archive = self._history.archive
+        mark_key = playlist.get('id') or url
+        known = None
+        skipped = 0
+        if sync:
+            def known(entry: Dict) -> bool:
+                nonlocal skipped
+                video_id = entry.get('id')
+                if not video_id:
+                    return False
+                is_known = archive.contains(video_id, entry.get('ie_key'))
+                skipped += is_known
+                return is_known
+
+        failed = 0
+        # (index, id) of the newest entry downloaded; lists are newest-first
+        latest: Optional[Tuple[int, str]] = None
+        latest_upload_date = None
+        # Entries in the post-processing stage: future -> (index, entry, key)
+        postprocessing: Dict[Future, Tuple[int, Dict, str]] = {}
+
+        def record(index: int, entry: Dict, key: str, info: Optional[Dict], status: str) -> None:
+            """Count a finished entry and report it."""
+            nonlocal failed, latest, latest_upload_date
+            if info is None:
+                failed += 1
+                status = 'FAILED'
+                entry_title = entry.get('title') or key
+            else:
+                completed.add(key)
+                entry_title = info.get('title') or key
+                self._events.emit(
+                    'file_written', job=thread_id, url=url, video_id=info.get('id'),
+                    path=self._downloaded_path(info),
+                    source={'LINKED': 'media_store', 'CONVERTED': 'local_copy'}.get(status, 'download')
+                )
+                if info.get('id'):
+                    archive.add(info['id'], info.get('extractor_key') or entry.get('ie_key'))
+                    if latest is None or index < latest[0]:
+                        latest = (index, info['id'])
+                latest_upload_date = max(
+                    filter(None, (info.get('upload_date'), latest_upload_date)), default=None
+                )
+
+            self._events.emit(
+                'entry_done', job=thread_id, url=url, index=index, status=status, title=entry_title,
+                downloaded=len(completed), failed=failed
+            )
+
+        def collect(block: bool = False) -> None:
+            """Record entries whose post-processing has finished."""
+            done = wait(postprocessing).done if block else [f for f in postprocessing if f.done()]
+            for future in done:
+                index, entry, key = postprocessing.pop(future)
+                try:
+                    info = future.result()
+                except Exception as error:
+                    if self._logger:
+                        self._logger.debug(f"Post-processing entry {key} of {url} failed: {error}")
+                    info = None
+                if info is not None:
+                    self._store_download(info, profile)
+                record(index, entry, key, info, 'OK')
+
+        entries = self._iter_entries(
+            ydl, playlist, known=known, stop_on_known=content_type == 'channel'
+        )
+        try:
+            for index, entry in entries:
+                key = entry.get('id') or entry.get('url')
+                collect()
+                if key in completed or any(key == pending[2] for pending in postprocessing.values()):
+                    continue
+
+                extra_info = {**playlist_fields, 'playlist_index': index}
+                status = 'LINKED'
+                info = self._link_stored(ydl, entry.get('id'), profile, extra_info)
+                if info is None:
+                    status = 'CONVERTED'
+                    info = self._reuse_local(ydl, entry.get('id'), plan, extra_info)
+                if info is None:
+                    try:
+                        with self._metrics.time('download'):
+                            info = ydl.process_ie_result(dict(entry), download=True, extra_info=extra_info)
+                    except Exception as error:
+                        if self._logger:
+                            self._logger.debug(f"Entry {key} of {url} failed: {error}")
+                        info = None
+                    if info is not None:
+                        # Fetch the next entry while this one is post-processed
+                        future = self._postprocess_pool.submit(self._postprocess, plan, info)
+                        postprocessing[future] = (index, entry, key)
+                        del info
+                        continue
+
+                record(index, entry, key, info, status)
+                # Drop the info dict before the next entry is fetched
+                del info
+        finally:
+            # Entries already downloaded count even if the listing failed
+            collect(block=True)
+
+        video_count = len(completed)
+        if sync:
+            archive.set_mark(mark_key, latest and latest[1], latest_upload_date, video_count)
+            if video_count == 0 and failed == 0:
+                return {
+                    'url': url,
+                    'success': True,
+                    'count': 0,
+                    'failed': 0,
+                    'skipped': skipped,
+                    'title': title,
+                    'type': content_type,
+                    'message': f"[OK] [Thread {thread_id}] {label} '{title}' is up to date"
+                }
+
+        if video_count == 0:
+            return {
+                'url': url,
+                'success': False,
+                'count': 0,
+                'failed': failed,
+                'message': f"[ERROR] [Thread {thread_id}] {label} appears to be empty or private"
+            }
+
+        failed_note = f", {failed} failed" if failed else ""
+        if skipped:
+            failed_note += f", {skipped} already archived"
+        return {
+            'url': url,
+            'success': True,
+            'count': video_count,
+            'failed': failed,
+            'skipped': skipped,
+            'title': title,
+            'type': content_type,
+            'message': f"[OK] [Thread {thread_id}] {label} '{title}' download completed! ({video_count} {'MP3s' if audio_only else 'videos'}{failed_note}) Location: {output_path}"
+        }
+
+    def _link_stored(
+        self,
+        ydl: Any,
+        video_id: Optional[str],
+        profile: Optional[str],
+        extra_info: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """
+        Link a stored copy of a video to where it would be downloaded.
+
+        Args:
+            ydl: Open YoutubeDL instance (its output template names the file)
+            video_id: Video ID, if known
+            profile: Media store profile of the download format
+            extra_info: Extra fields for the output template (playlist index, ...)
+
+        Returns:
+            The stored info dict if the video was linked, None if it has to
+            be downloaded
+        """
+        if self._store is None or not video_id or not profile:
+            return None
+
+        stored = self._store.lookup(video_id, profile)
+        if stored is None:
+            return None
+
+        # Output templates end in the final extension (or '{ext}'), so swap it
+        # for the stored file's own
+        filename = ydl.prepare_filename({**stored, **(extra_info or {})})
+        target = os.path.splitext(filename)[0] + os.path.splitext(stored['path'])[1]
+        try:
+            method = self._store.link(stored['path'], target)
+        except OSError as error:
+            if self._logger:
+                self._logger.warning(f"Could not link {video_id} from the media store: {error}")
+            return None
+
+        if self._logger:
+            self._logger.debug(f"Linked {video_id} from the media store ({method}): {target}")
+        stored['filepath'] = target
+        self._metrics.inc('cache_hits', cache='media_store')
+        return stored
+
+    def _local_sources(self, video_id: str) -> List[Dict]:
+        """
+        Find local files of a video in any format.
+
+        Args:
+            video_id: Video ID
+
+        Returns:
+            Info dicts with the file's 'path', from the media store first and
+            then from download history
+        """
+        sources = list(self._store.find(video_id)) if self._store is not None else []
+        entry = self._history.find_file(video_id)
+        if entry:
+            sources.append({'id': video_id, 'title': entry.get('title'), 'path': entry['file_path']})
+        return sources
+
+    def _reuse_local(
+        self,
+        ydl: Any,
+        video_id: Optional[str],
+        plan: FormatPlan,
+        extra_info: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """
+        Make the requested file from a local copy of the video in another format.
+
+        An MP3 is transcoded from a local video or audio file, and an MP4 is
+        remuxed from a local MKV/WebM, so only FFmpeg runs and nothing is
+        downloaded. Audio in its native format is always downloaded.
+
+        Args:
+            ydl: Open YoutubeDL instance (its output template names the file)
+            video_id: Video ID, if known
+            plan: Format of the download
+            extra_info: Extra fields for the output template (playlist index, ...)
+
+        Returns:
+            Info dict of the new file (with 'filepath'), or None if it has to
+            be downloaded
+        """
+        if not video_id or plan.extension is None:
+            return None
+
+        audio_only = plan.audio_only
+        extensions = LOCAL_AUDIO_SOURCE_EXTENSIONS if audio_only else LOCAL_REMUX_SOURCE_EXTENSIONS
+        source = next(
+            (source for source in self._local_sources(video_id)
+             if os.path.splitext(source['path'])[1].lstrip('.').lower() in extensions),
+            None
+        )
+        if source is None:
+            return None
+
+        extension = plan.extension
+        filename = ydl.prepare_filename({**source, **(extra_info or {})})
+        target = os.path.splitext(filename)[0] + '.' + extension
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+            if audio_only:
+                converted = self._ffmpeg.extract_audio(source['path'], target, f"{plan.audio_quality}k")
+            else:
+                converted = self._ffmpeg.remux(source['path'], target)
+            if not converted:
+                return None
+
+        info = {key: value for key, value in source.items() if key not in ('path', 'profile')}
+        info.update({'id': video_id, 'ext': extension, 'filepath': target})
+        if self._logger:
+            self._logger.debug(f"Made {target} from local copy {source['path']}")
+        self._store_download(info, plan.profile)
+        self._metrics.inc('cache_hits', cache='local_copy')
+        return info
+
+    @staticmethod
+    def _downloaded_path(info: Dict) -> Optional[str]:
+        """Get the final file path from a yt-dlp info dict."""
+        requested = info.get('requested_downloads') or [{}]
+        return requested[-1].get('filepath') or info.get('filepath')
+
+    def _store_download(self, info: Dict, profile: Optional[str]) -> None:
+        """
+        Add a finished download to the media store.
+
+        Args:
+            info: Info dict returned by yt-dlp after downloading
+            profile: Media store profile of the download format
+        """
+        if self._store is None or not profile or not info.get('id'):
+            return
+
+        file_path = self._downloaded_path(info)
+        if file_path:
+            self._store.add(file_path, info['id'], profile, info)
+
+    def _iter_entries(
+        self,
+        ydl: Any,
+        playlist: Dict,
+        depth: int = 0,
+        known: Optional[Callable[[Dict], bool]] = None,
+        stop_on_known: bool = False
+    ) -> Iterator[Tuple[int, Dict]]:
+        """
+        Yield the video entries of an unprocessed playlist, one at a time.
+
+        Nested playlists (e.g. the Videos/Shorts/Live tabs of a channel) are
+        expanded in place, up to MAX_NESTED_PLAYLIST_DEPTH levels.
+
+        Args:
+            ydl: Open YoutubeDL instance
+            playlist: Playlist info from ``extract_info(..., process=False)``
+            depth: Current nesting level
+            known: Predicate for entries to leave out (already downloaded)
+            stop_on_known: Stop enumerating a (nested) playlist after
+                SYNC_KNOWN_STREAK known entries in a row
+
+        Yields:
+            Tuples of (1-based position in its playlist, unprocessed entry dict)
+        """
+        known_streak = 0
+        for position, entry in enumerate(playlist.get('entries') or (), 1):
+            if not entry:
+                continue
+
+            entry_type = entry.get('_type', 'video')
+            if depth < MAX_NESTED_PLAYLIST_DEPTH and entry_type in ('playlist', 'multi_video'):
+                yield from self._iter_entries(ydl, entry, depth + 1, known, stop_on_known)
+            elif (depth < MAX_NESTED_PLAYLIST_DEPTH and entry_type == 'url'
+                    and guess_content_type(entry.get('url', '')) != 'video'):
+                nested = ydl.extract_info(
+                    entry['url'], download=False, process=False, ie_key=entry.get('ie_key')
+                )
+                if nested:
+                    yield from self._iter_entries(ydl, nested, depth + 1, known, stop_on_known)
+            elif known is not None and known(entry):
+                known_streak += 1
+                if stop_on_known and known_streak >= SYNC_KNOWN_STREAK:
+                    return
+            else:
+                known_streak = 0
+                yield position, entry
+
     def download(
         self,
         urls: List[str],
@@ -302,11 +1096,19 @@ class DownloadService:
         list_formats: bool = False,
         max_workers: int = DEFAULT_CONCURRENT_WORKERS,
         audio_only: bool = False,
-        cleaner: Optional['FilenameCleaner'] = None
-    ) -> None:
+        cleaner: Optional['FilenameCleaner'] = None,
+        sync: bool = False,
+        audio_format: Optional[str] = None,
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> List[Dict]:
         """
         Download YouTube content with concurrent downloads.
 
+        A URL that still fails after all retries is reported as a failed
+        result instead of aborting the other downloads.
+
         Args:
             urls: List of YouTube URLs to download
             output_path: Directory to save downloads
@@ -314,9 +1116,23 @@ class DownloadService:
             max_workers: Maximum number of concurrent downloads (1-5)
             audio_only: If True, download audio only in MP3 format
             cleaner: Optional AI filename cleaner instance
+            sync: Incrementally sync playlists and channels against the
+                download archive (see ``download_single_video``)
+            audio_format: 'mp3' or 'native' for audio downloads. If None,
+                uses the configured audio format.
+            quality: Video quality preset. If None, uses default_quality.
+            audio_quality: MP3 bitrate or preset name. If None, uses
+                mp3_quality.
+            source: Fairness group of this batch (e.g. its batch file). If
+                None, the call gets a group of its own.
+
+        Returns:
+            Result dicts (see ``download_single_video``) in completion order,
+            or an empty list when only listing formats
 
         Raises:
-            ValidationError: If max_workers is not between 1 and MAX_CONCURRENT_WORKERS
+            ValidationError: If max_workers is not between 1 and
+                MAX_CONCURRENT_WORKERS, or the format options are invalid
         """
         # Validate max_workers
         if not 1 <= max_workers <= MAX_CONCURRENT_WORKERS:
@@ -326,97 +1142,136 @@ class DownloadService:
                 value=max_workers,
             )
 
+        # Reject bad format options before any download starts
+        self.plan_format(audio_only, audio_format, quality, audio_quality)
+
         if output_path is None:
             output_path = os.path.join(os.getcwd(), 'downloads')
 
         if list_formats:
-            print("Available formats for the first provided URL:")
+            self._events.emit('message', level='info',
+                              text="Available formats for the first provided URL:")
             self._list_formats(urls[0])
-            return
+            return []
 
         os.makedirs(output_path, exist_ok=True)
 
-        print(
-            f"\nStarting download of {len(urls)} URL(s) with {max_workers} concurrent workers...")
-        print(f"Output directory: {output_path}")
-        print(f"Format: {'MP3 Audio Only' if audio_only else 'MP4 Video'}")
+        unique_urls = dedupe_urls(urls)
+        duplicates = len(urls) - len(unique_urls)
+        urls = unique_urls
 
         # Count content types
-        playlist_count = sum(1 for url in urls if self._info.get_content_type(url) == 'playlist')
-        channel_count = sum(1 for url in urls if self._info.get_content_type(url) == 'channel')
-        video_count = len(urls) - playlist_count - channel_count
-
-        content_summary = []
-        if playlist_count > 0:
-            content_summary.append(f"{playlist_count} playlist(s)")
-        if channel_count > 0:
-            content_summary.append(f"{channel_count} channel(s)")
-        if video_count > 0:
-            content_summary.append(f"{video_count} video(s)")
-
-        if content_summary:
-            print(f"Content: {' + '.join(content_summary)}")
-        else:
-            print("Content: Unknown content type")
+        content_types = [self._info.get_content_type(url) for url in urls]
+        playlist_count = content_types.count('playlist')
+        channel_count = content_types.count('channel')
 
-        print("-" * 60)
+        self._events.emit(
+            'batch_started', urls=len(urls), workers=max_workers, output_path=output_path,
+            audio_only=audio_only, duplicates=duplicates,
+            content={
+                'playlist': playlist_count,
+                'channel': channel_count,
+                'video': len(urls) - playlist_count - channel_count,
+            }
+        )
+
+        # Single videos go ahead of whole playlists and channels, so a large
+        # channel does not hold back quick downloads listed after it. At most
+        # MAX_IN_FLIGHT_PER_CHANNEL downloads of one channel run at once.
+        source = source or f"batch-{uuid.uuid4().hex[:8]}"
+        scheduler = DownloadScheduler()
+        for i, (url, content_type) in enumerate(zip(urls, content_types)):
+            priority = default_priority(content_type)
+            scheduler.add(
+                (i + 1, url), priority=priority, source=source,
+                channel=self._info.get_channel_key(url)
+            )
+            self._events.emit('job_queued', job=i + 1, url=url, content_type=content_type, priority=priority)
 
-        # Download with thread pool
+        # Download with thread pool, handing out one task per free worker. A
+        # worker is free again once its download is handed to post-processing.
+        # The lock file keeps tea cleanup away from the partial files.
         results = []
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_url = {
-                executor.submit(self.download_single_video, url, output_path, i+1, audio_only, cleaner): url
-                for i, url in enumerate(urls)
-            }
+        with download_lock(output_path), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+            postprocessing = {}
+            while running or postprocessing or len(scheduler):
+                while len(running) < max_workers:
+                    task = scheduler.next(block=False)
+                    if task is None:
+                        break
+                    thread_id, url = task.item
+                    future = executor.submit(
+                        self._fetch,
+                        url, output_path, thread_id, audio_only, cleaner, sync,
+                        min(max_workers, len(urls)), audio_format, quality, audio_quality
+                    )
+                    running[future] = task
 
-            for future in as_completed(future_to_url):
-                result = future.result()
-                results.append(result)
-                print(result['message'])
+                done, _ = wait([*running, *postprocessing], return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in running:
+                        task = running.pop(future)
+                        scheduler.done(task)
+                    else:
+                        task = postprocessing.pop(future)
+                    try:
+                        result = future.result()
+                    except DownloadError as error:
+                        result = {
+                            'url': task.item[1],
+                            'success': False,
+                            'message': f"[ERROR] {error}"
+                        }
+                    if isinstance(result, Future):
+                        postprocessing[result] = task
+                        continue
+                    results.append(result)
+                    self._events.emit(
+                        'job_done', job=task.item[0], url=result['url'], success=result['success'],
+                        count=result.get('count'),
+                        title=result.get('title'), filepath=result.get('filepath'),
+                        message=result['message']
+                    )
+                    self._metrics.inc('downloads', result='ok' if result['success'] else 'failed')
 
-                if result['success']:
-                    title = result.get('title', 'Unknown')
-                    self._history.add(result['url'], title, output_path)
+                    # A sync that found nothing new is not a download
+                    if result['success'] and result.get('count', 1):
+                        title = result.get('title', 'Unknown')
+                        with self._metrics.time('history_write'):
+                            self._history.add(
+                                result['url'], title, output_path, result.get('id'),
+                                result.get('filepath')
+                            )
 
-        # Print summary
-        self._print_summary(results, output_path)
+        self._report_summary(results, output_path)
+        return results
 
     def _list_formats(self, url: str) -> None:
-        """List available formats for a URL."""
+        """List available formats for a URL; the table itself is printed by yt-dlp."""
         ydl_opts = {
             'listformats': True,
             'quiet': False
         }
 
         try:
-            with YoutubeDL(ydl_opts) as ydl:
+            with self._ydl_pool.acquire('formats', ydl_opts, YoutubeDL) as ydl:
                 ydl.extract_info(url, download=False)
         except Exception as error:
-            print(f"Error listing formats: {str(error)}")
-
-    def _print_summary(self, results: List[Dict], output_path: str) -> None:
-        """Print download summary."""
-        print("\n" + "=" * 60)
-        print("DOWNLOAD SUMMARY")
-        print("=" * 60)
+            self._events.emit('message', level='error', text=f"Error listing formats: {error}")
 
+    def _report_summary(self, results: List[Dict], output_path: str) -> None:
+        """Send the download summary event."""
         successful_downloads = [r for r in results if r['success']]
         failed_downloads = [r for r in results if not r['success']]
 
-        total_successful_count = sum(r.get('count', 1) for r in successful_downloads)
-        total_failed_count = sum(r.get('count', 1) for r in failed_downloads)
-
-        print(f"[OK] Successful downloads: {total_successful_count} {'files' if total_successful_count != 1 else 'file'}")
-        print(f"[ERROR] Failed downloads: {total_failed_count} {'files' if total_failed_count != 1 else 'file'}")
-
-        if failed_downloads:
-            print("\n[ERROR] Failed URLs:")
-            for result in failed_downloads:
-                print(f"   * {result['url']}")
-                print(f"     Reason: {result['message']}")
-
-        if successful_downloads:
-            print(f"\nAll files saved to: {output_path}")
+        self._events.emit(
+            'summary', kind='download', output_path=output_path,
+            successful=sum(r.get('count', 1) for r in successful_downloads),
+            failed=sum(r.get('count', 1) for r in failed_downloads),
+            succeeded_jobs=len(successful_downloads),
+            failures=[{'url': r['url'], 'reason': r['message']} for r in failed_downloads],
+        )
 
 
 # Convenience functions for backward compatibility
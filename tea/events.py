@@ -0,0 +1,430 @@
+"""
+Event stream for Tea YouTube Downloader.
+
+Services report what happens as typed events on an EventBus instead of
+printing: each event is a dict with an ``event`` type, a ``ts`` Unix time
+and plain (unformatted) fields. Renderers subscribe to the bus:
+
+- HumanRenderer prints the console output.
+- JsonlWriter writes one JSON object per line, for ``tea --events jsonl``.
+
+Event types:
+
+========================  =====================================================
+``batch_started``         urls, workers, output_path, audio_only, content, duplicates
+``job_queued``            job, url, content_type, priority
+``job_started``           job, url, content_type, audio_only, output_path, title,
+                          quality (video preset), audio_quality (MP3 kbps)
+``title_cleaned``         job, title
+``playlist_started``      job, url, content_type, title, count (None when streamed)
+``progress``              status, filename, downloaded_bytes, total_bytes, speed, eta
+``postprocessing``        postprocessor
+``retry``                 job, url, attempt, max_attempts, delay, error
+``file_written``          path, source; job, url and video_id for downloads
+``entry_done``            job, url, index, status, title, downloaded, failed
+``job_done``              job, url, success, count, title, filepath, message
+``split_started``         clips, output_dir
+``split_clip_started``    clip, total, title, start, end
+``split_clip_done``       clip, total, title, success, path, error, skipped
+``search_started``        index, total, query
+``search_done``           index, total, query, url
+``summary``               kind ('download', 'split' or 'search') and its counts
+``message``               level, text, job (optional)
+========================  =====================================================
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, redirect_stdout
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+# Import from tea modules
+try:
+    from tea.exceptions import ValidationError
+    from tea.constants import EVENT_FORMATS
+except ImportError:
+    # Fallback for development
+    from tea.exceptions import ValidationError
+    from tea.constants import EVENT_FORMATS
+
+Event = Dict[str, Any]
+Sink = Callable[[Event], None]
+
+
+class EventBus:
+    """Thread-safe dispatcher of events to subscribed sinks."""
+
+    def __init__(self):
+        """Initialize an EventBus without sinks."""
+        self._lock = threading.Lock()
+        self._sinks: Tuple[Sink, ...] = ()
+
+    def subscribe(self, sink: Sink) -> None:
+        """
+        Send future events to a sink.
+
+        Args:
+            sink: Callable taking an event dict
+        """
+        with self._lock:
+            if sink not in self._sinks:
+                self._sinks = self._sinks + (sink,)
+
+    def unsubscribe(self, sink: Sink) -> None:
+        """
+        Stop sending events to a sink.
+
+        Args:
+            sink: A subscribed sink (unknown sinks are ignored)
+        """
+        with self._lock:
+            self._sinks = tuple(s for s in self._sinks if s != sink)
+
+    @property
+    def sinks(self) -> Tuple[Sink, ...]:
+        """Get the subscribed sinks."""
+        return self._sinks
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """
+        Send an event to every sink.
+
+        Args:
+            event: Event type, e.g. 'job_done'
+            **fields: Event fields
+        """
+        sinks = self._sinks
+        if not sinks:
+            return
+        record = {'event': event, 'ts': round(time.time(), 3), **fields}
+        for sink in sinks:
+            sink(record)
+
+
+class JsonlWriter:
+    """Sink that writes events as JSON Lines."""
+
+    def __init__(self, stream: TextIO):
+        """
+        Initialize JsonlWriter.
+
+        Args:
+            stream: Text stream events are written to
+        """
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event) -> None:
+        """Write one event as a line of JSON."""
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        with self._lock:
+            self._stream.write(line + '\n')
+            self._stream.flush()
+
+
+def format_bytes(size: Optional[float]) -> str:
+    """Format a byte count like yt-dlp does, e.g. '12.34MiB'."""
+    if size is None:
+        return '?'
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if size < 1024:
+            return f"{size:.2f}{unit}"
+        size /= 1024
+    return f"{size:.2f}TiB"
+
+
+def _format_eta(seconds: Optional[float]) -> str:
+    """Format remaining seconds as MM:SS or HH:MM:SS."""
+    if seconds is None:
+        return 'N/A'
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
+
+
+class HumanRenderer:
+    """Sink that prints events as Tea's console output."""
+
+    BAR_LENGTH = 30
+
+    def __init__(self):
+        """Initialize HumanRenderer."""
+        self._spinner = None
+
+    def __call__(self, event: Event) -> None:
+        """Print one event (events without a console form are ignored)."""
+        handler = getattr(self, f"_on_{event['event']}", None)
+        if handler is not None:
+            handler(event)
+
+    def _stop_spinner(self, final_message: Optional[str] = None) -> None:
+        """Stop the postprocessing spinner if it is running."""
+        if self._spinner is not None:
+            self._spinner.stop(final_message)
+            self._spinner = None
+
+    # Downloads
+
+    def _on_batch_started(self, e: Event) -> None:
+        if e.get('duplicates'):
+            print(f"[INFO] Skipped {e['duplicates']} duplicate URL(s) in the list")
+        print(f"\nStarting download of {e['urls']} URL(s) with {e['workers']} concurrent workers...")
+        print(f"Output directory: {e['output_path']}")
+        print(f"Format: {'MP3 Audio Only' if e['audio_only'] else 'MP4 Video'}")
+
+        content = e.get('content') or {}
+        parts = [f"{content[kind]} {kind}(s)" for kind in ('playlist', 'channel', 'video') if content.get(kind)]
+        print(f"Content: {' + '.join(parts)}" if parts else "Content: Unknown content type")
+        print("-" * 60)
+
+    def _on_job_started(self, e: Event) -> None:
+        prefix = f"[Thread {e['job']}]"
+        output_path = e['output_path']
+        if e['audio_only'] and e.get('audio_quality'):
+            print(f"{prefix} Audio-only mode: Downloading MP3 ({e['audio_quality']}kbps) with album art...")
+        elif e['audio_only']:
+            print(f"{prefix} Audio-only mode: Downloading audio in its original format with album art...")
+        if e['content_type'] in ('playlist', 'channel'):
+            folder = 'playlist_name' if e['content_type'] == 'playlist' else 'channel_name'
+            print(f"{prefix} Detected {e['content_type']} URL. Downloading entire {e['content_type']}...")
+            print(f"{prefix} Files will be saved to: {output_path}/[{folder}]/")
+        elif not e.get('title'):
+            print(f"{prefix} Detected single video URL. Downloading {'audio' if e['audio_only'] else 'video'}...")
+            print(f"{prefix} File will be saved to: {output_path}/")
+
+    def _on_title_cleaned(self, e: Event) -> None:
+        print(f"[Thread {e['job']}] AI cleaned: '{e['title']}'")
+
+    def _on_playlist_started(self, e: Event) -> None:
+        count = 'streaming entries' if e.get('count') is None else f"{e['count']} videos"
+        print(f"[Thread {e['job']}] {e['content_type'].title()}: '{e['title']}' ({count})")
+
+    def _on_progress(self, e: Event) -> None:
+        if e['status'] == 'finished':
+            # Finish the progress bar line
+            print()
+            self._stop_spinner("[OK] Post-processing complete")
+            return
+
+        downloaded, total = e.get('downloaded_bytes'), e.get('total_bytes')
+        if total:
+            fraction = min(downloaded / total, 1.0)
+            filled = int(self.BAR_LENGTH * fraction)
+            bar = '#' * filled + '-' * (self.BAR_LENGTH - filled)
+            percent = f"{100 * fraction:.1f}%"
+        else:
+            bar, percent = '-' * self.BAR_LENGTH, 'N/A'
+        speed = f"{format_bytes(e['speed'])}/s" if e.get('speed') else 'N/A'
+        print(f"\r  [{bar}] {percent} | {format_bytes(downloaded)}/{format_bytes(total)} | "
+              f"{speed} | ETA: {_format_eta(e.get('eta'))}", end='', flush=True)
+
+    def _on_postprocessing(self, e: Event) -> None:
+        if self._spinner is None:
+            from tea.utils.spinner import Spinner
+            self._spinner = Spinner(f"[{e['postprocessor']}]")
+            self._spinner.start()
+
+    def _on_retry(self, e: Event) -> None:
+        print(f"[WARNING] [Thread {e['job']}] Attempt {e['attempt']}/{e['max_attempts']} failed: "
+              f"{e['error'][:100]}. Retrying in {e['delay']}s...")
+
+    def _on_entry_done(self, e: Event) -> None:
+        print(f"[Thread {e['job']}] [{e['index']}] {e['status']}: {e['title']} "
+              f"({e['downloaded']} downloaded, {e['failed']} failed)")
+
+    def _on_job_done(self, e: Event) -> None:
+        print(e['message'])
+
+    # Splitting
+
+    def _on_split_started(self, e: Event) -> None:
+        print(f"\n[OK] Splitting into {e['clips']} clips...")
+        print("-" * 60)
+
+    def _on_split_clip_started(self, e: Event) -> None:
+        print(f"[OK] Clip {e['clip']}/{e['total']}: {e['title']}")
+        print(f"   Time: {e['start']} -> {e['end']}")
+
+    def _on_split_clip_done(self, e: Event) -> None:
+        if e.get('skipped'):
+            print(f"[WARNING] Clip {e['clip']}: {e['error']}, skipping")
+        elif e['success']:
+            print(f"   [OK] Saved to: {os.path.basename(e['path'])}")
+        else:
+            print("   [ERROR] Failed to process clip")
+
+    # Search
+
+    def _on_search_started(self, e: Event) -> None:
+        print(f"\n[{e['index']}/{e['total']}] Searching for: {e['query']}")
+
+    def _on_search_done(self, e: Event) -> None:
+        if e.get('url'):
+            print("[OK] Added to download queue")
+        else:
+            print(f"[INFO] Skipped: {e['query']}")
+
+    # Summaries and messages
+
+    def _on_summary(self, e: Event) -> None:
+        kind = e['kind']
+        if kind == 'download':
+            print("\n" + "=" * 60)
+            print("DOWNLOAD SUMMARY")
+            print("=" * 60)
+            successful, failed = e['successful'], e['failed']
+            print(f"[OK] Successful downloads: {successful} {'files' if successful != 1 else 'file'}")
+            print(f"[ERROR] Failed downloads: {failed} {'files' if failed != 1 else 'file'}")
+            if e['failures']:
+                print("\n[ERROR] Failed URLs:")
+                for failure in e['failures']:
+                    print(f"   * {failure['url']}")
+                    print(f"     Reason: {failure['reason']}")
+            if e['succeeded_jobs']:
+                print(f"\nAll files saved to: {e['output_path']}")
+        elif kind == 'split':
+            print("\n" + "-" * 60)
+            print("SPLIT SUMMARY")
+            print("-" * 60)
+            print(f"[OK] Successful clips: {e['successful']}")
+            print(f"[ERROR] Failed clips: {e['failed']}")
+            if e['successful']:
+                print(f"\n[OK] Clips saved to: {e['output_dir']}")
+            if e['failures']:
+                print("\n[ERROR] Failed clips:")
+                for failure in e['failures']:
+                    print(f"  {failure['clip']}. {failure['title']}")
+        elif kind == 'search':
+            print(f"\n{'=' * 60}")
+            print("SEARCH SUMMARY")
+            print(f"{'=' * 60}")
+            print(f"[OK] Downloads queued: {e['queued']}")
+            print(f"[INFO] Skipped: {e['skipped']}")
+
+    def _on_message(self, e: Event) -> None:
+        prefix = f"[Thread {e['job']}] " if e.get('job') is not None else ""
+        level = '' if e.get('level', 'info') == 'info' else f"[{e['level'].upper()}] "
+        print(f"{prefix}{level}{e['text']}")
+
+
+_human = HumanRenderer()
+_events = EventBus()
+_events.subscribe(_human)
+
+
+def get_events() -> EventBus:
+    """
+    Get the process-wide EventBus.
+
+    It starts with the console renderer subscribed.
+
+    Returns:
+        Shared EventBus instance
+    """
+    return _events
+
+
+@contextmanager
+def jsonl_events(path: Optional[str] = None, bus: Optional[EventBus] = None) -> Iterator[JsonlWriter]:
+    """
+    Write events as JSON Lines for the duration of the block.
+
+    With a path, events are appended to that file and the console output is
+    unchanged. Without one, events go to stdout in place of the console
+    output, and anything still printed or logged to the console is sent to
+    stderr so stdout stays valid JSON Lines.
+
+    Args:
+        path: Output file, or None for stdout
+        bus: Event bus. If None, uses the process-wide one.
+
+    Yields:
+        The subscribed JsonlWriter
+
+    Raises:
+        OSError: If the file cannot be opened
+    """
+    bus = bus or get_events()
+    if path:
+        with open(path, 'a', encoding='utf-8') as f:
+            writer = JsonlWriter(f)
+            bus.subscribe(writer)
+            try:
+                yield writer
+            finally:
+                bus.unsubscribe(writer)
+        return
+
+    stdout = sys.stdout
+    writer = JsonlWriter(stdout)
+    replaced = [sink for sink in bus.sinks if isinstance(sink, HumanRenderer)]
+    handlers = [
+        handler for handler in logging.getLogger('tea').handlers
+        if isinstance(handler, logging.StreamHandler) and handler.stream is stdout
+    ]
+    for sink in replaced:
+        bus.unsubscribe(sink)
+    for handler in handlers:
+        handler.setStream(sys.stderr)
+    bus.subscribe(writer)
+    try:
+        with redirect_stdout(sys.stderr):
+            yield writer
+    finally:
+        bus.unsubscribe(writer)
+        for sink in replaced:
+            bus.subscribe(sink)
+        for handler in handlers:
+            handler.setStream(stdout)
+
+
+def extract_events_option(args: List[str]) -> Tuple[Optional[str], Optional[str], List[str]]:
+    """
+    Remove ``--events FORMAT`` and ``--events-file PATH`` from command-line arguments.
+
+    Both accept the ``--option=value`` form. ``--events-file`` alone implies
+    ``--events jsonl``.
+
+    Args:
+        args: Command-line arguments without the program name
+
+    Returns:
+        Tuple of (event format or None, events file or None, remaining arguments)
+
+    Raises:
+        ValidationError: If a value is missing or the format is unknown
+    """
+    values: Dict[str, Optional[str]] = {'--events': None, '--events-file': None}
+    remaining = []
+    args = list(args)
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        name, has_value, value = arg.partition('=')
+        if name in values:
+            if not has_value:
+                i += 1
+                if i >= len(args):
+                    raise ValidationError(f"{name} needs a value", field=name.lstrip('-'))
+                value = args[i]
+            values[name] = value
+        else:
+            remaining.append(arg)
+        i += 1
+
+    event_format, path = values['--events'], values['--events-file']
+    if event_format is None and path:
+        event_format = 'jsonl'
+    if event_format is not None:
+        event_format = event_format.lower()
+        if event_format not in EVENT_FORMATS:
+            raise ValidationError(
+                f"Unknown event format '{event_format}' (expected one of {', '.join(EVENT_FORMATS)})",
+                field='events',
+                value=event_format,
+            )
+    return event_format, path, remaining
@@ -270,3 +270,38 @@ class SearchError(TeaError):
 
         super().__init__(message, error_details)
         self.query = query
+
+
+class DaemonError(TeaError):
+    """Raised when talking to the Tea daemon fails.
+
+    This exception is used when:
+    - The daemon is not running or cannot be reached
+    - The daemon rejects a job submission
+    - The daemon returns an unexpected response
+    """
+
+    def __init__(
+        self,
+        message: str,
+        address: Optional[str] = None,
+        status: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize DaemonError.
+
+        Args:
+            message: Human-readable error message
+            address: host:port of the daemon
+            status: HTTP status code returned by the daemon
+            details: Optional dictionary with additional error context
+        """
+        error_details = details or {}
+        if address:
+            error_details["address"] = address
+        if status is not None:
+            error_details["status"] = status
+
+        super().__init__(message, error_details)
+        self.address = address
+        self.status = status
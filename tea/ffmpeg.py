@@ -49,18 +49,36 @@ except ImportError:
     class SecurityValidationError(Exception):
         pass
 
+# Import from tea modules
+try:
+    from tea.metrics import Metrics, get_metrics
+    from tea.events import EventBus, get_events
+except ImportError:
+    # Fallback for development
+    from tea.metrics import Metrics, get_metrics
+    from tea.events import EventBus, get_events
+
 
 class FFmpegService:
     """Handles FFmpeg operations for video/audio processing."""
 
-    def __init__(self, logger=None):
+    def __init__(
+        self,
+        logger=None,
+        metrics: Optional[Metrics] = None,
+        events: Optional[EventBus] = None
+    ):
         """
         Initialize FFmpegService.
 
         Args:
             logger: Logger instance for logging
+            metrics: Metrics registry. If None, uses the process-wide one.
+            events: Event bus. If None, uses the process-wide one.
         """
         self._logger = logger
+        self._metrics = metrics or get_metrics()
+        self._events = events or get_events()
 
     def _check_ffmpeg(self) -> bool:
         """
@@ -104,7 +122,7 @@ class FFmpegService:
 
         # Check FFmpeg availability
         if not self._check_ffmpeg():
-            print("[ERROR] FFmpeg not found. Install from: https://ffmpeg.org/")
+            self._events.emit('message', level='error', text="FFmpeg not found. Install from: https://ffmpeg.org/")
             return []
 
         # Sanitize output directory path
@@ -117,12 +135,11 @@ class FFmpegService:
         except (OSError, PermissionError) as e:
             if self._logger:
                 self._logger.error(f"Cannot create output directory: {e}")
-            print(f"[ERROR] Cannot create output directory: {e}")
+            self._events.emit('message', level='error', text=f"Cannot create output directory: {e}")
             return []
 
         total_clips = len(timestamps)
-        print(f"\n[OK] Splitting into {total_clips} clips...")
-        print("-" * 60)
+        self._events.emit('split_started', clips=total_clips, output_dir=safe_output_dir)
 
         for i, timestamp in enumerate(timestamps, 1):
             start = timestamp['start']
@@ -131,13 +148,16 @@ class FFmpegService:
 
             # Validate timestamps
             if not validate_timestamp(start) or not validate_timestamp(end):
-                print(f"[WARNING] Clip {i}: Invalid timestamp format, skipping")
                 results.append({
                     'success': False,
                     'clip': i,
                     'title': raw_title,
                     'error': 'Invalid timestamp format'
                 })
+                self._events.emit(
+                    'split_clip_done', clip=i, total=total_clips, title=raw_title, success=False,
+                    path=None, error='Invalid timestamp format', skipped=True
+                )
                 continue
 
             # Sanitize title for safe use in filenames and metadata
@@ -152,8 +172,9 @@ class FFmpegService:
                 _, ext = os.path.splitext(video_path)
                 output_path = os.path.join(safe_output_dir, f"{i:02d}-{safe_title}{ext}")
 
-            print(f"[OK] Clip {i}/{total_clips}: {safe_title}")
-            print(f"   Time: {start} -> {end}")
+            self._events.emit(
+                'split_clip_started', clip=i, total=total_clips, title=safe_title, start=start, end=end
+            )
 
             try:
                 result = self._execute_split(
@@ -174,7 +195,7 @@ class FFmpegService:
                     'title': safe_title,
                     'path': output_path
                 })
-                print(f"   [OK] Saved to: {os.path.basename(output_path)}")
+                self._events.emit('file_written', path=output_path, source='split')
 
             except subprocess.CalledProcessError as e:
                 error_msg = e.stderr if e.stderr else str(e)
@@ -185,7 +206,6 @@ class FFmpegService:
                     'title': safe_title,
                     'error': safe_error
                 })
-                print(f"   [ERROR] Failed to process clip")
 
             except Exception as e:
                 results.append({
@@ -194,7 +214,15 @@ class FFmpegService:
                     'title': safe_title,
                     'error': 'Processing error'
                 })
-                print(f"   [ERROR] Failed to process clip")
+
+            result = results[-1]
+            self._events.emit(
+                'split_clip_done', clip=i, total=total_clips, title=safe_title, success=result['success'],
+                path=result.get('path'), error=result.get('error'), skipped=False
+            )
+
+        for result in results:
+            self._metrics.inc('clips', result='ok' if result['success'] else 'failed')
 
         return results
 
@@ -252,12 +280,13 @@ class FFmpegService:
                     output_path
                 ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            with self._metrics.time('split'):
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
 
             # Stop spinner on success
             if spinner:
@@ -271,6 +300,84 @@ class FFmpegService:
                 spinner.stop()
             raise
 
+    def extract_audio(self, source_path: str, output_path: str, bitrate: str = '320k') -> bool:
+        """
+        Transcode the audio of a local file to MP3.
+
+        Args:
+            source_path: Video or audio file to read
+            output_path: MP3 file to write
+            bitrate: MP3 bitrate
+
+        Returns:
+            True if the MP3 was written
+        """
+        cmd = [
+            'ffmpeg',
+            '-i', source_path,
+            '-vn',
+            '-acodec', 'libmp3lame',
+            '-b:a', bitrate,
+            '-map_metadata', '0',
+            '-y',
+            output_path
+        ]
+        return self._convert(cmd, output_path)
+
+    def remux(self, source_path: str, output_path: str) -> bool:
+        """
+        Copy the streams of a local file into another container.
+
+        Args:
+            source_path: File to read
+            output_path: File to write; its extension selects the container
+
+        Returns:
+            True if the file was written
+        """
+        cmd = [
+            'ffmpeg',
+            '-i', source_path,
+            '-map', '0',
+            '-c', 'copy',
+            '-map_metadata', '0',
+            '-y',
+            output_path
+        ]
+        return self._convert(cmd, output_path)
+
+    def convert_image(self, source_path: str, output_path: str) -> bool:
+        """
+        Convert an image, e.g. a WebP thumbnail to PNG.
+
+        Args:
+            source_path: Image to read
+            output_path: Image to write; its extension selects the format
+
+        Returns:
+            True if the image was written
+        """
+        cmd = [
+            'ffmpeg',
+            '-i', source_path,
+            '-y',
+            output_path
+        ]
+        return self._convert(cmd, output_path)
+
+    def _convert(self, cmd: List[str], output_path: str) -> bool:
+        """Run a conversion command, removing partial output on failure."""
+        try:
+            with self._metrics.time('convert'):
+                subprocess.run(cmd, capture_output=True, text=True, check=True)
+            return True
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            if self._logger:
+                self._logger.warning(f"FFmpeg conversion to {output_path} failed: {e}")
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            return False
+
     def find_downloaded_video(
         self,
         output_path: str,
@@ -286,7 +393,7 @@ class FFmpegService:
         Returns:
             Path to found file or None
         """
-        extensions = ['.mp4', '.mkv', '.webm', '.avi', '.mp3']
+        extensions = ['.mp4', '.mkv', '.webm', '.avi', '.mp3', '.m4a', '.opus']
 
         # Sanitize the output path
         safe_output_path = sanitize_path(output_path)
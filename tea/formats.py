@@ -0,0 +1,286 @@
+"""
+Format planning for Tea YouTube Downloader.
+
+A FormatPlan says how one download is selected and post-processed: the
+yt-dlp format selector, the postprocessors and the final container. Video
+follows a QUALITY_PRESETS preset and MP3s an MP3 bitrate, taken from the
+default_quality and mp3_quality config keys unless a job overrides them.
+Plans prefer streams that already fit the target container (H.264 + AAC
+for MP4), so FFmpeg only remuxes them instead of re-encoding. In the
+'native' audio format, audio is kept as the M4A or Opus stream YouTube
+serves, without converting it to MP3.
+"""
+
+from typing import Any, Dict, List, Optional
+
+# Import from tea modules
+try:
+    from tea.store import store_profile
+    from tea.exceptions import ValidationError
+    from tea.constants import (
+        AUDIO_FORMAT_MP3,
+        AUDIO_FORMAT_NATIVE,
+        VALID_AUDIO_FORMATS,
+        QUALITY_PRESETS,
+        AUDIO_QUALITY_PRESETS,
+        AUDIO_ONLY_QUALITIES,
+        VALID_MP3_QUALITIES,
+        DEFAULT_VIDEO_QUALITY,
+        DEFAULT_MP3_QUALITY,
+        MP4_VIDEO_CODEC_FILTER,
+        MP4_AUDIO_CODEC_FILTER,
+        NATIVE_AUDIO_FORMAT,
+    )
+except ImportError:
+    # Fallback for development
+    from tea.store import store_profile
+    from tea.exceptions import ValidationError
+    from tea.constants import (
+        AUDIO_FORMAT_MP3,
+        AUDIO_FORMAT_NATIVE,
+        VALID_AUDIO_FORMATS,
+        QUALITY_PRESETS,
+        AUDIO_QUALITY_PRESETS,
+        AUDIO_ONLY_QUALITIES,
+        VALID_MP3_QUALITIES,
+        DEFAULT_VIDEO_QUALITY,
+        DEFAULT_MP3_QUALITY,
+        MP4_VIDEO_CODEC_FILTER,
+        MP4_AUDIO_CODEC_FILTER,
+        NATIVE_AUDIO_FORMAT,
+    )
+
+
+def is_audio_quality(quality: Optional[str]) -> bool:
+    """
+    Check whether a quality preset downloads audio only.
+
+    Args:
+        quality: Quality preset name, e.g. '5' or 'audio'
+
+    Returns:
+        True for audio-only presets
+    """
+    return quality in AUDIO_ONLY_QUALITIES
+
+
+def normalize_audio_quality(audio_quality: Optional[str]) -> str:
+    """
+    Turn an MP3 quality setting into a bitrate in kbps.
+
+    Args:
+        audio_quality: Bitrate ('128', '192k', ...), AUDIO_QUALITY_PRESETS
+            name ('low', ..., 'max') or None for DEFAULT_MP3_QUALITY
+
+    Returns:
+        Bitrate from VALID_MP3_QUALITIES
+
+    Raises:
+        ValidationError: If the setting is not a supported bitrate
+    """
+    if audio_quality is None:
+        return DEFAULT_MP3_QUALITY
+
+    value = str(audio_quality).strip().lower()
+    value = AUDIO_QUALITY_PRESETS.get(value, value).rstrip('k')
+    if value not in VALID_MP3_QUALITIES:
+        raise ValidationError(
+            message=f"Invalid MP3 quality '{audio_quality}'. Valid values: "
+            f"{', '.join(sorted(VALID_MP3_QUALITIES, key=int))} or {', '.join(AUDIO_QUALITY_PRESETS)}",
+            field="mp3_quality",
+            value=audio_quality,
+        )
+    return value
+
+
+def _prefer_mp4_streams(format_selector: str) -> str:
+    """
+    Put H.264 + AAC streams first in a video format selector.
+
+    The first 'video+audio' alternative is tried with MP4-ready codecs
+    before the selector itself, so the merge into MP4 copies streams.
+
+    Args:
+        format_selector: yt-dlp format selector from QUALITY_PRESETS
+
+    Returns:
+        Format selector preferring MP4-ready streams
+    """
+    first = format_selector.split('/', 1)[0]
+    if '+' not in first:
+        return format_selector
+    video, audio = first.split('+', 1)
+    return f"{video}{MP4_VIDEO_CODEC_FILTER}+{audio}{MP4_AUDIO_CODEC_FILTER}/{format_selector}"
+
+
+class FormatPlan:
+    """How a download is selected and post-processed.
+
+    Attributes:
+        audio_only: Whether only audio is downloaded
+        format_selector: yt-dlp format selector
+        extension: Final file extension, or None when audio keeps the
+            source's own container
+        postprocessors: yt-dlp postprocessor definitions
+        merge_output_format: Container for merged video and audio streams
+        quality: Video quality preset, for video downloads
+        audio_quality: Audio bitrate in kbps when audio is transcoded
+    """
+
+    def __init__(
+        self,
+        audio_only: bool,
+        format_selector: str,
+        extension: Optional[str],
+        postprocessors: List[Dict[str, Any]],
+        merge_output_format: Optional[str] = None,
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None
+    ):
+        """
+        Initialize FormatPlan.
+
+        Args:
+            audio_only: Whether only audio is downloaded
+            format_selector: yt-dlp format selector
+            extension: Final file extension, or None to keep the source's
+            postprocessors: yt-dlp postprocessor definitions
+            merge_output_format: Container for merged video and audio streams
+            quality: Video quality preset, for video downloads
+            audio_quality: Audio bitrate in kbps when audio is transcoded
+        """
+        self.audio_only = audio_only
+        self.format_selector = format_selector
+        self.extension = extension
+        self.postprocessors = postprocessors
+        self.merge_output_format = merge_output_format
+        self.quality = quality
+        self.audio_quality = audio_quality
+
+    @property
+    def output_extension(self) -> str:
+        """Get the extension to put in output templates."""
+        return self.extension or '%(ext)s'
+
+    @property
+    def embeds_thumbnail(self) -> bool:
+        """Check whether the thumbnail is embedded into the file."""
+        return any(postprocessor['key'] == 'EmbedThumbnail' for postprocessor in self.postprocessors)
+
+    @property
+    def profile(self) -> str:
+        """Get the media store profile of this format."""
+        return store_profile(self.format_selector, self.extension or 'audio', self.audio_quality)
+
+    def downloader_options(self, postprocess: bool = True) -> Dict[str, Any]:
+        """
+        Get the yt-dlp options that carry out this plan.
+
+        Args:
+            postprocess: Include the postprocessors. Without them yt-dlp only
+                fetches (and merges) the streams, and the postprocessors are
+                run later (see ``tea.postprocess``).
+
+        Returns:
+            Options with 'format', 'postprocessors' and, for video,
+            'merge_output_format'
+        """
+        postprocessors = self.postprocessors if postprocess else []
+        options: Dict[str, Any] = {
+            'format': self.format_selector,
+            'postprocessors': [dict(postprocessor) for postprocessor in postprocessors],
+        }
+        if self.merge_output_format:
+            options['merge_output_format'] = self.merge_output_format
+        return options
+
+    def __repr__(self) -> str:
+        """Get a readable representation."""
+        return f"FormatPlan({self.format_selector!r}, extension={self.extension!r})"
+
+
+def plan_format(
+    audio_only: bool = False,
+    audio_format: str = AUDIO_FORMAT_MP3,
+    quality: Optional[str] = None,
+    audio_quality: Optional[str] = None
+) -> FormatPlan:
+    """
+    Plan the format of a download.
+
+    Video is selected with a QUALITY_PRESETS preset, trying H.264 + AAC
+    streams first, and merged or remuxed into MP4, which copies the
+    streams; other codecs are remuxed as they are rather than converted.
+    Audio is either converted to MP3 at the given bitrate or, with
+    AUDIO_FORMAT_NATIVE, extracted from its container without re-encoding
+    (so at the source's bitrate).
+
+    Args:
+        audio_only: Whether only audio is downloaded
+        audio_format: AUDIO_FORMAT_MP3 or AUDIO_FORMAT_NATIVE
+        quality: Video quality preset. None, or an audio-only preset, means
+            DEFAULT_VIDEO_QUALITY.
+        audio_quality: MP3 bitrate or preset name (see
+            ``normalize_audio_quality``)
+
+    Returns:
+        FormatPlan for the download
+
+    Raises:
+        ValidationError: If audio_format, quality or audio_quality is unknown
+    """
+    if audio_format not in VALID_AUDIO_FORMATS:
+        raise ValidationError(
+            message=f"Invalid audio format '{audio_format}'. Valid values: {', '.join(VALID_AUDIO_FORMATS)}",
+            field="audio_format",
+            value=audio_format,
+        )
+    if quality is not None and quality not in QUALITY_PRESETS:
+        raise ValidationError(
+            message=f"Invalid quality '{quality}'. Valid values: {', '.join(QUALITY_PRESETS)}",
+            field="quality",
+            value=quality,
+        )
+
+    metadata = {'key': 'FFmpegMetadata', 'add_metadata': True}
+    if not audio_only:
+        if quality is None or is_audio_quality(quality):
+            quality = DEFAULT_VIDEO_QUALITY
+        return FormatPlan(
+            audio_only=False,
+            format_selector=_prefer_mp4_streams(QUALITY_PRESETS[quality]),
+            extension='mp4',
+            postprocessors=[
+                {'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mp4'},
+                metadata,
+            ],
+            merge_output_format='mp4',
+            quality=quality,
+        )
+
+    thumbnail = {'key': 'EmbedThumbnail', 'already_have_thumbnail': False}
+    if audio_format == AUDIO_FORMAT_NATIVE:
+        return FormatPlan(
+            audio_only=True,
+            format_selector=NATIVE_AUDIO_FORMAT,
+            extension=None,
+            postprocessors=[
+                # 'best' copies the audio stream into its own container
+                {'key': 'FFmpegExtractAudio', 'preferredcodec': 'best'},
+                thumbnail,
+                metadata,
+            ],
+        )
+
+    bitrate = normalize_audio_quality(audio_quality)
+    return FormatPlan(
+        audio_only=True,
+        format_selector=QUALITY_PRESETS['audio'],
+        extension='mp3',
+        postprocessors=[
+            {'key': 'FFmpegExtractAudio', 'preferredcodec': 'mp3', 'preferredquality': bitrate},
+            thumbnail,
+            metadata,
+        ],
+        audio_quality=bitrate,
+    )
@@ -6,10 +6,22 @@ This module handles tracking, displaying, and managing download history.
 
 import json
 import os
+import threading
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+# Import from tea modules
+try:
+    from tea.archive import DownloadArchive
+    from tea.info import canonical_url_key
+    from tea.constants import ARCHIVE_FILENAME, SYNC_STATE_FILENAME
+except ImportError:
+    # Fallback for development
+    from tea.archive import DownloadArchive
+    from tea.info import canonical_url_key
+    from tea.constants import ARCHIVE_FILENAME, SYNC_STATE_FILENAME
+
 
 def get_history_path() -> str:
     """Get path to download history file."""
@@ -32,10 +44,22 @@ class HistoryManager:
 
     History is stored in tea-history.json in the project directory,
     organized by date with each date containing a list of downloads.
+    Video IDs are also indexed in a DownloadArchive next to it (see
+    ``archive``), which incremental channel syncs use.
+
+    The file is only read again when it changed on disk, and lookups go
+    through indexes by canonical URL key and by video ID that are built
+    once per read. A lock makes reads, lookups and updates safe to call
+    from several threads.
 
     Attributes:
         _history_path: Path to history file
         _history: In-memory history dictionary
+        _signature: (mtime, size) of the file when it was last read or written
+        _by_key: Entries by canonical URL key, oldest first (built on first lookup)
+        _by_video_id: Entries with a file by video ID, newest first (built on first lookup)
+        _archive: DownloadArchive next to the history file (created on first use)
+        _lock: Guards the history and its indexes
         _logger: Logger instance for logging
     """
 
@@ -49,28 +73,87 @@ class HistoryManager:
         self._history_path = history_path or get_history_path()
         self._logger = logger
         self._history: Dict[str, List[Dict]] = {}
+        self._signature: Optional[Tuple[int, int]] = None
+        self._by_key: Optional[Dict[str, List[Dict]]] = None
+        self._by_video_id: Optional[Dict[str, List[Dict]]] = None
+        self._archive: Optional[DownloadArchive] = None
+        # Downloads add entries while workers look up local copies
+        self._lock = threading.RLock()
+
+    @property
+    def archive(self) -> DownloadArchive:
+        """Get the download archive stored next to the history file."""
+        with self._lock:
+            if self._archive is None:
+                directory = os.path.dirname(os.path.abspath(self._history_path))
+                self._archive = DownloadArchive(
+                    os.path.join(directory, ARCHIVE_FILENAME),
+                    os.path.join(directory, SYNC_STATE_FILENAME),
+                    logger=self._logger,
+                )
+            return self._archive
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        """Get (mtime, size) of the history file, or None if it does not exist."""
+        try:
+            stat = os.stat(self._history_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def load(self) -> Dict[str, List[Dict]]:
         """
         Load download history from file.
 
+        The file is not read again while it is unchanged since the last
+        load or save.
+
         Returns:
             Dictionary mapping dates to download lists
         """
-        if os.path.exists(self._history_path):
-            try:
-                with open(self._history_path, 'r', encoding='utf-8') as f:
-                    self._history = json.load(f)
-            except json.JSONDecodeError:
+        with self._lock:
+            signature = self._file_signature()
+            if signature is not None and signature == self._signature:
+                return self._history
+
+            self._by_key = None
+            self._by_video_id = None
+            self._signature = signature
+            if signature is not None:
+                try:
+                    with open(self._history_path, 'r', encoding='utf-8') as f:
+                        self._history = json.load(f)
+                except json.JSONDecodeError:
+                    self._history = {}
+                except Exception as e:
+                    if self._logger:
+                        self._logger.warning(f"Error loading history: {e}")
+                    self._history = {}
+                    self._signature = None
+            else:
                 self._history = {}
-            except Exception as e:
-                if self._logger:
-                    self._logger.warning(f"Error loading history: {e}")
-                self._history = {}
-        else:
-            self._history = {}
 
-        return self._history
+            return self._history
+
+    def _key_index(self) -> Dict[str, List[Dict]]:
+        """Get the entries by canonical URL key, building the index if needed."""
+        if self._by_key is None:
+            self._by_key = {}
+            for downloads in self._history.values():
+                for download in downloads:
+                    key = canonical_url_key(download.get('url', ''))
+                    self._by_key.setdefault(key, []).append(download)
+        return self._by_key
+
+    def _video_index(self) -> Dict[str, List[Dict]]:
+        """Get the entries with a file by video ID, building the index if needed."""
+        if self._by_video_id is None:
+            self._by_video_id = {}
+            for date in sorted(self._history, reverse=True):
+                for download in reversed(self._history[date]):
+                    if download.get('video_id') and download.get('file_path'):
+                        self._by_video_id.setdefault(download['video_id'], []).append(download)
+        return self._by_video_id
 
     def save(self) -> bool:
         """
@@ -79,16 +162,25 @@ class HistoryManager:
         Returns:
             True if saved successfully, False otherwise
         """
-        try:
-            with open(self._history_path, 'w', encoding='utf-8') as f:
-                json.dump(self._history, f, indent=2, ensure_ascii=False)
-            return True
-        except Exception as e:
-            if self._logger:
-                self._logger.warning(f"Could not save to history: {e}")
-            return False
-
-    def add(self, url: str, title: str, output_path: str) -> bool:
+        with self._lock:
+            try:
+                with open(self._history_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._history, f, indent=2, ensure_ascii=False)
+                self._signature = self._file_signature()
+                return True
+            except Exception as e:
+                if self._logger:
+                    self._logger.warning(f"Could not save to history: {e}")
+                return False
+
+    def add(
+        self,
+        url: str,
+        title: str,
+        output_path: str,
+        video_id: Optional[str] = None,
+        file_path: Optional[str] = None
+    ) -> bool:
         """
         Add a download to history.
 
@@ -96,76 +188,111 @@ class HistoryManager:
             url: YouTube URL
             title: Video/playlist title
             output_path: Where the file was saved
+            video_id: Video ID, also recorded in the download archive
+            file_path: Downloaded file, for single videos
 
         Returns:
             True if saved successfully
         """
-        self.load()  # Ensure history is loaded
+        if video_id:
+            self.archive.add(video_id)
+
+        with self._lock:
+            self.load()  # Ensure history is loaded
+
+            today = datetime.now().strftime('%Y-%m-%d')
+
+            if today not in self._history:
+                self._history[today] = []
+
+            entry = {
+                'url': url,
+                'title': title,
+                'output_path': output_path,
+                'timestamp': datetime.now().isoformat()
+            }
+            if video_id:
+                entry['video_id'] = video_id
+            if file_path:
+                entry['file_path'] = file_path
+            self._history[today].append(entry)
+            if self._by_key is not None:
+                self._by_key.setdefault(canonical_url_key(url), []).append(entry)
+            if self._by_video_id is not None and video_id and file_path:
+                self._by_video_id.setdefault(video_id, []).insert(0, entry)
 
-        today = datetime.now().strftime('%Y-%m-%d')
-
-        if today not in self._history:
-            self._history[today] = []
-
-        self._history[today].append({
-            'url': url,
-            'title': title,
-            'output_path': output_path,
-            'timestamp': datetime.now().isoformat()
-        })
-
-        return self.save()
+            return self.save()
 
     def is_downloaded(self, url: str) -> Tuple[bool, Optional[Dict]]:
         """
         Check if URL was already downloaded.
 
+        URLs are compared by canonical key, so youtu.be/ID, watch?v=ID&t=30,
+        m.youtube.com and /shorts/ID forms of the same video all match.
+
         Args:
             url: YouTube URL to check
 
         Returns:
             Tuple of (is_downloaded, download_info)
         """
-        self.load()
+        with self._lock:
+            self.load()
 
-        for date, downloads in self._history.items():
-            for download in downloads:
-                if download.get('url') == url:
-                    return True, download
-        return False, None
+            matches = self._key_index().get(canonical_url_key(url))
+            if matches:
+                return True, matches[0]
+            return False, None
 
-    def remove(self, url: str) -> bool:
+    def find_file(self, video_id: str) -> Optional[Dict]:
         """
-        Remove a URL from download history.
+        Find the newest downloaded file of a video that still exists.
 
         Args:
-            url: URL to remove
+            video_id: Video ID
 
         Returns:
-            True if removed, False if not found
+            History entry with 'file_path', or None
         """
-        self.load()
-        found = False
+        with self._lock:
+            self.load()
+            candidates = list(self._video_index().get(video_id, ()))
 
-        for date, downloads in self._history.items():
-            original_length = len(downloads)
-            self._history[date] = [d for d in downloads if d.get('url') != url]
+        for download in candidates:
+            if os.path.isfile(download['file_path']):
+                return download
+        return None
 
-            if len(self._history[date]) < original_length:
-                found = True
+    def remove(self, url: str) -> bool:
+        """
+        Remove a URL (in any of its forms) from download history.
 
-        # Remove empty date entries
-        self._history = {
-            date: downloads
-            for date, downloads in self._history.items()
-            if downloads
-        }
+        Args:
+            url: URL to remove
 
-        if found:
+        Returns:
+            True if removed, False if not found
+        """
+        with self._lock:
+            self.load()
+            removed = self._key_index().pop(canonical_url_key(url), None)
+            if not removed:
+                return False
+
+            removed_ids = {id(download) for download in removed}
+            # Rebuilt on the next find_file(); removals are rare
+            self._by_video_id = None
+            # Drop empty date entries too
+            self._history = {
+                date: kept
+                for date, kept in (
+                    (date, [d for d in downloads if id(d) not in removed_ids])
+                    for date, downloads in self._history.items()
+                )
+                if kept
+            }
             return self.save()
 
-        return False
-
     def clear(self) -> bool:
         """
         Clear all download history.
@@ -173,8 +300,11 @@ class HistoryManager:
         Returns:
             True if cleared successfully
         """
-        self._history = {}
-        return self.save()
+        with self._lock:
+            self._history = {}
+            self._by_key = {}
+            self._by_video_id = {}
+            return self.save()
 
     def show(self, limit: Optional[int] = None) -> None:
         """
@@ -219,14 +349,15 @@ class HistoryManager:
         Returns:
             List of unique URLs
         """
-        self.load()
-        urls = []
-        for downloads in self._history.values():
-            for download in downloads:
-                url = download.get('url')
-                if url and url not in urls:
-                    urls.append(url)
-        return urls
+        with self._lock:
+            self.load()
+            urls = []
+            for downloads in self._history.values():
+                for download in downloads:
+                    url = download.get('url')
+                    if url and url not in urls:
+                        urls.append(url)
+            return urls
 
     def get_stats(self) -> Dict[str, int]:
         """
@@ -235,18 +366,20 @@ class HistoryManager:
         Returns:
             Dictionary with stats (total_downloads, unique_days, etc.)
         """
-        self.load()
-        total = sum(len(downloads) for downloads in self._history.values())
-        return {
-            'total_downloads': total,
-            'unique_days': len(self._history),
-            'urls_today': len(self._history.get(datetime.now().strftime('%Y-%m-%d'), []))
-        }
+        with self._lock:
+            self.load()
+            total = sum(len(downloads) for downloads in self._history.values())
+            return {
+                'total_downloads': total,
+                'unique_days': len(self._history),
+                'urls_today': len(self._history.get(datetime.now().strftime('%Y-%m-%d'), []))
+            }
 
     def to_dict(self) -> Dict[str, List[Dict]]:
         """Return history as dictionary."""
-        self.load()
-        return self._history.copy()
+        with self._lock:
+            self.load()
+            return self._history.copy()
 
 
 # Convenience functions for backward compatibility
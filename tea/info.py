@@ -5,11 +5,23 @@ This module handles URL validation and content type detection (video/playlist/ch
 """
 
 import re
-from typing import Dict, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 from urllib.parse import urlparse, parse_qs
 from functools import lru_cache
 
-from yt_dlp import YoutubeDL
+from tea.utils.lazy import LazyImport
+
+# Import from tea modules
+try:
+    from tea.metrics import Metrics, get_metrics
+    from tea.pool import YoutubeDLPool, get_ydl_pool
+except ImportError:
+    # Fallback for development
+    from tea.metrics import Metrics, get_metrics
+    from tea.pool import YoutubeDLPool, get_ydl_pool
+
+# yt-dlp is slow to import and only needed once a URL is processed
+YoutubeDL = LazyImport('yt_dlp', 'YoutubeDL')
 
 
 # YouTube URL patterns
@@ -31,17 +43,32 @@ YOUTUBE_PATTERNS = {
 }
 
 
+# Path prefixes that are followed by a video ID
+VIDEO_ID_PATH_PREFIXES = ('shorts', 'embed', 'live', 'v', 'e')
+
+VIDEO_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
 class InfoExtractor:
     """Extracts information from YouTube URLs."""
 
-    def __init__(self, logger=None):
+    def __init__(
+        self,
+        logger=None,
+        metrics: Optional[Metrics] = None,
+        ydl_pool: Optional[YoutubeDLPool] = None
+    ):
         """
         Initialize InfoExtractor.
 
         Args:
             logger: Logger instance for logging
+            metrics: Metrics registry. If None, uses the process-wide one.
+            ydl_pool: YoutubeDL pool. If None, uses the process-wide one.
         """
         self._logger = logger
+        self._metrics = metrics or get_metrics()
+        self._ydl_pool = ydl_pool or get_ydl_pool()
         self._cache: Dict[str, Tuple[str, Dict]] = {}
 
     def _extract_with_ytdlp(self, url: str) -> Tuple[str, Dict]:
@@ -63,7 +90,7 @@ class InfoExtractor:
                 'playlist_items': '1',
             }
 
-            with YoutubeDL(ydl_opts) as ydl:
+            with self._ydl_pool.acquire('probe', ydl_opts, YoutubeDL) as ydl:
                 info = ydl.extract_info(url, download=False)
 
                 if info is None:
@@ -95,29 +122,11 @@ class InfoExtractor:
         Returns:
             Tuple of (content_type, empty_dict)
         """
-        parsed_url = urlparse(url)
-        query_params = parse_qs(parsed_url.query)
-
-        # Check for channel patterns first
-        if self._is_channel_url(url):
-            return 'channel', {}
-
-        # Check for playlist
-        if 'list' in query_params:
-            return 'playlist', {}
-
-        # Default to video
-        return 'video', {}
+        return guess_content_type(url), {}
 
     def _is_channel_url(self, url: str) -> bool:
         """Check if URL matches channel patterns."""
-        patterns = [
-            '/@' in url,
-            '/channel/' in url,
-            '/c/' in url,
-            '/user/' in url
-        ]
-        return any(patterns)
+        return _is_channel_url(url)
 
     def get_info(self, url: str, use_cache: bool = True) -> Tuple[str, Dict]:
         """
@@ -131,8 +140,10 @@ class InfoExtractor:
             Tuple of (content_type, info_dict) where content_type is 'video', 'playlist', or 'channel'
         """
         if use_cache and url in self._cache:
+            self._metrics.inc('cache_hits', cache='info')
             return self._cache[url]
 
+        self._metrics.inc('cache_misses', cache='info')
         result = self._extract_with_ytdlp(url)
 
         if use_cache:
@@ -153,11 +164,62 @@ class InfoExtractor:
         content_type, _ = self.get_info(url)
         return content_type
 
+    def get_channel_key(self, url: str) -> Optional[str]:
+        """
+        Get the per-channel scheduling key of a URL (see ``channel_key``).
+
+        Uses the cached info of the URL, so the uploader of single videos
+        is known once their content type has been looked up.
+
+        Args:
+            url: YouTube URL
+
+        Returns:
+            Channel key, or None if the channel is unknown
+        """
+        _, info = self.get_info(url)
+        return channel_key(url, info)
+
     def clear_cache(self) -> None:
         """Clear the URL info cache."""
         self._cache.clear()
 
 
+def _is_channel_url(url: str) -> bool:
+    """Check if URL matches channel patterns."""
+    patterns = [
+        '/@' in url,
+        '/channel/' in url,
+        '/c/' in url,
+        '/user/' in url
+    ]
+    return any(patterns)
+
+
+def guess_content_type(url: str) -> str:
+    """
+    Guess the content type of a YouTube URL from its pattern alone.
+
+    Unlike InfoExtractor.get_content_type this makes no network request.
+
+    Args:
+        url: YouTube URL
+
+    Returns:
+        'video', 'playlist', or 'channel'
+    """
+    # Check for channel patterns first
+    if _is_channel_url(url):
+        return 'channel'
+
+    # Check for playlist
+    if 'list' in parse_qs(urlparse(url).query):
+        return 'playlist'
+
+    # Default to video
+    return 'video'
+
+
 # Global instance with LRU cache for backward compatibility
 @lru_cache(maxsize=128)
 def get_url_info(url: str) -> Tuple[str, Dict]:
@@ -210,3 +272,133 @@ def is_youtube_url(url: str) -> bool:
         return domain in ('youtube.com', 'www.youtube.com', 'm.youtube.com', 'youtu.be')
     except Exception:
         return False
+
+
+def _youtube_host(url: str) -> Optional[str]:
+    """Get the lower-cased YouTube host of a URL, without 'www.'/'m.'/'music.'."""
+    try:
+        host = (urlparse(url.strip()).hostname or '').lower()
+    except ValueError:
+        return None
+    for prefix in ('www.', 'm.', 'music.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    if host in ('youtube.com', 'youtu.be', 'youtube-nocookie.com'):
+        return host
+    return None
+
+
+def extract_video_id(url: str) -> Optional[str]:
+    """
+    Get the video ID from any form of YouTube video URL, without network access.
+
+    Handles youtu.be/ID, watch?v=ID (with any extra parameters), /shorts/ID,
+    /embed/ID, /live/ID and /v/ID on www., m. and music. hosts.
+
+    Args:
+        url: YouTube URL
+
+    Returns:
+        The video ID, or None if the URL does not point at a single video
+    """
+    if not url or not isinstance(url, str):
+        return None
+
+    host = _youtube_host(url)
+    if host is None:
+        return None
+
+    parsed = urlparse(url.strip())
+    parts = [part for part in parsed.path.split('/') if part]
+
+    if host == 'youtu.be':
+        candidate = parts[0] if parts else None
+    elif parts[:1] == ['watch']:
+        candidate = parse_qs(parsed.query).get('v', [None])[0]
+    elif len(parts) >= 2 and parts[0] in VIDEO_ID_PATH_PREFIXES:
+        candidate = parts[1]
+    else:
+        candidate = None
+
+    if candidate and VIDEO_ID_PATTERN.match(candidate):
+        return candidate
+    return None
+
+
+def canonical_url_key(url: str) -> str:
+    """
+    Get a key that is equal for every URL form of the same content.
+
+    Videos are keyed by ID ('video:ID'), playlists by list ID
+    ('playlist:ID'); anything else falls back to the stripped URL.
+
+    Args:
+        url: YouTube URL
+
+    Returns:
+        Canonical key for de-duplication
+    """
+    url = (url or '').strip()
+    if guess_content_type(url) == 'playlist' and _youtube_host(url):
+        list_id = parse_qs(urlparse(url).query).get('list', [None])[0]
+        if list_id:
+            return f'playlist:{list_id}'
+
+    video_id = extract_video_id(url)
+    if video_id:
+        return f'video:{video_id}'
+
+    return url.rstrip('/')
+
+
+def channel_key(url: str, info: Optional[Dict] = None) -> Optional[str]:
+    """
+    Get the key that limits how many downloads of one channel run at once.
+
+    The channel ID from yt-dlp info is used when known ('channel:UC...').
+    Otherwise channel URLs are keyed by their handle or ID, so every tab
+    of a channel shares a key, and playlists by their canonical key.
+
+    Args:
+        url: YouTube URL
+        info: Info dict of the URL, if it has been extracted
+
+    Returns:
+        Channel key, or None for single videos of unknown uploader
+    """
+    if info:
+        channel_id = info.get('channel_id') or info.get('uploader_id')
+        if channel_id:
+            return f'channel:{channel_id}'
+
+    content_type = guess_content_type(url)
+    if content_type == 'channel' and _youtube_host(url):
+        parts = [part for part in urlparse(url.strip()).path.split('/') if part]
+        if parts and parts[0].startswith('@'):
+            return f'channel:{parts[0].lower()}'
+        if len(parts) >= 2:
+            return f'channel:{parts[1]}'
+    if content_type == 'playlist':
+        return canonical_url_key(url)
+    return None
+
+
+def dedupe_urls(urls: Iterable[str]) -> List[str]:
+    """
+    Drop URLs that point at content already listed, keeping the first form.
+
+    Args:
+        urls: URLs in order
+
+    Returns:
+        URLs in order with canonical duplicates removed
+    """
+    seen = set()
+    unique = []
+    for url in urls:
+        key = canonical_url_key(url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(url)
+    return unique
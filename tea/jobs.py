@@ -0,0 +1,524 @@
+"""
+Download job queue for Tea YouTube Downloader.
+
+This module keeps a queue of download jobs and runs them on a fixed pool of
+worker threads that share one DownloadService, so caches and loaded modules
+stay warm between jobs. A worker takes the next job as soon as a download is
+handed to post-processing; the job finishes when post-processing does. It is
+used by the daemon (tea serve) and tea watch.
+"""
+
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, List, Optional, Set
+
+# Import from tea modules
+try:
+    from tea.downloader import DownloadService
+    from tea.history import HistoryManager
+    from tea.info import canonical_url_key, guess_content_type
+    from tea.scheduler import DownloadScheduler, default_priority, parse_priority
+    from tea.exceptions import DownloadError, ValidationError
+    from tea.constants import (
+        DEFAULT_CONCURRENT_WORKERS,
+        MAX_CONCURRENT_WORKERS,
+        DAEMON_MAX_FINISHED_JOBS,
+        PRIORITY_NORMAL,
+        PRIORITY_NAMES,
+        JOB_QUEUED,
+        JOB_RUNNING,
+        JOB_DONE,
+        JOB_FAILED,
+        JOB_CANCELLED,
+        JOB_FINISHED_STATES,
+    )
+except ImportError:
+    # Fallback for development
+    from tea.downloader import DownloadService
+    from tea.history import HistoryManager
+    from tea.info import canonical_url_key, guess_content_type
+    from tea.scheduler import DownloadScheduler, default_priority, parse_priority
+    from tea.exceptions import DownloadError, ValidationError
+    from tea.constants import (
+        DEFAULT_CONCURRENT_WORKERS,
+        MAX_CONCURRENT_WORKERS,
+        DAEMON_MAX_FINISHED_JOBS,
+        PRIORITY_NORMAL,
+        PRIORITY_NAMES,
+        JOB_QUEUED,
+        JOB_RUNNING,
+        JOB_DONE,
+        JOB_FAILED,
+        JOB_CANCELLED,
+        JOB_FINISHED_STATES,
+    )
+
+_PRIORITY_LABELS = {value: name for name, value in PRIORITY_NAMES.items()}
+
+
+class Job:
+    """A single URL queued for download.
+
+    Attributes:
+        id: Unique job identifier
+        url: YouTube URL to download
+        output_path: Directory to save the download
+        audio_only: Download audio only (MP3)
+        priority: Priority class (PRIORITY_* from tea.constants)
+        source: Fairness group the job is scheduled with
+        audio_format: Audio format override ('mp3' or 'native')
+        quality: Video quality preset override
+        audio_quality: MP3 bitrate override
+        status: One of the JOB_* states from tea.constants
+        result: Result dict from DownloadService.fetch
+        error: Error message if the job failed
+    """
+
+    def __init__(
+        self,
+        url: str,
+        output_path: str,
+        audio_only: bool = False,
+        priority: int = PRIORITY_NORMAL,
+        source: str = '',
+        audio_format: Optional[str] = None,
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None
+    ):
+        """Initialize Job.
+
+        Args:
+            url: YouTube URL to download
+            output_path: Directory to save the download
+            audio_only: Download audio only (MP3)
+            priority: Priority class
+            source: Fairness group the job is scheduled with
+            audio_format: Audio format override; None uses the config
+            quality: Video quality preset override; None uses the config
+            audio_quality: MP3 bitrate override; None uses the config
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.url = url
+        self.output_path = output_path
+        self.audio_only = audio_only
+        self.priority = priority
+        self.source = source
+        self.audio_format = audio_format
+        self.quality = quality
+        self.audio_quality = audio_quality
+        self.status = JOB_QUEUED
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self.status in JOB_FINISHED_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable view of the job.
+
+        Returns:
+            Dictionary describing the job
+        """
+        data = {
+            'id': self.id,
+            'url': self.url,
+            'output_path': self.output_path,
+            'audio_only': self.audio_only,
+            'priority': _PRIORITY_LABELS[self.priority],
+            'source': self.source,
+            'audio_format': self.audio_format,
+            'quality': self.quality,
+            'audio_quality': self.audio_quality,
+            'status': self.status,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'error': self.error,
+        }
+        if self.result:
+            data['title'] = self.result.get('title')
+            data['count'] = self.result.get('count')
+            data['message'] = self.result.get('message')
+        return data
+
+    def __repr__(self) -> str:
+        """Return string representation of the job."""
+        return f"Job(id={self.id!r}, url={self.url!r}, status={self.status!r})"
+
+
+class JobQueue:
+    """Runs download jobs on a pool of long-lived worker threads.
+
+    All workers share the same DownloadService, so its InfoExtractor cache
+    and imported modules are reused across jobs. Successful downloads are
+    recorded in history. Jobs are handed out by a DownloadScheduler, so
+    high-priority jobs start first and a large submission takes turns with
+    smaller ones instead of blocking them.
+
+    Attributes:
+        _downloader: DownloadService used for every job
+        _history: HistoryManager that records finished downloads
+        _workers: Number of worker threads
+        _cleaner: Optional AI filename cleaner passed to every download
+        _logger: Logger instance for logging
+    """
+
+    def __init__(
+        self,
+        download_service: Optional[DownloadService] = None,
+        history_manager: Optional[HistoryManager] = None,
+        workers: int = DEFAULT_CONCURRENT_WORKERS,
+        cleaner=None,
+        max_finished: int = DAEMON_MAX_FINISHED_JOBS,
+        logger=None
+    ):
+        """Initialize JobQueue.
+
+        Args:
+            download_service: Service that performs downloads. If None, creates default.
+            history_manager: History manager instance. If None, creates default.
+            workers: Number of concurrent download workers (1-5)
+            cleaner: Optional AI filename cleaner instance
+            max_finished: Finished jobs kept for status queries
+            logger: Logger instance for logging
+
+        Raises:
+            ValidationError: If workers is not between 1 and MAX_CONCURRENT_WORKERS
+        """
+        if not 1 <= workers <= MAX_CONCURRENT_WORKERS:
+            raise ValidationError(
+                f"workers must be between 1 and {MAX_CONCURRENT_WORKERS}",
+                field="workers",
+                value=workers,
+            )
+
+        self._history = history_manager or HistoryManager(logger=logger)
+        self._downloader = download_service or DownloadService(
+            history_manager=self._history, logger=logger
+        )
+        self._workers = workers
+        self._cleaner = cleaner
+        self._max_finished = max_finished
+        self._logger = logger
+
+        self._scheduler = DownloadScheduler()
+        self._jobs: Dict[str, Job] = {}
+        self._finished_ids: Deque[str] = deque()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._history_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        # Jobs handed to post-processing that have not finished yet
+        self._postprocessing = 0
+
+    # Lifecycle
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        if self._threads:
+            return
+        for i in range(self._workers):
+            thread = threading.Thread(
+                target=self._worker, args=(i + 1,), name=f"tea-job-worker-{i + 1}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the workers after their current job.
+
+        Jobs still queued stay queued and are not run. Jobs being
+        post-processed are waited for.
+
+        Args:
+            timeout: Seconds to wait for each worker to exit, and then for
+                post-processing to finish
+        """
+        self._scheduler.close()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        with self._idle:
+            self._idle.wait_for(lambda: not self._postprocessing, timeout)
+
+    # Jobs
+
+    def submit(
+        self,
+        url: str,
+        output_path: str,
+        audio_only: bool = False,
+        on_duplicate: str = 'download',
+        priority: Optional[Any] = None,
+        source: Optional[str] = None,
+        channel: Optional[str] = None,
+        audio_format: Optional[str] = None,
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None
+    ) -> Optional[Job]:
+        """
+        Queue a URL for download.
+
+        Args:
+            url: YouTube URL to download
+            output_path: Directory to save the download
+            audio_only: Download audio only (MP3)
+            on_duplicate: What to do if the URL is already in history:
+                'download' queues it anyway, 'skip' does not queue it and
+                'replace' removes the history entry first
+            priority: 'high', 'normal', 'low' or a PRIORITY_* value. By default
+                videos are normal priority and playlists and channels low.
+            source: Fairness group (a submission, a batch file, a playlist);
+                jobs of different sources take turns. Defaults to the URL.
+            channel: Key limiting how many jobs of one channel run at once
+            audio_format: Audio format for this job ('mp3' or 'native')
+            quality: Video quality preset for this job
+            audio_quality: MP3 bitrate or preset name for this job
+
+        Returns:
+            The queued Job, the unfinished job already queued for the same
+            video (in any URL form), or None if skipped as a duplicate
+
+        Raises:
+            ValueError: If the priority is unknown
+        """
+        key = canonical_url_key(url)
+        with self._lock:
+            for existing in self._jobs.values():
+                if not existing.finished and canonical_url_key(existing.url) == key:
+                    return existing
+
+        if priority is None:
+            priority = default_priority(guess_content_type(url))
+        else:
+            priority = parse_priority(priority)
+
+        if on_duplicate in ('skip', 'replace'):
+            with self._history_lock:
+                already_downloaded, _ = self._history.is_downloaded(url)
+                if already_downloaded and on_duplicate == 'skip':
+                    return None
+                if already_downloaded:
+                    self._history.remove(url)
+
+        job = Job(
+            url, output_path, audio_only, priority, source or url,
+            audio_format=audio_format, quality=quality, audio_quality=audio_quality
+        )
+        with self._lock:
+            self._jobs[job.id] = job
+        self._scheduler.add(job, priority=job.priority, source=job.source, channel=channel)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job by ID.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The Job, or None if unknown or already dropped
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Job]:
+        """
+        List known jobs, oldest first.
+
+        Args:
+            status: Only return jobs in this state
+
+        Returns:
+            List of jobs
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if status:
+            jobs = [job for job in jobs if job.status == status]
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job that has not started yet.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            True if the job was cancelled
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JOB_QUEUED:
+                return False
+            job.status = JOB_CANCELLED
+            job.finished_at = time.time()
+            self._scheduler.remove(lambda item: item is job)
+            self._remember_finished(job)
+            self._idle.notify_all()
+            return True
+
+    def pending_urls(self) -> Set[str]:
+        """
+        Get URLs that are queued or downloading.
+
+        Returns:
+            Set of URLs not yet finished
+        """
+        with self._lock:
+            return {job.url for job in self._jobs.values() if not job.finished}
+
+    def pending_by_source(self) -> Dict[str, List[str]]:
+        """
+        Get URLs that are queued or downloading, grouped by source.
+
+        Returns:
+            Dictionary mapping each source to its unfinished URLs, oldest first
+        """
+        pending: Dict[str, List[str]] = {}
+        for job in self.list_jobs():
+            if not job.finished:
+                pending.setdefault(job.source, []).append(job.url)
+        return pending
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count jobs by state.
+
+        Returns:
+            Dictionary mapping each JOB_* state to a count
+        """
+        counts = {state: 0 for state in (JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED, JOB_CANCELLED)}
+        with self._lock:
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return counts
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no job is queued or running.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits as needed)
+
+        Returns:
+            True if the queue became idle, False on timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(
+                lambda: all(job.finished for job in self._jobs.values()), timeout
+            )
+
+    # Workers
+
+    def _worker(self, worker_id: int) -> None:
+        """Take jobs from the scheduler until it is closed."""
+        while True:
+            task = self._scheduler.next()
+            if task is None:
+                return
+
+            job = task.item
+            try:
+                with self._lock:
+                    if job.status != JOB_QUEUED:
+                        continue
+                    job.status = JOB_RUNNING
+                    job.started_at = time.time()
+
+                self._run(job, worker_id)
+            finally:
+                self._scheduler.done(task)
+
+    def _run(self, job: Job, worker_id: int) -> None:
+        """
+        Fetch one job's download.
+
+        If the download is handed to post-processing, this returns at once
+        so the worker and the job's channel slot are free for the next job,
+        and the job is finished by a callback when post-processing is done.
+        """
+        try:
+            result = self._downloader.fetch(
+                job.url, job.output_path, worker_id, job.audio_only, self._cleaner,
+                workers=self._workers, audio_format=job.audio_format,
+                quality=job.quality, audio_quality=job.audio_quality
+            )
+        except Exception as e:
+            self._finish(job, error=e)
+            return
+
+        if isinstance(result, Future):
+            with self._lock:
+                self._postprocessing += 1
+            result.add_done_callback(lambda future: self._finish_postprocessed(job, future))
+        else:
+            self._finish(job, result)
+
+    def _finish_postprocessed(self, job: Job, future: Future) -> None:
+        """Finish a job once its post-processing is done."""
+        try:
+            try:
+                result = future.result()
+            except Exception as e:
+                self._finish(job, error=e)
+            else:
+                self._finish(job, result)
+        finally:
+            with self._lock:
+                self._postprocessing -= 1
+                self._idle.notify_all()
+
+    def _finish(
+        self,
+        job: Job,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[Exception] = None
+    ) -> None:
+        """Record the outcome of a job in history and in its state."""
+        if error is None:
+            message = None if result.get('success') else result.get('message')
+        elif isinstance(error, DownloadError):
+            message = str(error)
+        else:
+            if self._logger:
+                self._logger.error(f"Job {job.id} crashed: {error}")
+            message = f"Unexpected error: {error}"
+
+        if message is None:
+            try:
+                # HistoryManager reads and rewrites its file, so serialize writers
+                with self._history_lock:
+                    self._history.add(
+                        job.url, result.get('title', 'Unknown'), job.output_path, result.get('id'),
+                        result.get('filepath')
+                    )
+            except Exception as e:
+                if self._logger:
+                    self._logger.error(f"Could not record job {job.id} in history: {e}")
+
+        with self._lock:
+            job.result = result
+            job.error = message
+            job.status = JOB_DONE if message is None else JOB_FAILED
+            job.finished_at = time.time()
+            self._remember_finished(job)
+            self._idle.notify_all()
+
+    def _remember_finished(self, job: Job) -> None:
+        """Track a finished job, dropping the oldest beyond max_finished (lock held)."""
+        self._finished_ids.append(job.id)
+        while len(self._finished_ids) > self._max_finished:
+            self._jobs.pop(self._finished_ids.popleft(), None)
@@ -0,0 +1,242 @@
+"""
+Pipeline metrics for Tea YouTube Downloader.
+
+A Metrics registry collects per-stage timers (probe, AI clean, download,
+merge, postprocess, split, history write, search, ...) and counters (bytes,
+retries, throttles, cache hits, ...). Services record into the process-wide
+registry from ``get_metrics()`` unless given their own.
+
+The registry is exposed two ways:
+
+- ``tea serve`` answers ``GET /metrics`` with the Prometheus text format.
+- ``tea download --metrics-report FILE`` writes a JSON run report.
+"""
+
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Import from tea modules
+try:
+    from tea.constants import METRICS_NAMESPACE
+except ImportError:
+    # Fallback for development
+    from tea.constants import METRICS_NAMESPACE
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, Any]) -> LabelSet:
+    """Normalize labels into a hashable, sorted tuple."""
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: LabelSet) -> str:
+    """Format labels for the Prometheus text format."""
+    if not labels:
+        return ''
+    escaped = (
+        (key, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels
+    )
+    return '{' + ','.join(f'{key}="{value}"' for key, value in escaped) + '}'
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the Prometheus text format without losing precision."""
+    if isinstance(value, int):
+        return str(value)
+    value = float(value)
+    if value.is_integer():
+        return str(int(value))
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if math.isnan(value):
+        return 'NaN'
+    return repr(value)
+
+
+class Metrics:
+    """Thread-safe registry of stage timers and counters.
+
+    Attributes:
+        started_at: Unix time the registry was created or last reset
+    """
+
+    def __init__(self):
+        """Initialize an empty Metrics registry."""
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, LabelSet], float] = {}
+        # stage -> [count, total seconds, max seconds]
+        self._stages: Dict[str, List[float]] = {}
+        self.started_at = time.time()
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        """
+        Increase a counter.
+
+        Args:
+            name: Counter name, e.g. 'retries' (exported as tea_retries_total)
+            value: Amount to add
+            **labels: Label values, e.g. cache='info'
+        """
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """
+        Record the duration of one run of a pipeline stage.
+
+        Args:
+            stage: Stage name, e.g. 'download'
+            seconds: Time spent
+        """
+        with self._lock:
+            stats = self._stages.setdefault(stage, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """
+        Time a block of code as a pipeline stage.
+
+        The duration is recorded even if the block raises.
+
+        Args:
+            stage: Stage name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def counter(self, name: str, **labels: Any) -> float:
+        """
+        Get the value of a counter.
+
+        Args:
+            name: Counter name
+            **labels: Label values
+
+        Returns:
+            Current value (0 if never increased)
+        """
+        with self._lock:
+            return self._counters.get((name, _labels(labels)), 0)
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            self._counters.clear()
+            self._stages.clear()
+            self.started_at = time.time()
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build a JSON-serializable run report.
+
+        Returns:
+            Dictionary with 'started_at', 'elapsed_seconds', 'stages' (count,
+            total, mean and max seconds per stage) and 'counters' (name ->
+            list of {'labels', 'value'})
+        """
+        with self._lock:
+            stages = {
+                stage: {
+                    'count': int(count),
+                    'total_seconds': round(total, 6),
+                    'mean_seconds': round(total / count, 6) if count else 0.0,
+                    'max_seconds': round(longest, 6),
+                }
+                for stage, (count, total, longest) in sorted(self._stages.items())
+            }
+            counters: Dict[str, List[Dict[str, Any]]] = {}
+            for (name, labels), value in sorted(self._counters.items()):
+                counters.setdefault(name, []).append({'labels': dict(labels), 'value': value})
+
+        return {
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat(),
+            'elapsed_seconds': round(time.time() - self.started_at, 6),
+            'stages': stages,
+            'counters': counters,
+        }
+
+    def write_report(self, path: str) -> None:
+        """
+        Write the run report to a JSON file.
+
+        Args:
+            path: Output file
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+    def to_prometheus(self, extra: Optional[Dict[str, Dict[LabelSet, float]]] = None) -> str:
+        """
+        Render the registry in the Prometheus text exposition format.
+
+        Counters are exported as ``tea_<name>_total`` and stage timers as the
+        summary ``tea_stage_seconds`` (count and sum) plus the gauge
+        ``tea_stage_seconds_max``.
+
+        Args:
+            extra: Additional gauges, name -> {labels: value}, e.g. job counts
+
+        Returns:
+            Exposition text
+        """
+        with self._lock:
+            counters = sorted(self._counters.items())
+            stages = sorted(self._stages.items())
+
+        lines: List[str] = []
+        declared = set()
+        for (name, labels), value in counters:
+            metric = f"{METRICS_NAMESPACE}_{name}_total"
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_format_labels(labels)} {_format_value(value)}")
+
+        if stages:
+            metric = f"{METRICS_NAMESPACE}_stage_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for stage, (count, total, _) in stages:
+                labels = _format_labels((('stage', stage),))
+                lines.append(f"{metric}_count{labels} {int(count)}")
+                lines.append(f"{metric}_sum{labels} {total:.6f}")
+            lines.append(f"# TYPE {metric}_max gauge")
+            for stage, (_, _, longest) in stages:
+                lines.append(f"{metric}_max{_format_labels((('stage', stage),))} {longest:.6f}")
+
+        for name, values in sorted((extra or {}).items()):
+            metric = f"{METRICS_NAMESPACE}_{name}"
+            lines.append(f"# TYPE {metric} gauge")
+            for labels, value in sorted(values.items()):
+                lines.append(f"{metric}{_format_labels(labels)} {_format_value(value)}")
+
+        return '\n'.join(lines) + '\n'
+
+
+_metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    """
+    Get the process-wide Metrics registry.
+
+    Returns:
+        Shared Metrics instance
+    """
+    return _metrics
@@ -0,0 +1,171 @@
+"""
+Reusable YoutubeDL instances for Tea YouTube Downloader.
+
+Building a YoutubeDL loads its extractors, cookie jar, HTTP handlers and
+postprocessors, which is a noticeable share of the time for short videos.
+A YoutubeDLPool keeps configured instances open between jobs: a worker
+checks one out for an option profile ('probe', 'search', 'download-audio',
+'download-video', ...), has it to itself while it runs, and returns it for
+the next job with the same options, keeping its connections and extractor
+caches warm.
+"""
+
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from tea.utils.lazy import LazyImport
+
+# yt-dlp is slow to import and only needed once a URL is processed
+YoutubeDL = LazyImport('yt_dlp', 'YoutubeDL')
+
+# Import from tea modules
+try:
+    from tea.metrics import Metrics, get_metrics
+    from tea.constants import YTDLP_POOL_MAX_IDLE
+except ImportError:
+    # Fallback for development
+    from tea.metrics import Metrics, get_metrics
+    from tea.constants import YTDLP_POOL_MAX_IDLE
+
+# (profile, factory, options fingerprint)
+PoolKey = Tuple[str, Any, str]
+
+
+def _options_key(options: Dict[str, Any]) -> str:
+    """Fingerprint YoutubeDL options (hooks compare by the object they are bound to)."""
+    return repr(sorted(options.items(), key=lambda item: item[0]))
+
+
+class YoutubeDLPool:
+    """Thread-safe pool of open YoutubeDL instances.
+
+    Instances are keyed by profile name, factory and the exact options, so a
+    checked-out instance always behaves like a freshly built one.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = YTDLP_POOL_MAX_IDLE,
+        metrics: Optional[Metrics] = None,
+        logger=None
+    ):
+        """
+        Initialize YoutubeDLPool.
+
+        Args:
+            max_idle: Idle instances kept open across all profiles
+            metrics: Metrics registry. If None, uses the process-wide one.
+            logger: Logger instance for logging
+        """
+        self._max_idle = max_idle
+        self._metrics = metrics or get_metrics()
+        self._logger = logger
+        self._lock = threading.Lock()
+        # Least recently returned first: (key, context manager, entered instance)
+        self._idle: List[Tuple[PoolKey, Any, Any]] = []
+
+    def __len__(self) -> int:
+        """Get the number of idle instances."""
+        with self._lock:
+            return len(self._idle)
+
+    @contextmanager
+    def acquire(
+        self,
+        profile: str,
+        options: Dict[str, Any],
+        factory: Callable[[Dict[str, Any]], Any] = YoutubeDL
+    ) -> Iterator[Any]:
+        """
+        Check out a YoutubeDL instance for the duration of the block.
+
+        An idle instance built with the same profile, factory and options is
+        reused; otherwise a new one is built. The instance goes back to the
+        pool when the block ends, unless the block raised: an instance that
+        failed mid-download is closed rather than trusted again.
+
+        Args:
+            profile: Option profile name, e.g. 'download-video'
+            options: YoutubeDL options
+            factory: YoutubeDL class to build instances with (callers pass
+                their module's binding, so it can be replaced in tests)
+
+        Yields:
+            Entered YoutubeDL instance, used by this thread only
+        """
+        key = (profile, factory, _options_key(options))
+        entry = self._take(key)
+        if entry is None:
+            self._metrics.inc('cache_misses', cache='ytdlp')
+            context = factory(options)
+            entry = (key, context, context.__enter__())
+        else:
+            self._metrics.inc('cache_hits', cache='ytdlp')
+
+        try:
+            yield entry[2]
+        except GeneratorExit:
+            # A consumer stopped early; the instance itself is fine
+            self._give_back(entry)
+            raise
+        except BaseException:
+            self._close(entry)
+            raise
+        else:
+            self._give_back(entry)
+
+    def close(self) -> None:
+        """Close every idle instance."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            self._close(entry)
+
+    def _take(self, key: PoolKey) -> Optional[Tuple[PoolKey, Any, Any]]:
+        """Remove and return the most recently returned idle instance for a key."""
+        with self._lock:
+            for index in range(len(self._idle) - 1, -1, -1):
+                if self._idle[index][0] == key:
+                    return self._idle.pop(index)
+        return None
+
+    def _give_back(self, entry: Tuple[PoolKey, Any, Any]) -> None:
+        """Return an instance to the pool, closing the oldest beyond max_idle."""
+        with self._lock:
+            self._idle.append(entry)
+            excess = max(len(self._idle) - max(self._max_idle, 0), 0)
+            evicted = self._idle[:excess]
+            del self._idle[:excess]
+        for old in evicted:
+            self._close(old)
+
+    def _close(self, entry: Tuple[PoolKey, Any, Any]) -> None:
+        """Close an instance, ignoring errors."""
+        try:
+            entry[1].__exit__(None, None, None)
+        except Exception as e:
+            if self._logger:
+                self._logger.debug(f"Error closing YoutubeDL ({entry[0][0]}): {e}")
+
+
+_pool: Optional[YoutubeDLPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_ydl_pool() -> YoutubeDLPool:
+    """
+    Get the process-wide YoutubeDL pool.
+
+    Its instances are closed when the interpreter exits.
+
+    Returns:
+        Shared YoutubeDLPool instance
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = YoutubeDLPool()
+            atexit.register(_pool.close)
+        return _pool
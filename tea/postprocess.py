@@ -0,0 +1,120 @@
+"""
+Post-processing stage for Tea YouTube Downloader.
+
+Downloads run as a two-stage pipeline. Network workers only fetch streams
+(merging separate video and audio streams, which copies them); the FFmpeg
+postprocessors of a FormatPlan (audio extraction, remuxing, thumbnail and
+metadata embedding) then run on a PostProcessPool with one worker per CPU.
+A bounded queue sits between the stages: while the pool keeps up, a
+network worker hands a file over and moves on to the next download; once
+POSTPROCESS_QUEUE_SIZE files are waiting, it waits for a free slot instead
+of filling the disk with raw downloads.
+"""
+
+import atexit
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+# Import from tea modules
+try:
+    from tea.metrics import Metrics, get_metrics
+    from tea.constants import POSTPROCESS_QUEUE_SIZE
+except ImportError:
+    # Fallback for development
+    from tea.metrics import Metrics, get_metrics
+    from tea.constants import POSTPROCESS_QUEUE_SIZE
+
+
+class PostProcessPool:
+    """CPU-sized worker pool with a bounded queue for post-processing jobs.
+
+    FFmpeg runs as a subprocess, so worker threads spend their time waiting
+    on it and one worker per CPU keeps every core busy.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        queue_size: int = POSTPROCESS_QUEUE_SIZE,
+        metrics: Optional[Metrics] = None,
+        logger=None
+    ):
+        """
+        Initialize PostProcessPool.
+
+        Args:
+            workers: Jobs run at the same time. If None, uses the CPU count.
+            queue_size: Jobs that may wait for a worker before ``submit`` blocks
+            metrics: Metrics registry. If None, uses the process-wide one.
+            logger: Logger instance for logging
+        """
+        self._workers = max(1, workers or os.cpu_count() or 1)
+        self._metrics = metrics or get_metrics()
+        self._logger = logger
+        # One slot per running or waiting job
+        self._slots = threading.BoundedSemaphore(self._workers + max(queue_size, 0))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix='tea-postprocess'
+        )
+
+    @property
+    def workers(self) -> int:
+        """Get the number of worker threads."""
+        return self._workers
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Queue a post-processing job, waiting while the queue is full.
+
+        Args:
+            fn: Job to run on a worker
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future of the job's result
+        """
+        if not self._slots.acquire(blocking=False):
+            self._metrics.inc('postprocess_queue_full')
+            with self._metrics.time('postprocess_wait'):
+                self._slots.acquire()
+
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the workers once queued jobs have run.
+
+        Args:
+            wait: Block until the running and queued jobs are done
+        """
+        self._executor.shutdown(wait=wait)
+
+
+_pool: Optional[PostProcessPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_postprocess_pool() -> PostProcessPool:
+    """
+    Get the process-wide post-processing pool.
+
+    Its workers finish their jobs when the interpreter exits.
+
+    Returns:
+        Shared PostProcessPool instance
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PostProcessPool()
+            atexit.register(_pool.shutdown)
+        return _pool
@@ -0,0 +1,349 @@
+"""
+Built-in profiling for Tea YouTube Downloader.
+
+``tea --profile[=MODE] ...`` runs any command under a profiler that covers
+every worker thread and writes a report when the command exits:
+
+- ``cpu``: deterministic profiling with cProfile, merged across threads
+  into one ``.pstats`` file (open with ``python -m pstats`` or snakeviz).
+- ``wall``: sampling profiler that records the stacks of all threads every
+  few milliseconds, including time spent waiting on the network or FFmpeg.
+  Written as a speedscope file (https://www.speedscope.app).
+- ``alloc``: tracemalloc snapshots at start and exit, dumped as a
+  ``.tracemalloc`` file (load with ``tracemalloc.Snapshot.load``).
+
+Each mode also prints a top-N summary and logs where the report was written.
+"""
+
+import io
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from tea.utils.lazy import LazyImport
+
+# The profilers are only loaded when profiling is requested
+cProfile = LazyImport('cProfile')
+pstats = LazyImport('pstats')
+tracemalloc = LazyImport('tracemalloc')
+
+# Import from tea modules
+try:
+    from tea.exceptions import ValidationError
+    from tea.constants import (
+        PROFILE_MODES,
+        PROFILE_DEFAULT_MODE,
+        PROFILE_FILE_EXTENSIONS,
+        PROFILE_SAMPLE_INTERVAL,
+        PROFILE_TOP_N,
+        PROFILE_TRACEMALLOC_FRAMES,
+    )
+except ImportError:
+    # Fallback for development
+    from tea.exceptions import ValidationError
+    from tea.constants import (
+        PROFILE_MODES,
+        PROFILE_DEFAULT_MODE,
+        PROFILE_FILE_EXTENSIONS,
+        PROFILE_SAMPLE_INTERVAL,
+        PROFILE_TOP_N,
+        PROFILE_TRACEMALLOC_FRAMES,
+    )
+
+# (file name, line number of the function, function name)
+FrameKey = Tuple[str, int, str]
+
+# Python 3.12+ profiles every thread with a single cProfile.Profile
+_CPROFILE_COVERS_ALL_THREADS = sys.version_info >= (3, 12)
+
+
+def extract_profile_option(args: List[str]) -> Tuple[Optional[str], List[str]]:
+    """
+    Remove ``--profile`` / ``--profile=MODE`` from command-line arguments.
+
+    Args:
+        args: Command-line arguments without the program name
+
+    Returns:
+        Tuple of (profiling mode or None, remaining arguments)
+
+    Raises:
+        ValidationError: If the mode is not one of PROFILE_MODES
+    """
+    mode = None
+    remaining = []
+    for arg in args:
+        if arg == '--profile':
+            mode = PROFILE_DEFAULT_MODE
+        elif arg.startswith('--profile='):
+            mode = arg.split('=', 1)[1].lower()
+            if mode not in PROFILE_MODES:
+                raise ValidationError(
+                    f"Unknown profile mode '{mode}' (expected one of {', '.join(PROFILE_MODES)})",
+                    field='profile',
+                    value=mode,
+                )
+        else:
+            remaining.append(arg)
+    return mode, remaining
+
+
+def _frame_key(code) -> FrameKey:
+    """Identify the function of a code object."""
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+def _format_frame(key: FrameKey) -> str:
+    """Format a function for summaries."""
+    filename, line, name = key
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+class Profiler:
+    """Profiles the whole process, across threads, until stopped.
+
+    Attributes:
+        mode: 'cpu', 'wall' or 'alloc'
+        output_path: Report file written by stop()
+        top_n: Entries in the printed summary
+    """
+
+    def __init__(
+        self,
+        mode: str = PROFILE_DEFAULT_MODE,
+        output_path: Optional[str] = None,
+        top_n: int = PROFILE_TOP_N,
+        logger=None
+    ):
+        """Initialize Profiler.
+
+        Args:
+            mode: 'cpu', 'wall' or 'alloc'
+            output_path: Report file. If None, a timestamped file in the
+                current directory.
+            top_n: Entries in the printed summary
+            logger: Logger the report location is written to
+
+        Raises:
+            ValidationError: If the mode is unknown
+        """
+        if mode not in PROFILE_MODES:
+            raise ValidationError(f"Unknown profile mode '{mode}'", field='profile', value=mode)
+
+        self.mode = mode
+        self.output_path = output_path or (
+            f"tea-profile-{mode}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            f"{PROFILE_FILE_EXTENSIONS[mode]}"
+        )
+        self.top_n = top_n
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._running = False
+        self._started_at = 0.0
+
+        # cpu
+        self._profiles: List = []
+        # wall: thread name -> stack (outermost first) -> samples
+        self._samples: Dict[str, Counter] = {}
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampling = threading.Event()
+        # alloc
+        self._first_snapshot = None
+
+    def __enter__(self) -> 'Profiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start profiling the current thread and every thread started later."""
+        if self._running:
+            return
+        self._running = True
+        self._started_at = time.perf_counter()
+
+        if self.mode == 'cpu':
+            if not _CPROFILE_COVERS_ALL_THREADS:
+                threading.setprofile(self._profile_new_thread)
+            self._enable_profile()
+        elif self.mode == 'wall':
+            self._stop_sampling.clear()
+            self._sampler = threading.Thread(target=self._sample_loop, name='tea-profiler', daemon=True)
+            self._sampler.start()
+        else:
+            tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+            self._first_snapshot = tracemalloc.take_snapshot()
+
+    def stop(self) -> Optional[str]:
+        """
+        Stop profiling, write the report and print the summary.
+
+        Returns:
+            Path of the report file, or None if profiling was not running
+        """
+        if not self._running:
+            return None
+        self._running = False
+
+        if self.mode == 'cpu':
+            threading.setprofile(None)
+            with self._lock:
+                profiles = list(self._profiles)
+            for profile in profiles:
+                profile.disable()
+            summary = self._write_cpu(profiles)
+        elif self.mode == 'wall':
+            self._stop_sampling.set()
+            if self._sampler is not None:
+                self._sampler.join()
+            summary = self._write_wall()
+        else:
+            summary = self._write_alloc()
+
+        print(summary)
+        if self._logger:
+            self._logger.info(f"Profile ({self.mode}) written to {os.path.abspath(self.output_path)}")
+        return self.output_path
+
+    # cpu mode
+
+    def _enable_profile(self) -> None:
+        """Profile the calling thread."""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is already active
+            return
+        with self._lock:
+            self._profiles.append(profile)
+
+    def _profile_new_thread(self, frame, event, arg) -> None:
+        """threading.setprofile hook: switch a new thread over to cProfile."""
+        sys.setprofile(None)
+        self._enable_profile()
+
+    def _write_cpu(self, profiles: List) -> str:
+        """Merge per-thread profiles into one pstats file."""
+        stats = pstats.Stats(profiles[0], stream=io.StringIO())
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(self.output_path)
+
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats('cumulative').print_stats(self.top_n)
+        return (f"\n[OK] CPU profile of {len(profiles)} thread(s), top {self.top_n} by cumulative time:"
+                f"{stream.getvalue()}")
+
+    # wall mode
+
+    def _sample_loop(self) -> None:
+        """Record the stack of every thread until stopped."""
+        own_id = threading.get_ident()
+        while not self._stop_sampling.wait(PROFILE_SAMPLE_INTERVAL):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_key(frame.f_code))
+                    frame = frame.f_back
+                stack.reverse()
+                name = names.get(thread_id, str(thread_id))
+                self._samples.setdefault(name, Counter())[tuple(stack)] += 1
+
+    def _write_wall(self) -> str:
+        """Write the samples as a speedscope file."""
+        frames: List[FrameKey] = []
+        index: Dict[FrameKey, int] = {}
+        profiles = []
+        total_self: Counter = Counter()
+        total_inclusive: Counter = Counter()
+        sample_count = 0
+
+        for name, stacks in sorted(self._samples.items()):
+            samples, weights = [], []
+            for stack, count in stacks.items():
+                for key in stack:
+                    if key not in index:
+                        index[key] = len(frames)
+                        frames.append(key)
+                samples.append([index[key] for key in stack])
+                weights.append(round(count * PROFILE_SAMPLE_INTERVAL, 6))
+
+                sample_count += count
+                if stack:
+                    total_self[stack[-1]] += count
+                for key in set(stack):
+                    total_inclusive[key] += count
+            profiles.append({
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': round(sum(weights), 6),
+                'samples': samples,
+                'weights': weights,
+            })
+
+        document = {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': 'tea ' + ' '.join(sys.argv[1:]),
+            'exporter': 'tea',
+            'activeProfileIndex': 0,
+            'shared': {'frames': [
+                {'name': name, 'file': filename, 'line': line} for filename, line, name in frames
+            ]},
+            'profiles': profiles,
+        }
+        with open(self.output_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+
+        elapsed = time.perf_counter() - self._started_at
+        lines = [f"\n[OK] Wall-clock profile: {sample_count} samples of {len(profiles)} thread(s) "
+                 f"over {elapsed:.1f}s, top {self.top_n} functions by self time:",
+                 f"  {'self':>7} {'total':>7}  function"]
+        ranked = sorted(total_inclusive, key=lambda key: (total_self[key], total_inclusive[key]), reverse=True)
+        for key in ranked[:self.top_n]:
+            lines.append(f"  {100 * total_self[key] / sample_count:6.1f}% "
+                         f"{100 * total_inclusive[key] / sample_count:6.1f}%  {_format_frame(key)}")
+        return '\n'.join(lines)
+
+    # alloc mode
+
+    def _write_alloc(self) -> str:
+        """Dump the final tracemalloc snapshot and summarize it."""
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        ignore = [
+            tracemalloc.Filter(False, '*tracemalloc.py'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ]
+        snapshot = snapshot.filter_traces(ignore)
+        snapshot.dump(self.output_path)
+
+        lines = [f"\n[OK] Allocations: {current / 1024:.1f} KiB live at exit, "
+                 f"peak {peak / 1024:.1f} KiB",
+                 f"  Top {self.top_n} by live size:"]
+        for stat in snapshot.statistics('lineno')[:self.top_n]:
+            lines.append(f"  {stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  {stat.traceback[0]}")
+
+        if self._first_snapshot is not None:
+            lines.append(f"  Top {self.top_n} growth since start:")
+            growth = snapshot.compare_to(self._first_snapshot.filter_traces(ignore), 'lineno')
+            for stat in growth[:self.top_n]:
+                lines.append(f"  {stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocks  "
+                             f"{stat.traceback[0]}")
+        return '\n'.join(lines)
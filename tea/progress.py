@@ -1,28 +1,55 @@
 """
 Progress reporting for Tea YouTube Downloader.
 
-This module handles progress reporting for downloads.
+This module turns yt-dlp progress hooks into ``progress`` and
+``postprocessing`` events; the console renderer draws the progress bar.
 """
 
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+# Import from tea modules
+try:
+    from tea.metrics import Metrics, get_metrics
+    from tea.events import EventBus, get_events
+    from tea.constants import EVENT_PROGRESS_INTERVAL
+except ImportError:
+    # Fallback for development
+    from tea.metrics import Metrics, get_metrics
+    from tea.events import EventBus, get_events
+    from tea.constants import EVENT_PROGRESS_INTERVAL
 
 
 class ProgressReporter:
     """Reports download progress."""
 
-    def __init__(self, logger=None):
+    def __init__(
+        self,
+        logger=None,
+        metrics: Optional[Metrics] = None,
+        events: Optional[EventBus] = None
+    ):
         """
         Initialize ProgressReporter.
 
         Args:
             logger: Logger instance for logging
+            metrics: Metrics registry. If None, uses the process-wide one.
+            events: Event bus. If None, uses the process-wide one.
         """
         self._logger = logger
+        self._metrics = metrics or get_metrics()
+        self._events = events or get_events()
         self._last_percent = -1
+        # filename -> time of the last progress event for it
+        self._last_emitted: Dict[str, float] = {}
+        # (thread, postprocessor) -> start time of the running postprocessor
+        self._postprocessor_started: Dict[Tuple[int, str], float] = {}
 
     def progress_hook(self, d: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Progress hook for yt-dlp with beautiful formatting.
+        Progress hook for yt-dlp.
 
         Args:
             d: Progress dictionary from yt-dlp
@@ -41,56 +68,57 @@ class ProgressReporter:
 
         return None
 
+    def postprocessor_hook(self, d: Dict[str, Any]) -> None:
+        """
+        Postprocessor hook for yt-dlp that times merging and postprocessing.
+
+        Args:
+            d: Postprocessor status dictionary from yt-dlp
+        """
+        postprocessor = d.get('postprocessor') or 'unknown'
+        key = (threading.get_ident(), postprocessor)
+        if d.get('status') == 'started':
+            self._postprocessor_started[key] = time.perf_counter()
+        elif d.get('status') == 'finished':
+            started = self._postprocessor_started.pop(key, None)
+            if started is not None:
+                stage = 'merge' if postprocessor == 'Merger' else 'postprocess'
+                self._metrics.observe(stage, time.perf_counter() - started)
+
     def _report_downloading(self, d: Dict[str, Any]) -> Dict[str, Any]:
         """
         Report downloading progress.
 
+        Events for the same file are sent at most every
+        EVENT_PROGRESS_INTERVAL seconds, so hooks called per chunk stay cheap.
+
         Args:
             d: Progress dictionary from yt-dlp
 
         Returns:
             Structured progress data
         """
-        try:
-            percent = d.get('_percent_str', 'N/A').strip()
-            downloaded = d.get('_downloaded_bytes_str', '?')
-            total = d.get('_total_bytes_str', '?')
-            speed = d.get('_speed_str', 'N/A').strip()
-            eta = d.get('_eta_str', 'N/A').strip()
-
-            # Build progress bar
-            bar_length = 30
-            if '_percent_str' in d:
-                try:
-                    percent_num = float(d['_percent_str'].strip('%'))
-                    filled = int(bar_length * percent_num / 100)
-                    bar = '#' * filled + '-' * (bar_length - filled)
-                except (ValueError, TypeError):
-                    bar = '-' * bar_length
-            else:
-                bar = '-' * bar_length
-
-            # Print progress bar inline
-            print(f"\r  [{bar}] {percent} | {downloaded}/{total} | {speed} | ETA: {eta}", end='', flush=True)
-
-            return {
-                'status': 'downloading',
-                'percent': percent,
-                'downloaded': downloaded,
-                'total': total,
-                'speed': speed,
-                'eta': eta,
-                'bar': bar
-            }
-
-        except Exception:
-            pass
-
-        return {'status': 'downloading'}
+        progress = {
+            'status': 'downloading',
+            'filename': d.get('filename'),
+            'downloaded_bytes': d.get('downloaded_bytes'),
+            'total_bytes': d.get('total_bytes') or d.get('total_bytes_estimate'),
+            'speed': d.get('speed'),
+            'eta': d.get('eta'),
+        }
+
+        now = time.monotonic()
+        key = progress['filename'] or ''
+        done = progress['total_bytes'] and progress['downloaded_bytes'] == progress['total_bytes']
+        if done or now - self._last_emitted.get(key, 0.0) >= EVENT_PROGRESS_INTERVAL:
+            self._last_emitted[key] = now
+            self._events.emit('progress', **progress)
+
+        return progress
 
     def _report_postprocessing(self, d: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Show spinner during postprocessing.
+        Report postprocessing.
 
         Args:
             d: Progress dictionary from yt-dlp
@@ -99,11 +127,7 @@ class ProgressReporter:
             Structured progress data
         """
         postprocessor = d.get('postprocessor', 'Processing')
-
-        if not hasattr(self, '_spinner'):
-            from tea.utils.spinner import Spinner
-            self._spinner = Spinner(f"[{postprocessor}]")
-            self._spinner.start()
+        self._events.emit('postprocessing', postprocessor=postprocessor)
 
         return {'status': 'postprocessing', 'postprocessor': postprocessor}
 
@@ -117,19 +141,18 @@ class ProgressReporter:
         Returns:
             Structured progress data
         """
-        # Print newline to finish the progress bar
-        print()
+        downloaded = d.get('total_bytes') or d.get('downloaded_bytes')
+        if downloaded:
+            self._metrics.inc('downloaded_bytes', downloaded)
 
-        # Stop postprocessing spinner if running
-        if hasattr(self, '_spinner') and self._spinner:
-            self._spinner.stop("[OK] Post-processing complete")
-            self._spinner = None
-
-        return {
+        self._last_emitted.pop(d.get('filename') or '', None)
+        progress = {
             'status': 'finished',
             'filename': d.get('filename'),
             'total_bytes': d.get('total_bytes')
         }
+        self._events.emit('progress', **progress)
+        return progress
 
     def _report_error(self, d: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -143,11 +166,6 @@ class ProgressReporter:
         """
         error = d.get('error', 'Unknown error')
 
-        # Stop postprocessing spinner if running
-        if hasattr(self, '_spinner') and self._spinner:
-            self._spinner.stop()
-            self._spinner = None
-
         if self._logger:
             self._logger.error(f"Download error: {error}")
 
@@ -159,10 +177,7 @@ class ProgressReporter:
     def reset(self) -> None:
         """Reset progress tracking state."""
         self._last_percent = -1
-        # Clean up spinner if exists
-        if hasattr(self, '_spinner') and self._spinner:
-            self._spinner.stop()
-            self._spinner = None
+        self._last_emitted.clear()
 
 
 # Convenience function for backward compatibility
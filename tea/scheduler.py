@@ -0,0 +1,272 @@
+"""
+Download scheduling for Tea YouTube Downloader.
+
+The scheduler decides which queued download a free worker takes next:
+
+- Priority classes: every high-priority task starts before any normal
+  one, and every normal task before any low one.
+- Fairness: within a class, sources (a playlist, a channel, a batch file,
+  one submission) take turns, so one 2,000-video channel does not hold
+  back a single video queued after it.
+- Per-channel limit: at most ``max_in_flight_per_channel`` tasks with the
+  same channel key run at once. Other sources can use the remaining
+  workers.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+# Import from tea modules
+try:
+    from tea.constants import (
+        PRIORITY_HIGH,
+        PRIORITY_NORMAL,
+        PRIORITY_LOW,
+        PRIORITY_NAMES,
+        MAX_IN_FLIGHT_PER_CHANNEL,
+        CONTENT_TYPE_VIDEO,
+    )
+except ImportError:
+    # Fallback for development
+    from tea.constants import (
+        PRIORITY_HIGH,
+        PRIORITY_NORMAL,
+        PRIORITY_LOW,
+        PRIORITY_NAMES,
+        MAX_IN_FLIGHT_PER_CHANNEL,
+        CONTENT_TYPE_VIDEO,
+    )
+
+PRIORITIES = (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+
+
+def parse_priority(value: Any) -> int:
+    """
+    Convert a priority name or number to a priority class.
+
+    Args:
+        value: 'high', 'normal', 'low' or one of the PRIORITY_* numbers
+
+    Returns:
+        Priority class
+
+    Raises:
+        ValueError: If the value is not a known priority
+    """
+    if isinstance(value, str) and value.lower() in PRIORITY_NAMES:
+        return PRIORITY_NAMES[value.lower()]
+    if isinstance(value, int) and not isinstance(value, bool) and value in PRIORITIES:
+        return value
+    raise ValueError(f"Unknown priority: {value!r} (expected one of {', '.join(PRIORITY_NAMES)})")
+
+
+def default_priority(content_type: str) -> int:
+    """
+    Get the default priority for a kind of content.
+
+    Single videos are quick and run at normal priority; whole playlists and
+    channels run in the background.
+
+    Args:
+        content_type: 'video', 'playlist' or 'channel'
+
+    Returns:
+        Priority class
+    """
+    return PRIORITY_NORMAL if content_type == CONTENT_TYPE_VIDEO else PRIORITY_LOW
+
+
+class Task:
+    """A unit of work waiting in the scheduler.
+
+    Attributes:
+        item: The scheduled object (a URL, a Job, ...)
+        priority: Priority class
+        source: Fairness group the task belongs to
+        channel: Key used for the per-channel in-flight limit (None for no limit)
+    """
+
+    __slots__ = ('item', 'priority', 'source', 'channel', 'seq')
+
+    def __init__(self, item: Any, priority: int, source: str, channel: Optional[str], seq: int):
+        """Initialize Task."""
+        self.item = item
+        self.priority = priority
+        self.source = source
+        self.channel = channel
+        self.seq = seq
+
+    def __repr__(self) -> str:
+        """Return string representation of the task."""
+        return f"Task({self.item!r}, priority={self.priority}, source={self.source!r})"
+
+
+class DownloadScheduler:
+    """Thread-safe priority queue with per-source round-robin and channel limits.
+
+    Workers call ``next()`` to take a task and ``done()`` when it finishes.
+
+    Attributes:
+        max_in_flight_per_channel: Concurrent tasks allowed per channel key
+    """
+
+    def __init__(self, max_in_flight_per_channel: int = MAX_IN_FLIGHT_PER_CHANNEL):
+        """Initialize DownloadScheduler.
+
+        Args:
+            max_in_flight_per_channel: Concurrent tasks allowed per channel key
+        """
+        if max_in_flight_per_channel < 1:
+            raise ValueError("max_in_flight_per_channel must be at least 1")
+
+        self.max_in_flight_per_channel = max_in_flight_per_channel
+        # priority -> source -> tasks; the OrderedDict order is the round-robin order
+        self._queues: Dict[int, "OrderedDict[str, Deque[Task]]"] = {
+            priority: OrderedDict() for priority in PRIORITIES
+        }
+        self._in_flight: Dict[str, int] = {}
+        self._size = 0
+        self._closed = False
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        """Number of tasks waiting to start."""
+        with self._cond:
+            return self._size
+
+    def add(
+        self,
+        item: Any,
+        priority: int = PRIORITY_NORMAL,
+        source: Optional[str] = None,
+        channel: Optional[str] = None
+    ) -> Task:
+        """
+        Queue an item.
+
+        Args:
+            item: Object to schedule
+            priority: Priority class (PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW)
+            source: Fairness group; tasks without one share a default group
+            channel: Key for the per-channel in-flight limit
+
+        Returns:
+            The queued Task
+        """
+        priority = parse_priority(priority)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Scheduler is closed")
+            task = Task(item, priority, source or '', channel, next(self._seq))
+            self._queues[priority].setdefault(task.source, deque()).append(task)
+            self._size += 1
+            self._cond.notify()
+            return task
+
+    def _pop_eligible(self) -> Optional[Task]:
+        """Take the next runnable task (lock held)."""
+        for priority in PRIORITIES:
+            sources = self._queues[priority]
+            for source in list(sources):
+                tasks = sources[source]
+                task = tasks[0]
+                if task.channel is not None and (
+                    self._in_flight.get(task.channel, 0) >= self.max_in_flight_per_channel
+                ):
+                    continue
+
+                tasks.popleft()
+                # Give the other sources a turn before this one runs again
+                if tasks:
+                    sources.move_to_end(source)
+                else:
+                    del sources[source]
+
+                if task.channel is not None:
+                    self._in_flight[task.channel] = self._in_flight.get(task.channel, 0) + 1
+                self._size -= 1
+                return task
+        return None
+
+    def next(self, block: bool = True, timeout: Optional[float] = None) -> Optional[Task]:
+        """
+        Take the next task to run.
+
+        Args:
+            block: Wait until a task can run
+            timeout: Maximum seconds to wait when blocking (None waits as needed)
+
+        Returns:
+            A Task, or None if none can run (or the scheduler was closed)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                task = self._pop_eligible()
+                if task is not None or not block:
+                    return task
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+    def done(self, task: Task) -> None:
+        """
+        Mark a task taken with next() as finished.
+
+        Args:
+            task: The finished task
+        """
+        with self._cond:
+            if task.channel is not None:
+                remaining = self._in_flight.get(task.channel, 0) - 1
+                if remaining > 0:
+                    self._in_flight[task.channel] = remaining
+                else:
+                    self._in_flight.pop(task.channel, None)
+            # A channel slot may have opened up for a waiting worker
+            self._cond.notify_all()
+
+    def remove(self, predicate: Callable[[Any], bool]) -> List[Any]:
+        """
+        Drop waiting tasks whose item matches a predicate.
+
+        Args:
+            predicate: Called with each waiting item
+
+        Returns:
+            Items that were removed
+        """
+        removed = []
+        with self._cond:
+            for sources in self._queues.values():
+                for source in list(sources):
+                    kept = deque()
+                    for task in sources[source]:
+                        if predicate(task.item):
+                            removed.append(task.item)
+                        else:
+                            kept.append(task)
+                    if kept:
+                        sources[source] = kept
+                    else:
+                        del sources[source]
+            self._size -= len(removed)
+        return removed
+
+    def close(self) -> None:
+        """Stop handing out tasks and wake every waiting worker."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
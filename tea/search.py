@@ -5,21 +5,28 @@ This module provides AI-enhanced YouTube search functionality to help users
 find the correct videos when they only know song names or partial information.
 """
 
-import json
+import math
 import os
 import re
-import time
-from typing import List, Dict, Optional
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from typing import Dict, Iterable, Iterator, List, Optional
 
-from yt_dlp import YoutubeDL
+from tea.utils.lazy import LazyImport, is_available
+
+# yt-dlp is slow to import and only needed once a URL is processed
+YoutubeDL = LazyImport('yt_dlp', 'YoutubeDL')
 
 # Import from tea modules
 try:
     from tea.logger import setup_logger
     from tea.config import ConfigManager
+    from tea.metrics import Metrics, get_metrics
+    from tea.pool import YoutubeDLPool, get_ydl_pool
+    from tea.constants import SEARCH_PREVIEW_RESULTS, SEARCH_AUTO_PICK_RATIO
+    from tea.constants import (
+        OPENROUTER_API_URL as API_URL,
+        OPENROUTER_MODEL as MODEL,
+        AI_MIN_REQUEST_INTERVAL as MIN_REQUEST_INTERVAL,
+    )
     from tea.utils.security import (
         validate_file_path,
         sanitize_path,
@@ -29,23 +36,24 @@ except ImportError:
     # Fallback for development
     from tea.logger import setup_logger
     from tea.config import ConfigManager
+    from tea.metrics import Metrics, get_metrics
+    from tea.pool import YoutubeDLPool, get_ydl_pool
+    from tea.constants import SEARCH_PREVIEW_RESULTS, SEARCH_AUTO_PICK_RATIO
+    from tea.constants import (
+        OPENROUTER_API_URL as API_URL,
+        OPENROUTER_MODEL as MODEL,
+        AI_MIN_REQUEST_INTERVAL as MIN_REQUEST_INTERVAL,
+    )
     from tea.utils.security import (
         validate_file_path,
         sanitize_path,
         validate_url
     )
 
-# Try to import fuzzywuzzy for result ranking
-try:
-    from fuzzywuzzy import fuzz
-    FUZZY_AVAILABLE = True
-except ImportError:
-    FUZZY_AVAILABLE = False
-
-# Constants
-API_URL = "https://openrouter.ai/api/v1/chat/completions"
-MODEL = "qwen/qwen-2.5-coder-32b-instruct:free"
-MIN_REQUEST_INTERVAL = 3.0  # seconds between requests
+# fuzzywuzzy is used for result ranking when installed; it is imported on
+# first use to keep startup fast
+FUZZY_AVAILABLE = is_available('fuzzywuzzy')
+fuzz = LazyImport('fuzzywuzzy.fuzz')
 
 # Dangerous patterns for AI output validation
 DANGEROUS_PATTERNS = [
@@ -58,6 +66,74 @@ DANGEROUS_PATTERNS = [
     r'\x1b',  # Escape sequences
 ]
 
+# Keywords that earn a small bonus when they appear in a title
+MUSIC_KEYWORDS = ('official', 'audio', 'video', 'lyrics', 'hd', 'remastered')
+MUSIC_KEYWORD_BONUS = 5
+MAX_VIEW_BONUS = 20
+
+# Sentinel returned by the selection prompt when more results are requested
+_MORE_RESULTS = object()
+
+
+def score_results(query: str, results: List[Dict], fuzzy_threshold: int = 70) -> List[int]:
+    """
+    Compute relevance scores for a batch of search results.
+
+    All features (title match, uploader match, keyword and view-count
+    bonuses) are computed in one pass. Query-dependent work is done once,
+    and fuzzy ratios are computed once per distinct title or uploader since
+    search results often share a channel or a title.
+
+    Args:
+        query: Original search query
+        results: List of search results with 'title', 'uploader' and 'view_count'
+        fuzzy_threshold: Minimum fuzzy ratio (0-100) for a match to count
+
+    Returns:
+        List of integer scores, one per result, in input order
+    """
+    query_lower = query.lower()
+    titles = [result['title'].lower() for result in results]
+
+    if FUZZY_AVAILABLE:
+        title_ratios = _batch_partial_ratio(query_lower, titles)
+        uploader_ratios = _batch_partial_ratio(
+            query_lower, [result['uploader'].lower() for result in results]
+        )
+        scores = [
+            (title_ratio if title_ratio >= fuzzy_threshold else 0)
+            + (uploader_ratio // 2 if uploader_ratio >= fuzzy_threshold else 0)
+            for title_ratio, uploader_ratio in zip(title_ratios, uploader_ratios)
+        ]
+    else:
+        # Simple string matching fallback: exact phrase and word matches
+        query_words = set(query_lower.split())
+        scores = [
+            (80 if query_lower in title else 0)
+            + len(query_words & set(title.split())) * 20
+            for title in titles
+        ]
+
+    for i, (title, result) in enumerate(zip(titles, results)):
+        # Bonus for common music keywords in title
+        scores[i] += MUSIC_KEYWORD_BONUS * sum(1 for keyword in MUSIC_KEYWORDS if keyword in title)
+
+        # Logarithmic bonus for view count (diminishing returns)
+        view_count = result['view_count']
+        if view_count > 0:
+            scores[i] += min(MAX_VIEW_BONUS, int(math.log10(view_count + 1) * 2))
+
+    return scores
+
+
+def _batch_partial_ratio(query: str, choices: List[str]) -> List[int]:
+    """Compute fuzz.partial_ratio(query, choice) once per distinct choice."""
+    ratios: Dict[str, int] = {}
+    for choice in choices:
+        if choice not in ratios:
+            ratios[choice] = fuzz.partial_ratio(query, choice)
+    return [ratios[choice] for choice in choices]
+
 
 class YouTubeSearchService:
     """
@@ -70,7 +146,9 @@ class YouTubeSearchService:
     def __init__(
         self,
         config_manager: Optional[ConfigManager] = None,
-        logger=None
+        logger=None,
+        metrics: Optional[Metrics] = None,
+        ydl_pool: Optional[YoutubeDLPool] = None
     ):
         """
         Initialize YouTubeSearchService.
@@ -78,10 +156,13 @@ class YouTubeSearchService:
         Args:
             config_manager: Configuration manager instance
             logger: Logger instance
+            metrics: Metrics registry. If None, uses the process-wide one.
+            ydl_pool: YoutubeDL pool. If None, uses the process-wide one.
         """
         self._config = config_manager or ConfigManager(logger=logger)
         self._logger = logger or setup_logger()
-        self._last_request_time: float = 0
+        self._metrics = metrics or get_metrics()
+        self._ydl_pool = ydl_pool or get_ydl_pool()
         self._api_key = self._config.openrouter_api_key
 
     # Search methods
@@ -106,25 +187,67 @@ class YouTubeSearchService:
         if not query or not query.strip():
             return []
 
-        # Enhance query with AI if enabled and API key is available
-        enhanced_query = query
-        if use_ai and self._config.get('search_use_ai', True) and self._api_key:
-            enhanced_query = self._enhance_query_with_ai(query)
-            if enhanced_query and enhanced_query != query:
-                self._logger.info(f"AI enhanced query: '{query}' -> '{enhanced_query}'")
-
-        # Use enhanced query or fall back to original
-        search_query = enhanced_query if enhanced_query else query
+        self._metrics.inc('searches')
+        with self._metrics.time('ai_query'):
+            search_query = self._prepare_query(query, use_ai)
 
         # Perform YouTube search using yt-dlp
-        results = self._youtube_search(search_query, max_results)
+        with self._metrics.time('search'):
+            results = self._youtube_search(search_query, max_results)
 
         # Rank and filter results
         if results:
-            results = self._rank_results(query, results)
+            with self._metrics.time('rank'):
+                results = self._rank_results(query, results)
 
         return results
 
+    def iter_search_results(
+        self,
+        query: str,
+        max_results: int = 5,
+        use_ai: bool = True
+    ) -> Iterator[Dict]:
+        """
+        Search YouTube and yield results as yt-dlp produces them.
+
+        Unlike ``search_songs`` the results are not ranked, so the first
+        candidates are available before the remaining ones are fetched.
+
+        Args:
+            query: Search query (song name, artist, etc.)
+            max_results: Maximum number of results to yield
+            use_ai: Whether to use AI for query enhancement
+
+        Yields:
+            Search results with url, title, duration, views, etc.
+        """
+        if not query or not query.strip():
+            return
+
+        self._metrics.inc('searches')
+        yield from self._iter_youtube_search(self._prepare_query(query, use_ai), max_results)
+
+    def _prepare_query(self, query: str, use_ai: bool) -> str:
+        """
+        Enhance a query with AI if enabled and an API key is available.
+
+        Args:
+            query: Original search query
+            use_ai: Whether to use AI for query enhancement
+
+        Returns:
+            Enhanced query, or the original query if enhancement is unavailable
+        """
+        enhanced_query = query
+        if use_ai and self._config.get('search_use_ai', True) and self._api_key:
+            enhanced_query = self._enhance_query_with_ai(query)
+            if enhanced_query and enhanced_query != query:
+                self._logger.info(f"AI enhanced query: '{query}' -> '{enhanced_query}'")
+
+        # Use enhanced query or fall back to original
+        return enhanced_query if enhanced_query else query
+
     def _enhance_query_with_ai(self, query: str) -> Optional[str]:
         """
         Enhance search query using AI for better YouTube search results.
@@ -138,19 +261,6 @@ class YouTubeSearchService:
         if not self._api_key:
             return None
 
-        # Wait for minimum interval between requests
-        time_since_last = time.time() - self._last_request_time
-        if time_since_last < MIN_REQUEST_INTERVAL:
-            time.sleep(MIN_REQUEST_INTERVAL - time_since_last)
-
-        # Prepare request
-        headers = {
-            'Authorization': f'Bearer {self._api_key}',
-            'Content-Type': 'application/json',
-            'HTTP-Referer': 'https://github.com/yourusername/tea',
-            'X-Title': 'Tea YouTube Downloader',
-        }
-
         prompt = f"""Extract the artist and song title from this user input and create an optimized YouTube search query.
 
 Rules:
@@ -165,55 +275,38 @@ User input: {query}
 
 Optimized YouTube search query:"""
 
-        data = {
-            'model': MODEL,
-            'messages': [
-                {
-                    'role': 'system',
-                    'content': 'You are a helpful assistant that creates optimized YouTube search queries. Output only the search query, no explanations.'
-                },
-                {
-                    'role': 'user',
-                    'content': prompt
-                }
-            ],
-            'max_tokens': 100,
-            'temperature': 0.3,
-        }
+        messages = [
+            {
+                'role': 'system',
+                'content': 'You are a helpful assistant that creates optimized YouTube search queries. Output only the search query, no explanations.'
+            },
+            {
+                'role': 'user',
+                'content': prompt
+            }
+        ]
+
+        # The AI client is only imported once a query needs enhancing
+        from tea.ai.client import AIClientError, get_client
 
         try:
-            # Make request with timeout
-            req = Request(
-                API_URL,
-                data=json.dumps(data).encode('utf-8'),
-                headers=headers,
-                method='POST'
+            # Waits for the rate limiter shared with the filename cleaner
+            enhanced = get_client(self._api_key).complete(
+                messages, max_tokens=100, temperature=0.3
             )
-
-            with urlopen(req, timeout=10) as response:
-                response_data = json.loads(response.read().decode('utf-8'))
-
-                # Extract the enhanced query
-                if 'choices' in response_data and len(response_data['choices']) > 0:
-                    enhanced = response_data['choices'][0]['message']['content'].strip()
-
-                    # Validate the response
-                    if self._validate_ai_output(enhanced):
-                        self._last_request_time = time.time()
-                        return enhanced
-
-            return None
-
-        except (URLError, HTTPError) as e:
+        except AIClientError as e:
             self._logger.warning(f"AI API error: {e}")
             return None
-        except (json.JSONDecodeError, KeyError, IndexError) as e:
-            self._logger.warning(f"AI response parsing error: {e}")
-            return None
         except Exception as e:
             self._logger.warning(f"AI enhancement failed: {e}")
             return None
 
+        # Validate the response
+        if enhanced and self._validate_ai_output(enhanced):
+            return enhanced
+
+        return None
+
     def _validate_ai_output(self, output: str) -> bool:
         """
         Validate AI output for security issues.
@@ -253,6 +346,23 @@ Optimized YouTube search query:"""
         Returns:
             List of search results
         """
+        return list(self._iter_youtube_search(query, max_results))
+
+    def _iter_youtube_search(self, query: str, max_results: int) -> Iterator[Dict]:
+        """
+        Perform YouTube search using yt-dlp, yielding entries as they arrive.
+
+        The search playlist is extracted without processing so its entries
+        stay a lazy generator; each result page is only requested once the
+        entries before it have been consumed.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results
+
+        Yields:
+            Search results that pass URL and duration filters
+        """
         search_url = f"ytsearch{max_results}:{query}"
 
         ydl_opts = {
@@ -262,47 +372,51 @@ Optimized YouTube search query:"""
             'skip_download': True,
         }
 
+        min_duration = self._config.get('search_min_duration', 30)
+        max_duration = self._config.get('search_max_duration', 600)
+
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                search_results = ydl.extract_info(search_url, download=False)
+            with self._ydl_pool.acquire('search', ydl_opts, YoutubeDL) as ydl:
+                search_results = ydl.extract_info(search_url, download=False, process=False)
 
                 if not search_results:
-                    return []
-
-                results = []
-                entries = search_results.get('entries', [])
+                    return
 
-                for entry in entries:
+                for entry in search_results.get('entries') or []:
                     if not entry:
                         continue
 
-                    # Extract relevant information
-                    result = {
-                        'url': entry.get('url', entry.get('webpage_url', '')),
-                        'title': entry.get('title', 'Unknown'),
-                        'duration': entry.get('duration', 0),
-                        'view_count': entry.get('view_count', 0),
-                        'uploader': entry.get('uploader', entry.get('channel', 'Unknown')),
-                        'id': entry.get('id', ''),
-                    }
+                    result = self._entry_to_result(entry)
 
                     # Validate URL
-                    if result['url'] and validate_url(result['url']):
-                        # Filter by duration if configured
-                        min_duration = self._config.get('search_min_duration', 30)
-                        max_duration = self._config.get('search_max_duration', 600)
-
-                        if result['duration'] == 0:
-                            # Duration not available, include it anyway
-                            results.append(result)
-                        elif min_duration <= result['duration'] <= max_duration:
-                            results.append(result)
+                    if not result['url'] or not validate_url(result['url']):
+                        continue
 
-                return results
+                    # Filter by duration; include results without a duration
+                    if result['duration'] == 0 or min_duration <= result['duration'] <= max_duration:
+                        yield result
 
         except Exception as e:
             self._logger.error(f"YouTube search error: {e}")
-            return []
+
+    def _entry_to_result(self, entry: Dict) -> Dict:
+        """
+        Extract the relevant information from a yt-dlp search entry.
+
+        Args:
+            entry: Flat search entry from yt-dlp
+
+        Returns:
+            Search result dict
+        """
+        return {
+            'url': entry.get('url') or entry.get('webpage_url') or '',
+            'title': entry.get('title') or 'Unknown',
+            'duration': entry.get('duration') or 0,
+            'view_count': entry.get('view_count') or 0,
+            'uploader': entry.get('uploader') or entry.get('channel') or 'Unknown',
+            'id': entry.get('id') or '',
+        }
 
     def _rank_results(self, query: str, results: List[Dict]) -> List[Dict]:
         """
@@ -318,65 +432,12 @@ Optimized YouTube search query:"""
         if not results:
             return results
 
-        # Calculate relevance scores
-        for result in results:
-            score = 0
-
-            # Fuzzy matching on title
-            if FUZZY_AVAILABLE:
-                fuzzy_threshold = self._config.get('search_fuzzy_threshold', 70)
-                title_score = fuzz.partial_ratio(
-                    query.lower(),
-                    result['title'].lower()
-                )
-                if title_score >= fuzzy_threshold:
-                    score += title_score
-
-                # Bonus for uploader/channel matching
-                uploader_score = fuzz.partial_ratio(
-                    query.lower(),
-                    result['uploader'].lower()
-                )
-                if uploader_score >= fuzzy_threshold:
-                    score += uploader_score // 2
-            else:
-                # Simple string matching fallback
-                query_lower = query.lower()
-                title_lower = result['title'].lower()
-
-                # Exact phrase match
-                if query_lower in title_lower:
-                    score += 80
-
-                # Word-by-word matching
-                query_words = set(query_lower.split())
-                title_words = set(title_lower.split())
-                matching_words = query_words & title_words
-                if matching_words:
-                    score += len(matching_words) * 20
-
-            # Bonus for common music keywords in title
-            music_keywords = ['official', 'audio', 'video', 'lyrics', 'hd', 'remastered']
-            title_lower = result['title'].lower()
-            for keyword in music_keywords:
-                if keyword in title_lower:
-                    score += 5
-
-            # Logarithmic bonus for view count (diminishing returns)
-            if result['view_count'] > 0:
-                import math
-                score += min(20, int(math.log10(result['view_count'] + 1) * 2))
-
-            result['_relevance_score'] = score
-
-        # Sort by relevance score
-        ranked = sorted(results, key=lambda x: x.get('_relevance_score', 0), reverse=True)
-
-        # Remove temporary score field
-        for result in ranked:
-            result.pop('_relevance_score', None)
-
-        return ranked
+        fuzzy_threshold = self._config.get('search_fuzzy_threshold', 70)
+        scores = score_results(query, results, fuzzy_threshold)
+
+        # Sort by relevance score, keeping search order for ties
+        order = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
+        return [results[i] for i in order]
 
     # Display methods
 
@@ -407,32 +468,130 @@ Optimized YouTube search query:"""
                 return self.search_and_select(new_query)
             return None
 
+        self._print_results_header(query)
+        for i, result in enumerate(results, 1):
+            self._print_result(i, result)
+        print(f"\n{'=' * 70}")
+
+        if not show_indices:
+            return None
+
+        return self._prompt_selection(results, query)
+
+    def select_from_stream(
+        self,
+        results: Iterable[Dict],
+        query: str,
+        auto_pick: bool = False,
+        preview: int = SEARCH_PREVIEW_RESULTS
+    ) -> Optional[str]:
+        """
+        Display search results as they arrive and get a selection early.
+
+        Results are printed as soon as the search yields them. Once
+        ``preview`` results are on screen the user can choose one, ask for
+        more, skip, or search again while the rest are still unfetched.
+        With ``auto_pick`` the first result whose title closely matches the
+        query is selected without prompting; if none does, the best ranked
+        result is selected once the search completes.
+
+        Args:
+            results: Iterable of search results, typically from iter_search_results
+            query: Original search query
+            auto_pick: Select automatically instead of prompting
+            preview: Number of results to show before the first prompt
+
+        Returns:
+            Selected URL or None if user skipped
+        """
+        stream = iter(results)
+        shown: List[Dict] = []
+        exhausted = False
+        batch = preview
+
+        try:
+            while True:
+                target = len(shown) + batch
+                for result in stream:
+                    if not shown:
+                        self._print_results_header(query)
+                    shown.append(result)
+                    self._print_result(len(shown), result)
+
+                    if auto_pick and self._is_confident_match(query, result):
+                        print(f"\n[OK] Auto-selected: {result['title'][:60]}")
+                        return result['url']
+
+                    if len(shown) >= target:
+                        break
+                else:
+                    exhausted = True
+
+                if not shown:
+                    if auto_pick:
+                        print(f"\n[ERROR] No results found for: {query}")
+                        return None
+                    return self.display_search_results([], query)
+
+                if auto_pick and exhausted:
+                    best = self._rank_results(query, shown)[0]
+                    print(f"\n[OK] Auto-selected: {best['title'][:60]}")
+                    return best['url']
+
+                if auto_pick:
+                    continue
+
+                print(f"\n{'=' * 70}")
+                choice = self._prompt_selection(shown, query, allow_more=not exhausted)
+                if choice is not _MORE_RESULTS:
+                    return choice
+
+                # Fetch everything that is left
+                batch = float('inf')
+        finally:
+            close = getattr(stream, 'close', None)
+            if close:
+                close()
+
+    def _print_results_header(self, query: str) -> None:
+        """Print the search results header."""
         print(f"\n{'=' * 70}")
         print(f"Search results for: {query}")
         print(f"{'=' * 70}")
 
-        for i, result in enumerate(results, 1):
-            duration_str = self._format_duration(result['duration'])
-            views_str = self._format_views(result['view_count'])
+    def _print_result(self, index: int, result: Dict) -> None:
+        """Print a single numbered search result."""
+        duration_str = self._format_duration(result['duration'])
+        views_str = self._format_views(result['view_count'])
 
-            print(f"\n  [{i}] {result['title'][:70]}")
-            print(f"       Channel: {result['uploader']}")
-            print(f"       Duration: {duration_str} | Views: {views_str}")
-            print(f"       URL: {result['url']}")
+        print(f"\n  [{index}] {result['title'][:70]}")
+        print(f"       Channel: {result['uploader']}")
+        print(f"       Duration: {duration_str} | Views: {views_str}")
+        print(f"       URL: {result['url']}", flush=True)
 
-        print(f"\n{'=' * 70}")
+    def _prompt_selection(self, results: List[Dict], query: str, allow_more: bool = False):
+        """
+        Prompt the user to pick one of the displayed results.
 
-        if not show_indices:
-            return None
+        Args:
+            results: Displayed search results
+            query: Original search query
+            allow_more: Offer loading the remaining results
 
+        Returns:
+            Selected URL, None if user skipped, or _MORE_RESULTS if more were requested
+        """
+        more_hint = ", m for more" if allow_more else ""
         while True:
             choice = input(
-                f"Select result (1-{len(results)}, 0 to skip, s to search again): "
+                f"Select result (1-{len(results)}, 0 to skip{more_hint}, s to search again): "
             ).strip().lower()
 
             if choice == '0':
                 print("[INFO] Skipped")
                 return None
+            elif choice == 'm' and allow_more:
+                return _MORE_RESULTS
             elif choice == 's':
                 new_query = input("Enter new search query: ").strip()
                 if new_query:
@@ -450,10 +609,21 @@ Optimized YouTube search query:"""
             except ValueError:
                 print("[WARNING] Invalid input. Please enter a number")
 
+    def _is_confident_match(self, query: str, result: Dict) -> bool:
+        """Check whether a result title matches the query closely enough to auto-pick."""
+        query_lower = query.lower()
+        title_lower = result['title'].lower()
+        if FUZZY_AVAILABLE:
+            return fuzz.partial_ratio(query_lower, title_lower) >= SEARCH_AUTO_PICK_RATIO
+        return query_lower in title_lower
+
     def search_and_select(self, query: str) -> Optional[str]:
         """
         Search and select a video in one step.
 
+        Results are streamed so the first candidates can be chosen before
+        the search has finished.
+
         Args:
             query: Search query
 
@@ -462,9 +632,10 @@ Optimized YouTube search query:"""
         """
         max_results = self._config.get('search_max_results', 5)
         use_ai = self._config.get('search_use_ai', True)
+        auto_pick = self._config.get('search_auto_pick', False)
 
-        results = self.search_songs(query, max_results, use_ai)
-        return self.display_search_results(results, query)
+        results = self.iter_search_results(query, max_results, use_ai)
+        return self.select_from_stream(results, query, auto_pick=auto_pick)
 
     # File loading methods
 
@@ -0,0 +1,247 @@
+"""
+Content-addressed media store for Tea YouTube Downloader.
+
+When ``media_store`` is set in the config, every finished video or MP3 is
+kept once in the store, keyed by video ID and format profile (the format
+selector and output format it was made with). The file in the output
+directory is a hard link to the stored copy. A later request for the same
+video in the same format, into any directory or as part of any playlist,
+is linked from the store instead of downloaded again.
+
+Layout::
+
+    <root>/<profile>/<video id>/<file name>
+    <root>/<profile>/<video id>/info.json
+
+Links fall back from hard link to symlink to copy, so the store also works
+across filesystems.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from typing import Any, Dict, List, Optional
+
+# Import from tea modules
+try:
+    from tea.constants import STORE_INFO_FIELDS, STORE_INFO_FILENAME
+except ImportError:
+    # Fallback for development
+    from tea.constants import STORE_INFO_FIELDS, STORE_INFO_FILENAME
+
+
+def store_profile(format_selector: str, extension: str, audio_quality: Optional[str] = None) -> str:
+    """
+    Build the store profile key for a download format.
+
+    Args:
+        format_selector: yt-dlp format selector
+        extension: Final file extension ('mp3', 'mp4', ...)
+        audio_quality: Audio bitrate for converted audio, if any
+
+    Returns:
+        Profile key such as 'mp3-1a2b3c4d5e'
+    """
+    digest = hashlib.sha1(f"{format_selector}|{extension}|{audio_quality or ''}".encode('utf-8'))
+    return f"{extension}-{digest.hexdigest()[:10]}"
+
+
+class MediaStore:
+    """Stores finished media once and links it into output directories.
+
+    Attributes:
+        root: Store directory
+        _logger: Logger instance for logging
+    """
+
+    def __init__(self, root: str, logger=None):
+        """Initialize MediaStore.
+
+        Args:
+            root: Store directory (created on first use)
+            logger: Optional logger instance for logging operations.
+        """
+        self.root = os.path.abspath(os.path.expanduser(root))
+        self._logger = logger
+        self._lock = threading.Lock()
+
+    def _entry_dir(self, video_id: str, profile: str) -> str:
+        """Get the directory holding one stored item."""
+        return os.path.join(self.root, profile, video_id)
+
+    def lookup(self, video_id: str, profile: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a stored copy of a video.
+
+        Args:
+            video_id: Video ID
+            profile: Profile key from store_profile()
+
+        Returns:
+            Stored info (see STORE_INFO_FIELDS) with the file's 'path', or
+            None if the video is not stored in this profile
+        """
+        entry_dir = self._entry_dir(video_id, profile)
+        try:
+            with open(os.path.join(entry_dir, STORE_INFO_FILENAME), 'r', encoding='utf-8') as f:
+                info = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        path = os.path.join(entry_dir, info.get('filename', ''))
+        if not info.get('filename') or not os.path.isfile(path):
+            return None
+        info['path'] = path
+        return info
+
+    def find(self, video_id: str) -> List[Dict[str, Any]]:
+        """
+        Find every stored copy of a video, in any profile.
+
+        Args:
+            video_id: Video ID
+
+        Returns:
+            Stored info dicts (see lookup()), each with its 'profile'
+        """
+        try:
+            profiles = sorted(os.listdir(self.root))
+        except OSError:
+            return []
+
+        found = []
+        for profile in profiles:
+            stored = self.lookup(video_id, profile)
+            if stored is not None:
+                stored['profile'] = profile
+                found.append(stored)
+        return found
+
+    def contains(self, video_id: str) -> bool:
+        """
+        Check if a video is stored in any profile.
+
+        Args:
+            video_id: Video ID
+
+        Returns:
+            True if at least one format of the video is stored
+        """
+        return bool(self.find(video_id))
+
+    def add(self, file_path: str, video_id: str, profile: str, info: Dict[str, Any]) -> Optional[str]:
+        """
+        Put a finished download into the store, leaving a link at its old path.
+
+        Args:
+            file_path: Downloaded file
+            video_id: Video ID
+            profile: Profile key from store_profile()
+            info: yt-dlp info dict of the video (only STORE_INFO_FIELDS are kept)
+
+        Returns:
+            Path of the stored copy, or None if it could not be stored
+        """
+        if not os.path.isfile(file_path) or os.path.islink(file_path):
+            return None
+
+        entry_dir = self._entry_dir(video_id, profile)
+        stored_path = os.path.join(entry_dir, os.path.basename(file_path))
+
+        with self._lock:
+            try:
+                os.makedirs(entry_dir, exist_ok=True)
+                if not os.path.exists(stored_path):
+                    try:
+                        os.link(file_path, stored_path)
+                    except OSError:
+                        # Different filesystem: keep the only copy in the store
+                        shutil.move(file_path, stored_path)
+                        self.link(stored_path, file_path)
+
+                stored_info = {key: info.get(key) for key in STORE_INFO_FIELDS if key in info}
+                stored_info['id'] = video_id
+                stored_info['filename'] = os.path.basename(stored_path)
+                tmp_path = os.path.join(entry_dir, STORE_INFO_FILENAME + '.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(stored_info, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, os.path.join(entry_dir, STORE_INFO_FILENAME))
+            except OSError as e:
+                if self._logger:
+                    self._logger.warning(f"Could not add {video_id} to the media store: {e}")
+                return None
+
+        return stored_path
+
+    @staticmethod
+    def _same_content(stored_path: str, dest_path: str) -> bool:
+        """Check whether dest_path already holds the stored file, as a link or a copy."""
+        try:
+            if os.path.samefile(stored_path, dest_path):
+                return True
+            if os.path.getsize(stored_path) != os.path.getsize(dest_path):
+                return False
+        except OSError:
+            return False
+
+        digests = []
+        for path in (stored_path, dest_path):
+            digest = hashlib.sha256()
+            try:
+                with open(path, 'rb') as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b''):
+                        digest.update(block)
+            except OSError:
+                return False
+            digests.append(digest.digest())
+        return digests[0] == digests[1]
+
+    def link(self, stored_path: str, dest_path: str) -> str:
+        """
+        Make dest_path refer to a stored file.
+
+        Tries a hard link, then a symlink, then a copy. A file already at
+        dest_path is kept only if it is the stored file or a copy of it;
+        anything else (another video with the same name, a partial file, a
+        broken link) is replaced atomically.
+
+        Args:
+            stored_path: File in the store
+            dest_path: Path to create
+
+        Returns:
+            'exists', 'hardlink', 'symlink' or 'copy'
+
+        Raises:
+            OSError: If the file cannot be linked or copied
+        """
+        if os.path.lexists(dest_path) and self._same_content(stored_path, dest_path):
+            return 'exists'
+
+        os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+        temp_path = f'{dest_path}.{os.getpid()}-{threading.get_ident()}.tmp'
+        try:
+            method = self._make_link(stored_path, temp_path)
+            os.replace(temp_path, dest_path)
+        finally:
+            if os.path.lexists(temp_path):
+                os.remove(temp_path)
+        return method
+
+    @staticmethod
+    def _make_link(stored_path: str, path: str) -> str:
+        """Create path as a hard link, symlink or copy of a stored file."""
+        try:
+            os.link(stored_path, path)
+            return 'hardlink'
+        except OSError:
+            pass
+        try:
+            os.symlink(stored_path, path)
+            return 'symlink'
+        except OSError:
+            pass
+        shutil.copy2(stored_path, path)
+        return 'copy'
@@ -0,0 +1,212 @@
+"""
+Thumbnail cache for Tea YouTube Downloader.
+
+Audio downloads embed the video thumbnail as cover art. Rather than have
+yt-dlp fetch the thumbnail and convert it to PNG with FFmpeg for every
+file, the post-processing stage takes a ready-to-embed image from the
+ThumbnailCache:
+
+- A thumbnail URL fetched before is served from the cache, with no request
+  and no conversion.
+- Images are stored by content hash, so artwork shared by several videos
+  (the tracks of an album) is converted only once, whatever its URL.
+
+Layout::
+
+    <root>/<sha256 of the image>.<jpg|png>
+    <root>/urls/<sha1 of the URL>.<jpg|png>   (link to the image)
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+# Import from tea modules
+try:
+    from tea.ffmpeg import FFmpegService
+    from tea.metrics import Metrics, get_metrics
+    from tea.constants import THUMBNAIL_EMBED_EXTENSIONS, THUMBNAIL_CONVERT_EXTENSION
+except ImportError:
+    # Fallback for development
+    from tea.ffmpeg import FFmpegService
+    from tea.metrics import Metrics, get_metrics
+    from tea.constants import THUMBNAIL_EMBED_EXTENSIONS, THUMBNAIL_CONVERT_EXTENSION
+
+
+def _image_extension(data: bytes, url: str) -> str:
+    """Guess an image's extension from its signature, falling back to the URL."""
+    if data.startswith(b'\xff\xd8\xff'):
+        return 'jpg'
+    if data.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp'
+    extension = os.path.splitext(url.split('?', 1)[0])[1].lstrip('.').lower()
+    return 'jpg' if extension == 'jpeg' else extension or 'jpg'
+
+
+class ThumbnailCache:
+    """Thumbnails converted for embedding, keyed by URL and content.
+
+    Attributes:
+        root: Cache directory
+    """
+
+    def __init__(
+        self,
+        root: str,
+        ffmpeg_service: Optional[FFmpegService] = None,
+        metrics: Optional[Metrics] = None,
+        logger=None
+    ):
+        """
+        Initialize ThumbnailCache.
+
+        Args:
+            root: Cache directory, created on first use
+            ffmpeg_service: FFmpeg service for conversions. If None, creates default.
+            metrics: Metrics registry. If None, uses the process-wide one.
+            logger: Logger instance for logging
+        """
+        self.root = root
+        self._ffmpeg = ffmpeg_service or FFmpegService(logger=logger)
+        self._metrics = metrics or get_metrics()
+        self._logger = logger
+
+    def _url_path(self, url: str, extension: str) -> str:
+        """Get the index path of a thumbnail URL."""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.root, 'urls', f'{key}.{extension}')
+
+    def lookup(self, url: str) -> Optional[str]:
+        """
+        Find the cached image of a thumbnail URL.
+
+        Args:
+            url: Thumbnail URL
+
+        Returns:
+            Path of an image ready to embed, or None if the URL is not cached
+        """
+        for extension in THUMBNAIL_EMBED_EXTENSIONS:
+            path = self._url_path(url, extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def add(self, url: str, data: bytes) -> Optional[str]:
+        """
+        Cache a fetched thumbnail, converting it for embedding if needed.
+
+        Args:
+            url: Thumbnail URL
+            data: Image as fetched
+
+        Returns:
+            Path of the cached image, or None if it could not be converted
+        """
+        extension = _image_extension(data, url)
+        target_extension = (
+            extension if extension in THUMBNAIL_EMBED_EXTENSIONS else THUMBNAIL_CONVERT_EXTENSION
+        )
+        digest = hashlib.sha256(data).hexdigest()
+        image = os.path.join(self.root, f'{digest}.{target_extension}')
+        os.makedirs(os.path.join(self.root, 'urls'), exist_ok=True)
+
+        if os.path.exists(image):
+            # Same artwork under another URL
+            self._metrics.inc('cache_hits', cache='thumbnail_image')
+        elif not self._write_image(data, extension, image):
+            return None
+
+        self._link(image, self._url_path(url, target_extension))
+        return image
+
+    def prepare(self, ydl: Any, info: Dict[str, Any], filepath: str) -> Optional[str]:
+        """
+        Put a thumbnail next to a downloaded file for EmbedThumbnail.
+
+        Thumbnails are tried in yt-dlp's order of preference (best last);
+        cached URLs are used without fetching them again. The copy is
+        recorded as the thumbnail's 'filepath', so EmbedThumbnail embeds it
+        without converting it, and deletes it afterwards.
+
+        Args:
+            ydl: Open YoutubeDL instance, used to fetch thumbnails
+            info: Info dict of the download
+            filepath: Downloaded media file
+
+        Returns:
+            Path of the thumbnail copy, or None if no thumbnail is available
+        """
+        for thumbnail in reversed(info.get('thumbnails') or []):
+            url = thumbnail.get('url')
+            if not url:
+                continue
+
+            image = self.lookup(url)
+            if image is not None:
+                self._metrics.inc('cache_hits', cache='thumbnail')
+            else:
+                self._metrics.inc('cache_misses', cache='thumbnail')
+                try:
+                    with self._metrics.time('thumbnail_fetch'):
+                        data = ydl.urlopen(url).read()
+                except Exception as e:
+                    # Try the next thumbnail, as yt-dlp does
+                    if self._logger:
+                        self._logger.debug(f"Could not fetch thumbnail {url}: {e}")
+                    continue
+                image = self.add(url, data)
+                if image is None:
+                    return None
+
+            target = os.path.splitext(filepath)[0] + os.path.splitext(image)[1]
+            shutil.copyfile(image, target)
+            thumbnail['filepath'] = target
+            return target
+        return None
+
+    def _write_image(self, data: bytes, extension: str, image: str) -> bool:
+        """
+        Write an image into the cache, converting it if its format differs.
+
+        Args:
+            data: Image as fetched
+            extension: Format of data
+            image: Cache path; its extension is the format to store
+
+        Returns:
+            True if the image was written
+        """
+        convert = not image.endswith(f'.{extension}')
+        handle, temp_path = tempfile.mkstemp(suffix=os.path.splitext(image)[1], dir=self.root)
+        source = None
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                if not convert:
+                    f.write(data)
+            if convert:
+                handle, source = tempfile.mkstemp(suffix=f'.{extension}', dir=self.root)
+                with os.fdopen(handle, 'wb') as f:
+                    f.write(data)
+                if not self._ffmpeg.convert_image(source, temp_path):
+                    return False
+            os.replace(temp_path, image)
+            return True
+        finally:
+            for path in (source, temp_path):
+                if path and os.path.exists(path):
+                    os.remove(path)
+
+    def _link(self, image: str, path: str) -> None:
+        """Point a URL index entry at an image, replacing any older entry."""
+        temp_path = f'{path}.{os.getpid()}-{threading.get_ident()}.tmp'
+        try:
+            os.link(image, temp_path)
+        except OSError:
+            shutil.copyfile(image, temp_path)
+        os.replace(temp_path, path)
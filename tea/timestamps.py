@@ -8,7 +8,11 @@ import re
 import json
 import os
 from typing import List, Dict, Optional
-from yt_dlp import YoutubeDL
+
+from tea.utils.lazy import LazyImport
+
+# yt-dlp is slow to import and only needed once a URL is processed
+YoutubeDL = LazyImport('yt_dlp', 'YoutubeDL')
 
 # Import security utilities
 try:
@@ -40,18 +44,27 @@ except ImportError:
     class SecurityValidationError(Exception):
         pass
 
+# Import from tea modules
+try:
+    from tea.pool import YoutubeDLPool, get_ydl_pool
+except ImportError:
+    # Fallback for development
+    from tea.pool import YoutubeDLPool, get_ydl_pool
+
 
 class TimestampProcessor:
     """Processes timestamps for video splitting."""
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, ydl_pool: Optional[YoutubeDLPool] = None):
         """
         Initialize TimestampProcessor.
 
         Args:
             logger: Logger instance for logging
+            ydl_pool: YoutubeDL pool. If None, uses the process-wide one.
         """
         self._logger = logger
+        self._ydl_pool = ydl_pool or get_ydl_pool()
 
     def time_to_seconds(self, timestamp: str) -> int:
         """
@@ -241,7 +254,7 @@ class TimestampProcessor:
         }
 
         try:
-            with YoutubeDL(ydl_opts) as ydl:
+            with self._ydl_pool.acquire('probe', ydl_opts, YoutubeDL) as ydl:
                 info = ydl.extract_info(url, download=False)
 
                 if not info:
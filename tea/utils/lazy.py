@@ -0,0 +1,90 @@
+"""
+Lazy imports for Tea YouTube Downloader.
+
+Heavy optional-at-startup dependencies (yt-dlp, fuzzy matching, the AI
+client) are only needed once a command actually downloads or searches.
+Binding them through ``LazyImport`` keeps ``tea --help``, ``tea --history``
+and ``tea --config`` from paying their import cost, while module attributes
+such as ``tea.downloader.YoutubeDL`` stay in place for callers and tests.
+"""
+
+import importlib
+import importlib.util
+import threading
+from typing import Any, Optional
+
+
+class LazyImport:
+    """
+    Stand-in for a module, or an attribute of a module, imported on first use.
+
+    Calling the stand-in or reading an attribute from it imports the target
+    and forwards to it.
+
+    Example:
+        YoutubeDL = LazyImport('yt_dlp', 'YoutubeDL')
+        fuzz = LazyImport('fuzzywuzzy.fuzz')
+    """
+
+    def __init__(self, module_name: str, attribute: Optional[str] = None):
+        """
+        Initialize LazyImport.
+
+        Args:
+            module_name: Fully qualified module name to import
+            attribute: Optional attribute of the module to resolve to
+        """
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target: Any = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Any:
+        """
+        Import and return the target.
+
+        Returns:
+            The imported module or module attribute
+
+        Raises:
+            ImportError: If the module cannot be imported
+            AttributeError: If the module has no such attribute
+        """
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    module = importlib.import_module(self._module_name)
+                    self._target = getattr(module, self._attribute) if self._attribute else module
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the target."""
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Read an attribute of the target."""
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        """Return string representation of the stand-in."""
+        target = f"{self._module_name}.{self._attribute}" if self._attribute else self._module_name
+        state = 'loaded' if self._target is not None else 'not loaded'
+        return f"<LazyImport {target} ({state})>"
+
+
+def is_available(module_name: str) -> bool:
+    """
+    Check whether a module can be imported, without importing it.
+
+    Args:
+        module_name: Fully qualified module name
+
+    Returns:
+        True if the module is installed
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
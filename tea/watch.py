@@ -0,0 +1,483 @@
+"""
+Watch-folder ingestion for Tea YouTube Downloader.
+
+``tea watch DIR`` follows a directory of URL list files (the format read
+by ``tea --batch``) and queues every new URL as soon as it is written.
+Each file is read incrementally: only bytes appended since the last read
+are parsed, and only complete lines are taken so half-written URLs are
+never queued. Read offsets are kept in a small state file so a restart
+does not re-read old lists. URLs that were read but whose downloads have
+not finished are kept in the same file and delivered again on restart.
+
+On Linux the directory is watched with inotify; elsewhere, or if inotify
+is unavailable, it is rescanned every few seconds.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+# Import from tea modules
+try:
+    from tea.info import canonical_url_key, channel_key
+    from tea.constants import (
+        WATCH_FILE_EXTENSIONS,
+        WATCH_POLL_INTERVAL,
+        WATCH_SETTLE_SECONDS,
+        WATCH_STATE_FILENAME,
+    )
+except ImportError:
+    # Fallback for development
+    from tea.info import canonical_url_key, channel_key
+    from tea.constants import (
+        WATCH_FILE_EXTENSIONS,
+        WATCH_POLL_INTERVAL,
+        WATCH_SETTLE_SECONDS,
+        WATCH_STATE_FILENAME,
+    )
+
+# Import security utilities
+try:
+    from tea.utils.security import validate_url
+except ImportError:
+    # Fallback definition
+    def validate_url(url):
+        if not url or not isinstance(url, str):
+            return False
+        return 'youtube.com' in url or 'youtu.be' in url
+
+
+# inotify(7) event masks and flags
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class _InotifyBackend:
+    """Reports changed file names using Linux inotify."""
+
+    name = 'inotify'
+
+    def __init__(self, directory: str):
+        """
+        Start watching a directory.
+
+        Raises:
+            OSError: If inotify is not available
+        """
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux")
+
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, os.strerror(errno))
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        """
+        Wait for changes.
+
+        Returns:
+            Names of changed files (empty on timeout), or None if events
+            were lost and the whole directory should be rescanned
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        names: Set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if name:
+                    names.add(os.fsdecode(name))
+        return names
+
+    def close(self) -> None:
+        """Stop watching."""
+        os.close(self._fd)
+
+
+class _PollingBackend:
+    """Reports changed file names by comparing directory scans."""
+
+    name = 'polling'
+
+    def __init__(self, directory: str, interval: float):
+        """Take an initial snapshot of the directory."""
+        self._directory = directory
+        self._interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, tuple]:
+        """Map file names to (inode, size, mtime)."""
+        snapshot = {}
+        try:
+            with os.scandir(self._directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            st = entry.stat()
+                            snapshot[entry.name] = (st.st_ino, st.st_size, st.st_mtime_ns)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return snapshot
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        """
+        Sleep, rescan and report changes.
+
+        Returns:
+            Names of files that were added, changed or removed
+        """
+        time.sleep(min(timeout, self._interval))
+        snapshot = self._scan()
+        changed = {
+            name for name in snapshot.keys() | self._snapshot.keys()
+            if snapshot.get(name) != self._snapshot.get(name)
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+
+
+class FolderWatcher:
+    """Follows URL list files in a directory and reports new URLs.
+
+    Every complete line appended to a ``.txt`` or ``.list`` file is parsed
+    like ``tea --batch`` input (blank lines and ``#`` comments ignored,
+    non-YouTube URLs skipped) and valid URLs are passed to ``on_urls``.
+
+    Attributes:
+        directory: Directory being watched
+        backend_name: 'inotify' or 'polling'
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        on_urls: Callable[[str, List[str]], None],
+        poll_interval: float = WATCH_POLL_INTERVAL,
+        settle_time: float = WATCH_SETTLE_SECONDS,
+        state_path: Optional[str] = None,
+        use_inotify: bool = True,
+        pending: Optional[Callable[[], Dict[str, List[str]]]] = None,
+        logger=None
+    ):
+        """Initialize FolderWatcher.
+
+        Args:
+            directory: Directory to watch
+            on_urls: Called with (file name, new URLs) for every batch of new lines
+            poll_interval: Seconds between scans when polling
+            settle_time: Seconds a file must be unchanged before a final line
+                without a trailing newline is read
+            state_path: Where read offsets are stored. Defaults to
+                WATCH_STATE_FILENAME inside the directory.
+            use_inotify: Use inotify when available
+            pending: Returns the delivered URLs not downloaded yet, by file
+                name. They are saved with the offsets and delivered again by
+                the first scan() after a restart.
+            logger: Logger instance for logging
+
+        Raises:
+            NotADirectoryError: If directory does not exist
+        """
+        if not os.path.isdir(directory):
+            raise NotADirectoryError(f"Not a directory: {directory}")
+
+        self.directory = os.path.abspath(directory)
+        self._on_urls = on_urls
+        self._poll_interval = poll_interval
+        self._settle_time = settle_time
+        self._state_path = state_path or os.path.join(self.directory, WATCH_STATE_FILENAME)
+        self._pending = pending
+        self._logger = logger
+        self._stop = threading.Event()
+
+        # name -> {'inode': int, 'offset': int}
+        self._files: Dict[str, Dict[str, int]] = {}
+        # name -> URLs left pending by the previous run
+        self._restored: Dict[str, List[str]] = {}
+        self._load_state()
+
+        self._backend = None
+        if use_inotify:
+            try:
+                self._backend = _InotifyBackend(self.directory)
+            except (OSError, AttributeError) as e:
+                if self._logger:
+                    self._logger.debug(f"inotify unavailable, polling instead: {e}")
+        if self._backend is None:
+            self._backend = _PollingBackend(self.directory, poll_interval)
+
+    @property
+    def backend_name(self) -> str:
+        """Name of the change-detection backend in use."""
+        return self._backend.name
+
+    # State
+
+    def _load_state(self) -> None:
+        """Load saved read offsets and pending URLs."""
+        try:
+            with open(self._state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self._files = {
+                name: {'inode': int(entry['inode']), 'offset': int(entry['offset'])}
+                for name, entry in state.get('files', {}).items()
+            }
+            self._restored = {
+                name: [url for url in urls if isinstance(url, str)]
+                for name, urls in state.get('pending', {}).items()
+                if isinstance(urls, list)
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._files, self._restored = {}, {}
+
+    def _save_state(self) -> None:
+        """Persist read offsets and the URLs still pending."""
+        pending = {name: list(urls) for name, urls in self._restored.items()}
+        if self._pending is not None:
+            for name, urls in self._pending().items():
+                known = pending.setdefault(name, [])
+                known.extend(url for url in urls if url not in known)
+        temp_path = self._state_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'files': self._files, 'pending': pending}, f)
+            os.replace(temp_path, self._state_path)
+        except OSError as e:
+            if self._logger:
+                self._logger.warning(f"Could not save watch state: {e}")
+
+    # Reading
+
+    def _is_list_file(self, name: str) -> bool:
+        """Whether a file name looks like a URL list."""
+        return os.path.splitext(name)[1].lower() in WATCH_FILE_EXTENSIONS
+
+    def _read_new_lines(self, name: str, flush: bool = False) -> List[str]:
+        """
+        Read complete lines appended to a file since the last read.
+
+        Args:
+            name: File name inside the watched directory
+            flush: Also take a final line that has no trailing newline
+
+        Returns:
+            New lines (without line endings)
+        """
+        path = os.path.join(self.directory, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Deleted or renamed away
+            self._files.pop(name, None)
+            return []
+
+        state = self._files.get(name)
+        if state is None or state['inode'] != st.st_ino or st.st_size < state['offset']:
+            # New, replaced or truncated file: start from the beginning
+            state = {'inode': st.st_ino, 'offset': 0}
+            self._files[name] = state
+
+        if st.st_size <= state['offset']:
+            return []
+
+        try:
+            with open(path, 'rb') as f:
+                f.seek(state['offset'])
+                data = f.read(st.st_size - state['offset'])
+        except OSError as e:
+            if self._logger:
+                self._logger.warning(f"Could not read {name}: {e}")
+            return []
+
+        end = len(data) if flush else data.rfind(b'\n') + 1
+        if end <= 0:
+            return []
+
+        state['offset'] += end
+        return data[:end].decode('utf-8', errors='replace').splitlines()
+
+    def _parse_urls(self, lines: List[str]) -> List[str]:
+        """Extract valid URLs from list lines."""
+        urls = []
+        for line in lines:
+            line = line.strip().lstrip('\ufeff')
+            if not line or line.startswith('#'):
+                continue
+            if validate_url(line):
+                urls.append(line)
+            elif self._logger:
+                self._logger.warning(f"Skipping invalid URL: {line[:50]}")
+        return urls
+
+    def _process(self, names: Set[str], flush: bool = False, save: bool = False) -> int:
+        """Read the given files and deliver their new URLs, saving state if anything changed."""
+        delivered = 0
+        changed = save
+        for name in sorted(names):
+            if not self._is_list_file(name):
+                continue
+            before = dict(self._files.get(name, {}))
+            urls = self._parse_urls(self._read_new_lines(name, flush=flush))
+            changed = changed or self._files.get(name) != before
+            if urls:
+                self._on_urls(name, urls)
+                delivered += len(urls)
+        if changed:
+            self._save_state()
+        return delivered
+
+    def _settled_files(self) -> Set[str]:
+        """Files with an unread final line that have not changed for settle_time."""
+        settled = set()
+        now = time.time()
+        for name, state in self._files.items():
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            if st.st_size > state['offset'] and now - st.st_mtime >= self._settle_time:
+                settled.add(name)
+        return settled
+
+    # Watching
+
+    def scan(self) -> int:
+        """
+        Read every list file in the directory once.
+
+        The first scan also delivers the URLs the previous run left pending.
+
+        Returns:
+            Number of URLs delivered
+        """
+        delivered = 0
+        restored, self._restored = self._restored, {}
+        for name, urls in sorted(restored.items()):
+            if urls:
+                self._on_urls(name, urls)
+                delivered += len(urls)
+
+        try:
+            with os.scandir(self.directory) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return delivered
+        # Forget files that no longer exist
+        for name in set(self._files) - names:
+            del self._files[name]
+        return delivered + self._process(names, save=bool(restored))
+
+    def poll_once(self, timeout: Optional[float] = None) -> int:
+        """
+        Wait for changes once and deliver any new URLs.
+
+        Args:
+            timeout: Seconds to wait for changes (default: poll_interval)
+
+        Returns:
+            Number of URLs delivered
+        """
+        changed = self._backend.wait(self._poll_interval if timeout is None else timeout)
+        if changed is None:
+            return self.scan()
+
+        delivered = self._process(changed)
+        settled = self._settled_files()
+        if settled:
+            delivered += self._process(settled, flush=True)
+        return delivered
+
+    def run(self) -> None:
+        """Scan existing files, then follow changes until stop() is called."""
+        self.scan()
+        while not self._stop.is_set():
+            self.poll_once()
+
+    def stop(self) -> None:
+        """Ask run() to return after the current wait."""
+        self._stop.set()
+
+    def close(self) -> None:
+        """Save the URLs still pending and release the change-detection backend."""
+        if self._pending is not None:
+            self._save_state()
+        self._backend.close()
+
+
+def queue_urls(
+    job_queue,
+    urls: List[str],
+    output_path: str,
+    audio_only: bool = False,
+    priority: Optional[str] = None,
+    source: Optional[str] = None
+) -> int:
+    """
+    Queue URLs on a JobQueue, skipping ones already downloaded or queued.
+
+    Args:
+        job_queue: JobQueue that runs the downloads
+        urls: URLs to queue
+        output_path: Directory to save downloads
+        audio_only: Download audio only (MP3)
+        priority: 'high', 'normal' or 'low' (default: by content type)
+        source: Fairness group, e.g. the list file the URLs came from
+
+    Returns:
+        Number of jobs queued
+    """
+    pending = {canonical_url_key(url) for url in job_queue.pending_urls()}
+    queued = 0
+    for url in urls:
+        key = canonical_url_key(url)
+        if key in pending:
+            continue
+        job = job_queue.submit(
+            url, output_path, audio_only, on_duplicate='skip', priority=priority, source=source,
+            channel=channel_key(url)
+        )
+        if job is not None:
+            pending.add(key)
+            queued += 1
+    return queued
@@ -11,7 +11,7 @@ import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, Mock
-from typing import Generator, Dict, Any
+from typing import Any, Callable, Dict, Generator, Optional
 
 import pytest
 
@@ -212,6 +212,49 @@ def download_service(
     )
 
 
+@pytest.fixture
+def make_download_service(mock_logger: Mock) -> Callable[..., DownloadService]:
+    """Create a factory for DownloadService instances built on mocks.
+
+    The config is a MagicMock with the settings DownloadService reads, so
+    tests can change one of them without writing a config file. Every other
+    keyword replaces the matching DownloadService argument.
+
+    Args:
+        mock_logger: Mock logger
+
+    Returns:
+        Function taking ``config`` settings and DownloadService arguments
+    """
+    def make(config: Optional[Dict[str, Any]] = None, **services: Any) -> DownloadService:
+        settings: Dict[str, Any] = {
+            "media_store": None,
+            "thumbnail_cache": None,
+            "use_ai_filename_cleaning": False,
+            "concurrent_fragments": 4,
+            "http_chunk_size": None,
+            "external_downloader": None,
+            "audio_format": "mp3",
+            "default_quality": "1",
+            "mp3_quality": "320",
+        }
+        settings.update(config or {})
+        arguments: Dict[str, Any] = {
+            "config_manager": MagicMock(**settings),
+            "history_manager": MagicMock(**{"find_file.return_value": None}),
+            "info_extractor": MagicMock(**{
+                "get_info.return_value": ("video", {}),
+                "get_content_type.return_value": "video",
+            }),
+            "progress_reporter": MagicMock(),
+            "logger": mock_logger,
+        }
+        arguments.update(services)
+        return DownloadService(**arguments)
+
+    return make
+
+
 @pytest.fixture
 def sample_video_info() -> Dict[str, Any]:
     """Sample video information for testing.
@@ -0,0 +1,145 @@
+"""
+Tests for the shared OpenRouter client.
+
+Tests cover:
+- Token-bucket rate limiting and daily cap
+- Keep-alive connection reuse
+- Error handling and metrics
+- Sharing one client per API key
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator, List
+
+import pytest
+
+from tea.ai.client import AIClientError, OpenRouterClient, TokenBucket, get_client
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive chat completions endpoint."""
+
+    protocol_version = "HTTP/1.1"
+    status = 200
+    content = "Cleaned Title"
+    connections: List[int] = []
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.connections.append(id(self.connection))
+
+        body = json.dumps({"choices": [{"message": {"content": f"  {self.content}  "}}]})
+        data = body.encode("utf-8")
+        self.send_response(self.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def completion_server() -> Generator[ThreadingHTTPServer, None, None]:
+    """Run a local completions server for the duration of a test."""
+    _CompletionHandler.connections = []
+    _CompletionHandler.status = 200
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _make_client(server: ThreadingHTTPServer, **kwargs) -> OpenRouterClient:
+    """Create a client pointed at the local server with no pacing."""
+    host, port = server.server_address
+    limiter = kwargs.pop("limiter", TokenBucket(interval=0, capacity=1, daily_limit=100))
+    return OpenRouterClient(
+        "test-key", api_url=f"http://{host}:{port}/api/v1/chat/completions", limiter=limiter, **kwargs
+    )
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Test TokenBucket rate limiting."""
+
+    def test_non_blocking_acquire_respects_interval(self):
+        """Test a second immediate request is refused."""
+        bucket = TokenBucket(interval=60, capacity=1, daily_limit=10)
+        assert bucket.acquire(blocking=False) is True
+        assert bucket.acquire(blocking=False) is False
+
+    def test_daily_limit(self):
+        """Test requests stop once the daily cap is reached."""
+        bucket = TokenBucket(interval=0, capacity=1, daily_limit=2)
+        assert bucket.acquire() is True
+        assert bucket.acquire() is True
+        assert bucket.acquire() is False
+        assert bucket.remaining_today() == 0
+
+    def test_blocking_acquire_times_out(self):
+        """Test a blocking acquire gives up after its timeout."""
+        bucket = TokenBucket(interval=60, capacity=1, daily_limit=10)
+        bucket.acquire()
+        assert bucket.acquire(blocking=True, timeout=0.01) is False
+
+
+@pytest.mark.unit
+class TestOpenRouterClient:
+    """Test OpenRouterClient requests and pooling."""
+
+    def test_complete_returns_stripped_content(self, completion_server):
+        """Test completion text is extracted and stripped."""
+        client = _make_client(completion_server)
+        assert client.complete([{"role": "user", "content": "hi"}]) == "Cleaned Title"
+
+    def test_connection_reused(self, completion_server):
+        """Test sequential requests share one keep-alive connection."""
+        client = _make_client(completion_server)
+        for _ in range(3):
+            client.complete([{"role": "user", "content": "hi"}])
+
+        metrics = client.get_metrics()
+        assert metrics["connections_opened"] == 1
+        assert metrics["connections_reused"] == 2
+        assert len(set(_CompletionHandler.connections)) == 1
+        assert metrics["requests"] == 3
+        assert metrics["avg_response_time"] > 0
+
+    def test_http_error_raises(self, completion_server):
+        """Test HTTP error statuses raise AIClientError and count as errors."""
+        _CompletionHandler.status = 500
+        client = _make_client(completion_server)
+        with pytest.raises(AIClientError):
+            client.complete([{"role": "user", "content": "hi"}])
+        assert client.get_metrics()["errors"] == 1
+
+    def test_rate_limited_returns_none(self, completion_server):
+        """Test a refused non-blocking request returns None without a request."""
+        client = _make_client(
+            completion_server, limiter=TokenBucket(interval=60, capacity=1, daily_limit=10)
+        )
+        assert client.complete([{"role": "user", "content": "hi"}], wait=False) is not None
+        assert client.complete([{"role": "user", "content": "hi"}], wait=False) is None
+        assert client.get_metrics()["rate_limited"] == 1
+        assert len(_CompletionHandler.connections) == 1
+
+    def test_invalid_api_key(self):
+        """Test empty API keys are rejected."""
+        with pytest.raises(ValueError):
+            OpenRouterClient("")
+
+
+@pytest.mark.unit
+def test_get_client_shared_per_key():
+    """Test callers using the same key share one client and limiter."""
+    assert get_client("shared-key") is get_client(" shared-key ")
+    assert get_client("shared-key") is not get_client("other-key")
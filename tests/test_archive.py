@@ -0,0 +1,76 @@
+"""
+Tests for the download archive.
+
+Tests cover:
+- Recording and looking up video IDs
+- yt-dlp compatible file format and reloading
+- Per-channel high-water marks
+- Integration with HistoryManager
+"""
+
+from pathlib import Path
+
+import pytest
+
+from tea.archive import DownloadArchive
+from tea.history import HistoryManager
+
+
+@pytest.fixture
+def archive(temp_dir: Path) -> DownloadArchive:
+    """Create a DownloadArchive in a temporary directory."""
+    return DownloadArchive(str(temp_dir / 'archive.txt'), str(temp_dir / 'sync.json'))
+
+
+@pytest.mark.unit
+class TestDownloadArchive:
+    """Test DownloadArchive functionality."""
+
+    def test_add_and_contains(self, archive: DownloadArchive):
+        """Test recorded IDs are found and duplicates are not re-added."""
+        assert archive.contains('abc') is False
+
+        assert archive.add('abc') is True
+        assert archive.add('abc') is False
+
+        assert archive.contains('abc') is True
+        assert archive.contains('abc', 'Youtube') is True
+        assert archive.contains('abc', 'vimeo') is False
+        assert len(archive) == 1
+
+    def test_file_format_and_reload(self, archive: DownloadArchive, temp_dir: Path):
+        """Test the file uses yt-dlp's download-archive format and is reloaded."""
+        archive.add('abc')
+        archive.add('xyz', 'Vimeo')
+
+        assert (temp_dir / 'archive.txt').read_text() == 'youtube abc\nvimeo xyz\n'
+
+        reloaded = DownloadArchive(str(temp_dir / 'archive.txt'), str(temp_dir / 'sync.json'))
+        assert reloaded.contains('xyz', 'vimeo')
+
+    def test_marks(self, archive: DownloadArchive, temp_dir: Path):
+        """Test high-water marks are saved and keep the newest upload date."""
+        assert archive.get_mark('UCchannel') is None
+
+        archive.set_mark('UCchannel', 'new1', '20240105', count=2)
+        archive.set_mark('UCchannel', None, '20231201', count=0)
+
+        reloaded = DownloadArchive(str(temp_dir / 'archive.txt'), str(temp_dir / 'sync.json'))
+        mark = reloaded.get_mark('UCchannel')
+        assert mark['latest_id'] == 'new1'
+        assert mark['latest_upload_date'] == '20240105'
+        assert mark['count'] == 0
+
+    def test_corrupt_state_is_ignored(self, archive: DownloadArchive, temp_dir: Path):
+        """Test an unreadable sync state file starts fresh."""
+        (temp_dir / 'sync.json').write_text('{not json')
+        assert archive.get_mark('UCchannel') is None
+
+    def test_history_shares_archive(self, temp_dir: Path):
+        """Test HistoryManager records video IDs in the archive next to it."""
+        history = HistoryManager(history_path=str(temp_dir / 'history.json'))
+
+        history.add('https://youtu.be/abc', 'Video', 'downloads', video_id='abc')
+
+        assert history.archive.contains('abc')
+        assert (temp_dir / 'tea-archive.txt').exists()
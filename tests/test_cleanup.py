@@ -0,0 +1,174 @@
+"""
+Tests for the cleanup of interrupted downloads.
+
+Tests cover:
+- Removing leftovers in one pass, with reclaimed bytes
+- Dry runs and the min-age threshold
+- Skipping directories of running downloads
+- Download lock files
+- The tea cleanup command
+"""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from tea.cleanup import cleanup_downloads, download_lock, lock_path
+from tea.cli import CLI
+from tea.constants import EXIT_OK, EXIT_USAGE
+
+OLD = time.time() - 24 * 3600
+
+
+def _write(path: Path, size: int = 10, mtime: float = OLD) -> Path:
+    """Create a file of a given size and modification time."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'x' * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _dead_pid() -> int:
+    """Find a process ID that is not in use."""
+    pid = 999999
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return pid
+        except OSError:
+            pass
+        pid -= 1
+
+
+@pytest.mark.unit
+class TestCleanupDownloads:
+    """Test cleanup_downloads."""
+
+    def test_removes_leftovers(self, temp_dir: Path):
+        """Test every pattern is matched in one walk, and complete files are kept and counted."""
+        leftovers = [
+            _write(temp_dir / 'a.mp4.part', 100),
+            _write(temp_dir / 'Playlist' / 'b.f137.mp4.part-Frag12', 20),
+            _write(temp_dir / 'Playlist' / 'b.f137.mp4.ytdl', 3),
+            _write(temp_dir / 'deep' / 'er' / 'c.temp', 7),
+        ]
+        _write(temp_dir / 'done.mp4')
+        _write(temp_dir / 'Playlist' / 'song.mp3')
+        _write(temp_dir / 'notes.txt')
+
+        report = cleanup_downloads(str(temp_dir))
+
+        assert sorted(report.removed) == sorted(str(path) for path in leftovers)
+        assert report.reclaimed_bytes == 130
+        assert report.complete_files == 2
+        assert not any(path.exists() for path in leftovers)
+        assert (temp_dir / 'done.mp4').exists() and (temp_dir / 'notes.txt').exists()
+
+    def test_dry_run(self, temp_dir: Path):
+        """Test a dry run reports files without removing them."""
+        part = _write(temp_dir / 'a.part', 50)
+
+        report = cleanup_downloads(str(temp_dir), dry_run=True)
+
+        assert report.removed == [str(part)] and report.reclaimed_bytes == 50
+        assert part.exists()
+
+    def test_recent_files_are_kept(self, temp_dir: Path):
+        """Test files younger than min_age are skipped."""
+        recent = _write(temp_dir / 'a.part', mtime=time.time())
+        old = _write(temp_dir / 'b.part')
+
+        report = cleanup_downloads(str(temp_dir), min_age=3600)
+
+        assert report.recent == [str(recent)] and report.removed == [str(old)]
+        assert recent.exists()
+
+    def test_locked_directory_is_skipped(self, temp_dir: Path):
+        """Test leftovers below a directory held by a running download are kept."""
+        _write(temp_dir / 'out' / lock_path('', os.getpid()))
+        part = _write(temp_dir / 'out' / 'Playlist' / 'a.part')
+        other = _write(temp_dir / 'other' / 'b.part')
+
+        report = cleanup_downloads(str(temp_dir))
+
+        assert report.locked == [str(part)] and report.removed == [str(other)]
+        assert part.exists()
+        assert cleanup_downloads(str(temp_dir / 'out' / 'Playlist')).locked == [str(part)]
+
+    def test_stale_lock_is_removed(self, temp_dir: Path):
+        """Test the lock file of a process that is gone does not protect anything."""
+        stale = _write(temp_dir / lock_path('', _dead_pid()))
+        part = _write(temp_dir / 'a.part')
+
+        report = cleanup_downloads(str(temp_dir))
+
+        assert sorted(report.removed) == sorted([str(stale), str(part)])
+
+    def test_missing_directory(self, temp_dir: Path):
+        """Test a missing directory is an error."""
+        with pytest.raises(FileNotFoundError):
+            cleanup_downloads(str(temp_dir / 'missing'))
+
+
+@pytest.mark.unit
+class TestDownloadLock:
+    """Test download_lock."""
+
+    def test_shared_by_concurrent_downloads(self, temp_dir: Path):
+        """Test the lock file stays until the last download into the directory ends."""
+        path = lock_path(str(temp_dir))
+
+        with download_lock(str(temp_dir)):
+            with download_lock(str(temp_dir)):
+                assert os.path.exists(path)
+            assert os.path.exists(path)
+        assert not os.path.exists(path)
+
+    def test_download_holds_lock(self, temp_dir: Path, make_download_service):
+        """Test DownloadService.download keeps the lock while downloads run."""
+        seen = []
+        service = make_download_service(history_manager=MagicMock())
+        service._fetch = lambda url, output_path, *args: seen.append(
+            os.path.exists(lock_path(output_path))
+        ) or {'url': url, 'success': False, 'message': 'failed'}
+
+        service.download(['https://youtu.be/aaaaaaaaaaa'], str(temp_dir), max_workers=1)
+
+        assert seen == [True]
+        assert not os.path.exists(lock_path(str(temp_dir)))
+
+
+@pytest.mark.unit
+class TestCleanupCommand:
+    """Test the tea cleanup command."""
+
+    def test_reports_reclaimed_bytes(self, mock_logger: MagicMock, temp_dir: Path, capsys):
+        """Test tea cleanup removes leftovers and reports what it reclaimed."""
+        part = _write(temp_dir / 'a.part', 2048)
+        _write(temp_dir / 'b.part', mtime=time.time())
+
+        code = CLI(logger=mock_logger).run(['cleanup', str(temp_dir)])
+
+        out = capsys.readouterr().out
+        assert code == EXIT_OK
+        assert not part.exists()
+        assert 'Removed 1 file(s), reclaimed 2.00KiB' in out
+        assert 'Skipped 1 file(s) changed in the last 3600s' in out
+
+    def test_dry_run(self, mock_logger: MagicMock, temp_dir: Path, capsys):
+        """Test --dry-run and --min-age."""
+        part = _write(temp_dir / 'a.part', mtime=time.time() - 120)
+
+        code = CLI(logger=mock_logger).run(['cleanup', str(temp_dir), '--min-age', '60', '--dry-run'])
+
+        assert code == EXIT_OK
+        assert part.exists()
+        assert 'Would remove 1 file(s)' in capsys.readouterr().out
+
+    def test_missing_directory(self, mock_logger: MagicMock, temp_dir: Path):
+        """Test a missing directory is a usage error."""
+        assert CLI(logger=mock_logger).run(['cleanup', str(temp_dir / 'missing')]) == EXIT_USAGE
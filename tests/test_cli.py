@@ -10,12 +10,15 @@ Tests cover:
 - Batch file handling
 """
 
+import json
+
 import pytest
 from unittest.mock import MagicMock, patch, call
 from io import StringIO
 import sys
 
-from tea.cli import CLI
+from tea.cli import CLI, exit_code_for
+from tea.constants import EXIT_OK, EXIT_FAILURE, EXIT_USAGE, EXIT_PARTIAL
 from tea.exceptions import ValidationError
 
 
@@ -197,3 +200,172 @@ class TestCLIValidation:
 def cli(mock_logger: MagicMock) -> CLI:
     """Create CLI instance for testing."""
     return CLI(logger=mock_logger)
+
+
+@pytest.fixture
+def headless_cli(cli: CLI, config_manager, history_manager) -> CLI:
+    """Create CLI instance with a mocked downloader and temporary config/history."""
+    cli._config = config_manager
+    cli._history = history_manager
+    cli._downloader = MagicMock()
+    cli._downloader.download.return_value = [{"url": "https://youtu.be/video1", "success": True}]
+    return cli
+
+
+@pytest.mark.unit
+class TestHeadlessCommands:
+    """Test the non-interactive 'tea download' command."""
+
+    @patch("builtins.input", side_effect=AssertionError("prompted"))
+    def test_download_passes_options(self, mock_input, headless_cli: CLI, tmp_path):
+        """Test download options reach the downloader without prompting."""
+        code = headless_cli.run([
+            "download", "https://youtu.be/video1", "https://youtu.be/video2",
+            "--audio", "--out", str(tmp_path), "--workers", "2",
+        ])
+
+        assert code == EXIT_OK
+        headless_cli._downloader.download.assert_called_once_with(
+            urls=["https://youtu.be/video1", "https://youtu.be/video2"],
+            output_path=str(tmp_path),
+            max_workers=2,
+            audio_only=True,
+            cleaner=None,
+            sync=False,
+            audio_format=None,
+            quality=None,
+            audio_quality=None,
+            source=None,
+        )
+
+    def test_download_quality_options(self, headless_cli: CLI):
+        """Test --quality and --audio-quality reach the downloader, and audio presets imply --audio."""
+        headless_cli.run(["download", "https://youtu.be/video1", "--quality", "720p"])
+        headless_cli.run([
+            "download", "https://youtu.be/video1", "--quality", "audio", "--audio-quality", "192",
+        ])
+
+        video, audio = [call.kwargs for call in headless_cli._downloader.download.call_args_list]
+        assert (video["quality"], video["audio_only"]) == ("720p", False)
+        assert (audio["audio_quality"], audio["audio_only"]) == ("192", True)
+
+    def test_download_writes_metrics_report(self, headless_cli: CLI, tmp_path):
+        """Test --metrics-report writes a JSON run report."""
+        report = tmp_path / "metrics.json"
+
+        code = headless_cli.run(["download", "https://youtu.be/video1", "--metrics-report", str(report)])
+
+        assert code == EXIT_OK
+        assert {"stages", "counters", "elapsed_seconds"} <= set(json.loads(report.read_text()))
+
+    def test_download_reads_url_file(self, headless_cli: CLI, tmp_path):
+        """Test URLs from --file are merged and deduplicated."""
+        url_file = tmp_path / "urls.txt"
+        url_file.write_text("https://youtu.be/video1\n# comment\nhttps://youtu.be/video2\n")
+
+        headless_cli.run(["download", "https://youtu.be/video1", "--file", str(url_file)])
+
+        kwargs = headless_cli._downloader.download.call_args.kwargs
+        assert kwargs["urls"] == ["https://youtu.be/video1", "https://youtu.be/video2"]
+        assert kwargs["source"] == str(url_file)
+
+    def test_download_without_urls_is_usage_error(self, headless_cli: CLI):
+        """Test missing or invalid URLs return a usage error."""
+        assert headless_cli.run(["download", "not-a-url"]) == EXIT_USAGE
+        headless_cli._downloader.download.assert_not_called()
+
+    def test_invalid_workers_is_usage_error(self, headless_cli: CLI):
+        """Test out-of-range --workers is rejected by the parser."""
+        assert headless_cli.run(["download", "https://youtu.be/video1", "-w", "99"]) == EXIT_USAGE
+
+    @patch("builtins.input", side_effect=AssertionError("prompted"))
+    def test_on_duplicate_skip(self, mock_input, headless_cli: CLI):
+        """Test --on-duplicate skip drops URLs already in history."""
+        headless_cli._history.add("https://youtu.be/video1", "Video 1", "downloads")
+
+        code = headless_cli.run(["download", "https://youtu.be/video1", "--on-duplicate", "skip"])
+
+        assert code == EXIT_OK
+        headless_cli._downloader.download.assert_not_called()
+
+    def test_on_duplicate_replace(self, headless_cli: CLI):
+        """Test --on-duplicate replace removes the history entry and downloads."""
+        headless_cli._history.add("https://youtu.be/video1", "Video 1", "downloads")
+
+        headless_cli.run(["download", "https://youtu.be/video1", "--on-duplicate", "replace"])
+
+        assert headless_cli._history.is_downloaded("https://youtu.be/video1")[0] is False
+        headless_cli._downloader.download.assert_called_once()
+
+    @patch("builtins.input", side_effect=AssertionError("prompted"))
+    def test_ask_config_falls_back_to_skip(self, mock_input, headless_cli: CLI):
+        """Test duplicate_action 'ask' never prompts in headless mode."""
+        headless_cli._config.set("duplicate_action", "ask")
+        headless_cli._history.add("https://youtu.be/video1", "Video 1", "downloads")
+
+        assert headless_cli.run(["download", "https://youtu.be/video1"]) == EXIT_OK
+        headless_cli._downloader.download.assert_not_called()
+
+    @patch("builtins.input", side_effect=AssertionError("prompted"))
+    def test_sync_rechecks_downloaded_channels(self, mock_input, headless_cli: CLI):
+        """Test --sync re-runs channels in history but still skips downloaded videos."""
+        channel = "https://www.youtube.com/@creator"
+        headless_cli._history.add(channel, "Creator", "downloads")
+        headless_cli._history.add("https://youtu.be/video1", "Video 1", "downloads")
+
+        code = headless_cli.run([
+            "download", channel, "https://youtu.be/video1", "--sync", "--on-duplicate", "skip",
+        ])
+
+        assert code == EXIT_OK
+        kwargs = headless_cli._downloader.download.call_args.kwargs
+        assert kwargs["urls"] == [channel]
+        assert kwargs["sync"] is True
+
+    def test_split_needs_single_url(self, headless_cli: CLI):
+        """Test --split-from with several URLs is a usage error."""
+        code = headless_cli.run([
+            "download", "https://youtu.be/video1", "https://youtu.be/video2",
+            "--split-from", "chapters",
+        ])
+        assert code == EXIT_USAGE
+
+    def test_split_from_chapters(self, headless_cli: CLI, tmp_path):
+        """Test chapters are fetched and the downloaded file is split."""
+        timestamps = [{"start": "0:00", "end": "1:00", "title": "Intro"}]
+        headless_cli._timestamps = MagicMock()
+        headless_cli._timestamps.extract_youtube_chapters.return_value = timestamps
+        headless_cli._downloader.download.return_value = [
+            {"url": "https://youtu.be/video1", "success": True, "title": "Song"}
+        ]
+
+        with patch.object(headless_cli, "_handle_splitting", return_value=True) as split:
+            code = headless_cli.run([
+                "download", "https://youtu.be/video1", "--out", str(tmp_path),
+                "--split-from", "chapters",
+            ])
+
+        assert code == EXIT_OK
+        split.assert_called_once_with(str(tmp_path), timestamps, False, title="Song")
+
+    def test_download_failures_set_exit_code(self, headless_cli: CLI):
+        """Test failed downloads are reflected in the exit code."""
+        headless_cli._downloader.download.return_value = [
+            {"url": "https://youtu.be/video1", "success": False}
+        ]
+        assert headless_cli.run(["download", "https://youtu.be/video1"]) == EXIT_FAILURE
+
+    @pytest.mark.parametrize("successes,expected", [
+        ([True, True], EXIT_OK),
+        ([], EXIT_OK),
+        ([True, False], EXIT_PARTIAL),
+        ([False, False], EXIT_FAILURE),
+    ])
+    def test_exit_code_for(self, successes, expected):
+        """Test mapping of download results to exit codes."""
+        assert exit_code_for([{"success": ok} for ok in successes]) == expected
+
+    def test_legacy_flags_still_work(self, headless_cli: CLI, capsys):
+        """Test legacy --help flag is still handled."""
+        assert headless_cli.run(["--help"]) == EXIT_OK
+        assert "tea download" in capsys.readouterr().out
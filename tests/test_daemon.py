@@ -0,0 +1,329 @@
+"""
+Tests for daemon mode.
+
+Tests cover:
+- Health, metrics and job endpoints of TeaDaemon
+- Submission validation and duplicate handling
+- Host, token, Content-Type and output directory checks
+- DaemonClient errors and waiting for jobs
+- tea submit / tea jobs commands
+"""
+
+import http.client
+import json
+import os
+import socket
+import stat
+from pathlib import Path
+from typing import Dict, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from tea.cli import CLI
+from tea.constants import EXIT_FAILURE, EXIT_OK, EXIT_PARTIAL, JOB_DONE, JOB_FAILED
+from tea.daemon import DaemonClient, TeaDaemon
+from tea.config import validate_config
+from tea.exceptions import DaemonError, ValidationError
+from tea.history import HistoryManager
+from tea.jobs import JobQueue
+
+
+def _fake_download(url: str, output_path: str, thread_id: int, audio_only: bool, cleaner,
+                   **options) -> Dict:
+    """Stand-in for DownloadService.fetch."""
+    if 'fail' in url:
+        return {'url': url, 'success': False, 'count': 0, 'message': 'unavailable'}
+    return {'url': url, 'success': True, 'count': 1, 'title': 'A Title', 'message': 'ok'}
+
+
+@pytest.fixture
+def history(temp_dir: Path) -> HistoryManager:
+    """Create a HistoryManager backed by a temporary file."""
+    return HistoryManager(history_path=str(temp_dir / 'history.json'))
+
+
+@pytest.fixture
+def daemon(history: HistoryManager, config_manager, tmp_path: Path):
+    """Run a TeaDaemon on a free port with a mock downloader."""
+    downloader = MagicMock()
+    downloader.fetch.side_effect = _fake_download
+    job_queue = JobQueue(download_service=downloader, history_manager=history, workers=2)
+
+    config_manager.set('duplicate_action', 'skip')
+    config_manager.set('daemon_output_dirs', [str(tmp_path)])
+    server = TeaDaemon(job_queue, config_manager=config_manager, port=0)
+    server.start()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def client(daemon: TeaDaemon) -> DaemonClient:
+    """Create a DaemonClient for the test daemon."""
+    host, port = daemon.address
+    return DaemonClient(host, port, timeout=5, config_path=daemon._config.config_path)
+
+
+def _raw_request(daemon: TeaDaemon, method: str, path: str, body: bytes = b'',
+                 headers: Optional[Dict[str, str]] = None) -> tuple:
+    """Send a raw request (JSON with the daemon token by default) and return (status, decoded JSON)."""
+    if headers is None:
+        headers = {'Content-Type': 'application/json', 'Authorization': f'Bearer {daemon.token}'}
+    connection = http.client.HTTPConnection(*daemon.address, timeout=5)
+    try:
+        connection.request(method, path, body=body or None, headers=headers)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+@pytest.mark.unit
+class TestTeaDaemon:
+    """Test the daemon HTTP API."""
+
+    def test_health(self, client: DaemonClient):
+        """Test /health reports status and job counts."""
+        health = client.health()
+        assert health['status'] == 'ok'
+        assert health['jobs'][JOB_DONE] == 0
+
+    def test_metrics(self, daemon: TeaDaemon):
+        """Test /metrics serves the Prometheus text format with job counts."""
+        connection = http.client.HTTPConnection(*daemon.address, timeout=5)
+        try:
+            connection.request('GET', '/metrics')
+            response = connection.getresponse()
+            body = response.read().decode('utf-8')
+        finally:
+            connection.close()
+
+        assert response.status == 200
+        assert response.getheader('Content-Type').startswith('text/plain')
+        assert 'tea_jobs{status="queued"} 0' in body
+        assert 'tea_uptime_seconds' in body
+
+    def test_submit_and_wait(self, client: DaemonClient, tmp_path: Path):
+        """Test submitted jobs run and can be waited on."""
+        response = client.submit(
+            ['https://youtu.be/video1', 'https://youtu.be/fail1', 'not-a-url'],
+            output=str(tmp_path),
+            audio=True,
+        )
+
+        assert response['invalid'] == ['not-a-url']
+        assert [job['output_path'] for job in response['jobs']] == [str(tmp_path)] * 2
+
+        finished = client.wait([job['id'] for job in response['jobs']], poll_interval=0.01, timeout=5)
+        assert [job['status'] for job in finished] == [JOB_DONE, JOB_FAILED]
+        assert finished[0]['title'] == 'A Title'
+        assert finished[0]['audio_only'] is True
+
+    def test_submit_skips_downloaded(self, daemon: TeaDaemon, client: DaemonClient, history):
+        """Test duplicates follow the daemon's duplicate_action."""
+        history.add('https://youtu.be/video1', 'Video 1', 'downloads')
+
+        response = client.submit(['https://youtu.be/video1'])
+
+        assert response['jobs'] == []
+        assert response['skipped'] == ['https://youtu.be/video1']
+
+    def test_list_jobs(self, daemon: TeaDaemon, client: DaemonClient):
+        """Test jobs can be listed and filtered by state."""
+        client.submit(['https://youtu.be/video1', 'https://youtu.be/fail1'])
+        assert daemon.jobs.wait_idle(timeout=5)
+
+        assert len(client.list_jobs()) == 2
+        assert [job['url'] for job in client.list_jobs(JOB_FAILED)] == ['https://youtu.be/fail1']
+
+    def test_submit_priority(self, client: DaemonClient):
+        """Test the submission priority is applied to its jobs."""
+        response = client.submit(
+            ['https://youtu.be/video1', 'https://www.youtube.com/@channel'], priority='high'
+        )
+        assert [job['priority'] for job in response['jobs']] == ['high', 'high']
+
+        response = client.submit(['https://youtu.be/video2', 'https://www.youtube.com/@other'])
+        assert [job['priority'] for job in response['jobs']] == ['normal', 'low']
+
+    def test_submit_format_overrides(self, daemon: TeaDaemon, client: DaemonClient):
+        """Test format overrides of a submission reach the downloader."""
+        response = client.submit(['https://youtu.be/video1'], audio=True, audio_quality='128')
+        job = response['jobs'][0]
+        assert job['audio_quality'] == '128'
+        assert job['quality'] is None
+
+        client.wait([job['id']], poll_interval=0.01, timeout=5)
+        options = daemon.jobs._downloader.fetch.call_args.kwargs
+        assert options['audio_quality'] == '128'
+
+    @pytest.mark.parametrize("body", [
+        b'not json', b'[]', b'{"urls": []}', b'{"urls": ["x"], "audio": "yes"}',
+        b'{"urls": ["https://youtu.be/x"], "priority": "urgent"}',
+        b'{"urls": ["https://youtu.be/x"], "quality": "8k"}',
+        b'{"urls": ["https://youtu.be/x"], "audio_quality": "96"}',
+        b'{"urls": ["https://youtu.be/x"], "audio_format": "flac"}',
+        b'{"urls": ["https://youtu.be/x"], "on_duplicate": "donwload"}',
+        b'{"urls": ["https://youtu.be/x"], "on_duplicate": "ask"}',
+    ])
+    def test_bad_submission(self, daemon: TeaDaemon, body: bytes):
+        """Test malformed submissions are rejected with 400."""
+        status, data = _raw_request(daemon, 'POST', '/jobs', body)
+        assert status == 400
+        assert 'error' in data
+
+    def test_configured_ask_skips_duplicates(self, daemon: TeaDaemon, client: DaemonClient):
+        """Test a configured duplicate_action of 'ask' falls back to 'skip' in the daemon."""
+        client.submit(['https://youtu.be/video1'])
+        assert daemon.jobs.wait_idle(timeout=5)
+        daemon._config.set('duplicate_action', 'ask')
+
+        response = client.submit(['https://youtu.be/video1'])
+
+        assert response['jobs'] == []
+        assert response['skipped'] == ['https://youtu.be/video1']
+
+    def test_unknown_routes(self, daemon: TeaDaemon, client: DaemonClient):
+        """Test unknown paths and jobs return 404."""
+        assert _raw_request(daemon, 'GET', '/nope')[0] == 404
+        with pytest.raises(DaemonError) as exc_info:
+            client.get_job('missing')
+        assert exc_info.value.status == 404
+
+    def test_cancel_finished_job_conflicts(self, daemon: TeaDaemon, client: DaemonClient):
+        """Test only queued jobs can be cancelled."""
+        job = client.submit(['https://youtu.be/video1'])['jobs'][0]
+        assert daemon.jobs.wait_idle(timeout=5)
+
+        with pytest.raises(DaemonError) as exc_info:
+            client.cancel(job['id'])
+        assert exc_info.value.status == 409
+
+    def test_token_file(self, daemon: TeaDaemon):
+        """Test the token is written next to the config file, readable only by the user."""
+        path = Path(daemon._config.config_path).parent / f'tea-daemon-{daemon.address[1]}.token'
+
+        assert path.read_text() == daemon.token
+        if os.name == 'posix':
+            assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    @pytest.mark.parametrize("method,path", [('POST', '/jobs'), ('DELETE', '/jobs/x')])
+    @pytest.mark.parametrize("authorization", [None, 'Bearer wrong', 'Basic abc'])
+    def test_changes_need_token(self, daemon: TeaDaemon, method: str, path: str,
+                                authorization: Optional[str]):
+        """Test submissions and cancellations without the token are refused."""
+        headers = {'Content-Type': 'application/json'}
+        if authorization:
+            headers['Authorization'] = authorization
+
+        status, _ = _raw_request(daemon, method, path, b'{"urls": ["https://youtu.be/x"]}', headers)
+
+        assert status == 401
+        assert daemon.jobs.list_jobs() == []
+
+    def test_submission_must_be_json(self, daemon: TeaDaemon):
+        """Test cross-origin 'simple' requests (text/plain) cannot submit jobs."""
+        status, _ = _raw_request(
+            daemon, 'POST', '/jobs', b'{"urls": ["https://youtu.be/x"]}',
+            {'Content-Type': 'text/plain', 'Authorization': f'Bearer {daemon.token}'}
+        )
+
+        assert status == 415
+        assert daemon.jobs.list_jobs() == []
+
+    def test_foreign_host_is_refused(self, daemon: TeaDaemon):
+        """Test requests for another host name (DNS rebinding) are refused."""
+        port = daemon.address[1]
+        connection = http.client.HTTPConnection(*daemon.address, timeout=5)
+        try:
+            connection.putrequest('GET', '/jobs', skip_host=True)
+            connection.putheader('Host', f'evil.example:{port}')
+            connection.endheaders()
+            assert connection.getresponse().status == 403
+        finally:
+            connection.close()
+
+    @pytest.mark.parametrize("host,allowed", [
+        ('127.0.0.1:{port}', True), ('localhost:{port}', True), ('[::1]:{port}', True),
+        ('LOCALHOST:{port}', True), ('127.0.0.1:1', False), ('evil.example:{port}', False),
+        ('10.0.0.5:{port}', False), ('', False),
+    ])
+    def test_check_host(self, daemon: TeaDaemon, host: str, allowed: bool):
+        """Test Host headers are matched against the bound address and loopback names."""
+        assert daemon.check_host(host.format(port=daemon.address[1])) is allowed
+
+    def test_output_outside_allowed_dirs(self, daemon: TeaDaemon, client: DaemonClient,
+                                         temp_dir: Path):
+        """Test jobs cannot write outside default_output and daemon_output_dirs."""
+        with pytest.raises(DaemonError) as exc_info:
+            client.submit(['https://youtu.be/video1'], output=str(temp_dir / 'elsewhere'))
+        assert exc_info.value.status == 400
+
+        daemon._config.set('default_output', str(temp_dir / 'downloads'))
+        response = client.submit(['https://youtu.be/video1'], output=str(temp_dir / 'downloads' / 'music'))
+        assert len(response['jobs']) == 1
+
+    @pytest.mark.parametrize("value", ['/srv/music', [''], [5]])
+    def test_invalid_output_dirs_config(self, value):
+        """Test daemon_output_dirs must be a list of paths."""
+        with pytest.raises(ValidationError):
+            validate_config({'daemon_output_dirs': value})
+
+    def test_client_without_daemon(self):
+        """Test a clear error when nothing is listening."""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        with pytest.raises(DaemonError, match='not running'):
+            DaemonClient('127.0.0.1', port, timeout=1).health()
+
+    def test_port_in_use(self, daemon: TeaDaemon):
+        """Test binding a busy port raises DaemonError."""
+        host, port = daemon.address
+        with pytest.raises(DaemonError):
+            TeaDaemon(daemon.jobs, config_manager=MagicMock(), host=host, port=port)
+
+
+@pytest.mark.unit
+class TestDaemonCommands:
+    """Test the tea submit and tea jobs commands."""
+
+    def test_submit_wait_exit_code(self, daemon: TeaDaemon, mock_logger: MagicMock, capsys):
+        """Test tea submit --wait reports the combined job status."""
+        host, port = daemon.address
+        cli = CLI(logger=mock_logger)
+        cli._config = daemon._config
+
+        code = cli.run([
+            'submit', 'https://youtu.be/video1', 'https://youtu.be/fail1',
+            '--wait', '--host', host, '--port', str(port),
+        ])
+
+        assert code == EXIT_PARTIAL
+        assert 'Queued' in capsys.readouterr().out
+
+    def test_submit_without_daemon(self, mock_logger: MagicMock, capsys):
+        """Test tea submit fails cleanly when no daemon is running."""
+        cli = CLI(logger=mock_logger)
+
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        code = cli.run(['submit', 'https://youtu.be/video1', '--port', str(port)])
+
+        assert code == EXIT_FAILURE
+        assert 'not running' in capsys.readouterr().out
+
+    def test_jobs_listing(self, daemon: TeaDaemon, mock_logger: MagicMock, capsys):
+        """Test tea jobs prints the daemon's jobs."""
+        host, port = daemon.address
+        daemon.jobs.submit('https://youtu.be/video1', 'downloads')
+        assert daemon.jobs.wait_idle(timeout=5)
+
+        code = CLI(logger=mock_logger).run(['jobs', '--host', host, '--port', str(port)])
+
+        assert code == EXIT_OK
+        assert 'A Title' in capsys.readouterr().out
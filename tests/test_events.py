@@ -0,0 +1,235 @@
+"""
+Tests for the event stream.
+
+Tests cover:
+- EventBus dispatch and the JSON Lines writer
+- Console rendering of events
+- Parsing of the --events options and JSON Lines on stdout
+- Events sent by ProgressReporter, DownloadService and FFmpegService
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tea.events import EventBus, HumanRenderer, JsonlWriter, extract_events_option, jsonl_events
+from tea.exceptions import ValidationError
+from tea.ffmpeg import FFmpegService
+from tea.progress import ProgressReporter
+
+
+@pytest.fixture
+def recorded() -> List[Dict]:
+    """List that collects events."""
+    return []
+
+
+@pytest.fixture
+def bus(recorded: List[Dict]) -> EventBus:
+    """Event bus that records every event."""
+    bus = EventBus()
+    bus.subscribe(recorded.append)
+    return bus
+
+
+def _types(events: List[Dict]) -> List[str]:
+    """Get the event types in order."""
+    return [event['event'] for event in events]
+
+
+@pytest.mark.unit
+class TestEventBus:
+    """Test EventBus and JsonlWriter."""
+
+    def test_emit(self, bus: EventBus, recorded: List[Dict]):
+        """Test events reach subscribed sinks with type and time."""
+        bus.emit('retry', job=1, attempt=2)
+
+        assert recorded[0]['event'] == 'retry'
+        assert recorded[0]['attempt'] == 2
+        assert 'ts' in recorded[0]
+
+    def test_unsubscribe(self, bus: EventBus, recorded: List[Dict]):
+        """Test unsubscribed sinks get no more events."""
+        bus.unsubscribe(recorded.append)
+        bus.emit('retry')
+
+        assert recorded == []
+
+    def test_jsonl_writer(self):
+        """Test each event is written as one line of JSON."""
+        stream = io.StringIO()
+        bus = EventBus()
+        bus.subscribe(JsonlWriter(stream))
+
+        bus.emit('file_written', path=Path('a.mp4'), source='download')
+        bus.emit('summary', kind='download', successful=1)
+
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line)['event'] for line in lines] == ['file_written', 'summary']
+        assert json.loads(lines[0])['path'] == 'a.mp4'
+
+
+@pytest.mark.unit
+class TestHumanRenderer:
+    """Test console rendering."""
+
+    def test_retry(self, capsys):
+        """Test retries render as warnings."""
+        bus = EventBus()
+        bus.subscribe(HumanRenderer())
+        bus.emit('retry', job=2, url='u', attempt=1, max_attempts=3, delay=2, error='HTTP Error 429')
+
+        assert capsys.readouterr().out.strip() == (
+            "[WARNING] [Thread 2] Attempt 1/3 failed: HTTP Error 429. Retrying in 2s..."
+        )
+
+    def test_download_summary(self, capsys):
+        """Test the download summary lists failed URLs."""
+        bus = EventBus()
+        bus.subscribe(HumanRenderer())
+        bus.emit('summary', kind='download', output_path='out', successful=2, failed=1,
+                 succeeded_jobs=2, failures=[{'url': 'https://x', 'reason': 'gone'}])
+
+        out = capsys.readouterr().out
+        assert 'DOWNLOAD SUMMARY' in out
+        assert '[OK] Successful downloads: 2 files' in out
+        assert '[ERROR] Failed downloads: 1 file\n' in out
+        assert 'Reason: gone' in out
+        assert 'All files saved to: out' in out
+
+    def test_unknown_events_are_ignored(self, capsys):
+        """Test events without a console form print nothing."""
+        HumanRenderer()({'event': 'file_written', 'path': 'a.mp4'})
+
+        assert capsys.readouterr().out == ''
+
+
+@pytest.mark.unit
+class TestEventsOption:
+    """Test extract_events_option and jsonl_events."""
+
+    def test_no_option(self):
+        """Test arguments pass through untouched."""
+        assert extract_events_option(['--history']) == (None, None, ['--history'])
+
+    def test_format_and_file(self):
+        """Test both options are read in either form."""
+        assert extract_events_option(['--events', 'jsonl', 'download', '--events-file=e.jsonl', 'URL']) == (
+            'jsonl', 'e.jsonl', ['download', 'URL']
+        )
+
+    def test_file_implies_jsonl(self):
+        """Test --events-file alone selects JSON Lines."""
+        assert extract_events_option(['--events-file', 'e.jsonl'])[:2] == ('jsonl', 'e.jsonl')
+
+    def test_invalid(self):
+        """Test unknown formats and missing values are rejected."""
+        with pytest.raises(ValidationError):
+            extract_events_option(['--events=xml'])
+        with pytest.raises(ValidationError):
+            extract_events_option(['--events'])
+
+    def test_stdout_is_jsonl_only(self, capsys):
+        """Test events replace console output on stdout and prints go to stderr."""
+        bus = EventBus()
+        renderer = HumanRenderer()
+        bus.subscribe(renderer)
+
+        with jsonl_events(bus=bus):
+            print("chatter")
+            bus.emit('summary', kind='search', queued=1, skipped=0)
+
+        captured = capsys.readouterr()
+        assert [json.loads(line)['event'] for line in captured.out.splitlines()] == ['summary']
+        assert 'chatter' in captured.err
+        assert bus.sinks == (renderer,)
+
+    def test_file_keeps_console(self, temp_dir: Path, capsys):
+        """Test events are appended to a file alongside the console output."""
+        bus = EventBus()
+        bus.subscribe(HumanRenderer())
+        path = temp_dir / 'events.jsonl'
+
+        with jsonl_events(str(path), bus=bus):
+            bus.emit('summary', kind='search', queued=1, skipped=0)
+
+        assert 'SEARCH SUMMARY' in capsys.readouterr().out
+        assert json.loads(path.read_text(encoding='utf-8'))['queued'] == 1
+
+
+@pytest.mark.unit
+class TestServiceEvents:
+    """Test events sent by the services."""
+
+    def test_progress_is_throttled(self, bus: EventBus, recorded: List[Dict]):
+        """Test per-chunk hooks send few progress events, always including completion."""
+        reporter = ProgressReporter(metrics=MagicMock(), events=bus)
+        for downloaded in range(1, 101):
+            reporter.progress_hook({'status': 'downloading', 'filename': 'a.mp4',
+                                    'downloaded_bytes': downloaded, 'total_bytes': 100})
+        reporter.progress_hook({'status': 'finished', 'filename': 'a.mp4', 'total_bytes': 100})
+
+        progress = [event for event in recorded if event['event'] == 'progress']
+        assert len(progress) == 3
+        assert progress[0]['downloaded_bytes'] == 1
+        assert progress[1]['downloaded_bytes'] == 100
+        assert progress[2]['status'] == 'finished'
+
+    def test_batch_events(self, bus: EventBus, recorded: List[Dict], make_download_service):
+        """Test a batch reports queued jobs, results and a summary."""
+        info = MagicMock(**{'get_content_type.return_value': 'video'})
+        service = make_download_service(
+            history_manager=MagicMock(), info_extractor=info, events=bus
+        )
+        urls = ['https://www.youtube.com/watch?v=aaaaaaaaaaa', 'https://www.youtube.com/watch?v=bbbbbbbbbbb']
+
+        def fake_download(url, *args):
+            return {'url': url, 'success': url.endswith('a'), 'count': 1, 'message': 'done'}
+
+        with patch.object(service, '_fetch', side_effect=fake_download):
+            service.download(urls, output_path='out', max_workers=1)
+
+        assert _types(recorded) == ['batch_started', 'job_queued', 'job_queued',
+                                    'job_done', 'job_done', 'summary']
+        summary = recorded[-1]
+        assert summary['successful'] == 1
+        assert summary['failures'] == [{'url': urls[1], 'reason': 'done'}]
+
+    def test_list_formats_events(self, bus: EventBus, recorded: List[Dict],
+                                 make_download_service, capsys):
+        """Test format listing notices go through the event stream."""
+        pool = MagicMock()
+        pool.acquire.return_value.__enter__.return_value.extract_info.side_effect = \
+            RuntimeError('no formats')
+        service = make_download_service(ydl_pool=pool, events=bus)
+
+        assert service.download(['https://www.youtube.com/watch?v=aaaaaaaaaaa'],
+                                list_formats=True) == []
+
+        messages = [(e['level'], e['text']) for e in recorded if e['event'] == 'message']
+        assert messages == [('info', 'Available formats for the first provided URL:'),
+                            ('error', 'Error listing formats: no formats')]
+        assert capsys.readouterr().out == ''
+
+    def test_split_events(self, bus: EventBus, recorded: List[Dict], temp_dir: Path):
+        """Test clip results are reported, including skipped clips."""
+        service = FFmpegService(metrics=MagicMock(), events=bus)
+        timestamps = [
+            {'start': '0:00', 'end': '0:10', 'title': 'One'},
+            {'start': 'bad', 'end': '0:20', 'title': 'Two'},
+        ]
+
+        with patch.object(service, '_check_ffmpeg', return_value=True), \
+                patch.object(service, '_execute_split', return_value=True):
+            service.split_video_by_timestamps('in.mp3', timestamps, str(temp_dir), audio_only=True)
+
+        assert _types(recorded) == ['split_started', 'split_clip_started', 'file_written',
+                                    'split_clip_done', 'split_clip_done']
+        assert recorded[3]['success'] is True
+        assert recorded[4]['skipped'] is True
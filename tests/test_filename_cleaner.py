@@ -0,0 +1,83 @@
+"""
+Tests for FilenameCleaner module.
+
+Tests cover:
+- Regex fallback cleaning
+- Order-dependent removal of trailing junk tags
+- AI output validation
+"""
+
+import pytest
+
+from tea.ai.filename_cleaner import FilenameCleaner
+
+
+@pytest.fixture
+def cleaner() -> FilenameCleaner:
+    """Create a FilenameCleaner instance for testing."""
+    return FilenameCleaner(api_key="test-key")
+
+
+@pytest.mark.unit
+class TestRegexClean:
+    """Test the regex fallback of FilenameCleaner."""
+
+    @pytest.mark.parametrize(
+        "title, expected",
+        [
+            ("Rick Astley - Never Gonna Give You Up (Official Music Video)",
+             "Rick Astley - Never Gonna Give You Up"),
+            ("Song [Official Video] HD", "Song"),
+            ("Nujabes - Feather (feat. Cise Starr)", "Nujabes - Feather"),
+            ("Song (feat. A) ft. B", "Song"),
+            ("Daft Punk - Get Lucky (Official Audio) ft. Pharrell Williams",
+             "Daft Punk - Get Lucky Official Audio"),
+            ("Tom Misch - Movie 🎬✨ (Official Video)", "Tom Misch - Movie"),
+            ("Vulfpeck /// Dean Town", "Vulfpeck Dean Town"),
+        ],
+    )
+    def test_regex_clean(self, cleaner: FilenameCleaner, title: str, expected: str):
+        """Test cleaning of typical titles."""
+        assert cleaner._regex_clean(title) == expected
+
+    @pytest.mark.parametrize(
+        "title, expected",
+        [
+            # Lyrics is tried before Audio, so both are stripped
+            ("Song Audio Lyrics", "Song"),
+            # Audio is tried after Lyrics, so the uncovered Lyrics stays
+            ("Song Lyrics Audio", "Song Lyrics"),
+            # Trailing "Official Video" is tried before the bracketed music video tag
+            ("Song Official Video (Official Music Video)", "Song Official Video"),
+            # Each trailing tag is stripped at most once
+            ("Song  HD HD", "Song HD"),
+        ],
+    )
+    def test_regex_clean_trailing_tag_order(
+        self, cleaner: FilenameCleaner, title: str, expected: str
+    ):
+        """Test trailing tags are stripped once each, in order."""
+        assert cleaner._regex_clean(title) == expected
+
+    @pytest.mark.parametrize("title", ["", "😀😀", "!!!", None])
+    def test_regex_clean_empty_result(self, cleaner: FilenameCleaner, title):
+        """Test titles that clean to nothing fall back to 'Untitled'."""
+        assert cleaner._regex_clean(title) == "Untitled"
+
+    def test_regex_clean_limits_length(self, cleaner: FilenameCleaner):
+        """Test cleaned titles are limited to 100 characters."""
+        assert len(cleaner._regex_clean("a" * 300)) == 100
+
+
+@pytest.mark.unit
+class TestValidateAIOutput:
+    """Test validation of AI generated titles."""
+
+    def test_valid_output(self, cleaner: FilenameCleaner):
+        """Test a plain title is accepted."""
+        assert cleaner._validate_ai_output("Never Gonna Give You Up")
+
+    @pytest.mark.parametrize("output", ["../etc/passwd", "<script>x</script>", "", "!!!", "a" * 101])
+    def test_invalid_output(self, cleaner: FilenameCleaner, output: str):
+        """Test unsafe or empty output is rejected."""
+        assert not cleaner._validate_ai_output(output)
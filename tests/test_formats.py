@@ -0,0 +1,280 @@
+"""
+Tests for format planning.
+
+Tests cover:
+- MP4 video plans that remux instead of converting
+- MP3 and native (no-transcode) audio plans
+- Video quality presets and MP3 bitrates
+- Media store profiles of plans
+- Plans reaching the downloader options, from config or per-call overrides
+"""
+
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tea.constants import AUDIO_FORMAT_MP3, AUDIO_FORMAT_NATIVE
+from tea.downloader import DownloadService
+from tea.exceptions import ValidationError
+from tea.formats import is_audio_quality, normalize_audio_quality, plan_format
+from tea.metrics import Metrics
+from tea.pool import YoutubeDLPool
+
+
+def _keys(options: Dict) -> List[str]:
+    """Get the postprocessor keys of downloader options."""
+    return [postprocessor['key'] for postprocessor in options['postprocessors']]
+
+
+def _postprocessing(built: List[Dict]) -> List[Dict]:
+    """Get the options of the YoutubeDLs that ran postprocessors."""
+    return [options for options in built if options['postprocessors']]
+
+
+@pytest.mark.unit
+class TestPlanFormat:
+    """Test plan_format."""
+
+    def test_video_prefers_mp4_streams_and_remuxes(self):
+        """Test video prefers H.264 + AAC and never re-encodes."""
+        options = plan_format().downloader_options()
+
+        assert options['format'].startswith(
+            'bestvideo[height<=1080][vcodec^=avc1]+bestaudio[ext=m4a]'
+        )
+        assert options['merge_output_format'] == 'mp4'
+        assert 'FFmpegVideoConvertor' not in _keys(options)
+        assert options['postprocessors'][0] == {'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mp4'}
+
+    def test_mp3_audio(self):
+        """Test MP3 audio converts with FFmpegExtractAudio."""
+        plan = plan_format(audio_only=True, audio_format=AUDIO_FORMAT_MP3)
+        options = plan.downloader_options()
+
+        assert plan.extension == 'mp3'
+        assert options['postprocessors'][0]['preferredcodec'] == 'mp3'
+        assert 'merge_output_format' not in options
+
+    def test_native_audio_keeps_codec(self):
+        """Test native audio picks M4A/Opus and copies the stream."""
+        plan = plan_format(audio_only=True, audio_format=AUDIO_FORMAT_NATIVE)
+        options = plan.downloader_options()
+
+        assert options['format'].startswith('bestaudio[ext=m4a]/bestaudio[acodec=opus]')
+        assert options['postprocessors'][0] == {'key': 'FFmpegExtractAudio', 'preferredcodec': 'best'}
+        assert plan.extension is None
+        assert plan.output_extension == '%(ext)s'
+
+    def test_audio_format_ignored_for_video(self):
+        """Test the audio format only affects audio downloads."""
+        assert plan_format(audio_format=AUDIO_FORMAT_NATIVE).extension == 'mp4'
+
+    def test_profiles_differ(self):
+        """Test each plan is stored under its own media store profile."""
+        profiles = {
+            plan_format().profile,
+            plan_format(audio_only=True).profile,
+            plan_format(audio_only=True, audio_format=AUDIO_FORMAT_NATIVE).profile,
+        }
+        assert len(profiles) == 3
+
+    def test_options_without_postprocessors(self):
+        """Test the network stage can leave the postprocessors out."""
+        options = plan_format(audio_only=True).downloader_options(postprocess=False)
+
+        assert options['postprocessors'] == []
+        assert options['format'] == plan_format(audio_only=True).format_selector
+
+    def test_options_are_copies(self):
+        """Test yt-dlp can't change the plan through its options."""
+        plan = plan_format()
+        plan.downloader_options()['postprocessors'][0]['preferedformat'] = 'mkv'
+
+        assert plan.postprocessors[0]['preferedformat'] == 'mp4'
+
+    def test_invalid_audio_format(self):
+        """Test unknown audio formats are rejected."""
+        with pytest.raises(ValidationError):
+            plan_format(audio_only=True, audio_format='flac')
+
+
+@pytest.mark.unit
+class TestQualityPresets:
+    """Test quality presets and MP3 bitrates."""
+
+    @pytest.mark.parametrize('quality, height', [('1', 1080), ('2', 720), ('720p', 720), ('4', 360)])
+    def test_video_height(self, quality: str, height: int):
+        """Test video presets cap the height of both the preferred and fallback streams."""
+        selector = plan_format(quality=quality).format_selector
+
+        assert selector.startswith(f'bestvideo[height<={height}][vcodec^=avc1]+bestaudio[ext=m4a]/')
+        assert f'/bestvideo[height<={height}]+bestaudio/' in selector
+
+    def test_best_is_uncapped(self):
+        """Test 'best' has no height limit."""
+        assert 'height' not in plan_format(quality='best').format_selector
+
+    def test_audio_preset_for_video_uses_default(self):
+        """Test an audio-only default_quality still gives video downloads a video preset."""
+        plan = plan_format(quality='5')
+
+        assert plan.quality == '1'
+        assert is_audio_quality('5') and is_audio_quality('audio')
+        assert not is_audio_quality('1')
+
+    def test_invalid_quality(self):
+        """Test unknown presets are rejected."""
+        with pytest.raises(ValidationError):
+            plan_format(quality='8k')
+
+    @pytest.mark.parametrize('value, bitrate', [
+        (None, '320'), ('128', '128'), ('192k', '192'), ('low', '128'), ('MAX', '320'),
+    ])
+    def test_normalize_audio_quality(self, value, bitrate: str):
+        """Test bitrates and preset names map to a supported bitrate."""
+        assert normalize_audio_quality(value) == bitrate
+
+    def test_invalid_audio_quality(self):
+        """Test unsupported bitrates are rejected."""
+        with pytest.raises(ValidationError):
+            normalize_audio_quality('96')
+
+    def test_mp3_bitrate(self):
+        """Test the MP3 bitrate reaches the encoder and the store profile."""
+        low = plan_format(audio_only=True, audio_quality='128')
+
+        assert low.postprocessors[0]['preferredquality'] == '128'
+        assert low.profile != plan_format(audio_only=True, audio_quality='320').profile
+
+
+@pytest.mark.unit
+class TestPlannedDownloads:
+    """Test DownloadService uses the planned format."""
+
+    @pytest.fixture
+    def built(self) -> List[Dict]:
+        """Options of every YoutubeDL built."""
+        return []
+
+    @pytest.fixture
+    def fake_ydl(self, built: List[Dict]):
+        """YoutubeDL stand-in that records its options."""
+        class FakeYoutubeDL:
+            def __init__(self, options: Dict):
+                built.append(options)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                pass
+
+            def prepare_filename(self, info: Dict) -> str:
+                return 'Title.m4a'
+
+            def extract_info(self, url: str, download: bool = True, **kwargs) -> Dict:
+                return {
+                    'id': url[-11:], 'title': 'Title', 'ext': 'm4a',
+                    'requested_downloads': [{'filepath': 'Title.m4a'}],
+                }
+
+            def post_process(self, filename: str, info: Dict) -> Dict:
+                return {**info, 'filepath': filename}
+
+        return FakeYoutubeDL
+
+    def _service(
+        self,
+        make_download_service,
+        audio_format: str,
+        default_quality: str = '1',
+        mp3_quality: str = '320'
+    ) -> DownloadService:
+        """Build a DownloadService with the given configured format."""
+        return make_download_service(
+            config={'audio_format': audio_format, 'default_quality': default_quality,
+                    'mp3_quality': mp3_quality},
+            info_extractor=MagicMock(**{'get_info.return_value': ('video', {})}),
+            ydl_pool=YoutubeDLPool(metrics=Metrics()),
+        )
+
+    def test_configured_audio_format(
+        self, make_download_service, fake_ydl, built: List[Dict], temp_dir
+    ):
+        """Test the configured audio format is used by default."""
+        service = self._service(make_download_service, AUDIO_FORMAT_NATIVE)
+
+        with patch('tea.downloader.YoutubeDL', fake_ydl):
+            result = service.download_single_video(
+                'https://youtu.be/aaaaaaaaaaa', str(temp_dir), audio_only=True
+            )
+
+        assert result['success']
+        assert built[0]['postprocessors'] == []
+        assert built[0]['outtmpl'].endswith('%(title)s.{ext}')
+        assert _postprocessing(built)[0]['postprocessors'][0]['preferredcodec'] == 'best'
+
+
+    def test_audio_format_override(
+        self, make_download_service, fake_ydl, built: List[Dict], temp_dir
+    ):
+        """Test a per-call audio format overrides the configured one."""
+        service = self._service(make_download_service, AUDIO_FORMAT_NATIVE)
+
+        with patch('tea.downloader.YoutubeDL', fake_ydl):
+            service.download_single_video(
+                'https://youtu.be/aaaaaaaaaaa', str(temp_dir), audio_only=True,
+                audio_format=AUDIO_FORMAT_MP3
+            )
+
+        assert _postprocessing(built)[0]['postprocessors'][0]['preferredcodec'] == 'mp3'
+
+    def test_configured_quality(self, make_download_service, fake_ydl, built: List[Dict], temp_dir):
+        """Test default_quality and mp3_quality decide stream selection and bitrate."""
+        service = self._service(
+            make_download_service, AUDIO_FORMAT_MP3, default_quality='3', mp3_quality='128'
+        )
+
+        with patch('tea.downloader.YoutubeDL', fake_ydl):
+            service.download_single_video('https://youtu.be/aaaaaaaaaaa', str(temp_dir))
+            service.download_single_video('https://youtu.be/bbbbbbbbbbb', str(temp_dir), audio_only=True)
+
+        assert '[height<=480]' in built[0]['format']
+        assert _postprocessing(built)[1]['postprocessors'][0]['preferredquality'] == '128'
+
+    def test_quality_override(self, make_download_service, fake_ydl, built: List[Dict], temp_dir):
+        """Test per-call quality options override the config."""
+        service = self._service(
+            make_download_service, AUDIO_FORMAT_MP3, default_quality='3', mp3_quality='128'
+        )
+
+        with patch('tea.downloader.YoutubeDL', fake_ydl):
+            service.download(
+                ['https://youtu.be/aaaaaaaaaaa'], str(temp_dir), max_workers=1, quality='720p'
+            )
+            service.download(
+                ['https://youtu.be/bbbbbbbbbbb'], str(temp_dir), max_workers=1, audio_only=True,
+                audio_quality='high'
+            )
+
+        assert '[height<=720]' in built[0]['format']
+        assert _postprocessing(built)[1]['postprocessors'][0]['preferredquality'] == '256'
+
+    def test_invalid_override_fails_before_downloading(self, make_download_service, fake_ydl,
+                                                       built: List[Dict], temp_dir):
+        """Test a batch with a bad quality fails before any download starts."""
+        service = self._service(make_download_service, AUDIO_FORMAT_MP3)
+
+        with patch('tea.downloader.YoutubeDL', fake_ydl), pytest.raises(ValidationError):
+            service.download(['https://youtu.be/aaaaaaaaaaa'], str(temp_dir), quality='8k')
+
+        assert built == []
+
+    def test_native_audio_skips_local_conversion(self, make_download_service, temp_dir):
+        """Test native audio is not converted from a local copy of the video."""
+        service = self._service(make_download_service, AUDIO_FORMAT_NATIVE)
+        service._history.find_file.return_value = {'file_path': str(temp_dir / 'Title.mp4')}
+
+        plan = plan_format(audio_only=True, audio_format=AUDIO_FORMAT_NATIVE)
+        assert service._reuse_local(MagicMock(), 'aaaaaaaaaaa', plan) is None
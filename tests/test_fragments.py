@@ -0,0 +1,131 @@
+"""
+Tests for concurrent fragment and chunked downloads.
+
+Tests cover:
+- Validation of the fragment, chunk size and external downloader settings
+- Sharing of the fragment thread cap between workers
+- External downloader selection and fallback
+"""
+
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tea.config import DEFAULT_CONFIG, validate_config
+from tea.constants import MAX_FRAGMENT_THREADS, MIN_HTTP_CHUNK_SIZE
+from tea.downloader import DownloadService
+from tea.exceptions import ValidationError
+from tea.metrics import Metrics
+from tea.pool import YoutubeDLPool
+
+
+def _service(make_download_service, **settings) -> DownloadService:
+    """Build a DownloadService with the given transfer settings."""
+    return make_download_service(config=settings, ydl_pool=YoutubeDLPool(metrics=Metrics()))
+
+
+@pytest.mark.unit
+class TestFragmentConfig:
+    """Test validation of the transfer settings."""
+
+    def test_defaults_are_valid(self):
+        """Test the default settings pass validation."""
+        assert validate_config(DEFAULT_CONFIG.copy()) is True
+
+    @pytest.mark.parametrize('value', [0, MAX_FRAGMENT_THREADS + 1, '4'])
+    def test_invalid_concurrent_fragments(self, value):
+        """Test fragment counts outside 1..MAX_FRAGMENT_THREADS are rejected."""
+        with pytest.raises(ValidationError):
+            validate_config({'concurrent_fragments': value})
+
+    def test_http_chunk_size(self):
+        """Test chunk sizes must be null or at least MIN_HTTP_CHUNK_SIZE."""
+        assert validate_config({'http_chunk_size': None}) is True
+        assert validate_config({'http_chunk_size': 10 * MIN_HTTP_CHUNK_SIZE}) is True
+        with pytest.raises(ValidationError):
+            validate_config({'http_chunk_size': 1024})
+
+    def test_external_downloader(self):
+        """Test only known external downloaders are accepted."""
+        assert validate_config({'external_downloader': 'aria2c'}) is True
+        with pytest.raises(ValidationError):
+            validate_config({'external_downloader': 'wget'})
+
+
+@pytest.mark.unit
+class TestTransferOptions:
+    """Test DownloadService._transfer_options."""
+
+    def test_single_worker(self, make_download_service):
+        """Test one worker gets the configured fragment count."""
+        options = _service(make_download_service, concurrent_fragments=8)._transfer_options(1)
+
+        assert options == {'concurrent_fragment_downloads': 8}
+
+    def test_workers_share_cap(self, make_download_service):
+        """Test fragments times workers stays within MAX_FRAGMENT_THREADS."""
+        service = _service(make_download_service, concurrent_fragments=MAX_FRAGMENT_THREADS)
+
+        for workers in range(1, 6):
+            fragments = service._transfer_options(workers)['concurrent_fragment_downloads']
+            assert fragments >= 1
+            assert fragments * workers <= MAX_FRAGMENT_THREADS
+
+    def test_http_chunk_size(self, make_download_service):
+        """Test a configured chunk size is passed to yt-dlp."""
+        service = _service(make_download_service, http_chunk_size=MIN_HTTP_CHUNK_SIZE)
+        options = service._transfer_options(1)
+
+        assert options['http_chunk_size'] == MIN_HTTP_CHUNK_SIZE
+
+    def test_external_downloader(self, make_download_service):
+        """Test an installed external downloader gets as many connections as fragments."""
+        service = _service(
+            make_download_service, concurrent_fragments=4, external_downloader='aria2c'
+        )
+
+        with patch('tea.downloader.shutil.which', return_value='/usr/bin/aria2c'):
+            options = service._transfer_options(2)
+
+        assert options['external_downloader'] == {'default': 'aria2c'}
+        assert options['external_downloader_args'] == {'aria2c': ['-x', '4', '-s', '4', '-k', '1M']}
+
+    def test_missing_external_downloader(self, mock_logger: MagicMock, make_download_service):
+        """Test a missing external downloader falls back to the built-in one."""
+        service = _service(make_download_service, external_downloader='aria2c')
+
+        with patch('tea.downloader.shutil.which', return_value=None):
+            options = service._transfer_options(1)
+
+        assert 'external_downloader' not in options
+        mock_logger.warning.assert_called_once()
+
+    def test_options_reach_youtubedl(self, make_download_service, temp_dir):
+        """Test a batch passes its worker count through to the downloader options."""
+        built: List[Dict] = []
+
+        class FakeYoutubeDL:
+            def __init__(self, options: Dict):
+                built.append(options)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                pass
+
+            def prepare_filename(self, info: Dict) -> str:
+                return 'Title.mp4'
+
+            def extract_info(self, url: str, download: bool = True, **kwargs) -> Dict:
+                return {'id': url[-11:], 'title': 'Title', 'ext': 'mp4'}
+
+        service = _service(make_download_service, concurrent_fragments=MAX_FRAGMENT_THREADS)
+        urls = [f'https://www.youtube.com/watch?v=video{i:06d}' for i in range(4)]
+
+        with patch('tea.downloader.YoutubeDL', FakeYoutubeDL):
+            service.download(urls, output_path=str(temp_dir), max_workers=4)
+
+        assert built
+        assert all(options['concurrent_fragment_downloads'] == MAX_FRAGMENT_THREADS // 4 for options in built)
@@ -8,15 +8,20 @@ Tests cover:
 - Checking duplicates
 - Displaying history
 - History clearing
+- Cached reads and the lookup index
 """
 
 import pytest
+import itertools
 import json
+import sys
+import threading
 from pathlib import Path
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from tea.history import HistoryManager, get_history_path
+from tea.info import canonical_url_key
 from tea.exceptions import HistoryError
 
 
@@ -270,3 +275,160 @@ class TestHistoryHelpers:
         path = get_history_path()
         assert path is not None
         assert "tea-history.json" in path
+
+
+@pytest.mark.unit
+class TestCanonicalHistory:
+    """Test history lookups across URL forms of the same video."""
+
+    def test_is_downloaded_matches_other_forms(self, temp_dir: Path):
+        """Test a video downloaded via one URL form is found via the others."""
+        history = HistoryManager(history_path=str(temp_dir / "history.json"))
+        history.add("https://youtu.be/dQw4w9WgXcQ", "Test Video", "downloads")
+
+        for url in (
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=30",
+            "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        ):
+            downloaded, info = history.is_downloaded(url)
+            assert downloaded is True
+            assert info["title"] == "Test Video"
+
+        assert history.is_downloaded("https://youtu.be/otherVideo1")[0] is False
+
+    def test_remove_matches_other_forms(self, temp_dir: Path):
+        """Test removing any form of a URL removes the history entry."""
+        history = HistoryManager(history_path=str(temp_dir / "history.json"))
+        history.add("https://youtu.be/dQw4w9WgXcQ", "Test Video", "downloads")
+
+        assert history.remove("https://www.youtube.com/watch?v=dQw4w9WgXcQ") is True
+        assert history.get_all_urls() == []
+
+
+@pytest.mark.unit
+class TestHistoryIndex:
+    """Test lookups do not re-read or re-scan an unchanged history."""
+
+    def _history(self, temp_dir: Path, count: int) -> HistoryManager:
+        """Create a history with count videos."""
+        history = HistoryManager(history_path=str(temp_dir / "history.json"))
+        for i in range(count):
+            history.add(f"https://youtu.be/v{i:010d}", f"Video {i}", "downloads")
+        return history
+
+    def test_lookups_use_index(self, temp_dir: Path):
+        """Test only the looked-up URL is canonicalized once the index is built."""
+        history = self._history(temp_dir, 20)
+        assert history.is_downloaded("https://youtu.be/v0000000003")[0] is True
+
+        with patch("tea.history.canonical_url_key", wraps=canonical_url_key) as key, \
+                patch("tea.history.json.load") as load:
+            assert history.is_downloaded("https://youtu.be/v0000000007")[0] is True
+            assert history.is_downloaded("https://youtu.be/missing0000")[0] is False
+
+        assert key.call_count == 2
+        load.assert_not_called()
+
+    def test_external_changes_are_read(self, temp_dir: Path):
+        """Test a history written by another process is picked up."""
+        history = self._history(temp_dir, 1)
+        assert history.is_downloaded("https://youtu.be/v0000000005")[0] is False
+
+        other = HistoryManager(history_path=history._history_path)
+        other.add("https://youtu.be/v0000000005", "Video 5", "downloads")
+
+        assert history.is_downloaded("https://www.youtube.com/watch?v=v0000000005")[0] is True
+
+    def test_remove_updates_index(self, temp_dir: Path):
+        """Test removed and re-added URLs are looked up correctly."""
+        history = self._history(temp_dir, 3)
+        history.is_downloaded("https://youtu.be/v0000000001")
+
+        assert history.remove("https://youtu.be/v0000000001") is True
+        assert history.is_downloaded("https://youtu.be/v0000000001")[0] is False
+        assert history.remove("https://youtu.be/v0000000001") is False
+        assert len(history.get_all_urls()) == 2
+
+        history.add("https://youtu.be/v0000000001", "Again", "downloads")
+        assert history.is_downloaded("https://youtu.be/v0000000001")[1]["title"] == "Again"
+
+    def test_find_file_uses_index(self, temp_dir: Path):
+        """Test find_file looks videos up without scanning the history again."""
+        history = self._history(temp_dir, 20)
+        video = temp_dir / "video.mp4"
+        video.write_bytes(b"video")
+        history.add("https://youtu.be/dQw4w9WgXcQ", "Video", "downloads", "dQw4w9WgXcQ", str(video))
+        assert history.find_file("dQw4w9WgXcQ")["file_path"] == str(video)
+
+        newer = temp_dir / "newer.mp4"
+        newer.write_bytes(b"newer")
+        history.add("https://youtu.be/dQw4w9WgXcQ", "Video", "other", "dQw4w9WgXcQ", str(newer))
+        with patch("tea.history.json.load") as load, patch.object(history, "_history", {}):
+            assert history.find_file("dQw4w9WgXcQ")["file_path"] == str(newer)
+            assert history.find_file("otherVideo1") is None
+        load.assert_not_called()
+
+        history.remove("https://youtu.be/dQw4w9WgXcQ")
+        assert history.find_file("dQw4w9WgXcQ") is None
+
+
+
+@pytest.mark.unit
+class TestFindFile:
+    """Test lookups of downloaded files by video ID."""
+
+    def test_find_file(self, temp_dir: Path):
+        """Test the newest existing file of a video is returned."""
+        history = HistoryManager(history_path=str(temp_dir / "history.json"))
+        old_file = temp_dir / "old.mp4"
+        new_file = temp_dir / "new.webm"
+        old_file.write_bytes(b"old")
+        new_file.write_bytes(b"new")
+        history.add("https://youtu.be/dQw4w9WgXcQ", "Video", "a", "dQw4w9WgXcQ", str(old_file))
+        history.add("https://youtu.be/dQw4w9WgXcQ", "Video", "b", "dQw4w9WgXcQ", str(new_file))
+
+        assert history.find_file("dQw4w9WgXcQ")["file_path"] == str(new_file)
+
+        new_file.unlink()
+        assert history.find_file("dQw4w9WgXcQ")["file_path"] == str(old_file)
+        assert history.find_file("otherVideo1") is None
+
+    def test_concurrent_lookups_and_adds(self, temp_dir: Path):
+        """Test workers can look up files while another thread adds entries."""
+        history = HistoryManager(history_path=str(temp_dir / "history.json"))
+        media = temp_dir / "video.mp4"
+        media.write_bytes(b"video")
+        # Every load() sees a changed file, as if another process wrote it
+        counter = itertools.count()
+        history._file_signature = lambda: (next(counter), 0)
+        stop = threading.Event()
+        errors = []
+
+        def look_up() -> None:
+            while not stop.is_set():
+                try:
+                    history.find_file("vid00000001")
+                    history.is_downloaded("https://youtu.be/vid00000001")
+                except Exception as error:
+                    errors.append(error)
+                    return
+
+        workers = [threading.Thread(target=look_up) for _ in range(3)]
+        interval = sys.getswitchinterval()
+        # Switch threads often so unguarded updates would interleave
+        sys.setswitchinterval(1e-6)
+        for worker in workers:
+            worker.start()
+        try:
+            for i in range(200):
+                video_id = f"vid{i:08d}"
+                history.add(f"https://youtu.be/{video_id}", "Video", "out", video_id, str(media))
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join(5)
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+        assert history.find_file("vid00000199")["file_path"] == str(media)
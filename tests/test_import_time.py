@@ -0,0 +1,90 @@
+"""
+Tests for CLI startup cost.
+
+Tests cover:
+- Heavy dependencies are not imported by ``import tea.cli``
+- Commands that never download or search do not load yt-dlp
+- Import time of ``tea.cli`` stays within budget
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Modules that must only be imported once a command needs them
+HEAVY_MODULES = ('yt_dlp', 'fuzzywuzzy', 'tea.ai')
+
+# Generous budget for cumulative ``import tea.cli`` time (yt-dlp alone costs more)
+IMPORT_BUDGET_US = 150_000
+
+
+def _run_python(code: str, cwd: Path) -> subprocess.CompletedProcess:
+    """Run a snippet in a fresh interpreter with the project on sys.path."""
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env={'PYTHONPATH': str(PROJECT_ROOT), 'PATH': ''},
+    )
+
+
+def _loaded_heavy_modules(code: str, cwd: Path) -> List[str]:
+    """Return the heavy modules loaded after running ``code``."""
+    check = (
+        f"{code}\n"
+        "import sys\n"
+        f"print('LOADED:' + ','.join(m for m in sys.modules if m.split('.')[0] in {HEAVY_MODULES!r} "
+        f"or m.startswith('tea.ai')))"
+    )
+    result = _run_python(check, cwd)
+    assert result.returncode == 0, result.stderr
+    loaded = result.stdout.rsplit('LOADED:', 1)[1].strip()
+    return [m for m in loaded.split(',') if m]
+
+
+def _cumulative_import_times(stderr: str) -> Dict[str, int]:
+    """Parse ``-X importtime`` output into module -> cumulative microseconds."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.unit
+@pytest.mark.slow
+class TestImportTime:
+    """Test that CLI startup stays light."""
+
+    def test_import_cli_skips_heavy_modules(self, temp_dir: Path):
+        """Test importing tea.cli does not import yt-dlp, fuzzywuzzy or AI modules."""
+        assert _loaded_heavy_modules("import tea.cli", temp_dir) == []
+
+    @pytest.mark.parametrize("arg", ["--help", "--history"])
+    def test_commands_skip_heavy_modules(self, temp_dir: Path, arg: str):
+        """Test commands that do not download or search never load yt-dlp."""
+        code = (
+            "import sys\n"
+            f"sys.argv = ['tea', {arg!r}]\n"
+            "from tea.cli import CLI\n"
+            "CLI().run()"
+        )
+        assert _loaded_heavy_modules(code, temp_dir) == []
+
+    def test_import_cli_within_budget(self, temp_dir: Path):
+        """Test cumulative import time of tea.cli stays within budget."""
+        # Take the best of a few runs to smooth out a cold disk cache
+        best = min(
+            _cumulative_import_times(_run_python("import tea.cli", temp_dir).stderr)['tea.cli']
+            for _ in range(3)
+        )
+        assert best < IMPORT_BUDGET_US
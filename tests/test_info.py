@@ -0,0 +1,88 @@
+"""
+Tests for URL parsing helpers in tea.info.
+
+Tests cover:
+- Video ID extraction from every YouTube URL form
+- Canonical keys for videos, playlists and channels
+- De-duplication of URL lists
+"""
+
+import pytest
+
+from tea.info import (
+    canonical_url_key, channel_key, dedupe_urls, extract_video_id, guess_content_type
+)
+
+
+@pytest.mark.unit
+class TestVideoIds:
+    """Test extract_video_id and canonical_url_key."""
+
+    @pytest.mark.parametrize("url", [
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?t=30",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtube.com/watch?v=dQw4w9WgXcQ&t=30s",
+        "https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://music.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        "https://www.youtube.com/live/dQw4w9WgXcQ?si=abc",
+        "  https://WWW.YouTube.com/watch?v=dQw4w9WgXcQ  ",
+    ])
+    def test_video_url_forms(self, url: str):
+        """Test every form of a video URL yields the same ID and key."""
+        assert extract_video_id(url) == "dQw4w9WgXcQ"
+        assert canonical_url_key(url) == "video:dQw4w9WgXcQ"
+
+    @pytest.mark.parametrize("url", [
+        "https://www.youtube.com/playlist?list=PLxyz",
+        "https://www.youtube.com/@creator",
+        "https://www.youtube.com/watch",
+        "https://example.com/watch?v=dQw4w9WgXcQ",
+        "not a url",
+        "",
+    ])
+    def test_no_video_id(self, url: str):
+        """Test non-video URLs have no video ID."""
+        assert extract_video_id(url) is None
+
+    def test_playlist_key(self):
+        """Test playlist URLs are keyed by list ID, even on a watch page."""
+        assert canonical_url_key("https://www.youtube.com/playlist?list=PLxyz") == "playlist:PLxyz"
+        assert canonical_url_key("https://www.youtube.com/watch?v=abc&list=PLxyz") == "playlist:PLxyz"
+
+    def test_channel_key(self):
+        """Test other URLs fall back to the URL without a trailing slash."""
+        assert canonical_url_key("https://www.youtube.com/@creator/") == "https://www.youtube.com/@creator"
+        assert guess_content_type("https://www.youtube.com/@creator") == "channel"
+
+    @pytest.mark.parametrize("url,info,expected", [
+        ("https://www.youtube.com/@Creator/videos", None, "channel:@creator"),
+        ("https://www.youtube.com/@creator/shorts", None, "channel:@creator"),
+        ("https://www.youtube.com/channel/UCabc/streams", None, "channel:UCabc"),
+        ("https://www.youtube.com/playlist?list=PLxyz", None, "playlist:PLxyz"),
+        ("https://youtu.be/dQw4w9WgXcQ", None, None),
+        ("https://youtu.be/dQw4w9WgXcQ", {"channel_id": "UCabc"}, "channel:UCabc"),
+        ("https://www.youtube.com/@creator", {"channel_id": "UCabc"}, "channel:UCabc"),
+    ])
+    def test_scheduling_channel_key(self, url: str, info, expected):
+        """Test every tab of a channel, and its videos once their info is known, share a key."""
+        assert channel_key(url, info) == expected
+
+    def test_dedupe_urls(self):
+        """Test duplicate forms collapse to the first one listed."""
+        urls = [
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=30",
+            "https://www.youtube.com/shorts/abc123",
+            "https://m.youtube.com/watch?v=abc123",
+            "https://www.youtube.com/playlist?list=PLxyz",
+        ]
+
+        assert dedupe_urls(urls) == [
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/shorts/abc123",
+            "https://www.youtube.com/playlist?list=PLxyz",
+        ]
@@ -0,0 +1,217 @@
+"""
+Tests for the download job queue.
+
+Tests cover:
+- Running jobs on worker threads
+- History recording and duplicate handling
+- Cancellation and bounded job retention
+- Workers moving on while jobs are post-processed
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict
+from unittest.mock import MagicMock
+
+import pytest
+
+from tea.constants import JOB_CANCELLED, JOB_DONE, JOB_FAILED, JOB_QUEUED, JOB_RUNNING
+from tea.exceptions import DownloadError, ValidationError
+from tea.history import HistoryManager
+from tea.jobs import JobQueue
+
+
+def _fake_download(url: str, output_path: str, thread_id: int, audio_only: bool, cleaner,
+                   **options) -> Dict:
+    """Stand-in for DownloadService.fetch."""
+    if 'fail' in url:
+        return {'url': url, 'success': False, 'count': 0, 'message': 'unavailable'}
+    if 'raise' in url:
+        raise DownloadError("Failed after 3 attempts", url=url)
+    return {'url': url, 'success': True, 'count': 1, 'title': f"Title {url[-1]}", 'message': 'ok'}
+
+
+@pytest.fixture
+def history(temp_dir: Path) -> HistoryManager:
+    """Create a HistoryManager backed by a temporary file."""
+    return HistoryManager(history_path=str(temp_dir / 'history.json'))
+
+
+@pytest.fixture
+def downloader() -> MagicMock:
+    """Create a mock DownloadService."""
+    service = MagicMock()
+    service.fetch.side_effect = _fake_download
+    return service
+
+
+@pytest.fixture
+def job_queue(downloader: MagicMock, history: HistoryManager):
+    """Create a started JobQueue and stop it after the test."""
+    jobs = JobQueue(download_service=downloader, history_manager=history, workers=2)
+    jobs.start()
+    yield jobs
+    jobs.stop(timeout=5)
+
+
+@pytest.mark.unit
+class TestJobQueue:
+    """Test JobQueue functionality."""
+
+    def test_invalid_worker_count(self, downloader: MagicMock, history: HistoryManager):
+        """Test worker count is validated."""
+        with pytest.raises(ValidationError):
+            JobQueue(download_service=downloader, history_manager=history, workers=0)
+
+    def test_runs_jobs_and_records_history(self, job_queue: JobQueue, history: HistoryManager):
+        """Test successful jobs finish and are added to history."""
+        job = job_queue.submit('https://youtu.be/video1', 'downloads', audio_only=True)
+
+        assert job_queue.wait_idle(timeout=5)
+        assert job.status == JOB_DONE
+        assert job.to_dict()['title'] == 'Title 1'
+        assert history.is_downloaded('https://youtu.be/video1')[0]
+
+    def test_failed_jobs(self, job_queue: JobQueue, history: HistoryManager):
+        """Test unsuccessful results and DownloadErrors mark jobs failed."""
+        failed = job_queue.submit('https://youtu.be/fail1', 'downloads')
+        raised = job_queue.submit('https://youtu.be/raise1', 'downloads')
+
+        assert job_queue.wait_idle(timeout=5)
+        assert failed.status == JOB_FAILED
+        assert failed.error == 'unavailable'
+        assert raised.status == JOB_FAILED
+        assert 'Failed after 3 attempts' in raised.error
+        assert history.get_all_urls() == []
+
+    def test_duplicate_skip(self, job_queue: JobQueue, history: HistoryManager):
+        """Test on_duplicate='skip' does not queue URLs already in history."""
+        history.add('https://youtu.be/video1', 'Video 1', 'downloads')
+
+        assert job_queue.submit('https://youtu.be/video1', 'downloads', on_duplicate='skip') is None
+        assert job_queue.list_jobs() == []
+
+    def test_duplicate_replace(self, job_queue: JobQueue, history: HistoryManager):
+        """Test on_duplicate='replace' removes the old entry and downloads again."""
+        history.add('https://youtu.be/video1', 'Old', 'downloads')
+
+        job = job_queue.submit('https://youtu.be/video1', 'downloads', on_duplicate='replace')
+
+        assert job_queue.wait_idle(timeout=5)
+        assert job.status == JOB_DONE
+        assert history.get_all_urls() == ['https://youtu.be/video1']
+
+    def test_same_video_queued_once(self, downloader: MagicMock, history: HistoryManager):
+        """Test another URL form of a queued video returns the existing job."""
+        jobs = JobQueue(download_service=downloader, history_manager=history, workers=1)
+
+        first = jobs.submit('https://youtu.be/video1', 'downloads')
+        second = jobs.submit('https://www.youtube.com/watch?v=video1&t=30', 'downloads')
+
+        assert second is first
+        assert len(jobs.list_jobs()) == 1
+
+    def test_cancel_queued_job(self, downloader: MagicMock, history: HistoryManager):
+        """Test queued jobs can be cancelled and are never run."""
+        release = threading.Event()
+        downloader.fetch.side_effect = (
+            lambda *args, **kwargs: release.wait(5) and _fake_download(*args, **kwargs)
+        )
+        jobs = JobQueue(download_service=downloader, history_manager=history, workers=1)
+        jobs.start()
+        try:
+            first = jobs.submit('https://youtu.be/video1', 'downloads')
+            second = jobs.submit('https://youtu.be/video2', 'downloads')
+
+            assert jobs.cancel(second.id)
+            assert not jobs.cancel(second.id)
+            assert jobs.pending_urls() == {'https://youtu.be/video1'}
+
+            release.set()
+            assert jobs.wait_idle(timeout=5)
+        finally:
+            jobs.stop(timeout=5)
+
+        assert first.status == JOB_DONE
+        assert second.status == JOB_CANCELLED
+        assert downloader.fetch.call_count == 1
+
+    def test_worker_moves_on_during_postprocessing(
+        self, downloader: MagicMock, history: HistoryManager
+    ):
+        """Test a job being post-processed frees its worker and finishes when the Future does."""
+        postprocessing: Future = Future()
+        fetched = threading.Event()
+
+        def fetch(url: str, *args, **kwargs):
+            if url.endswith('video1'):
+                return postprocessing
+            fetched.set()
+            return _fake_download(url, *args, **kwargs)
+
+        downloader.fetch.side_effect = fetch
+        jobs = JobQueue(download_service=downloader, history_manager=history, workers=1)
+        jobs.start()
+        try:
+            first = jobs.submit('https://youtu.be/video1', 'downloads')
+            jobs.submit('https://youtu.be/video2', 'downloads')
+
+            assert fetched.wait(5)
+            assert first.status == JOB_RUNNING
+            assert not history.is_downloaded('https://youtu.be/video1')[0]
+
+            postprocessing.set_result(
+                _fake_download('https://youtu.be/video1', 'downloads', 1, False, None)
+            )
+            assert jobs.wait_idle(timeout=5)
+        finally:
+            jobs.stop(timeout=5)
+
+        assert first.status == JOB_DONE
+        assert history.is_downloaded('https://youtu.be/video1')[0]
+
+    def test_postprocessing_failure(self, downloader: MagicMock, history: HistoryManager):
+        """Test a job whose post-processing raises fails, and stop() waits for it."""
+        postprocessing: Future = Future()
+        downloader.fetch.side_effect = lambda *args, **kwargs: postprocessing
+        jobs = JobQueue(download_service=downloader, history_manager=history, workers=1)
+        jobs.start()
+        job = jobs.submit('https://youtu.be/video1', 'downloads')
+        while downloader.fetch.call_count == 0:
+            time.sleep(0.01)
+
+        threading.Timer(0.1, postprocessing.set_exception,
+                        [DownloadError("Post-processing failed", url=job.url)]).start()
+        jobs.stop(timeout=5)
+
+        assert job.status == JOB_FAILED
+        assert 'Post-processing failed' in job.error
+
+    def test_counts_and_listing(self, job_queue: JobQueue):
+        """Test job counts and status filtering."""
+        job_queue.submit('https://youtu.be/video1', 'downloads')
+        job_queue.submit('https://youtu.be/fail2', 'downloads')
+        assert job_queue.wait_idle(timeout=5)
+
+        counts = job_queue.counts()
+        assert counts[JOB_DONE] == 1
+        assert counts[JOB_FAILED] == 1
+        assert counts[JOB_QUEUED] == 0
+        assert [job.url for job in job_queue.list_jobs(JOB_FAILED)] == ['https://youtu.be/fail2']
+
+    def test_finished_jobs_are_bounded(self, downloader: MagicMock, history: HistoryManager):
+        """Test only the newest finished jobs are kept."""
+        jobs = JobQueue(
+            download_service=downloader, history_manager=history, workers=1, max_finished=2
+        )
+        jobs.start()
+        try:
+            submitted = [jobs.submit(f'https://youtu.be/fail{i}', 'downloads') for i in range(4)]
+            assert jobs.wait_idle(timeout=5)
+        finally:
+            jobs.stop(timeout=5)
+
+        assert [job.id for job in jobs.list_jobs()] == [job.id for job in submitted[2:]]
+        assert jobs.get(submitted[0].id) is None
@@ -0,0 +1,148 @@
+"""
+Tests for pipeline metrics.
+
+Tests cover:
+- Counters and stage timers of the Metrics registry
+- JSON run reports and the Prometheus text format
+- Byte counting and postprocessor timing in ProgressReporter
+- Stage timers recorded by DownloadService
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from tea.downloader import DownloadService
+from tea.metrics import Metrics
+from tea.progress import ProgressReporter
+
+
+@pytest.mark.unit
+class TestMetrics:
+    """Test the Metrics registry."""
+
+    def test_counters(self):
+        """Test counters add up per label set."""
+        metrics = Metrics()
+        metrics.inc('cache_hits', cache='info')
+        metrics.inc('cache_hits', cache='info')
+        metrics.inc('downloaded_bytes', 1024)
+
+        assert metrics.counter('cache_hits', cache='info') == 2
+        assert metrics.counter('cache_hits', cache='media_store') == 0
+        assert metrics.counter('downloaded_bytes') == 1024
+
+    def test_stage_timer_records_on_error(self):
+        """Test a failing stage is still timed."""
+        metrics = Metrics()
+        with pytest.raises(RuntimeError):
+            with metrics.time('download'):
+                raise RuntimeError("boom")
+        metrics.observe('download', 2.0)
+
+        stage = metrics.report()['stages']['download']
+        assert stage['count'] == 2
+        assert stage['max_seconds'] == 2.0
+        assert stage['total_seconds'] >= 2.0
+
+    def test_report_is_json(self, temp_dir: Path):
+        """Test the run report is written as JSON."""
+        metrics = Metrics()
+        metrics.inc('retries')
+        metrics.observe('probe', 0.5)
+        path = temp_dir / 'report.json'
+
+        metrics.write_report(str(path))
+
+        report = json.loads(path.read_text())
+        assert report['counters']['retries'] == [{'labels': {}, 'value': 1}]
+        assert report['stages']['probe']['mean_seconds'] == 0.5
+        assert 'elapsed_seconds' in report
+
+    def test_prometheus_text(self):
+        """Test counters, stages and extra gauges are exported."""
+        metrics = Metrics()
+        metrics.inc('downloads', result='ok')
+        metrics.inc('downloads', result='failed')
+        metrics.observe('split', 1.5)
+
+        text = metrics.to_prometheus(extra={'jobs': {(('status', 'queued'),): 3}})
+
+        assert '# TYPE tea_downloads_total counter' in text
+        assert text.count('# TYPE tea_downloads_total') == 1
+        assert 'tea_downloads_total{result="ok"} 1' in text
+        assert 'tea_stage_seconds_count{stage="split"} 1' in text
+        assert 'tea_stage_seconds_sum{stage="split"} 1.500000' in text
+        assert 'tea_stage_seconds_max{stage="split"} 1.500000' in text
+        assert 'tea_jobs{status="queued"} 3' in text
+
+    def test_prometheus_values_are_exact(self):
+        """Test large counters keep every digit and fractions are not rounded."""
+        metrics = Metrics()
+        metrics.inc('downloaded_bytes', 1234567891)
+
+        text = metrics.to_prometheus(extra={'ratio': {(): 0.1234567891}, 'limit': {(): float('inf')}})
+
+        assert 'tea_downloaded_bytes_total 1234567891\n' in text
+        assert 'tea_ratio 0.1234567891\n' in text
+        assert 'tea_limit +Inf\n' in text
+
+    def test_reset(self):
+        """Test reset() clears recorded values."""
+        metrics = Metrics()
+        metrics.inc('retries')
+        metrics.reset()
+        assert metrics.report()['counters'] == {}
+
+
+@pytest.mark.unit
+class TestProgressMetrics:
+    """Test metrics recorded by ProgressReporter."""
+
+    def test_finished_download_counts_bytes(self):
+        """Test finished downloads add to downloaded_bytes."""
+        metrics = Metrics()
+        reporter = ProgressReporter(metrics=metrics)
+
+        reporter.progress_hook({'status': 'finished', 'filename': 'a.mp4', 'total_bytes': 5000})
+
+        assert metrics.counter('downloaded_bytes') == 5000
+
+    def test_postprocessor_hook_times_stages(self):
+        """Test merging and other postprocessors are timed separately."""
+        metrics = Metrics()
+        reporter = ProgressReporter(metrics=metrics)
+
+        for postprocessor in ('Merger', 'FFmpegMetadata'):
+            reporter.postprocessor_hook({'status': 'started', 'postprocessor': postprocessor})
+            reporter.postprocessor_hook({'status': 'finished', 'postprocessor': postprocessor})
+
+        stages = metrics.report()['stages']
+        assert stages['merge']['count'] == 1
+        assert stages['postprocess']['count'] == 1
+
+
+@pytest.mark.unit
+class TestDownloadMetrics:
+    """Test metrics recorded by DownloadService."""
+
+    def test_download_records_stages_and_results(self, temp_dir: Path, make_download_service):
+        """Test probe, download and history stages and result counters."""
+        metrics = Metrics()
+        info = MagicMock()
+        info.get_info.return_value = ('video', {})
+        info.get_content_type.return_value = 'video'
+        service = make_download_service(info_extractor=info, metrics=metrics)
+        ydl = MagicMock()
+        ydl.__enter__.return_value = ydl
+        ydl.extract_info.return_value = {'id': 'abc', 'title': 'A Title'}
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('tea.downloader.YoutubeDL', MagicMock(return_value=ydl))
+            service.download(['https://www.youtube.com/watch?v=dQw4w9WgXcQ'], str(temp_dir))
+
+        stages = metrics.report()['stages']
+        assert {'probe', 'download', 'history_write'} <= set(stages)
+        assert metrics.counter('downloads', result='ok') == 1
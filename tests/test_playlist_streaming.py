@@ -0,0 +1,275 @@
+"""
+Tests for streaming playlist and channel downloads.
+
+Tests cover:
+- Lazy enumeration of playlist entries
+- Incremental counts and failed entries
+- Nested channel tabs
+- Resuming after a failed attempt
+- Incremental sync against the download archive
+"""
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tea.downloader import DownloadService
+from tea.history import HistoryManager
+
+
+def _entries(ids: List[str], log: List[str]) -> Iterator[Dict]:
+    """Generate flat entries, logging when each one is pulled."""
+    for video_id in ids:
+        log.append(f'enumerate {video_id}')
+        yield {
+            '_type': 'url',
+            'ie_key': 'Youtube',
+            'id': video_id,
+            'url': f'https://www.youtube.com/watch?v={video_id}',
+            'title': f'Title {video_id}',
+        }
+
+
+class _FakeYoutubeDL:
+    """Minimal YoutubeDL stand-in for streaming downloads."""
+
+    def __init__(self, playlists: Dict[str, Dict], log: List[str], fail: Optional[set] = None):
+        self.playlists = playlists
+        self.log = log
+        self.fail = fail or set()
+        self.extra_info: List[Dict] = []
+
+    def __call__(self, options: Dict) -> '_FakeYoutubeDL':
+        return self
+
+    def __enter__(self) -> '_FakeYoutubeDL':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def extract_info(self, url: str, download: bool = True, ie_key=None, extra_info=None,
+                     process: bool = True) -> Optional[Dict]:
+        assert process is False, "playlists must be enumerated without processing"
+        return self.playlists.get(url)
+
+    def process_ie_result(self, ie_result: Dict, download: bool = True,
+                          extra_info: Optional[Dict] = None) -> Optional[Dict]:
+        self.log.append(f"download {ie_result['id']}")
+        self.extra_info.append(extra_info or {})
+        if ie_result['id'] in self.fail:
+            return None
+        return {'id': ie_result['id'], 'title': ie_result['title'], 'extractor_key': 'Youtube',
+                'upload_date': '2024010' + str(len(self.extra_info))}
+
+
+@pytest.fixture
+def service(make_download_service) -> DownloadService:
+    """Create a DownloadService that treats test URLs as playlists or channels."""
+    info = MagicMock()
+    info.get_info.side_effect = lambda url: ('channel' if '@' in url else 'playlist', {})
+    return make_download_service(info_extractor=info)
+
+
+PLAYLIST_URL = 'https://www.youtube.com/playlist?list=PLtest'
+
+
+@pytest.mark.unit
+class TestPlaylistStreaming:
+    """Test entry-by-entry playlist downloads."""
+
+    def test_entries_are_downloaded_as_enumerated(self, service: DownloadService, temp_dir: Path):
+        """Test each entry is downloaded before the next one is fetched."""
+        log: List[str] = []
+        ydl = _FakeYoutubeDL(
+            {PLAYLIST_URL: {'_type': 'playlist', 'id': 'PLtest', 'title': 'Mix',
+                            'entries': _entries(['a', 'b', 'c'], log)}},
+            log,
+        )
+
+        with patch('tea.downloader.YoutubeDL', ydl):
+            result = service.download_single_video(PLAYLIST_URL, str(temp_dir))
+
+        assert log == ['enumerate a', 'download a', 'enumerate b', 'download b',
+                       'enumerate c', 'download c']
+        assert result['success'] is True
+        assert result['count'] == 3
+        assert result['type'] == 'playlist'
+        assert [extra['playlist_index'] for extra in ydl.extra_info] == [1, 2, 3]
+        assert ydl.extra_info[0]['playlist_title'] == 'Mix'
+
+    def test_failed_entries_are_counted(self, service: DownloadService, temp_dir: Path, capsys):
+        """Test unavailable entries are reported without stopping the rest."""
+        log: List[str] = []
+        ydl = _FakeYoutubeDL(
+            {PLAYLIST_URL: {'_type': 'playlist', 'title': 'Mix',
+                            'entries': _entries(['a', 'b', 'c'], log)}},
+            log,
+            fail={'b'},
+        )
+
+        with patch('tea.downloader.YoutubeDL', ydl):
+            result = service.download_single_video(PLAYLIST_URL, str(temp_dir))
+
+        assert result['count'] == 2
+        assert result['failed'] == 1
+        assert '(1 downloaded, 1 failed)' in capsys.readouterr().out
+
+    def test_empty_playlist(self, service: DownloadService, temp_dir: Path):
+        """Test an empty playlist is reported as a failure."""
+        ydl = _FakeYoutubeDL({PLAYLIST_URL: {'_type': 'playlist', 'title': 'Mix', 'entries': []}}, [])
+
+        with patch('tea.downloader.YoutubeDL', ydl):
+            result = service.download_single_video(PLAYLIST_URL, str(temp_dir))
+
+        assert result['success'] is False
+        assert 'empty or private' in result['message']
+
+    def test_channel_tabs_are_expanded(self, service: DownloadService, temp_dir: Path):
+        """Test a channel's tab entries are enumerated in place."""
+        log: List[str] = []
+        channel_url = 'https://www.youtube.com/@creator'
+        videos_url = 'https://www.youtube.com/@creator/videos'
+        ydl = _FakeYoutubeDL(
+            {
+                channel_url: {'_type': 'playlist', 'title': 'Creator', 'entries': [
+                    {'_type': 'url', 'url': videos_url, 'ie_key': 'YoutubeTab'},
+                ]},
+                videos_url: {'_type': 'playlist', 'title': 'Creator - Videos',
+                             'entries': _entries(['a', 'b'], log)},
+            },
+            log,
+        )
+
+        with patch('tea.downloader.YoutubeDL', ydl):
+            result = service.download_single_video(channel_url, str(temp_dir))
+
+        assert result['count'] == 2
+        assert result['type'] == 'channel'
+        assert [line for line in log if line.startswith('download')] == ['download a', 'download b']
+
+    def test_retry_resumes_after_completed_entries(self, service: DownloadService, temp_dir: Path):
+        """Test a retry after an enumeration error skips entries already done."""
+        log: List[str] = []
+
+        def flaky_entries() -> Iterator[Dict]:
+            yield from _entries(['a'], log)
+            raise ConnectionError("page fetch failed")
+
+        attempts = iter([flaky_entries(), _entries(['a', 'b'], log)])
+
+        class _Flaky(_FakeYoutubeDL):
+            def extract_info(self, url, download=True, ie_key=None, extra_info=None, process=True):
+                return {'_type': 'playlist', 'title': 'Mix', 'entries': next(attempts)}
+
+        ydl = _Flaky({}, log)
+        with patch('tea.downloader.YoutubeDL', ydl), patch('tea.downloader.time.sleep'):
+            result = service.download_single_video(PLAYLIST_URL, str(temp_dir))
+
+        assert [line for line in log if line.startswith('download')] == ['download a', 'download b']
+        assert result['count'] == 2
+
+
+@pytest.fixture
+def sync_service(service: DownloadService, temp_dir: Path) -> DownloadService:
+    """Use a real HistoryManager (and archive) in a temporary directory."""
+    service._history = HistoryManager(history_path=str(temp_dir / 'history.json'))
+    return service
+
+
+CHANNEL_URL = 'https://www.youtube.com/@creator'
+
+
+@pytest.mark.unit
+class TestIncrementalSync:
+    """Test --sync downloads against the download archive."""
+
+    def _channel(self, ids: List[str], log: List[str]) -> _FakeYoutubeDL:
+        """Build a fake channel listing the given IDs newest-first."""
+        return _FakeYoutubeDL(
+            {CHANNEL_URL: {'_type': 'playlist', 'id': 'UCcreator', 'title': 'Creator',
+                           'entries': _entries(ids, log)}},
+            log,
+        )
+
+    def test_downloads_are_archived(self, sync_service: DownloadService, temp_dir: Path):
+        """Test every streamed download is recorded in the archive."""
+        with patch('tea.downloader.YoutubeDL', self._channel(['a', 'b'], [])):
+            sync_service.download_single_video(CHANNEL_URL, str(temp_dir))
+
+        assert sync_service._history.archive.contains('a')
+        assert sync_service._history.archive.contains('b')
+
+    def test_channel_sync_stops_at_archived_videos(self, sync_service: DownloadService, temp_dir):
+        """Test a channel sync fetches new uploads and stops enumerating after known ones."""
+        archive = sync_service._history.archive
+        for video_id in ['c', 'd', 'e', 'f']:
+            archive.add(video_id)
+
+        log: List[str] = []
+        with patch('tea.downloader.YoutubeDL', self._channel(['new1', 'new2', 'c', 'd', 'e', 'f'], log)):
+            result = sync_service.download_single_video(CHANNEL_URL, str(temp_dir), sync=True)
+
+        assert [line for line in log if line.startswith('download')] == ['download new1', 'download new2']
+        assert 'enumerate f' not in log
+        assert result['count'] == 2
+        assert result['skipped'] == 3
+        mark = archive.get_mark('UCcreator')
+        assert mark['latest_id'] == 'new1'
+        assert mark['count'] == 2
+
+    def test_failed_newest_upload_is_retried(self, sync_service: DownloadService, temp_dir: Path):
+        """Test a newest upload that failed is downloaded by the next sync."""
+        archive = sync_service._history.archive
+        archive.add('old')
+
+        log: List[str] = []
+        ydl = self._channel(['new1', 'new2', 'old'], log)
+        ydl.fail = {'new1'}
+        with patch('tea.downloader.YoutubeDL', ydl):
+            sync_service.download_single_video(CHANNEL_URL, str(temp_dir), sync=True)
+
+        assert not archive.contains('new1')
+        assert archive.get_mark('UCcreator')['latest_id'] == 'new2'
+
+        log.clear()
+        with patch('tea.downloader.YoutubeDL', self._channel(['new1', 'new2', 'old'], log)):
+            result = sync_service.download_single_video(CHANNEL_URL, str(temp_dir), sync=True)
+
+        assert [line for line in log if line.startswith('download')] == ['download new1']
+        assert result['count'] == 1
+        assert archive.contains('new1')
+
+    def test_up_to_date_channel(self, sync_service: DownloadService, temp_dir: Path):
+        """Test a sync with nothing new succeeds without downloading."""
+        for video_id in ['a', 'b', 'c']:
+            sync_service._history.archive.add(video_id)
+
+        log: List[str] = []
+        with patch('tea.downloader.YoutubeDL', self._channel(['a', 'b', 'c', 'd'], log)):
+            result = sync_service.download_single_video(CHANNEL_URL, str(temp_dir), sync=True)
+
+        assert result['success'] is True
+        assert result['count'] == 0
+        assert 'up to date' in result['message']
+        assert 'enumerate d' not in log
+
+    def test_playlist_sync_skips_without_stopping(self, sync_service: DownloadService, temp_dir):
+        """Test playlists (not newest-first) skip archived entries but check every entry."""
+        for video_id in ['a', 'b', 'c']:
+            sync_service._history.archive.add(video_id)
+
+        log: List[str] = []
+        ydl = _FakeYoutubeDL(
+            {PLAYLIST_URL: {'_type': 'playlist', 'title': 'Mix',
+                            'entries': _entries(['a', 'b', 'c', 'new'], log)}},
+            log,
+        )
+        with patch('tea.downloader.YoutubeDL', ydl):
+            result = sync_service.download_single_video(PLAYLIST_URL, str(temp_dir), sync=True)
+
+        assert [line for line in log if line.startswith('download')] == ['download new']
+        assert ydl.extra_info[0]['playlist_index'] == 4
+        assert result['count'] == 1
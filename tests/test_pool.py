@@ -0,0 +1,139 @@
+"""
+Tests for the YoutubeDL pool.
+
+Tests cover:
+- Reuse of instances per profile and options
+- Exclusive checkout across threads
+- Closing failed, evicted and idle instances
+- Reuse across a batch of downloads
+"""
+
+import threading
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tea.metrics import Metrics
+from tea.pool import YoutubeDLPool
+
+
+class _FakeYoutubeDL:
+    """Records how many instances were built and closed."""
+
+    built: List['_FakeYoutubeDL'] = []
+
+    def __init__(self, options: Dict):
+        self.options = options
+        self.closed = False
+        _FakeYoutubeDL.built.append(self)
+
+    def __enter__(self) -> '_FakeYoutubeDL':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.closed = True
+
+    def prepare_filename(self, info: Dict) -> str:
+        return f"{info.get('title', 'NA')}.mp4"
+
+    def extract_info(self, url: str, download: bool = True, **kwargs) -> Dict:
+        return {'id': url[-11:], 'title': 'Title', 'ext': 'mp4'}
+
+
+@pytest.fixture(autouse=True)
+def reset_fake():
+    """Forget instances built by earlier tests."""
+    _FakeYoutubeDL.built = []
+
+
+@pytest.mark.unit
+class TestYoutubeDLPool:
+    """Test YoutubeDLPool."""
+
+    def test_reuses_same_options(self):
+        """Test an instance is reused for the same profile and options."""
+        metrics = Metrics()
+        pool = YoutubeDLPool(metrics=metrics)
+
+        with pool.acquire('probe', {'quiet': True}, _FakeYoutubeDL) as first:
+            pass
+        with pool.acquire('probe', {'quiet': True}, _FakeYoutubeDL) as second:
+            pass
+
+        assert first is second
+        assert len(_FakeYoutubeDL.built) == 1
+        assert metrics.counter('cache_hits', cache='ytdlp') == 1
+        assert metrics.counter('cache_misses', cache='ytdlp') == 1
+
+    def test_separates_profiles_and_options(self):
+        """Test different profiles or options get their own instances."""
+        pool = YoutubeDLPool(metrics=Metrics())
+
+        with pool.acquire('probe', {'quiet': True}, _FakeYoutubeDL):
+            pass
+        with pool.acquire('search', {'quiet': True}, _FakeYoutubeDL):
+            pass
+        with pool.acquire('probe', {'quiet': False}, _FakeYoutubeDL):
+            pass
+
+        assert len(_FakeYoutubeDL.built) == 3
+        assert len(pool) == 3
+
+    def test_exclusive_checkout(self):
+        """Test concurrent workers never share an instance."""
+        pool = YoutubeDLPool(metrics=Metrics())
+        barrier = threading.Barrier(3)
+        used: List[_FakeYoutubeDL] = []
+
+        def worker():
+            with pool.acquire('download-video', {'format': 'best'}, _FakeYoutubeDL) as ydl:
+                used.append(ydl)
+                barrier.wait(timeout=5)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(ydl) for ydl in used}) == 3
+        assert len(pool) == 3
+
+    def test_failed_instance_is_closed(self):
+        """Test an instance whose block raised is closed, not reused."""
+        pool = YoutubeDLPool(metrics=Metrics())
+
+        with pytest.raises(RuntimeError):
+            with pool.acquire('probe', {}, _FakeYoutubeDL):
+                raise RuntimeError('network down')
+
+        assert _FakeYoutubeDL.built[0].closed
+        assert len(pool) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test idle instances beyond max_idle are closed, oldest first."""
+        pool = YoutubeDLPool(max_idle=2, metrics=Metrics())
+
+        for index in range(3):
+            with pool.acquire('probe', {'index': index}, _FakeYoutubeDL):
+                pass
+
+        assert [ydl.closed for ydl in _FakeYoutubeDL.built] == [True, False, False]
+        pool.close()
+        assert all(ydl.closed for ydl in _FakeYoutubeDL.built)
+        assert len(pool) == 0
+
+    def test_batch_reuses_download_instances(self, make_download_service, temp_dir):
+        """Test a batch of videos builds one downloader per worker, not per video."""
+        info = MagicMock(**{'get_info.return_value': ('video', {}), 'get_content_type.return_value': 'video'})
+        service = make_download_service(
+            info_extractor=info, ydl_pool=YoutubeDLPool(metrics=Metrics())
+        )
+        urls = [f'https://www.youtube.com/watch?v=video{i:06d}' for i in range(6)]
+
+        with patch('tea.downloader.YoutubeDL', _FakeYoutubeDL):
+            results = service.download(urls, output_path=str(temp_dir), max_workers=1)
+
+        assert all(result['success'] for result in results)
+        assert len(_FakeYoutubeDL.built) == 1
@@ -0,0 +1,234 @@
+"""
+Tests for the post-processing stage.
+
+Tests cover:
+- PostProcessPool jobs and its bounded queue
+- Downloads fetching without postprocessors and post-processing afterwards
+- Network workers moving on while earlier downloads are post-processed
+- Post-processing failures
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from tea.downloader import DownloadService
+from tea.metrics import Metrics
+from tea.pool import YoutubeDLPool
+from tea.postprocess import PostProcessPool
+
+
+@pytest.mark.unit
+class TestPostProcessPool:
+    """Test PostProcessPool."""
+
+    def test_submit_returns_result(self):
+        """Test jobs run on a worker and return their result."""
+        pool = PostProcessPool(workers=2, metrics=Metrics())
+        try:
+            assert pool.submit(lambda a, b: a + b, 1, b=2).result(timeout=5) == 3
+            assert pool.workers == 2
+        finally:
+            pool.shutdown()
+
+    def test_full_queue_blocks_submit(self):
+        """Test submit waits while the worker and the queue are taken."""
+        metrics = Metrics()
+        pool = PostProcessPool(workers=1, queue_size=1, metrics=metrics)
+        release = threading.Event()
+        try:
+            pool.submit(release.wait, 5)
+            pool.submit(lambda: None)
+            submitted = threading.Event()
+            threading.Thread(target=lambda: (pool.submit(lambda: None), submitted.set())).start()
+
+            assert not submitted.wait(0.2)
+            release.set()
+            assert submitted.wait(5)
+            assert metrics.counter('postprocess_queue_full') == 1
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_failed_job_frees_its_slot(self):
+        """Test a job that raises does not keep its queue slot."""
+        pool = PostProcessPool(workers=1, queue_size=0, metrics=Metrics())
+        try:
+            with pytest.raises(ValueError):
+                pool.submit(int, 'x').result(timeout=5)
+            assert pool.submit(int, '1').result(timeout=5) == 1
+        finally:
+            pool.shutdown()
+
+
+class _FakeYoutubeDL:
+    """YoutubeDL stand-in that logs downloads and post-processing."""
+
+    def __init__(self, log: List[str], postprocess_gate: Optional[threading.Event] = None,
+                 fail: bool = False):
+        self.log = log
+        self.options: List[Dict] = []
+        self.postprocess_gate = postprocess_gate
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def __call__(self, options: Dict) -> '_FakeYoutubeDL':
+        self.options.append(options)
+        return self
+
+    def __enter__(self) -> '_FakeYoutubeDL':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def extract_info(self, url: str, download: bool = True, **kwargs) -> Dict:
+        video_id = url[-11:]
+        with self.lock:
+            self.log.append(f'download {video_id}')
+        return {'id': video_id, 'title': f'Title {video_id}',
+                'requested_downloads': [{'filepath': f'{video_id}.webm'}]}
+
+    def post_process(self, filename: str, info: Dict) -> Dict:
+        if self.postprocess_gate is not None:
+            # Hold the first file until the next download has started
+            assert self.postprocess_gate.wait(5), 'next download did not start'
+        if self.fail:
+            raise RuntimeError('ffmpeg exited with code 1')
+        with self.lock:
+            self.log.append(f'postprocess {filename}')
+        return {**info, 'filepath': filename.replace('.webm', '.mp3')}
+
+
+@pytest.mark.unit
+class TestPipelinedDownloads:
+    """Test downloads run as a network stage and a post-processing stage."""
+
+    @pytest.fixture
+    def pool(self):
+        """Create a post-processing pool for one test."""
+        pool = PostProcessPool(workers=2, metrics=Metrics())
+        yield pool
+        pool.shutdown()
+
+    def _service(self, make_download_service, pool: PostProcessPool) -> DownloadService:
+        """Build a DownloadService with its own post-processing pool."""
+        return make_download_service(
+            ydl_pool=YoutubeDLPool(metrics=Metrics()), postprocess_pool=pool
+        )
+
+    def test_postprocessors_run_in_second_stage(self, make_download_service, pool, temp_dir: Path):
+        """Test streams are fetched without postprocessors, which run afterwards."""
+        log: List[str] = []
+        ydl = _FakeYoutubeDL(log)
+        service = self._service(make_download_service, pool)
+
+        with patch('tea.downloader.YoutubeDL', ydl):
+            result = service.download_single_video(
+                'https://youtu.be/aaaaaaaaaaa', str(temp_dir), audio_only=True
+            )
+
+        assert log == ['download aaaaaaaaaaa', 'postprocess aaaaaaaaaaa.webm']
+        fetch, postprocess = ydl.options
+        assert fetch['postprocessors'] == []
+        assert postprocess['postprocessors'][0]['key'] == 'FFmpegExtractAudio'
+        assert result['filepath'] == 'aaaaaaaaaaa.mp3'
+
+    def test_worker_moves_on_during_postprocessing(
+        self, make_download_service, pool, temp_dir: Path
+    ):
+        """Test a network worker starts the next download while the last one is post-processed."""
+        log: List[str] = []
+        gate = threading.Event()
+        ydl = _FakeYoutubeDL(log, postprocess_gate=gate)
+        fetch = ydl.extract_info
+
+        def extract_info(url: str, download: bool = True, **kwargs) -> Dict:
+            info = fetch(url, download, **kwargs)
+            if url.endswith('bbbbbbbbbbb'):
+                gate.set()
+            return info
+
+        ydl.extract_info = extract_info
+        service = self._service(make_download_service, pool)
+        urls = ['https://youtu.be/aaaaaaaaaaa', 'https://youtu.be/bbbbbbbbbbb']
+
+        with patch('tea.downloader.YoutubeDL', ydl):
+            results = service.download(urls, str(temp_dir), max_workers=1, audio_only=True)
+
+        assert log.index('download bbbbbbbbbbb') < log.index('postprocess aaaaaaaaaaa.webm')
+        assert [result['success'] for result in results] == [True, True]
+        assert service._history.add.call_count == 2
+
+    def test_playlist_entries_are_pipelined(self, make_download_service, pool, temp_dir: Path):
+        """Test playlist entries are all post-processed and counted."""
+        log: List[str] = []
+        ydl = _FakeYoutubeDL(log)
+        playlist = {
+            '_type': 'playlist', 'id': 'PLtest', 'title': 'Mix',
+            'entries': [{'_type': 'url', 'id': video_id, 'title': video_id, 'url': video_id}
+                        for video_id in ('aaaaaaaaaaa', 'bbbbbbbbbbb')],
+        }
+        ydl.extract_info = lambda url, download=True, **kwargs: playlist
+        ydl.process_ie_result = lambda entry, download=True, extra_info=None: {
+            'id': entry['id'], 'title': entry['title'],
+            'requested_downloads': [{'filepath': f"{entry['id']}.webm"}],
+        }
+        service = self._service(make_download_service, pool)
+        service._info.get_info.return_value = ('playlist', {})
+
+        with patch('tea.downloader.YoutubeDL', ydl):
+            result = service.download_single_video(
+                'https://www.youtube.com/playlist?list=PLtest', str(temp_dir), audio_only=True
+            )
+
+        assert result['count'] == 2
+        assert sorted(log) == ['postprocess aaaaaaaaaaa.webm', 'postprocess bbbbbbbbbbb.webm']
+
+    def test_postprocessing_failure(self, make_download_service, pool, temp_dir: Path):
+        """Test a failed postprocessor fails the download without retrying it."""
+        log: List[str] = []
+        service = self._service(make_download_service, pool)
+
+        with patch('tea.downloader.YoutubeDL', _FakeYoutubeDL(log, fail=True)):
+            results = service.download(['https://youtu.be/aaaaaaaaaaa'], str(temp_dir), max_workers=1)
+
+        assert log == ['download aaaaaaaaaaa']
+        assert results[0]['success'] is False
+        assert 'Post-processing failed' in results[0]['message']
+
+    @pytest.mark.parametrize("failing,count,success", [({'bbbbbbbbbbb'}, 1, True),
+                                                       ({'aaaaaaaaaaa', 'bbbbbbbbbbb'}, 0, False)])
+    def test_failed_entry_of_resolved_playlist(self, make_download_service, pool, temp_dir: Path,
+                                               failing, count: int, success: bool):
+        """Test entries of a playlist yt-dlp downloaded at once are not counted if conversion fails."""
+        log: List[str] = []
+        ydl = _FakeYoutubeDL(log)
+        post_process = ydl.post_process
+
+        def flaky_post_process(filename: str, info: Dict) -> Dict:
+            if filename[:11] in failing:
+                raise RuntimeError('ffmpeg exited with code 1')
+            return post_process(filename, info)
+
+        ydl.post_process = flaky_post_process
+        ydl.extract_info = lambda url, download=True, **kwargs: {
+            '_type': 'playlist', 'title': 'Mix',
+            'entries': [{'id': video_id, 'requested_downloads': [{'filepath': f'{video_id}.webm'}]}
+                        for video_id in ('aaaaaaaaaaa', 'bbbbbbbbbbb')],
+        }
+        service = self._service(make_download_service, pool)
+
+        with patch('tea.downloader.YoutubeDL', ydl):
+            results = service.download(
+                ['https://www.youtube.com/watch?v=aaaaaaaaaaa&list=PLtest'], str(temp_dir),
+                max_workers=1, audio_only=True
+            )
+
+        assert results[0]['success'] is success
+        assert results[0]['count'] == count
+        assert results[0]['failed'] == len(failing)
+        assert service._history.add.call_count == int(success)
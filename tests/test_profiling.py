@@ -0,0 +1,136 @@
+"""
+Tests for the built-in profiler.
+
+Tests cover:
+- Parsing of the --profile option
+- CPU profiles merged across worker threads
+- Wall-clock samples written as speedscope files
+- Allocation snapshots
+- Profiling commands run through tea.cli.main
+"""
+
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tea.cli import main
+from tea.constants import EXIT_OK, EXIT_USAGE
+from tea.exceptions import ValidationError
+from tea.profiling import Profiler, extract_profile_option
+
+
+def _busy_worker() -> int:
+    """Burn a little CPU in a named function."""
+    return sum(i * i for i in range(20000))
+
+
+def _sleepy_worker() -> None:
+    """Wait long enough to be sampled."""
+    time.sleep(0.2)
+
+
+@pytest.mark.unit
+class TestProfileOption:
+    """Test extract_profile_option."""
+
+    def test_no_option(self):
+        """Test arguments pass through untouched."""
+        assert extract_profile_option(['download', 'URL']) == (None, ['download', 'URL'])
+
+    def test_default_mode(self):
+        """Test a bare --profile selects CPU profiling."""
+        assert extract_profile_option(['--profile', '--history']) == ('cpu', ['--history'])
+
+    def test_explicit_mode(self):
+        """Test the mode is read from --profile=MODE anywhere in the arguments."""
+        assert extract_profile_option(['download', 'URL', '--profile=WALL']) == ('wall', ['download', 'URL'])
+
+    def test_unknown_mode(self):
+        """Test unknown modes are rejected."""
+        with pytest.raises(ValidationError):
+            extract_profile_option(['--profile=gpu'])
+
+
+@pytest.mark.unit
+class TestProfiler:
+    """Test Profiler modes."""
+
+    def test_unknown_mode(self):
+        """Test the constructor rejects unknown modes."""
+        with pytest.raises(ValidationError):
+            Profiler('gpu')
+
+    def test_cpu_covers_threads(self, temp_dir: Path, capsys):
+        """Test functions run in worker threads appear in the CPU profile."""
+        output = temp_dir / 'run.pstats'
+        with Profiler('cpu', output_path=str(output)):
+            worker = threading.Thread(target=_busy_worker)
+            worker.start()
+            worker.join()
+
+        functions = {name for _, _, name in pstats.Stats(str(output)).stats}
+        assert '_busy_worker' in functions
+        assert 'cumulative time' in capsys.readouterr().out
+
+    def test_wall_speedscope(self, temp_dir: Path, capsys):
+        """Test wall-clock samples are written per thread in speedscope format."""
+        output = temp_dir / 'run.speedscope.json'
+        with Profiler('wall', output_path=str(output)):
+            worker = threading.Thread(target=_sleepy_worker, name='sleepy')
+            worker.start()
+            worker.join()
+
+        document = json.loads(output.read_text(encoding='utf-8'))
+        frames = [frame['name'] for frame in document['shared']['frames']]
+        profiles = {profile['name']: profile for profile in document['profiles']}
+        assert '_sleepy_worker' in frames
+        assert profiles['sleepy']['type'] == 'sampled'
+        assert len(profiles['sleepy']['samples']) == len(profiles['sleepy']['weights'])
+        assert '_sleepy_worker' in capsys.readouterr().out
+
+    def test_alloc_snapshot(self, temp_dir: Path, capsys):
+        """Test the allocation snapshot is dumped and summarized."""
+        output = temp_dir / 'run.tracemalloc'
+        with Profiler('alloc', output_path=str(output)):
+            blocks = [bytearray(1024) for _ in range(200)]
+
+        assert not tracemalloc.is_tracing()
+        snapshot = tracemalloc.Snapshot.load(str(output))
+        assert snapshot.statistics('lineno')
+        assert 'growth since start' in capsys.readouterr().out
+        del blocks
+
+    def test_logs_report_location(self, temp_dir: Path, mock_logger: MagicMock):
+        """Test the report location is logged."""
+        output = temp_dir / 'run.pstats'
+        profiler = Profiler('cpu', output_path=str(output), logger=mock_logger)
+        profiler.start()
+
+        assert profiler.stop() == str(output)
+        assert profiler.stop() is None
+        assert str(output) in mock_logger.info.call_args[0][0]
+
+
+@pytest.mark.unit
+class TestProfiledCommands:
+    """Test tea.cli.main with --profile."""
+
+    def test_profiles_command(self, temp_dir: Path, monkeypatch, capsys):
+        """Test the command runs without the option and a report is written."""
+        monkeypatch.chdir(temp_dir)
+        with patch('tea.cli.CLI.run', return_value=EXIT_OK) as run:
+            assert main(['--profile=cpu', '--history']) == EXIT_OK
+
+        run.assert_called_once_with(['--history'])
+        assert list(temp_dir.glob('tea-profile-cpu-*.pstats'))
+
+    def test_unknown_mode_is_usage_error(self, capsys):
+        """Test an unknown mode exits with a usage error."""
+        assert main(['--profile=gpu', '--history']) == EXIT_USAGE
+        assert 'Unknown profile mode' in capsys.readouterr().out
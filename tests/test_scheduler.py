@@ -0,0 +1,266 @@
+"""
+Tests for download scheduling.
+
+Tests cover:
+- Priority classes
+- Round-robin fairness across sources
+- Per-channel in-flight limits
+- Blocking, removal and closing
+- Scheduling order in DownloadService.download and JobQueue
+"""
+
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tea.constants import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL
+from tea.daemon import TeaDaemon
+from tea.downloader import DownloadService
+from tea.history import HistoryManager
+from tea.info import InfoExtractor
+from tea.jobs import JobQueue
+from tea.scheduler import DownloadScheduler, default_priority, parse_priority
+
+
+def _drain(scheduler: DownloadScheduler) -> List:
+    """Take every task, finishing each one immediately."""
+    items = []
+    while True:
+        task = scheduler.next(block=False)
+        if task is None:
+            return items
+        items.append(task.item)
+        scheduler.done(task)
+
+
+@pytest.mark.unit
+class TestDownloadScheduler:
+    """Test DownloadScheduler ordering and limits."""
+
+    def test_priority_classes(self):
+        """Test higher priority classes always start first."""
+        scheduler = DownloadScheduler()
+        scheduler.add('low', priority=PRIORITY_LOW)
+        scheduler.add('normal', priority=PRIORITY_NORMAL)
+        scheduler.add('high', priority='high')
+
+        assert _drain(scheduler) == ['high', 'normal', 'low']
+
+    def test_round_robin_across_sources(self):
+        """Test a large source takes turns with a small one queued after it."""
+        scheduler = DownloadScheduler()
+        for i in range(4):
+            scheduler.add(f'channel-{i}', source='channel')
+        scheduler.add('single', source='submission')
+
+        assert _drain(scheduler) == ['channel-0', 'single', 'channel-1', 'channel-2', 'channel-3']
+
+    def test_fifo_within_source(self):
+        """Test tasks of one source keep their order."""
+        scheduler = DownloadScheduler()
+        for i in range(3):
+            scheduler.add(i, source='batch')
+
+        assert _drain(scheduler) == [0, 1, 2]
+
+    def test_channel_in_flight_limit(self):
+        """Test a channel at its limit lets other sources through."""
+        scheduler = DownloadScheduler(max_in_flight_per_channel=2)
+        for i in range(3):
+            scheduler.add(f'a{i}', source='a', channel='chan-a')
+        scheduler.add('b0', source='b')
+
+        first = scheduler.next(block=False)
+        second = scheduler.next(block=False)
+        third = scheduler.next(block=False)
+        assert [first.item, second.item, third.item] == ['a0', 'b0', 'a1']
+
+        # chan-a has two running, so a2 waits
+        assert scheduler.next(block=False) is None
+        assert len(scheduler) == 1
+
+        scheduler.done(first)
+        assert scheduler.next(block=False).item == 'a2'
+
+    def test_blocking_next_wakes_on_add(self):
+        """Test a waiting worker receives a task added later."""
+        scheduler = DownloadScheduler()
+        received = []
+        worker = threading.Thread(target=lambda: received.append(scheduler.next(timeout=5)))
+        worker.start()
+
+        scheduler.add('late')
+        worker.join(5)
+
+        assert received[0].item == 'late'
+
+    def test_next_timeout(self):
+        """Test next() returns None when nothing arrives in time."""
+        assert DownloadScheduler().next(timeout=0.01) is None
+
+    def test_close_wakes_waiters(self):
+        """Test close() releases blocked workers with None."""
+        scheduler = DownloadScheduler()
+        received = []
+        worker = threading.Thread(target=lambda: received.append(scheduler.next()))
+        worker.start()
+
+        scheduler.close()
+        worker.join(5)
+
+        assert received == [None]
+        with pytest.raises(RuntimeError):
+            scheduler.add('too late')
+
+    def test_remove(self):
+        """Test waiting tasks can be removed."""
+        scheduler = DownloadScheduler()
+        scheduler.add('keep', source='a')
+        scheduler.add('drop', source='b')
+
+        assert scheduler.remove(lambda item: item == 'drop') == ['drop']
+        assert _drain(scheduler) == ['keep']
+
+    @pytest.mark.parametrize("value,expected", [
+        ('high', PRIORITY_HIGH), ('LOW', PRIORITY_LOW), (PRIORITY_NORMAL, PRIORITY_NORMAL),
+    ])
+    def test_parse_priority(self, value, expected):
+        """Test priority names and values are accepted."""
+        assert parse_priority(value) == expected
+
+    @pytest.mark.parametrize("value", ['urgent', 7, None, True])
+    def test_parse_priority_invalid(self, value):
+        """Test unknown priorities are rejected."""
+        with pytest.raises(ValueError):
+            parse_priority(value)
+
+    def test_default_priority(self):
+        """Test playlists and channels default to the background class."""
+        assert default_priority('video') == PRIORITY_NORMAL
+        assert default_priority('playlist') == PRIORITY_LOW
+        assert default_priority('channel') == PRIORITY_LOW
+
+
+def _record_download(order: List[str]):
+    """Build a DownloadService.fetch stand-in that records call order."""
+    def download(url: str, output_path: str, thread_id: int, audio_only: bool, cleaner,
+                 sync: bool = False, *args, **options) -> Dict:
+        order.append(url)
+        return {'url': url, 'success': True, 'count': 1, 'title': url, 'message': 'ok'}
+    return download
+
+
+def _track_channels(in_flight: Counter, peaks: Counter, lock: threading.Lock, channel_of):
+    """Build a download stand-in that records the most downloads run at once per channel."""
+    def download(url: str, *args, **options) -> Dict:
+        channel = channel_of(url)
+        with lock:
+            in_flight[channel] += 1
+            in_flight['all'] += 1
+            peaks[channel] = max(peaks[channel], in_flight[channel])
+            peaks['all'] = max(peaks['all'], in_flight['all'])
+        time.sleep(0.05)
+        with lock:
+            in_flight[channel] -= 1
+            in_flight['all'] -= 1
+        return {'url': url, 'success': True, 'count': 1, 'title': url, 'message': 'ok'}
+    return download
+
+
+@pytest.mark.unit
+class TestScheduledDownloads:
+    """Test that downloads are started in scheduler order."""
+
+    def test_download_runs_videos_before_channels(self, temp_dir: Path, make_download_service):
+        """Test single videos are not held back by a channel listed first."""
+        info = MagicMock()
+        info.get_content_type.side_effect = (
+            lambda url: 'channel' if '@' in url else 'video'
+        )
+        service = make_download_service(history_manager=MagicMock(), info_extractor=info)
+        order: List[str] = []
+        service._fetch = _record_download(order)
+
+        urls = ['https://www.youtube.com/@big', 'https://youtu.be/video1', 'https://youtu.be/video2']
+        results = service.download(urls, output_path=str(temp_dir), max_workers=1)
+
+        assert order == ['https://youtu.be/video1', 'https://youtu.be/video2',
+                         'https://www.youtube.com/@big']
+        assert len(results) == 3
+
+    def test_job_queue_interleaves_sources(self, temp_dir: Path):
+        """Test a small submission runs between the jobs of a large one."""
+        order: List[str] = []
+        downloader = MagicMock()
+        downloader.fetch.side_effect = _record_download(order)
+        history = HistoryManager(history_path=str(temp_dir / 'history.json'))
+        job_queue = JobQueue(download_service=downloader, history_manager=history, workers=1)
+
+        for i in range(3):
+            job_queue.submit(f'https://youtu.be/archive{i}', 'downloads', source='archive')
+        job_queue.submit('https://youtu.be/quick', 'downloads', source='interactive')
+        urgent = job_queue.submit('https://youtu.be/urgent', 'downloads', priority='high')
+
+        job_queue.start()
+        try:
+            assert job_queue.wait_idle(timeout=5)
+        finally:
+            job_queue.stop(timeout=5)
+
+        assert order == [
+            'https://youtu.be/urgent',
+            'https://youtu.be/archive0',
+            'https://youtu.be/quick',
+            'https://youtu.be/archive1',
+            'https://youtu.be/archive2',
+        ]
+        assert urgent.to_dict()['priority'] == 'high'
+
+    def test_download_limits_videos_per_channel(
+        self, temp_dir: Path, mock_logger: MagicMock, make_download_service
+    ):
+        """Test download() runs at most two videos of one uploader at once, using the probed info."""
+        uploaders = {f'https://youtu.be/big{i:08d}': 'UCbig' for i in range(4)}
+        uploaders['https://youtu.be/other000001'] = 'UCother'
+        info = InfoExtractor(logger=mock_logger)
+        in_flight, peaks, lock = Counter(), Counter(), threading.Lock()
+        service = make_download_service(history_manager=MagicMock(), info_extractor=info)
+        service._fetch = _track_channels(in_flight, peaks, lock, uploaders.get)
+
+        probe = lambda url: ('video', {'channel_id': uploaders[url]})  # noqa: E731
+        with patch.object(info, '_extract_with_ytdlp', side_effect=probe):
+            results = service.download(list(uploaders), output_path=str(temp_dir), max_workers=3)
+
+        assert len(results) == 5
+        assert peaks['UCbig'] == 2
+        assert peaks['all'] == 3
+
+    def test_daemon_limits_tabs_per_channel(self, temp_dir: Path, config_manager):
+        """Test daemon submissions of one channel's tabs share the channel limit."""
+        in_flight, peaks, lock = Counter(), Counter(), threading.Lock()
+        downloader = MagicMock()
+        downloader.fetch.side_effect = _track_channels(
+            in_flight, peaks, lock, lambda url: url.split('/')[3]
+        )
+        history = HistoryManager(history_path=str(temp_dir / 'history.json'))
+        job_queue = JobQueue(download_service=downloader, history_manager=history, workers=4)
+        daemon = TeaDaemon(job_queue, config_manager=config_manager, port=0)
+
+        tabs = ['videos', 'shorts', 'streams', 'playlists']
+        response = daemon.submit({'urls': [f'https://www.youtube.com/@big/{tab}' for tab in tabs]
+                                  + ['https://www.youtube.com/@other/videos']})
+        assert len(response['jobs']) == 5
+
+        daemon.start()
+        try:
+            assert job_queue.wait_idle(timeout=5)
+        finally:
+            daemon.shutdown()
+
+        assert peaks['@big'] == 2
+        assert peaks['all'] == 3
@@ -0,0 +1,225 @@
+"""
+Tests for YouTubeSearchService module.
+
+Tests cover:
+- Batched relevance scoring
+- Ranking order regression against the per-result heuristics
+- Duration and view formatting
+"""
+
+import math
+import random
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tea.config import ConfigManager
+from tea.search import FUZZY_AVAILABLE, YouTubeSearchService, score_results
+
+
+def _legacy_rank(query: str, results: List[Dict], fuzzy_threshold: int, fuzzy: bool) -> List[Dict]:
+    """Reference implementation of the original per-result ranking loop."""
+    if fuzzy:
+        from fuzzywuzzy import fuzz
+
+    scored = []
+    for result in results:
+        score = 0
+        if fuzzy:
+            title_score = fuzz.partial_ratio(query.lower(), result['title'].lower())
+            if title_score >= fuzzy_threshold:
+                score += title_score
+            uploader_score = fuzz.partial_ratio(query.lower(), result['uploader'].lower())
+            if uploader_score >= fuzzy_threshold:
+                score += uploader_score // 2
+        else:
+            query_lower = query.lower()
+            title_lower = result['title'].lower()
+            if query_lower in title_lower:
+                score += 80
+            matching_words = set(query_lower.split()) & set(title_lower.split())
+            if matching_words:
+                score += len(matching_words) * 20
+
+        title_lower = result['title'].lower()
+        for keyword in ['official', 'audio', 'video', 'lyrics', 'hd', 'remastered']:
+            if keyword in title_lower:
+                score += 5
+
+        if result['view_count'] > 0:
+            score += min(20, int(math.log10(result['view_count'] + 1) * 2))
+
+        scored.append((score, result))
+
+    return [result for _, result in sorted(scored, key=lambda x: x[0], reverse=True)]
+
+
+def _random_results(rng: random.Random, count: int) -> List[Dict]:
+    """Generate plausible search results."""
+    artists = ['Daft Punk', 'Queen', 'Sade', 'Stromae', 'Nujabes', 'Jorja Smith']
+    songs = ['Get Lucky', 'Bohemian Rhapsody', 'By Your Side', 'Papaoutai', 'Feather', 'Blue Lights']
+    tags = ['', '(Official Video)', '(Official Audio)', '[Lyrics]', 'HD Remastered', 'live', 'cover']
+    results = []
+    for i in range(count):
+        artist = rng.choice(artists)
+        results.append({
+            'url': f'https://www.youtube.com/watch?v=vid{i:08d}',
+            'title': f"{artist} - {rng.choice(songs)} {rng.choice(tags)}".strip(),
+            'uploader': rng.choice([artist, f'{artist}VEVO', 'Random Uploads', 'Lyrics Channel']),
+            'duration': rng.randint(0, 600),
+            'view_count': rng.choice([0, rng.randint(1, 10_000_000_000)]),
+            'id': f'vid{i:08d}',
+        })
+    return results
+
+
+@pytest.fixture
+def search_service(config_manager: ConfigManager, mock_logger: MagicMock) -> YouTubeSearchService:
+    """Create a YouTubeSearchService instance for testing."""
+    return YouTubeSearchService(config_manager=config_manager, logger=mock_logger)
+
+
+@pytest.mark.unit
+class TestRankResults:
+    """Test batched ranking of search results."""
+
+    @pytest.mark.skipif(not FUZZY_AVAILABLE, reason="fuzzywuzzy not installed")
+    @pytest.mark.parametrize("seed", range(20))
+    def test_ordering_matches_reference_fuzzy(self, search_service: YouTubeSearchService, seed: int):
+        """Test fuzzy ranking keeps the original heuristic's ordering."""
+        rng = random.Random(seed)
+        results = _random_results(rng, 50)
+        query = rng.choice(['daft punk get lucky', 'Queen', 'sade by your side', 'feather nujabes'])
+
+        expected = _legacy_rank(query, results, 70, fuzzy=True)
+        assert search_service._rank_results(query, results) == expected
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_ordering_matches_reference_fallback(self, search_service: YouTubeSearchService, seed: int):
+        """Test word-matching fallback keeps the original heuristic's ordering."""
+        rng = random.Random(seed)
+        results = _random_results(rng, 50)
+        query = rng.choice(['daft punk get lucky', 'queen', 'by your side'])
+
+        expected = _legacy_rank(query, results, 70, fuzzy=False)
+        with patch("tea.search.FUZZY_AVAILABLE", False):
+            assert search_service._rank_results(query, results) == expected
+
+    def test_rank_does_not_mutate_results(self, search_service: YouTubeSearchService):
+        """Test ranking leaves result dictionaries untouched."""
+        results = _random_results(random.Random(0), 5)
+        snapshot = [dict(r) for r in results]
+        search_service._rank_results('queen', results)
+        assert results == snapshot
+
+    def test_rank_empty(self, search_service: YouTubeSearchService):
+        """Test ranking an empty list."""
+        assert search_service._rank_results('query', []) == []
+
+    def test_score_results_view_bonus(self):
+        """Test view-count bonus is logarithmic and capped."""
+        results = [
+            {'title': 'x', 'uploader': 'y', 'view_count': 0},
+            {'title': 'x', 'uploader': 'y', 'view_count': 999},
+            {'title': 'x', 'uploader': 'y', 'view_count': 10 ** 15},
+        ]
+        with patch("tea.search.FUZZY_AVAILABLE", False):
+            assert score_results('zzz', results) == [0, 6, 20]
+
+
+@pytest.mark.unit
+class TestFormatting:
+    """Test display formatting helpers."""
+
+    def test_format_duration(self, search_service: YouTubeSearchService):
+        """Test durations format as M:SS or H:MM:SS."""
+        assert search_service._format_duration(0) == "Unknown"
+        assert search_service._format_duration(212) == "3:32"
+        assert search_service._format_duration(3723) == "1:02:03"
+
+    def test_format_views(self, search_service: YouTubeSearchService):
+        """Test view counts format with K/M suffixes."""
+        assert search_service._format_views(0) == "Unknown"
+        assert search_service._format_views(950) == "950"
+        assert search_service._format_views(1_500) == "1.5K"
+        assert search_service._format_views(2_300_000) == "2.3M"
+
+
+def _stream(results: List[Dict], consumed: List[Dict]):
+    """Yield results while recording how many the caller has pulled."""
+    for result in results:
+        consumed.append(result)
+        yield result
+
+
+@pytest.mark.unit
+class TestStreamingSearch:
+    """Test streaming search and early selection."""
+
+    def test_iter_search_results_streams_entries(self, search_service: YouTubeSearchService):
+        """Test entries are yielded lazily and filtered by URL and duration."""
+        entries = [
+            {'url': 'https://www.youtube.com/watch?v=aaaaaaaaaaa', 'title': 'A', 'duration': 200,
+             'view_count': None, 'uploader': None, 'id': 'aaaaaaaaaaa'},
+            {'url': 'https://example.com/not-youtube', 'title': 'B', 'duration': 200},
+            {'url': 'https://www.youtube.com/watch?v=ccccccccccc', 'title': 'C', 'duration': 5},
+            None,
+            {'url': 'https://www.youtube.com/watch?v=ddddddddddd', 'title': 'D', 'duration': None},
+        ]
+        consumed: List[Dict] = []
+        ydl = MagicMock()
+        ydl.__enter__.return_value = ydl
+        ydl.extract_info.return_value = {'entries': _stream(entries, consumed)}
+
+        with patch("tea.search.YoutubeDL", return_value=ydl):
+            stream = search_service.iter_search_results('query', 5, use_ai=False)
+            first = next(stream)
+            assert first['title'] == 'A'
+            assert first['uploader'] == 'Unknown'
+            assert first['view_count'] == 0
+            assert len(consumed) == 1
+            rest = list(stream)
+
+        assert [r['title'] for r in rest] == ['D']
+        assert ydl.extract_info.call_args.kwargs['process'] is False
+
+    def test_select_before_stream_finishes(self, search_service: YouTubeSearchService):
+        """Test the user can select once the preview is shown, before the rest arrive."""
+        results = _random_results(random.Random(1), 10)
+        consumed: List[Dict] = []
+
+        with patch("builtins.input", return_value="2"):
+            url = search_service.select_from_stream(_stream(results, consumed), 'query', preview=3)
+
+        assert url == results[1]['url']
+        assert len(consumed) == 3
+
+    def test_select_more_loads_remaining(self, search_service: YouTubeSearchService):
+        """Test asking for more fetches the remaining results."""
+        results = _random_results(random.Random(2), 6)
+        consumed: List[Dict] = []
+
+        with patch("builtins.input", side_effect=["m", "6"]):
+            url = search_service.select_from_stream(_stream(results, consumed), 'query', preview=3)
+
+        assert url == results[5]['url']
+        assert len(consumed) == 6
+
+    def test_auto_pick_confident_match(self, search_service: YouTubeSearchService):
+        """Test auto-pick stops at the first close title match."""
+        results = _random_results(random.Random(3), 5)
+        results[1]['title'] = 'Queen - Bohemian Rhapsody (Official Video)'
+        consumed: List[Dict] = []
+
+        url = search_service.select_from_stream(
+            _stream(results, consumed), 'queen - bohemian rhapsody', auto_pick=True
+        )
+
+        assert url == results[1]['url']
+        assert len(consumed) == 2
+
+    def test_auto_pick_no_results(self, search_service: YouTubeSearchService):
+        """Test auto-pick with no results returns None without prompting."""
+        with patch("builtins.input", side_effect=AssertionError("prompted")):
+            assert search_service.select_from_stream(iter([]), 'query', auto_pick=True) is None
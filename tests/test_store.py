@@ -0,0 +1,236 @@
+"""
+Tests for the content-addressed media store.
+
+Tests cover:
+- Profile keys
+- Adding, looking up and linking stored files
+- Linking stored videos instead of downloading them again
+- Converting local copies instead of downloading another format
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tea.downloader import DownloadService
+from tea.store import MediaStore, store_profile
+
+
+def _make_file(path: Path, content: bytes = b'media') -> str:
+    """Create a file with some content."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return str(path)
+
+
+@pytest.mark.unit
+class TestMediaStore:
+    """Test MediaStore operations."""
+
+    def test_profile_depends_on_format(self):
+        """Test different formats get different profiles."""
+        mp3 = store_profile('bestaudio/best', 'mp3', '320')
+        assert mp3.startswith('mp3-')
+        assert mp3 == store_profile('bestaudio/best', 'mp3', '320')
+        assert mp3 != store_profile('bestaudio/best', 'mp3', '192')
+        assert mp3 != store_profile('best', 'mp4')
+
+    def test_add_and_lookup(self, temp_dir: Path):
+        """Test a stored file is found with its info."""
+        store = MediaStore(str(temp_dir / 'store'))
+        source = _make_file(temp_dir / 'out' / 'Song.mp3')
+
+        stored_path = store.add(source, 'abc', 'mp3-x', {'title': 'Song', 'ext': 'mp3', 'formats': []})
+
+        stored = store.lookup('abc', 'mp3-x')
+        assert stored['path'] == stored_path
+        assert stored['title'] == 'Song'
+        assert 'formats' not in stored
+        # The output file and the stored copy are the same file
+        assert os.path.samefile(source, stored_path)
+        assert store.contains('abc')
+
+    def test_lookup_missing(self, temp_dir: Path):
+        """Test lookups of unknown videos or profiles return None."""
+        store = MediaStore(str(temp_dir / 'store'))
+        store.add(_make_file(temp_dir / 'a.mp4'), 'abc', 'mp4-x', {})
+
+        assert store.lookup('abc', 'mp3-x') is None
+        assert store.lookup('other', 'mp4-x') is None
+        assert not store.contains('other')
+
+    def test_lookup_ignores_removed_file(self, temp_dir: Path):
+        """Test an entry whose file was deleted is not returned."""
+        store = MediaStore(str(temp_dir / 'store'))
+        stored_path = store.add(_make_file(temp_dir / 'a.mp4'), 'abc', 'mp4-x', {})
+        os.remove(stored_path)
+
+        assert store.lookup('abc', 'mp4-x') is None
+
+    def test_link(self, temp_dir: Path):
+        """Test a stored file is linked into another directory."""
+        store = MediaStore(str(temp_dir / 'store'))
+        stored_path = store.add(_make_file(temp_dir / 'a.mp4'), 'abc', 'mp4-x', {})
+        dest = str(temp_dir / 'other' / 'a.mp4')
+
+        assert store.link(stored_path, dest) == 'hardlink'
+        assert os.path.samefile(stored_path, dest)
+        assert store.link(stored_path, dest) == 'exists'
+
+    def test_link_falls_back_to_copy(self, temp_dir: Path):
+        """Test linking copies the file when links are not possible."""
+        store = MediaStore(str(temp_dir / 'store'))
+        stored_path = store.add(_make_file(temp_dir / 'a.mp4'), 'abc', 'mp4-x', {})
+        dest = str(temp_dir / 'other' / 'a.mp4')
+
+        with patch('tea.store.os.link', side_effect=OSError), \
+                patch('tea.store.os.symlink', side_effect=OSError):
+            assert store.link(stored_path, dest) == 'copy'
+        assert Path(dest).read_bytes() == b'media'
+        assert store.link(stored_path, dest) == 'exists'
+
+    @pytest.mark.parametrize("existing", [b'other', b'medi', b'mediX'])
+    def test_link_replaces_other_file(self, temp_dir: Path, existing: bytes):
+        """Test a different file at the destination is replaced, not reported as linked."""
+        store = MediaStore(str(temp_dir / 'store'))
+        stored_path = store.add(_make_file(temp_dir / 'a.mp4'), 'abc', 'mp4-x', {})
+        dest = temp_dir / 'other' / 'a.mp4'
+        dest.parent.mkdir()
+        dest.write_bytes(existing)
+
+        assert store.link(stored_path, str(dest)) == 'hardlink'
+        assert os.path.samefile(stored_path, dest)
+        assert os.listdir(dest.parent) == ['a.mp4']
+
+    def test_link_replaces_broken_symlink(self, temp_dir: Path):
+        """Test a dangling link at the destination is replaced."""
+        store = MediaStore(str(temp_dir / 'store'))
+        stored_path = store.add(_make_file(temp_dir / 'a.mp4'), 'abc', 'mp4-x', {})
+        dest = temp_dir / 'b.mp4'
+        os.symlink(temp_dir / 'missing.mp4', dest)
+
+        assert store.link(stored_path, str(dest)) == 'hardlink'
+        assert dest.read_bytes() == b'media'
+        assert not (temp_dir / 'missing.mp4').exists()
+
+
+class _FakeYoutubeDL:
+    """YoutubeDL stand-in that writes a file per downloaded video."""
+
+    def __init__(self, output_path: Path, log: List[str]):
+        self.output_path = output_path
+        self.log = log
+
+    def __call__(self, options: Dict) -> '_FakeYoutubeDL':
+        return self
+
+    def __enter__(self) -> '_FakeYoutubeDL':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def prepare_filename(self, info: Dict) -> str:
+        return str(self.output_path / f"{info.get('title', 'NA')}.mp4")
+
+    def extract_info(self, url: str, download: bool = True, **kwargs) -> Optional[Dict]:
+        video_id = url.rsplit('=', 1)[-1]
+        self.log.append(f'download {video_id}')
+        info = {'id': video_id, 'title': f'Title {video_id}', 'ext': 'mp4'}
+        filepath = _make_file(Path(self.prepare_filename(info)))
+        info['requested_downloads'] = [{'filepath': filepath}]
+        return info
+
+    def post_process(self, filename: str, info: Dict) -> Dict:
+        return info
+
+
+@pytest.mark.unit
+class TestStoredDownloads:
+    """Test DownloadService reuse of stored media."""
+
+    @pytest.fixture
+    def service(self, temp_dir: Path, make_download_service) -> DownloadService:
+        """Create a DownloadService with a media store."""
+        info = MagicMock()
+        info.get_info.return_value = ('video', {})
+        return make_download_service(
+            info_extractor=info,
+            ffmpeg_service=MagicMock(),
+            media_store=MediaStore(str(temp_dir / 'store')),
+        )
+
+    def test_second_download_is_linked(self, service: DownloadService, temp_dir: Path):
+        """Test the same video in another folder is linked instead of downloaded."""
+        url = 'https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+        log: List[str] = []
+
+        with patch('tea.downloader.YoutubeDL', _FakeYoutubeDL(temp_dir / 'first', log)):
+            service.download_single_video(url, str(temp_dir / 'first'))
+        with patch('tea.downloader.YoutubeDL', _FakeYoutubeDL(temp_dir / 'second', log)):
+            result = service.download_single_video(url, str(temp_dir / 'second'))
+
+        assert log == ['download dQw4w9WgXcQ']
+        assert result['success'] is True
+        assert 'linked from media store' in result['message']
+        assert os.path.samefile(temp_dir / 'first' / 'Title dQw4w9WgXcQ.mp4',
+                                temp_dir / 'second' / 'Title dQw4w9WgXcQ.mp4')
+
+    def test_mp3_is_converted_from_stored_video(self, service: DownloadService, temp_dir: Path):
+        """Test an MP3 of a stored video is transcoded locally."""
+        url = 'https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+        log: List[str] = []
+        with patch('tea.downloader.YoutubeDL', _FakeYoutubeDL(temp_dir / 'videos', log)):
+            service.download_single_video(url, str(temp_dir / 'videos'))
+
+        service._ffmpeg.extract_audio.side_effect = (
+            lambda source, target, bitrate: bool(_make_file(Path(target)))
+        )
+        with patch('tea.downloader.YoutubeDL', _FakeYoutubeDL(temp_dir / 'music', log)):
+            result = service.download_single_video(url, str(temp_dir / 'music'), audio_only=True)
+
+        assert log == ['download dQw4w9WgXcQ']
+        source, target, bitrate = service._ffmpeg.extract_audio.call_args[0]
+        assert source.endswith('Title dQw4w9WgXcQ.mp4')
+        assert bitrate == '320k'
+        assert target == str(temp_dir / 'music' / 'Title dQw4w9WgXcQ.mp3')
+        assert 'converted from local copy' in result['message']
+        assert result['filepath'] == target
+        # The MP3 is stored too, so the next request is only a link
+        assert len(service.media_store.find('dQw4w9WgXcQ')) == 2
+
+    def test_remux_from_history_file(self, service: DownloadService, temp_dir: Path):
+        """Test an MP4 is remuxed from a WebM recorded in history."""
+        webm = _make_file(temp_dir / 'old' / 'Clip.webm')
+        service._history.find_file.return_value = {'title': 'Clip', 'file_path': webm}
+        service._ffmpeg.remux.return_value = True
+        log: List[str] = []
+
+        with patch('tea.downloader.YoutubeDL', _FakeYoutubeDL(temp_dir / 'new', log)):
+            result = service.download_single_video('https://youtu.be/dQw4w9WgXcQ', str(temp_dir / 'new'))
+
+        assert log == []
+        service._ffmpeg.remux.assert_called_once_with(webm, str(temp_dir / 'new' / 'Clip.mp4'))
+        assert result['success'] is True
+
+    def test_failed_conversion_downloads(self, service: DownloadService, temp_dir: Path):
+        """Test a failed local conversion falls back to downloading."""
+        service._history.find_file.return_value = {
+            'title': 'Clip', 'file_path': _make_file(temp_dir / 'old' / 'Clip.mp4')
+        }
+        service._ffmpeg.extract_audio.return_value = False
+        log: List[str] = []
+
+        with patch('tea.downloader.YoutubeDL', _FakeYoutubeDL(temp_dir / 'new', log)):
+            service.download_single_video('https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+                                          str(temp_dir / 'new'), audio_only=True)
+
+        assert log == ['download dQw4w9WgXcQ']
+
+    def test_disabled_without_config(self, make_download_service):
+        """Test no store is used unless one is configured."""
+        service = make_download_service()
+        assert service.media_store is None
@@ -0,0 +1,199 @@
+"""
+Tests for the thumbnail cache.
+
+Tests cover:
+- Serving known thumbnail URLs without fetching them
+- Converting shared artwork once
+- Fetch and conversion failures
+- The thumbnail_cache config key
+- Downloads taking thumbnails from the cache
+"""
+
+import io
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tea.config import ConfigManager, validate_config
+from tea.exceptions import ValidationError
+from tea.metrics import Metrics
+from tea.pool import YoutubeDLPool
+from tea.postprocess import PostProcessPool
+from tea.thumbnails import ThumbnailCache
+
+JPEG = b'\xff\xd8\xff\xe0' + b'jpeg artwork'
+WEBP = b'RIFF\x00\x00\x00\x00WEBP' + b'webp artwork'
+
+
+class _FakeYoutubeDL:
+    """YoutubeDL stand-in serving thumbnails from a dict."""
+
+    def __init__(self, images: Dict[str, bytes]):
+        self.images = images
+        self.fetched: List[str] = []
+
+    def urlopen(self, url: str) -> io.BytesIO:
+        self.fetched.append(url)
+        if url not in self.images:
+            raise OSError('HTTP Error 404')
+        return io.BytesIO(self.images[url])
+
+
+@pytest.fixture
+def ffmpeg() -> MagicMock:
+    """FFmpegService stand-in that 'converts' by writing a marker file."""
+    service = MagicMock()
+    service.convert_image.side_effect = (
+        lambda source, output: Path(output).write_bytes(b'png from ' + Path(source).read_bytes()) or True
+    )
+    return service
+
+
+@pytest.fixture
+def cache(temp_dir: Path, ffmpeg: MagicMock) -> ThumbnailCache:
+    """Create a ThumbnailCache in a temporary directory."""
+    return ThumbnailCache(str(temp_dir / 'thumbs'), ffmpeg_service=ffmpeg, metrics=Metrics())
+
+
+def _info(*urls: str) -> Dict:
+    """Build an info dict with thumbnails, best last."""
+    return {'thumbnails': [{'url': url} for url in urls]}
+
+
+@pytest.mark.unit
+class TestThumbnailCache:
+    """Test ThumbnailCache."""
+
+    def test_known_url_is_not_fetched(self, cache: ThumbnailCache, temp_dir: Path):
+        """Test a cached URL is copied next to the file without a request."""
+        ydl = _FakeYoutubeDL({'https://i.ytimg.com/a.jpg': JPEG})
+
+        first = cache.prepare(ydl, _info('https://i.ytimg.com/a.jpg'), str(temp_dir / 'One.webm'))
+        info = _info('https://i.ytimg.com/a.jpg')
+        second = cache.prepare(ydl, info, str(temp_dir / 'Two.webm'))
+
+        assert ydl.fetched == ['https://i.ytimg.com/a.jpg']
+        assert first == str(temp_dir / 'One.jpg')
+        assert second == info['thumbnails'][0]['filepath'] == str(temp_dir / 'Two.jpg')
+        assert Path(second).read_bytes() == JPEG
+
+    def test_webp_is_converted_once_per_image(self, cache: ThumbnailCache, ffmpeg: MagicMock,
+                                               temp_dir: Path):
+        """Test the same artwork under two URLs is converted to PNG once."""
+        ydl = _FakeYoutubeDL({'https://i.ytimg.com/a.webp': WEBP, 'https://i.ytimg.com/b.webp': WEBP})
+
+        first = cache.prepare(ydl, _info('https://i.ytimg.com/a.webp'), str(temp_dir / 'One.webm'))
+        second = cache.prepare(ydl, _info('https://i.ytimg.com/b.webp'), str(temp_dir / 'Two.webm'))
+
+        assert ffmpeg.convert_image.call_count == 1
+        assert first.endswith('One.png') and second.endswith('Two.png')
+        assert Path(second).read_bytes() == b'png from ' + WEBP
+        assert cache.lookup('https://i.ytimg.com/b.webp') is not None
+
+    def test_jpeg_is_not_converted(self, cache: ThumbnailCache, ffmpeg: MagicMock):
+        """Test images that can be embedded as they are skip FFmpeg."""
+        image = cache.add('https://i.ytimg.com/a.jpg', JPEG)
+
+        assert image.endswith('.jpg')
+        ffmpeg.convert_image.assert_not_called()
+
+    def test_fetch_failure_tries_next_thumbnail(self, cache: ThumbnailCache, temp_dir: Path):
+        """Test a missing thumbnail falls back to the next best one."""
+        ydl = _FakeYoutubeDL({'https://i.ytimg.com/small.jpg': JPEG})
+
+        path = cache.prepare(
+            ydl, _info('https://i.ytimg.com/small.jpg', 'https://i.ytimg.com/maxres.jpg'),
+            str(temp_dir / 'One.webm')
+        )
+
+        assert ydl.fetched == ['https://i.ytimg.com/maxres.jpg', 'https://i.ytimg.com/small.jpg']
+        assert path == str(temp_dir / 'One.jpg')
+
+    def test_conversion_failure(self, cache: ThumbnailCache, ffmpeg: MagicMock, temp_dir: Path):
+        """Test nothing is cached or embedded when conversion fails."""
+        ffmpeg.convert_image.side_effect = None
+        ffmpeg.convert_image.return_value = False
+        ydl = _FakeYoutubeDL({'https://i.ytimg.com/a.webp': WEBP})
+        info = _info('https://i.ytimg.com/a.webp')
+
+        assert cache.prepare(ydl, info, str(temp_dir / 'One.webm')) is None
+        assert 'filepath' not in info['thumbnails'][0]
+        assert cache.lookup('https://i.ytimg.com/a.webp') is None
+        assert sorted(p.name for p in (temp_dir / 'thumbs').iterdir()) == ['urls']
+
+
+@pytest.mark.unit
+class TestThumbnailCacheConfig:
+    """Test the thumbnail_cache config key."""
+
+    def test_relative_to_config_file(self, temp_dir: Path):
+        """Test the default cache lives next to the config file."""
+        config = ConfigManager(config_path=str(temp_dir / 'tea-config.json'))
+
+        assert config.thumbnail_cache == str(temp_dir / 'tea-thumbnails')
+
+    def test_disabled(self, temp_dir: Path):
+        """Test null disables the cache."""
+        config = ConfigManager(config_path=str(temp_dir / 'tea-config.json'))
+        config.set('thumbnail_cache', None)
+
+        assert config.thumbnail_cache is None
+
+    @pytest.mark.parametrize('value', ['', 5])
+    def test_invalid(self, value):
+        """Test non-path values are rejected."""
+        with pytest.raises(ValidationError):
+            validate_config({'thumbnail_cache': value})
+
+
+@pytest.mark.unit
+class TestCachedThumbnailDownloads:
+    """Test downloads embed thumbnails from the cache."""
+
+    def test_audio_download_uses_cache(self, cache: ThumbnailCache, make_download_service,
+                                       temp_dir: Path):
+        """Test yt-dlp does not write thumbnails and EmbedThumbnail gets a cached one."""
+        built: List[Dict] = []
+        embedded: List[str] = []
+
+        class FakeYoutubeDL(_FakeYoutubeDL):
+            def __init__(self, options: Dict):
+                super().__init__({'https://i.ytimg.com/a.jpg': JPEG})
+                built.append(options)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                pass
+
+            def extract_info(self, url: str, download: bool = True, **kwargs) -> Dict:
+                return {'id': url[-11:], 'title': 'Title', **_info('https://i.ytimg.com/a.jpg'),
+                        'requested_downloads': [{
+                            'filepath': str(temp_dir / 'Title.webm'),
+                            **_info('https://i.ytimg.com/a.jpg'),
+                        }]}
+
+            def post_process(self, filename: str, info: Dict) -> Dict:
+                embedded.append(info['thumbnails'][-1].get('filepath'))
+                return info
+
+        pool = PostProcessPool(workers=1, metrics=Metrics())
+        service = make_download_service(
+            info_extractor=MagicMock(**{'get_info.return_value': ('video', {})}),
+            thumbnail_cache=cache,
+            ydl_pool=YoutubeDLPool(metrics=Metrics()),
+            postprocess_pool=pool,
+        )
+
+        try:
+            with patch('tea.downloader.YoutubeDL', FakeYoutubeDL):
+                service.download_single_video('https://youtu.be/aaaaaaaaaaa', str(temp_dir), audio_only=True)
+        finally:
+            pool.shutdown()
+
+        assert built[0]['writethumbnail'] is False
+        assert embedded == [str(temp_dir / 'Title.jpg')]
+        assert cache.lookup('https://i.ytimg.com/a.jpg') is not None
@@ -0,0 +1,219 @@
+"""
+Tests for watch-folder ingestion.
+
+Tests cover:
+- Incremental reading of appended URL list files
+- Partial lines, truncation and restarts
+- inotify and polling backends
+- De-duplication against history and the live queue
+"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from tea.jobs import JobQueue
+from tea.watch import FolderWatcher, queue_urls
+
+
+class _Collector:
+    """Records on_urls callbacks."""
+
+    def __init__(self):
+        self.calls: List[Tuple[str, List[str]]] = []
+
+    def __call__(self, name: str, urls: List[str]) -> None:
+        self.calls.append((name, urls))
+
+    @property
+    def urls(self) -> List[str]:
+        return [url for _, batch in self.calls for url in batch]
+
+
+@pytest.fixture
+def collector() -> _Collector:
+    """Create a callback that records delivered URLs."""
+    return _Collector()
+
+
+@pytest.fixture
+def watcher(temp_dir: Path, collector: _Collector):
+    """Create a polling FolderWatcher on a temporary directory."""
+    folder = FolderWatcher(str(temp_dir), collector, poll_interval=0.01, settle_time=0.2, use_inotify=False)
+    yield folder
+    folder.close()
+
+
+def _append(path: Path, text: str) -> None:
+    """Append text to a file."""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+@pytest.mark.unit
+class TestFolderWatcher:
+    """Test FolderWatcher functionality."""
+
+    def test_missing_directory(self, temp_dir: Path, collector: _Collector):
+        """Test watching a missing directory fails."""
+        with pytest.raises(NotADirectoryError):
+            FolderWatcher(str(temp_dir / 'missing'), collector)
+
+    def test_scan_reads_existing_lists(self, watcher: FolderWatcher, temp_dir: Path, collector):
+        """Test existing list files are parsed like batch files."""
+        (temp_dir / 'a.txt').write_text(
+            "# comment\nhttps://youtu.be/video1\n\nnot-a-url\nhttps://youtu.be/video2\n"
+        )
+        (temp_dir / 'notes.md').write_text("https://youtu.be/ignored\n")
+
+        assert watcher.scan() == 2
+        assert collector.calls == [('a.txt', ['https://youtu.be/video1', 'https://youtu.be/video2'])]
+
+    def test_only_appended_lines_are_read(self, watcher: FolderWatcher, temp_dir: Path, collector):
+        """Test appending to a list delivers only the new lines."""
+        path = temp_dir / 'list.txt'
+        path.write_text("https://youtu.be/video1\n")
+        watcher.scan()
+
+        _append(path, "https://youtu.be/video2\n")
+        assert watcher.poll_once() == 1
+        assert watcher.poll_once() == 0
+
+        assert collector.urls == ['https://youtu.be/video1', 'https://youtu.be/video2']
+
+    def test_partial_line_waits_for_newline(self, watcher: FolderWatcher, temp_dir: Path, collector):
+        """Test a half-written line is not delivered until completed."""
+        path = temp_dir / 'list.txt'
+        path.write_text("https://youtu.be/vid")
+        watcher.scan()
+        assert collector.urls == []
+
+        _append(path, "eo1\n")
+        watcher.poll_once()
+        assert collector.urls == ['https://youtu.be/video1']
+
+    def test_final_line_without_newline_after_settle(self, watcher: FolderWatcher, temp_dir, collector):
+        """Test a last line without newline is read once the file settles."""
+        path = temp_dir / 'list.txt'
+        path.write_text("https://youtu.be/video1")
+        old = time.time() - 10
+        os.utime(path, (old, old))
+
+        watcher.scan()
+        watcher.poll_once()
+
+        assert collector.urls == ['https://youtu.be/video1']
+
+    def test_truncated_file_is_reread(self, watcher: FolderWatcher, temp_dir: Path, collector):
+        """Test a replaced or truncated list is read from the start."""
+        path = temp_dir / 'list.txt'
+        path.write_text("https://youtu.be/video1\nhttps://youtu.be/video2\n")
+        watcher.scan()
+
+        path.write_text("https://youtu.be/video3\n")
+        watcher.poll_once()
+
+        assert collector.urls[-1:] == ['https://youtu.be/video3']
+
+    def test_offsets_survive_restart(self, temp_dir: Path, collector: _Collector):
+        """Test a new watcher resumes from the saved offsets."""
+        path = temp_dir / 'list.txt'
+        path.write_text("https://youtu.be/video1\n")
+        first = FolderWatcher(str(temp_dir), collector, use_inotify=False)
+        first.scan()
+        first.close()
+
+        _append(path, "https://youtu.be/video2\n")
+        second = FolderWatcher(str(temp_dir), collector, use_inotify=False)
+        second.scan()
+        second.close()
+
+        assert collector.urls == ['https://youtu.be/video1', 'https://youtu.be/video2']
+
+    def test_queued_urls_survive_restart(self, temp_dir: Path, collector: _Collector):
+        """Test URLs still queued when watching stops are delivered again after a restart."""
+        (temp_dir / 'list.txt').write_text(
+            "https://youtu.be/video1\nhttps://youtu.be/video2\nhttps://youtu.be/video3\n"
+        )
+        running, release = threading.Event(), threading.Event()
+
+        def download(url: str, *args, **kwargs):
+            running.set()
+            release.wait(5)
+            return {'success': True, 'title': url, 'message': 'ok'}
+
+        job_queue = JobQueue(
+            download_service=MagicMock(**{'fetch.side_effect': download}),
+            history_manager=MagicMock(**{'is_downloaded.return_value': (False, None)}),
+            workers=1,
+        )
+        first = FolderWatcher(
+            str(temp_dir), lambda name, urls: queue_urls(job_queue, urls, str(temp_dir), source=name),
+            use_inotify=False, pending=job_queue.pending_by_source,
+        )
+        job_queue.start()
+        first.scan()
+        assert running.wait(5)
+
+        # Stop like Ctrl+C does: the running job finishes, the others stay queued
+        stopper = threading.Thread(target=job_queue.stop)
+        stopper.start()
+        while not job_queue._scheduler.closed:
+            time.sleep(0.01)
+        release.set()
+        stopper.join(5)
+        first.close()
+
+        second = FolderWatcher(str(temp_dir), collector, use_inotify=False)
+        second.scan()
+        second.scan()
+        second.close()
+
+        assert collector.calls == [('list.txt', ['https://youtu.be/video2', 'https://youtu.be/video3'])]
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is Linux-only")
+    def test_inotify_backend(self, temp_dir: Path, collector: _Collector):
+        """Test new files are picked up through inotify."""
+        folder = FolderWatcher(str(temp_dir), collector, poll_interval=1.0)
+        try:
+            assert folder.backend_name == 'inotify'
+            (temp_dir / 'new.list').write_text("https://youtu.be/video1\n")
+
+            deadline = time.monotonic() + 5
+            while not collector.urls and time.monotonic() < deadline:
+                folder.poll_once(timeout=0.5)
+        finally:
+            folder.close()
+
+        assert collector.urls == ['https://youtu.be/video1']
+
+
+@pytest.mark.unit
+class TestQueueUrls:
+    """Test de-duplication when queueing watched URLs."""
+
+    def test_skips_pending_and_downloaded(self):
+        """Test URLs already queued or in history are not queued again."""
+        job_queue = MagicMock()
+        job_queue.pending_urls.return_value = {'https://youtu.be/queued'}
+        job_queue.submit.side_effect = (
+            lambda url, *args, **kwargs: None if url.endswith('done') else MagicMock()
+        )
+
+        queued = queue_urls(
+            job_queue,
+            ['https://youtu.be/queued', 'https://youtu.be/done', 'https://youtu.be/new',
+             'https://youtu.be/new'],
+            'downloads',
+        )
+
+        assert queued == 1
+        submitted = [call.args[0] for call in job_queue.submit.call_args_list]
+        assert submitted == ['https://youtu.be/done', 'https://youtu.be/new']
+        assert all(call.kwargs['on_duplicate'] == 'skip' for call in job_queue.submit.call_args_list)